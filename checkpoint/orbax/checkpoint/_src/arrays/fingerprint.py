@@ -0,0 +1,163 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cheap content fingerprints used to detect arrays unchanged between saves.
+
+`jax.Array` fingerprints are computed on device by a single jitted reduction
+over all arrays, so only a few bytes per array are transferred to host. Each
+element is hashed together with its position, and the element hashes are
+summed into four independently seeded 32-bit lanes, giving 128 bits in total.
+`np.ndarray` fingerprints are a 128-bit BLAKE2b digest of the host buffer.
+Fingerprints of both kinds also include the shape and dtype of the array.
+
+Fingerprints are probabilistic: two different arrays with equal fingerprints
+are possible, but vanishingly unlikely. Any change to a single element of a
+`jax.Array` is always detected.
+"""
+
+import hashlib
+from typing import Any, Hashable, Sequence
+
+import jax
+from jax import numpy as jnp
+import numpy as np
+
+Fingerprint = Hashable
+
+# Multipliers of the MurmurHash3 finalizer.
+_MIX_MULTIPLIER_1 = 0x85EBCA6B
+_MIX_MULTIPLIER_2 = 0xC2B2AE35
+# Seeds of the independent 32-bit lanes of a `jax.Array` fingerprint.
+_LANE_SEEDS = (0x9E3779B9, 0x7F4A7C15, 0x94D049BB, 0xBF58476D)
+
+
+def _is_supported_dtype(dtype: jnp.dtype) -> bool:
+  if dtype == jnp.bool_:
+    return True
+  if not jnp.issubdtype(dtype, jnp.number):
+    return False
+  return jax.dtypes.itemsize_bits(dtype) in (8, 16, 32, 64)
+
+
+def _to_words(x: jax.Array) -> jax.Array:
+  """Reinterprets `x` as uint32 words, adding a trailing dimension if needed."""
+  if x.dtype == jnp.bool_:
+    return x.astype(jnp.uint32)
+  if jnp.issubdtype(x.dtype, jnp.complexfloating):
+    x = jnp.stack([x.real, x.imag], axis=-1)
+  bits = jax.dtypes.itemsize_bits(x.dtype)
+  if bits == 64:
+    return jax.lax.bitcast_convert_type(x, jnp.uint32)
+  unsigned = {8: jnp.uint8, 16: jnp.uint16, 32: jnp.uint32}[bits]
+  return jax.lax.bitcast_convert_type(x, unsigned).astype(jnp.uint32)
+
+
+def _position_ids(shape: tuple[int, ...]) -> jax.Array:
+  """Returns the row-major position of each element, modulo 2**32.
+
+  Computed from broadcasted iotas rather than by flattening, so that sharded
+  inputs are not resharded.
+
+  Args:
+    shape: The shape of the words array.
+
+  Returns:
+    A uint32 array of `shape`.
+  """
+  ids = jnp.zeros(shape, dtype=jnp.uint32)
+  stride = 1
+  for dim in reversed(range(len(shape))):
+    iota = jax.lax.broadcasted_iota(jnp.uint32, shape, dim)
+    ids = ids + iota * jnp.uint32(stride % 2**32)
+    stride *= shape[dim]
+  return ids
+
+
+def _mix(h: jax.Array) -> jax.Array:
+  """MurmurHash3 finalizer, a bijection on uint32 values."""
+  h = (h ^ (h >> 16)) * jnp.uint32(_MIX_MULTIPLIER_1)
+  h = (h ^ (h >> 13)) * jnp.uint32(_MIX_MULTIPLIER_2)
+  return h ^ (h >> 16)
+
+
+def _array_fingerprint(x: jax.Array) -> jax.Array:
+  """Returns the four uint32 lanes of the fingerprint of `x`.
+
+  For a given position, an element's hash is a bijection of its value, so
+  every lane changes whenever a single element does.
+
+  Args:
+    x: The array to fingerprint.
+  """
+  words = _to_words(x)
+  positions = _position_ids(words.shape)
+  lanes = []
+  for seed in _LANE_SEEDS:
+    keys = _mix(positions ^ jnp.uint32(seed))
+    lanes.append(jnp.sum(_mix(words ^ keys), dtype=jnp.uint32))
+  return jnp.stack(lanes)
+
+
+@jax.jit
+def _device_fingerprints(arrays: list[jax.Array]) -> jax.Array:
+  return jnp.stack([_array_fingerprint(x) for x in arrays])
+
+
+def _numpy_fingerprint(x: np.ndarray) -> str:
+  data = np.ascontiguousarray(x).reshape(-1).view(np.uint8)
+  return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def fingerprint_values(values: Sequence[Any]) -> list[Fingerprint | None]:
+  """Returns a fingerprint for each value, or None if it is not supported.
+
+  Supported values are `jax.Array` and `np.ndarray` with boolean or numeric
+  dtypes. Fingerprints include the shape and dtype of the value.
+
+  All `jax.Array` values are reduced together in a single computation, which
+  must be run by every process when arrays span multiple processes.
+
+  Args:
+    values: Values to fingerprint.
+
+  Returns:
+    A list of hashable fingerprints matching `values`.
+  """
+  fingerprints: list[Fingerprint | None] = [None] * len(values)
+  device_indices = []
+  for i, value in enumerate(values):
+    dtype = getattr(value, 'dtype', None)
+    if dtype is None or not _is_supported_dtype(dtype):
+      continue
+    if isinstance(value, jax.Array):
+      if not value.is_deleted():
+        device_indices.append(i)
+    elif isinstance(value, np.ndarray):
+      fingerprints[i] = (
+          value.shape,
+          str(value.dtype),
+          _numpy_fingerprint(value),
+      )
+
+  if device_indices:
+    result = _device_fingerprints([values[i] for i in device_indices])
+    # The result is replicated, so any addressable shard holds all of it.
+    digests = np.asarray(result.addressable_data(0))
+    for i, digest in zip(device_indices, digests):
+      fingerprints[i] = (
+          values[i].shape,
+          str(values[i].dtype),
+          int.from_bytes(digest.astype('>u4').tobytes(), 'big'),
+      )
+  return fingerprints
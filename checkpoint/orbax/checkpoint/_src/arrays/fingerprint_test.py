@@ -0,0 +1,91 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from absl.testing import absltest
+from absl.testing import parameterized
+import jax
+from jax import numpy as jnp
+import numpy as np
+from orbax.checkpoint._src.arrays import fingerprint
+
+
+class FingerprintValuesTest(parameterized.TestCase):
+
+  @parameterized.parameters(
+      jnp.float32, jnp.bfloat16, jnp.int8, jnp.uint16, jnp.bool_,
+      jnp.complex64,
+  )
+  def test_equal_values_have_equal_fingerprints(self, dtype):
+    x = jnp.arange(24).reshape(4, 6).astype(dtype)
+    y = jnp.arange(24).reshape(4, 6).astype(dtype)
+    fingerprints = fingerprint.fingerprint_values([x, y])
+    self.assertIsNotNone(fingerprints[0])
+    self.assertEqual(fingerprints[0], fingerprints[1])
+
+  def test_single_element_change_is_detected(self):
+    x = jnp.zeros((8, 8), dtype=jnp.float32)
+    fingerprints = fingerprint.fingerprint_values(
+        [x] + [x.at[i, j].set(1.0) for i in range(8) for j in range(8)]
+    )
+    self.assertLen(set(fingerprints), len(fingerprints))
+
+  def test_device_fingerprints_use_128_bits(self):
+    keys = jax.random.split(jax.random.key(0), 64)
+    values = [jax.random.bits(key, (16,), jnp.uint32) for key in keys]
+    digests = [f[2] for f in fingerprint.fingerprint_values(values)]
+    self.assertLen(set(digests), len(values))
+    self.assertTrue(all(0 <= d < 2**128 for d in digests))
+    self.assertTrue(any(d >= 2**96 for d in digests))
+
+  def test_transposed_values_differ(self):
+    x = jnp.arange(16, dtype=jnp.int32).reshape(4, 4)
+    fingerprints = fingerprint.fingerprint_values([x, x.T])
+    self.assertNotEqual(fingerprints[0], fingerprints[1])
+
+  def test_shape_and_dtype_are_included(self):
+    x = jnp.zeros((4, 4), dtype=jnp.float32)
+    fingerprints = fingerprint.fingerprint_values(
+        [x, x.reshape(2, 8), x.astype(jnp.int32)]
+    )
+    self.assertLen(set(fingerprints), 3)
+
+  def test_sharded_array(self):
+    mesh = jax.sharding.Mesh(np.asarray(jax.devices()), ('x',))
+    sharding = jax.sharding.NamedSharding(
+        mesh, jax.sharding.PartitionSpec('x')
+    )
+    x = jnp.arange(len(jax.devices()) * 4, dtype=jnp.float32)
+    self.assertEqual(
+        fingerprint.fingerprint_values([x]),
+        fingerprint.fingerprint_values([jax.device_put(x, sharding)]),
+    )
+
+  def test_numpy_values(self):
+    x = np.arange(10)
+    fingerprints = fingerprint.fingerprint_values(
+        [x, x.copy(), x[::-1], x.astype(np.float32)]
+    )
+    self.assertEqual(fingerprints[0], fingerprints[1])
+    self.assertLen(set(fingerprints), 3)
+
+  def test_unsupported_values(self):
+    self.assertEqual(
+        [None, None, None],
+        fingerprint.fingerprint_values(
+            [1, 'foo', jax.random.key(0)]
+        ),
+    )
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -14,6 +14,9 @@
 
 """AsyncCheckpointer."""
 
+from __future__ import annotations
+
+import collections
 import datetime
 import sys
 import threading
@@ -37,6 +40,7 @@ from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.path import atomicity
 from orbax.checkpoint._src.path import atomicity_types
+from orbax.checkpoint._src.serialization import limits
 
 BarrierSyncFn = multihost.BarrierSyncFn
 _DIRECTORY_CREATION_SIGNALS = [
@@ -66,8 +70,25 @@ def _background_wait_for_commit_futures(
     sync_fn: Callable[[str, int], None],
     timeout_secs: int,
     primary_host: int | None,
+    wait_for_predecessor: Callable[[], None] = lambda: None,
 ):
-  """A function to be run in a background thread that waits for futures."""
+  """A function to be run in a background thread that waits for futures.
+
+  Commit futures are awaited immediately, but finalization only starts once
+  `wait_for_predecessor` returns, so that concurrently committing checkpoints
+  become visible in the order in which they were saved.
+
+  Args:
+    directory: The final checkpoint directory.
+    commit_futures: Futures to wait for before finalizing.
+    on_commit_callback: Finalizes the checkpoint on the primary host.
+    barrier_sync_key_prefix: Prefix for barrier keys.
+    sync_fn: Barrier function, taking a key and a timeout in milliseconds.
+    timeout_secs: Deadline for the whole operation.
+    primary_host: The primary host, or None if all hosts are primary.
+    wait_for_predecessor: Blocks until the previously started save has been
+      finalized.
+  """
   current_process = multihost.process_index()
   current_thread_id = threading.current_thread().name
   process_count = jax.process_count()
@@ -106,6 +127,7 @@ def _background_wait_for_commit_futures(
       '/jax/orbax/write/async/tensorstore_duration_secs',
       commit_duration_secs,
   )
+  wait_for_predecessor()
 
   if process_count > 1:
     # All processes will wait at the barrier. When all processes are at the
@@ -176,8 +198,30 @@ def _add_deadline_exceeded_notes(e: jax.errors.JaxRuntimeError):
   e.add_note('3. Make sure that the storage has enough throughput quota.')
 
 
+class _Commit:
+  """State of a checkpoint committing in a background thread."""
+
+  # The background thread running the commit, set before it is started.
+  thread: threading.Thread
+
+  def __init__(self, directory: epath.Path, predecessor: Optional[_Commit]):
+    self.directory = directory
+    # The commit started just before this one, which is finalized first.
+    self.predecessor = predecessor
+    self.exception: Optional[BaseException] = None
+    # Set once the commit has finished, whether it succeeded or not.
+    self.done = threading.Event()
+    # Whether errors are only surfaced through a waiter, see `claim_commit`.
+    self.claimed = False
+
+
 class _AsyncManager:
-  """Helper class for background checkpoint saving work orchestration."""
+  """Helper class for background checkpoint saving work orchestration.
+
+  Up to `max_concurrent_commits` saves may commit in the background at once.
+  Each runs in its own thread; commit futures are awaited concurrently, while
+  finalization happens strictly in the order in which commits were started.
+  """
 
   def __init__(
       self,
@@ -186,33 +230,51 @@ class _AsyncManager:
       timeout_secs: int,
       primary_host: Optional[int] = 0,
       barrier_sync_key_prefix: Optional[str] = None,
+      max_concurrent_commits: int = 1,
   ):
     if timeout_secs <= 0:
       raise ValueError(
           f'Timeout must be positive, but got {timeout_secs} seconds.'
       )
+    if max_concurrent_commits < 1:
+      raise ValueError(
+          'max_concurrent_commits must be positive, but got'
+          f' {max_concurrent_commits}.'
+      )
     logging.info(
-        '[process=%s][thread=%s] Using barrier_sync_fn: %s timeout: %d secs and'
-        ' primary_host=%s for async checkpoint writes',
+        '[process=%s][thread=%s] Using barrier_sync_fn: %s timeout: %d secs,'
+        ' primary_host=%s and max_concurrent_commits=%d for async checkpoint'
+        ' writes',
         multihost.process_index(),
         threading.current_thread().name,
         barrier_sync_fn,
         timeout_secs,
         primary_host,
+        max_concurrent_commits,
     )
     self._timeout_secs = timeout_secs
     self._primary_host = primary_host
     self._barrier_sync_key_prefix = barrier_sync_key_prefix
+    self._max_concurrent_commits = max_concurrent_commits
 
-    self._thread = None
-    self._exception = None
+    # In-flight commits, oldest first. A commit is only removed once it has
+    # been joined, so that concurrent waiters all block until it is done.
+    self._commits: collections.deque[_Commit] = collections.deque()
+    self._commits_lock = threading.Lock()
+    # Failed commits whose errors have not been surfaced yet, in save order.
+    self._failed_commits: list[_Commit] = []
+    self._exception_lock = threading.Lock()
 
     self._sync_fn: Callable[[str, int], None] = (
         lambda key, timeout_ms: barrier_sync_fn(key=key, timeout_ms=timeout_ms)
     )
 
+  @property
+  def max_concurrent_commits(self) -> int:
+    return self._max_concurrent_commits
+
   def __del__(self):
-    if self._thread is not None and self._thread.is_alive():
+    if any(commit.thread.is_alive() for commit in self._commits):
       logging.warning(
           'Please add `.wait_until_finished()` in the main thread '
           'before your program finishes because there is a '
@@ -222,87 +284,156 @@ class _AsyncManager:
 
   def _thread_func(
       self,
-      directory: epath.Path,
+      commit: _Commit,
       commit_futures: Sequence[future.Future],
       on_commit_callback: Callable[[], None],
   ):
     """Awaits on commit futures and finalizes the checkpoint."""
+    predecessor = commit.predecessor
+
+    def _wait_for_predecessor():
+      if predecessor is None:
+        return
+      predecessor.done.wait()
+      if predecessor.exception is not None:
+        raise RuntimeError(
+            f'Not finalizing checkpoint at {commit.directory}: the previously'
+            f' started save to {predecessor.directory} failed.'
+        ) from predecessor.exception
+
     try:
       _background_wait_for_commit_futures(
-          directory,
+          commit.directory,
           commit_futures,
           on_commit_callback,
           barrier_sync_key_prefix=self._barrier_sync_key_prefix,  # pyrefly: ignore[bad-argument-type]
           sync_fn=self._sync_fn,
           timeout_secs=self._timeout_secs,
           primary_host=self._primary_host,
+          wait_for_predecessor=_wait_for_predecessor,
       )
     except Exception as e:  # pylint: disable=broad-exception-caught
       msg = (
           f'[process={multihost.process_index()}] Failed to run'
           f' {len(commit_futures)} Handler Commit operations or the Commit'
-          f' callback in background save thread, directory: {directory}'
+          f' callback in background save thread, directory:'
+          f' {commit.directory}'
       )
       logging.error(msg, exc_info=True)
-      self._exception = e
+      # Commits complete in save order, even if they fail early.
+      if predecessor is not None:
+        predecessor.done.wait()
+      with self._exception_lock:
+        commit.exception = e
+        if not commit.claimed:
+          self._failed_commits.append(commit)
+    finally:
+      commit.done.set()
+
+  def _join_oldest(self):
+    with self._commits_lock:
+      if not self._commits:
+        return
+      commit = self._commits[0]
+    thread = commit.thread
+    logging.info(
+        '[process=%s][thread=%s] Waiting for background save thread=%s.',
+        multihost.process_index(),
+        threading.current_thread().name,
+        thread.name,
+    )
+    thread.join()
+    with self._commits_lock:
+      if self._commits and self._commits[0] is commit:
+        self._commits.popleft()
+    logging.info(
+        '[process=%s][thread=%s] Done with waiting for background save'
+        ' thread=%s.',
+        multihost.process_index(),
+        threading.current_thread().name,
+        thread.name,
+    )
+
+  def _wait_for_capacity(self):
+    with self._commits_lock:
+      while self._commits and not self._commits[0].thread.is_alive():
+        self._commits.popleft().thread.join()
+    while len(self._commits) >= self._max_concurrent_commits:
+      self._join_oldest()
+
+  def wait_for_capacity(self):
+    """Blocks until another commit can be started without exceeding the limit.
+
+    Surfaces any errors from commits that have completed.
+    """
+    self._wait_for_capacity()
+    self.check_for_errors()
 
   def start_async_commit(
       self,
       directory: epath.Path,
       commit_futures: Sequence[future.Future],
       on_commit_callback: Callable[[], None],
-  ):
+  ) -> _Commit:
     """Completes checkpoint save in a background thread."""
-    self._thread = threading.Thread(
+    self._wait_for_capacity()
+    commit = _Commit(
+        directory,
+        predecessor=self._commits[-1] if self._commits else None,
+    )
+    commit.thread = threading.Thread(
         name='async_save',
         target=self._thread_func,
-        args=(
-            directory,
-            commit_futures,
-            on_commit_callback,
-        ),
+        args=(commit, commit_futures, on_commit_callback),
     )
-    self._thread.start()
+    commit.thread.start()
+    with self._commits_lock:
+      self._commits.append(commit)
+    return commit
+
+  def claim_commit(self, commit: _Commit) -> Callable[[], None]:
+    """Returns a function that waits for `commit` and raises its error.
+
+    Errors of a claimed commit are not surfaced by `check_for_errors`.
+
+    Args:
+      commit: A commit returned by `start_async_commit`.
+    """
+    with self._exception_lock:
+      commit.claimed = True
+      if commit in self._failed_commits:
+        self._failed_commits.remove(commit)
+
+    def _wait_for_commit():
+      commit.done.wait()
+      if commit.exception is not None:
+        raise commit.exception
+
+    return _wait_for_commit
 
   def check_for_errors(self):
     """Surfaces any errors from the background commit operations."""
-    if self._exception is not None:
-      # Clears self._exception so it is only raised once.
-      exception = self._exception
-      self._exception = None
-      raise exception  # pylint: disable=raising-bad-type
+    with self._exception_lock:
+      # Clears the failed commits so errors are only raised once. Later
+      # failures have been logged by the background threads.
+      failed_commits = self._failed_commits
+      self._failed_commits = []
+    if failed_commits:
+      raise failed_commits[0].exception  # pylint: disable=raising-bad-type
 
   def wait_until_finished(self):
     """Waits for any outstanding operations to complete."""
-    current_thread_name = threading.current_thread().name
-    background_thread_name = (
-        self._thread.name if self._thread is not None else None
-    )
-    if self._thread is not None:
-      logging.info(
-          '[process=%s][thread=%s] Waiting for background save thread=%s.',
-          multihost.process_index(),
-          current_thread_name,
-          background_thread_name,
-      )
-      self._thread.join()
-      self._thread = None
-      logging.info(
-          '[process=%s][thread=%s] Done with waiting for background save'
-          ' thread=%s.',
-          multihost.process_index(),
-          current_thread_name,
-          background_thread_name,
-      )
+    had_threads = bool(self._commits)
+    while self._commits:
+      self._join_oldest()
 
     self.check_for_errors()
-    if background_thread_name is not None:
+    if had_threads:
       logging.info(
           '[process=%s][thread=%s] No errors found in background save'
-          ' thread=%s.',
+          ' threads.',
           multihost.process_index(),
-          current_thread_name,
-          background_thread_name,
+          threading.current_thread().name,
       )
 
 
@@ -313,6 +444,13 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
   provided by AsyncManager). Users should call `wait_until_finished` to block
   until a save operation running in the background is complete.
 
+  By default, a new save waits for the previous one to finish committing. With
+  `AsyncOptions.max_concurrent_commits > 1`, up to that many saves may commit
+  concurrently; checkpoints are still finalized (i.e. become visible) in the
+  order in which they were saved, and a checkpoint is not finalized if an
+  earlier one failed. The handler's save memory budgets are split evenly between
+  concurrently committing saves, so peak host memory stays within the budget.
+
   Like its parent, AsyncCheckpointer also makes use of an underlying
   :py:class:`.CheckpointHandler` to deal with type-specific logic.
 
@@ -382,14 +520,17 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
         timeout_secs=timeout_secs,
         primary_host=multiprocessing_options.primary_host,
         barrier_sync_key_prefix=barrier_sync_key_prefix,
+        max_concurrent_commits=async_options.max_concurrent_commits,
     )
     self._multiprocessing_options = multiprocessing_options
+    self._latest_commit: Optional[_Commit] = None
 
   def _make_on_commit_callback(
       self,
       tmpdir: atomicity_types.TemporaryPath,
       custom_metadata: dict[str, Any] | None,
       checkpoint_start_time: float,
+      pre_commit_callback: Callable[[], None] | None = None,
   ) -> Callable[[], None]:
     # Directory is the final directory.
 
@@ -425,6 +566,8 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
       )
       if self._post_finalization_callback is not None:
         self._post_finalization_callback()
+      if pre_commit_callback is not None:
+        pre_commit_callback()
       logging.vlog(
           1,
           '[process=%s][thread=%s] Async Save Callback [3/3]: Finalizing'
@@ -515,13 +658,16 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
       *args,
       force: bool = False,
       custom_metadata: dict[str, Any] | None = None,
+      pre_commit_callback: Callable[[], None] | None = None,
       **kwargs,
   ):
     """Saves the given item to the provided directory.
 
     Delegates to the underlying CheckpointHandler. Ensures save operation
     atomicity. Must first block until any previous save operations running in
-    the background are completed.
+    the background are completed, unless
+    `AsyncOptions.max_concurrent_commits` allows more than one save to commit
+    at a time, in which case it only blocks while the commit queue is full.
 
     This method should be called by all hosts - process synchronization and
     actions that need to be performed on only one host are managed internally.
@@ -533,6 +679,9 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
         due to the need to delete any existing files.
       custom_metadata: a dictionary of custom metadata to be written to the
         checkpoint directory via StepMetadata.
+      pre_commit_callback: if set, called on the primary host in the
+        background thread, after the handler is finalized and right before the
+        checkpoint is committed.
       **kwargs: additional keyword args to provide to the CheckpointHandler's
         save method.
 
@@ -559,30 +708,52 @@ class AsyncCheckpointer(checkpointer.Checkpointer):
     )
     operation_recorder.record_start(start_time=checkpoint_start_time)
     tmpdir = self.get_temporary_path(directory)
-    self.wait_until_finished()
+    if self._async_manager.max_concurrent_commits > 1:
+      # Only wait for older saves if the commit queue is full.
+      self._async_manager.wait_for_capacity()
+    else:
+      self.wait_until_finished()
     self.synchronize_next_awaitable_signal_operation_id()
     on_commit_callback = self._make_on_commit_callback(
-        tmpdir, custom_metadata, checkpoint_start_time
-    )
-    commit_ops = asyncio_utils.run_sync(
-        self._save(
-            tmpdir,
-            *args,
-            force=force,
-            **kwargs,
-        )
+        tmpdir, custom_metadata, checkpoint_start_time, pre_commit_callback
     )
+    # Concurrently committing saves share the handler's memory budgets.
+    with limits.split_save_budget(self._async_manager.max_concurrent_commits):
+      commit_ops = asyncio_utils.run_sync(
+          self._save(
+              tmpdir,
+              *args,
+              force=force,
+              **kwargs,
+          )
+      )
     blocking_end_time = time.time()
     operation_recorder.record_blocking_completion(
         blocking_end_time - checkpoint_start_time,
         end_time=blocking_end_time,
     )
-    self._async_manager.start_async_commit(
+    self._latest_commit = self._async_manager.start_async_commit(
         directory,
         commit_futures=commit_ops,
         on_commit_callback=on_commit_callback,
     )
 
+  @property
+  def max_concurrent_commits(self) -> int:
+    """The maximum number of saves that may commit at the same time."""
+    return self._async_manager.max_concurrent_commits
+
+  def get_commit_waiter(self) -> Callable[[], None]:
+    """Returns a function that blocks until the latest save is finalized.
+
+    The function raises the error of that save, if it failed, which is then not
+    surfaced by `check_for_errors`. It must be obtained right after `save`
+    returns, before any other save is started.
+    """
+    if self._latest_commit is None:
+      raise ValueError('No save has been started.')
+    return self._async_manager.claim_commit(self._latest_commit)
+
   def restore(self, directory: epath.PathLike, *args, **kwargs) -> Any:
     """See superclass documentation."""
     self.wait_until_finished()
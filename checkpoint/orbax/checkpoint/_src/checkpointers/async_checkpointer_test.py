@@ -267,6 +267,112 @@ class MockPathAwaitingCreation(path_types.PathAwaitingCreation):
 MockDeferredWritableTemporaryPath = test_utils.MockDeferredWritableTemporaryPath
 
 
+class AsyncManagerTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.executor = futures.ThreadPoolExecutor(max_workers=4)
+    self.directory = epath.Path(self.create_tempdir().full_path)
+
+  def tearDown(self):
+    self.executor.shutdown(wait=True)
+    super().tearDown()
+
+  def _manager(self, max_concurrent_commits: int):
+    return async_checkpointer._AsyncManager(  # pylint: disable=protected-access
+        barrier_sync_fn=lambda *, key, timeout_ms: None,
+        timeout_secs=60,
+        max_concurrent_commits=max_concurrent_commits,
+    )
+
+  def test_invalid_max_concurrent_commits(self):
+    with self.assertRaisesRegex(ValueError, 'must be positive'):
+      self._manager(0)
+
+  def test_concurrent_commits_finalize_in_order(self):
+    manager = self._manager(max_concurrent_commits=3)
+    finalized = []
+    sleep_secs = [1.5, 0.5, 0.0]
+    start = time.time()
+    for i, secs in enumerate(sleep_secs):
+      manager.start_async_commit(
+          self.directory / str(i),
+          commit_futures=[self.executor.submit(time.sleep, secs)],
+          on_commit_callback=lambda i=i: finalized.append(i),
+      )
+    # None of the commits blocked the caller.
+    self.assertLess(time.time() - start, 0.5)
+    manager.wait_until_finished()
+    self.assertEqual(finalized, [0, 1, 2])
+    # Commits ran concurrently rather than back to back.
+    self.assertLess(time.time() - start, sum(sleep_secs))
+
+  def test_blocks_when_queue_is_full(self):
+    manager = self._manager(max_concurrent_commits=2)
+    finalized = []
+    for i in range(3):
+      manager.start_async_commit(
+          self.directory / str(i),
+          commit_futures=[self.executor.submit(time.sleep, 0.5)],
+          on_commit_callback=lambda i=i: finalized.append(i),
+      )
+      # Starting the third commit must wait for the first one to finish.
+      self.assertLessEqual(len(manager._commits), 2)  # pylint: disable=protected-access
+    self.assertIn(0, finalized)
+    manager.wait_until_finished()
+    self.assertEqual(finalized, [0, 1, 2])
+
+  def test_errors_are_surfaced(self):
+    manager = self._manager(max_concurrent_commits=2)
+    finalized = []
+
+    def _fail():
+      raise ValueError('commit failed')
+
+    manager.start_async_commit(
+        self.directory / '0',
+        commit_futures=[self.executor.submit(_fail)],
+        on_commit_callback=lambda: finalized.append(0),
+    )
+    manager.start_async_commit(
+        self.directory / '1',
+        commit_futures=[self.executor.submit(time.sleep, 0.1)],
+        on_commit_callback=lambda: finalized.append(1),
+    )
+    with self.assertRaisesRegex(ValueError, 'commit failed'):
+      manager.wait_until_finished()
+    # The successor is not finalized after its predecessor failed.
+    self.assertEqual(finalized, [])
+    manager.wait_until_finished()  # Errors are only raised once.
+
+  def test_commit_waiter_raises_error_of_its_commit(self):
+    manager = self._manager(max_concurrent_commits=2)
+
+    def _fail():
+      time.sleep(0.2)
+      raise ValueError('commit failed')
+
+    wait_for_first = manager.claim_commit(
+        manager.start_async_commit(
+            self.directory / '0',
+            commit_futures=[self.executor.submit(time.sleep, 0.1)],
+            on_commit_callback=lambda: None,
+        )
+    )
+    wait_for_second = manager.claim_commit(
+        manager.start_async_commit(
+            self.directory / '1',
+            commit_futures=[self.executor.submit(_fail)],
+            on_commit_callback=lambda: None,
+        )
+    )
+    wait_for_first()
+    with self.assertRaisesRegex(ValueError, 'commit failed'):
+      wait_for_second()
+    # The error is only raised by the waiter.
+    manager.wait_until_finished()
+
+
 @test_utils.barrier_compatible_test
 class AsyncCheckpointerTest(
     checkpointer_test_utils.CheckpointerTestBase.Test,
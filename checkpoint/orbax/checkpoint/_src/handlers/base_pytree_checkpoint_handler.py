@@ -22,13 +22,14 @@ customized, and is delegated to the `TypeHandler` class.
 from __future__ import annotations
 
 import asyncio
+import collections
 from collections.abc import Set
 import dataclasses
 import functools
 import json
 import threading
 import time
-from typing import Any, List, Mapping, Optional, Tuple, Union
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
 import uuid
 
 from absl import logging
@@ -39,19 +40,23 @@ from orbax.checkpoint import checkpoint_args
 from orbax.checkpoint import options as options_lib
 from orbax.checkpoint import utils
 from orbax.checkpoint._src import asyncio_utils
+from orbax.checkpoint._src.arrays import fingerprint as fingerprint_lib
 from orbax.checkpoint._src.futures import future
 from orbax.checkpoint._src.handlers import async_checkpoint_handler
 from orbax.checkpoint._src.logging import event_tracking
 from orbax.checkpoint._src.metadata import array_metadata_store as array_metadata_store_lib
 from orbax.checkpoint._src.metadata import empty_values
 from orbax.checkpoint._src.metadata import tree as tree_metadata
+from orbax.checkpoint._src.metadata import tree_index
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.path import atomicity_types
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import format_utils
 from orbax.checkpoint._src.path import types as path_types
 from orbax.checkpoint._src.path.snapshot import snapshot
 from orbax.checkpoint._src.serialization import async_io_engine
+from orbax.checkpoint._src.serialization import host_buffer_pool
 from orbax.checkpoint._src.serialization import limits
 from orbax.checkpoint._src.serialization import memory_regulator
 from orbax.checkpoint._src.serialization import ocdbt_utils
@@ -103,6 +108,8 @@ def batched_serialization_requests(
 ) -> BatchRequests:
   """Gets a list of batched serialization or deserialization requests."""
   grouped = {}
+  # Registry lookups scan the registered types, so they are memoized per type.
+  handlers = {}
 
   def _group_value(
       keypath: Tuple[Any, ...],
@@ -139,25 +146,28 @@ def batched_serialization_requests(
           f'Expected `RestoreArgs` or `SaveArgs`. Got {type(arg)}.'
       )
 
-    try:
-      handler = registry.get(type_for_registry_lookup)
-    except ValueError as e:
-      raise ValueError(
-          f'TypeHandler lookup failed for: type={type_for_registry_lookup},'
-          f' keypath={keypath}, ParamInfo={info}, RestoreArgs={arg},'
-          f' value={value}'
-      ) from e
-
-    if handler not in grouped:
-      grouped[handler] = BatchRequest(handler, [], [], [], [])
-    request = grouped[handler]
-    grouped[handler] = dataclasses.replace(
-        request,
-        keys=request.keys + [tuple_key],
-        values=request.values + [value],
-        infos=request.infos + [info],
-        args=request.args + [arg],
-    )
+    handler = handlers.get(type_for_registry_lookup)
+    if handler is None:
+      try:
+        handler = registry.get(type_for_registry_lookup)
+      except ValueError as e:
+        raise ValueError(
+            f'TypeHandler lookup failed for: type={type_for_registry_lookup},'
+            f' keypath={keypath}, ParamInfo={info}, RestoreArgs={arg},'
+            f' value={value}'
+        ) from e
+      handlers[type_for_registry_lookup] = handler
+
+    # TypeHandlers expect all ParamInfos in a batch to share `parent_dir`.
+    batch_key = (handler, info.data_ref)
+    if batch_key not in grouped:
+      grouped[batch_key] = BatchRequest(handler, [], [], [], [])
+    # Appends in place; copying the lists would be quadratic in the leaf count.
+    request = grouped[batch_key]
+    request.keys.append(tuple_key)
+    request.values.append(value)
+    request.infos.append(info)
+    request.args.append(arg)
 
   jax.tree_util.tree_map_with_path(
       _group_value,
@@ -368,6 +378,86 @@ def _filter_batch_requests(
   return filtered_requests
 
 
+def _exclude_batch_requests(
+    batch_requests: BatchRequests,
+    exclusions: Set[Any],
+) -> BatchRequests:
+  """Filters batch requests to exclude items whose key is in exclusions."""
+  filtered_requests = []
+  for request in batch_requests:
+    filtered_items = [
+        (key, value, info, arg)
+        for key, value, info, arg in zip(
+            request.keys, request.values, request.infos, request.args
+        )
+        if key not in exclusions
+    ]
+    if filtered_items:
+      keys, values, infos, args = zip(*filtered_items)
+      filtered_requests.append(
+          dataclasses.replace(
+              request,
+              keys=list(keys),
+              values=list(values),
+              infos=list(infos),
+              args=list(args),
+          )
+      )
+  return filtered_requests
+
+
+@dataclasses.dataclass(frozen=True)
+class _IncrementalRecord:
+  """Where the data of a leaf saved by an incremental save is stored.
+
+  Attributes:
+    fingerprint: Fingerprint of the leaf value and the way it was saved.
+    data_dir: Final directory of the checkpoint holding the leaf data.
+  """
+
+  fingerprint: Any
+  data_dir: epath.Path
+
+
+# Number of distinct PyTree structures whose `_ParamInfoPlan` is cached.
+_PARAM_INFO_PLAN_CACHE_SIZE = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class _ParamInfoPlan:
+  """The parts of a PyTree's ParamInfos that only depend on its structure.
+
+  Trees with the same structure and leaf types, e.g. the train state at
+  different steps, share a plan, so that names and typestrs are not recomputed
+  for every save or restore.
+
+  Attributes:
+    treedef: Structure of the tree, treating empty nodes as leaves.
+    leaf_indices: For each leaf of `treedef`, its index among the leaves of the
+      tree flattened without treating empty nodes as leaves, or None for empty
+      nodes.
+    empty_nodes: Empty nodes of the tree, keyed by their index among the leaves
+      of `treedef`.
+    keypaths: Keypath of each leaf of `treedef`.
+    names: Parameter name of each leaf of `treedef`.
+    typestrs: Value typestr of each leaf of `treedef`.
+  """
+
+  treedef: jax.tree_util.PyTreeDef
+  leaf_indices: Sequence[Optional[int]]
+  empty_nodes: Mapping[int, Any]
+  keypaths: Sequence[Tuple[Any, ...]]
+  names: Sequence[str]
+  typestrs: Sequence[str]
+
+  def leaves(self, flat_values: Sequence[Any]) -> List[Any]:
+    """Returns leaves of `treedef` given the leaves of a matching tree."""
+    return [
+        self.empty_nodes[i] if leaf_index is None else flat_values[leaf_index]
+        for i, leaf_index in enumerate(self.leaf_indices)
+    ]
+
+
 class BasePyTreeCheckpointHandler(
     async_checkpoint_handler.DeferredPathAsyncCheckpointHandler
 ):
@@ -398,6 +488,8 @@ class BasePyTreeCheckpointHandler(
       ),
       enable_pinned_host_transfer: Optional[bool] = None,
       is_prioritized_key_fn: Optional[types.IsPrioritizedKeyFn] = None,
+      enable_incremental_save: bool = False,
+      host_buffer_pool_bytes: Optional[int] = None,
   ):
     """Creates BasePyTreeCheckpointHandler.
 
@@ -442,6 +534,20 @@ class BasePyTreeCheckpointHandler(
         not prioritized. Note that any "prioritized" keys are assumed to be
         lightweight, and `save_device_host_concurrent_gb` will be ignored for
         them.
+      enable_incremental_save: If True, `jax.Array` and `np.ndarray` leaves
+        whose contents are unchanged since the previous save by this handler
+        are not written again. The checkpoint instead references the
+        checkpoint holding the data, which is resolved transparently on
+        restore. Unchanged leaves are detected with a cheap fingerprint
+        computed on device. `CheckpointManager` keeps referenced checkpoints
+        alive while a handler with incremental saves is registered with it;
+        otherwise, callers must not delete checkpoints that later
+        checkpoints reference.
+      host_buffer_pool_bytes: The byte budget of the pool of host buffers that
+        arrays are transferred into on save. Buffers are reused by later saves
+        instead of being allocated again, so resident host memory grows by up
+        to this many bytes. `None` uses a default budget, and 0 disables the
+        pool.
     """
     self._save_concurrent_bytes = save_concurrent_bytes
     self._restore_concurrent_bytes = restore_concurrent_bytes
@@ -453,6 +559,12 @@ class BasePyTreeCheckpointHandler(
             memory_limit_options.max_transfer_concurrent_gb * 10**9
         )
 
+    if host_buffer_pool_bytes is None:
+      host_buffer_pool_bytes = host_buffer_pool.DEFAULT_MAX_BYTES
+    self._host_buffer_pool = host_buffer_pool.HostBufferPool(
+        max_bytes=host_buffer_pool_bytes
+    )
+
     if self._save_device_host_concurrent_bytes == 'auto':
       if self._max_save_device_host_concurrent_bytes is None:
         raise ValueError(
@@ -464,6 +576,7 @@ class BasePyTreeCheckpointHandler(
       )
       self._memory_regulator = memory_regulator.MemoryRegulator(
           max_memory_limit_gib=max_memory_limit_gib,
+          host_buffer_pool=self._host_buffer_pool,
       )
       self._current_device_host_limit_bytes = int(
           self._memory_regulator.min_memory_limit_gib * 1024**3
@@ -490,6 +603,14 @@ class BasePyTreeCheckpointHandler(
       enable_pinned_host_transfer = jax.default_backend() == 'gpu'
     self._enable_pinned_host_transfer = enable_pinned_host_transfer
     self._is_prioritized_key_fn = is_prioritized_key_fn
+    self._enable_incremental_save = enable_incremental_save
+    # Records of the last committed incremental save, keyed by tuple keypath.
+    self._incremental_records: dict[Tuple[Any, ...], _IncrementalRecord] = {}
+    # Least recently used last.
+    self._param_info_plans: collections.OrderedDict[Any, _ParamInfoPlan] = (
+        collections.OrderedDict()
+    )
+    self._param_info_plans_lock = threading.Lock()
     if self._is_prioritized_key_fn:
       jax.monitoring.record_event(
           '/jax/orbax/pytree_checkpoint_handler/init/prioritized_key_fn'
@@ -513,6 +634,11 @@ class BasePyTreeCheckpointHandler(
     )
     self._async_io_engine = async_io_engine.AsyncIoEngine()
 
+  @property
+  def enable_incremental_save(self) -> bool:
+    """Whether saves reference unchanged data in earlier checkpoints."""
+    return self._enable_incremental_save
+
   def get_param_names(self, item: PyTree) -> PyTree:
     """Gets parameter names for PyTree elements."""
     return get_param_names(item)
@@ -552,12 +678,17 @@ class BasePyTreeCheckpointHandler(
     """
     if use_zarr3 is None:
       use_zarr3 = self._use_zarr3
-    names = self.get_param_names(item)
+    plan, flat_values = self._get_param_info_plan(item)
     ts_context = ts_utils.get_ts_context(use_ocdbt=use_ocdbt)
 
-    def _param_info(keypath, name, value):
+    def _param_info(keypath, name, typestr, value):
+      parent_dir = directory
+      data_ref = None
       if isinstance(value, tree_metadata.ValueMetadataEntry):
         skip_deserialize = value.skip_deserialize
+        if value.data_ref is not None:
+          data_ref = value.data_ref
+          parent_dir = data_references.resolve_reference(directory, data_ref)
       elif isinstance(value, type(PLACEHOLDER)):
         skip_deserialize = True
       else:
@@ -565,7 +696,7 @@ class BasePyTreeCheckpointHandler(
       return ParamInfo(
           name=name,
           keypath=keypath,
-          parent_dir=directory,
+          parent_dir=parent_dir,
           skip_deserialize=skip_deserialize,
           is_ocdbt_checkpoint=use_ocdbt,
           use_compression=use_compression,
@@ -574,17 +705,85 @@ class BasePyTreeCheckpointHandler(
           ocdbt_target_data_file_size=ocdbt_target_data_file_size,
           byte_limiter=byte_limiter,
           device_host_byte_limiter=device_host_byte_limiter,
+          host_buffer_pool=self._host_buffer_pool,
           ts_context=ts_context,
-          value_typestr=type_handler_registry_lib.get_param_typestr(
-              value, self._type_handler_registry, self._pytree_metadata_options
-          ),
+          value_typestr=typestr,
           raise_array_data_missing_error=raise_array_data_missing_error,
+          data_ref=data_ref,
           is_prioritized_key_fn=self._is_prioritized_key_fn,
       )
 
-    return jax.tree.map_with_path(
-        _param_info, names, item, is_leaf=utils.is_empty_or_leaf
+    return jax.tree.unflatten(
+        plan.treedef,
+        map(
+            _param_info,
+            plan.keypaths,
+            plan.names,
+            plan.typestrs,
+            plan.leaves(flat_values),
+        ),
+    )
+
+  def _get_param_info_plan(
+      self, item: PyTree
+  ) -> Tuple[_ParamInfoPlan, List[Any]]:
+    """Returns the `_ParamInfoPlan` of `item`, and the leaves of `item`.
+
+    Plans are cached by structure and leaf types. Computing the key only
+    requires flattening `item`, which is much cheaper than building the plan.
+
+    Args:
+      item: a PyTree.
+
+    Returns:
+      The plan, and the leaves of `item` as returned by `jax.tree.flatten`.
+    """
+    flat_values, treedef = jax.tree.flatten(item)
+    key = (treedef, tuple(map(type, flat_values)))
+    try:
+      with self._param_info_plans_lock:
+        plan = self._param_info_plans.get(key)
+        if plan is not None:
+          self._param_info_plans.move_to_end(key)
+          return plan, flat_values
+    except TypeError:
+      # Custom nodes may have unhashable auxiliary data.
+      key = None
+
+    keypaths_and_values, plan_treedef = jax.tree_util.tree_flatten_with_path(
+        item, is_leaf=utils.is_empty_or_leaf
     )
+    leaf_indices = []
+    empty_nodes = {}
+    num_values = 0
+    for i, (_, value) in enumerate(keypaths_and_values):
+      if jax.tree.structure(value).num_leaves:
+        leaf_indices.append(num_values)
+        num_values += 1
+      else:
+        leaf_indices.append(None)
+        empty_nodes[i] = value
+    plan = _ParamInfoPlan(
+        treedef=plan_treedef,
+        leaf_indices=leaf_indices,
+        empty_nodes=empty_nodes,
+        keypaths=[keypath for keypath, _ in keypaths_and_values],
+        names=jax.tree.leaves(self.get_param_names(item)),
+        typestrs=[
+            type_handler_registry_lib.get_param_typestr(
+                value,
+                self._type_handler_registry,
+                self._pytree_metadata_options,
+            )
+            for _, value in keypaths_and_values
+        ],
+    )
+    if key is not None:
+      with self._param_info_plans_lock:
+        self._param_info_plans[key] = plan
+        while len(self._param_info_plans) > _PARAM_INFO_PLAN_CACHE_SIZE:
+          self._param_info_plans.popitem(last=False)
+    return plan, flat_values
 
   async def _async_partial_save(
       self,
@@ -598,6 +797,76 @@ class BasePyTreeCheckpointHandler(
     )
     return _filter_batch_requests(batch_requests, additions)
 
+  async def _skip_unchanged_values(
+      self,
+      directory: epath.Path | path_types.PathAwaitingCreation,
+      batch_requests: BatchRequests,
+  ) -> Tuple[BatchRequests, dict[Tuple[Any, ...], _IncrementalRecord]]:
+    """Drops values unchanged since the last save from `batch_requests`.
+
+    The `ParamInfo` of each dropped value is updated in place with a
+    `data_ref` to the checkpoint already holding its data.
+
+    Args:
+      directory: save location directory.
+      batch_requests: requests for all values being saved.
+
+    Returns:
+      The requests that still need to be written, and the records to keep once
+      this save is committed.
+    """
+    if isinstance(directory, path_types.PathAwaitingCreation):
+      directory = directory.path
+    final_dir = data_references.get_final_path(directory)
+    items = [
+        (key, value, info, arg)
+        for request in batch_requests
+        for key, value, info, arg in zip(
+            request.keys, request.values, request.infos, request.args
+        )
+    ]
+    fingerprints = fingerprint_lib.fingerprint_values(
+        [value for _, value, _, _ in items]
+    )
+
+    previous_records = self._incremental_records
+    data_dir_exists = {}
+    records = {}
+    unchanged = set()
+    for (key, _, info, arg), value_fingerprint in zip(items, fingerprints):
+      if value_fingerprint is None:
+        continue
+      value_fingerprint = (value_fingerprint, info.value_typestr, repr(arg))
+      data_dir = final_dir
+      previous = previous_records.get(key)
+      if (
+          previous is not None
+          and previous.fingerprint == value_fingerprint
+          and previous.data_dir != final_dir
+      ):
+        if previous.data_dir not in data_dir_exists:
+          data_dir_exists[previous.data_dir] = await async_path.exists(
+              previous.data_dir
+          )
+        data_ref = data_references.relative_reference(
+            final_dir, previous.data_dir
+        )
+        if data_dir_exists[previous.data_dir] and data_ref is not None:
+          info.data_ref = data_ref
+          data_dir = previous.data_dir
+          unchanged.add(key)
+      records[key] = _IncrementalRecord(value_fingerprint, data_dir)
+
+    logging.info(
+        '[process=%s] Incremental save to %s: skipping %d of %d values that'
+        ' are unchanged since the previous save.',
+        multihost.process_index(),
+        final_dir,
+        len(unchanged),
+        len(items),
+    )
+    return _exclude_batch_requests(batch_requests, unchanged), records
+
   async def async_save(
       self,
       directory: epath.Path | path_types.PathAwaitingCreation,
@@ -650,7 +919,7 @@ class BasePyTreeCheckpointHandler(
     custom_metadata = args.custom_metadata
 
     save_args = _fill_missing_save_or_restore_args(item, save_args, mode='save')
-    byte_limiter = limits.get_byte_limiter(self._save_concurrent_bytes)
+    byte_limiter = limits.get_save_byte_limiter(self._save_concurrent_bytes)
 
     device_host_concurrent_bytes = self._save_device_host_concurrent_bytes
     if device_host_concurrent_bytes == 'auto':
@@ -659,11 +928,11 @@ class BasePyTreeCheckpointHandler(
               self._current_device_host_limit_bytes
           )
       )
-      device_host_byte_limiter = limits.get_byte_limiter(
+      device_host_byte_limiter = limits.get_save_byte_limiter(
           self._current_device_host_limit_bytes
       )
     else:
-      device_host_byte_limiter = limits.get_byte_limiter(
+      device_host_byte_limiter = limits.get_save_byte_limiter(
           device_host_concurrent_bytes  # pyrefly: ignore[bad-argument-type]
       )
     param_infos = self._get_param_infos(
@@ -690,10 +959,15 @@ class BasePyTreeCheckpointHandler(
     )
 
     batch_requests_ready_time = time.time()
+    incremental_records = None
     if args.partial_save_mode:
       requests_to_save = await self._async_partial_save(
           directory, item, batch_requests  # pyrefly: ignore[bad-argument-type]
       )
+    elif self._enable_incremental_save:
+      requests_to_save, incremental_records = (
+          await self._skip_unchanged_values(directory, batch_requests)
+      )
     else:
       requests_to_save = batch_requests
 
@@ -721,6 +995,15 @@ class BasePyTreeCheckpointHandler(
               name='write_metadata_after_commits',
           )
       )
+    elif self._array_metadata_store is not None:
+      save_futures.append(
+          future.CommitFutureAwaitingContractedSignals(
+              self._flush_array_metadatas_after_commits(
+                  commit_futures, param_infos
+              ),
+              name='flush_array_metadatas_after_commits',
+          )
+      )
     else:
       save_futures += commit_futures
 
@@ -733,19 +1016,19 @@ class BasePyTreeCheckpointHandler(
         '/jax/orbax/write/blocking_gbytes_per_sec',
         primary_host=self._primary_host,
     )
-    chained_futures = [
-        future.ChainedFuture(
-            save_futures,
-            functools.partial(
-                async_io_engine.log_io_metrics,
-                tree_memory_size,
-                start_time,
-                '/jax/orbax/write/gbytes_per_sec',
-                '/jax/orbax/write/gbytes',
-                primary_host=self._primary_host,
-            ),
-        )
-    ]
+
+    def _on_commit():
+      async_io_engine.log_io_metrics(
+          tree_memory_size,
+          start_time,
+          '/jax/orbax/write/gbytes_per_sec',
+          '/jax/orbax/write/gbytes',
+          primary_host=self._primary_host,
+      )
+      if incremental_records is not None:
+        self._incremental_records = incremental_records
+
+    chained_futures = [future.ChainedFuture(save_futures, _on_commit)]
     jax.monitoring.record_event_duration_secs(
         '/jax/orbax/write/async/tree_mapping_duration_secs',
         batch_requests_ready_time - start_time,
@@ -1001,9 +1284,21 @@ class BasePyTreeCheckpointHandler(
       raise FileNotFoundError(
           f'Requested directory for restore does not exist at {directory}'
       )
+    # Prep for restore.
+    serialized_item = tree_metadata.serialize_tree(
+        item, self._pytree_metadata_options
+    )
+    # Partial restores only need metadata of the requested subtrees.
+    keypath_prefixes = None
+    if item is not None and args.partial_restore:
+      keypath_prefixes = tree_index.keypath_prefixes(
+          serialized_item, is_leaf=tree_utils.is_empty_or_leaf
+      )
     # Get value metadata tree and use_zarr3 from serialized pytree metadata.
     internal_tree_metadata = asyncio_utils.run_sync(
-        self._read_metadata_file(directory)
+        self._read_metadata_file(
+            directory, keypath_prefixes=keypath_prefixes
+        )
     )
     value_metadata_tree = internal_tree_metadata.as_nested_tree()
     if not value_metadata_tree:
@@ -1024,10 +1319,6 @@ class BasePyTreeCheckpointHandler(
         internal_tree_metadata.store_array_data_equal_to_fill_value
     )
     del internal_tree_metadata
-    # Prep for restore.
-    serialized_item = tree_metadata.serialize_tree(
-        item, self._pytree_metadata_options
-    )
     if item is None:
       item = value_metadata_tree
     elif args.partial_restore:
@@ -1138,35 +1429,52 @@ class BasePyTreeCheckpointHandler(
     """
     if not utils.is_primary_host(self._primary_host):
       return param_infos
-    # Extract write_shape from ArrayMetadata for current process_index.
+    # Extract write_shape from ArrayMetadata for current process_index. Values
+    # skipped by an incremental save use the ArrayMetadata of the referenced
+    # checkpoint.
     process_index = multihost.process_index()
-    array_metadatas = await array_metadata_store.read(
-        checkpoint_dir, process_index=process_index
-    )
-    if array_metadatas is None:
-      jax_array_param_info = type_handlers.any_jax_array_param_info(param_infos)
-      if jax_array_param_info is not None:
-        raise ValueError(
-            f'No ArrayMetadata found for process_index={process_index} in the'
-            f' checkpoint directory: {checkpoint_dir}. But input PyTree'
-            ' contains at least one jax.Array param_info:'
-            f' {jax_array_param_info}.'
+    data_ref_dirs = {None: checkpoint_dir}
+    for info in jax.tree.leaves(param_infos):
+      if info.data_ref is not None and info.data_ref not in data_ref_dirs:
+        data_ref_dirs[info.data_ref] = data_references.resolve_reference(
+            checkpoint_dir, info.data_ref
         )
-      return param_infos
-
-    assert isinstance(array_metadatas, list)
-    array_metadatas_cache = {
-        array_metadata.param_name: array_metadata
-        for array_metadata in array_metadatas
-    }
+    array_metadatas_caches = {}
+    for data_ref, data_dir in data_ref_dirs.items():
+      array_metadatas = await array_metadata_store.read(
+          data_dir, process_index=process_index
+      )
+      if array_metadatas is None:
+        jax_array_param_info = type_handlers.any_jax_array_param_info(
+            [
+                info
+                for info in jax.tree.leaves(param_infos)
+                if info.data_ref == data_ref
+            ]
+        )
+        if jax_array_param_info is not None:
+          raise ValueError(
+              f'No ArrayMetadata found for process_index={process_index} in'
+              f' the checkpoint directory: {data_dir}. But input PyTree'
+              ' contains at least one jax.Array param_info:'
+              f' {jax_array_param_info}.'
+          )
+        array_metadatas = []
+      assert isinstance(array_metadatas, list)
+      array_metadatas_caches[data_ref] = {
+          array_metadata.param_name: array_metadata
+          for array_metadata in array_metadatas
+      }
 
     def update_param_info(param_info: types.ParamInfo) -> types.ParamInfo:
       if not type_handlers.represents_jax_array(param_info):
         return param_info
+      array_metadatas_cache = array_metadatas_caches[param_info.data_ref]
       if param_info.name not in array_metadatas_cache:
         raise ValueError(
             f'No ArrayMetadata found for param_info: {param_info}, checkpoint'
-            f' directory: {checkpoint_dir}, process_index={process_index}.'
+            f' directory: {data_ref_dirs[param_info.data_ref]},'
+            f' process_index={process_index}.'
         )
       return param_info.replace(
           write_shape=array_metadatas_cache[param_info.name].write_shape
@@ -1202,10 +1510,21 @@ class BasePyTreeCheckpointHandler(
           path,
           self._pytree_metadata_options,
       )
-      await async_path.write_text(
-          path,
-          json.dumps(metadata_content.to_json()),
-      )
+      json_content = json.dumps(metadata_content.to_json())
+      await async_path.write_text(path, json_content)
+      if self._pytree_metadata_options.write_metadata_index:
+        if tree_index.can_serialize(metadata_content):
+          await async_path.write_bytes(
+              directory / tree_index.PYTREE_METADATA_INDEX_FILE,
+              tree_index.serialize(
+                  metadata_content,
+                  source_size=len(json_content.encode('utf-8')),
+              ),
+          )
+        else:
+          logging.warning(
+              'Pytree metadata cannot be indexed, only writing %s.', path
+          )
       jax.monitoring.record_event_duration_secs(
           '/jax/checkpoint/write/async/metadata_write_duration_secs',
           time.time() - metadata_write_start_time,
@@ -1215,6 +1534,18 @@ class BasePyTreeCheckpointHandler(
           time.time() - metadata_write_start_time,
       )
 
+  async def _flush_array_metadatas_after_commits(
+      self, commit_futures: List[future.Future], param_infos: PyTree
+  ) -> None:
+    """Writes the ArrayMetadata of this process once its commits complete."""
+    for commit_future in commit_futures:
+      await asyncio.to_thread(commit_future.result)
+    await asyncio.gather(
+        *[info.await_path_creation() for info in jax.tree.leaves(param_infos)]
+    )
+    checkpoint_dir = jax.tree.leaves(param_infos)[0].parent_dir
+    await self._array_metadata_store.flush(checkpoint_dir)
+
   async def _write_metadata_after_commits(
       self,
       commit_futures: List[future.Future],
@@ -1246,6 +1577,7 @@ class BasePyTreeCheckpointHandler(
     # BasePyTreeCheckpointHandler should delegate all metadata related code to
     # that class.
     if self._array_metadata_store is not None:
+      await self._array_metadata_store.flush(checkpoint_dir)
       param_infos = await self._get_param_infos_with_write_shape(
           param_infos, checkpoint_dir, self._array_metadata_store
       )
@@ -1260,6 +1592,15 @@ class BasePyTreeCheckpointHandler(
             use_zarr3=use_zarr3,
         )
     ]
+    data_refs = {
+        info.data_ref
+        for info in jax.tree.leaves(param_infos)
+        if info.data_ref is not None
+    }
+    if data_refs:
+      tasks.append(
+          data_references.write_references(checkpoint_dir, data_refs)
+      )
     await asyncio.gather(*tasks)
 
     end_time = time.time()
@@ -1273,13 +1614,50 @@ class BasePyTreeCheckpointHandler(
         end_time - commit_time,
     )
 
+  async def _read_metadata_index(
+      self,
+      directory: epath.Path,
+      keypath_prefixes: Optional[Sequence[Sequence[str]]],
+  ) -> Optional[tree_metadata.InternalTreeMetadata]:
+    """Reads metadata from the index file, if present and up to date."""
+    if self._pytree_metadata_options.support_rich_types:
+      return None
+    path = directory / tree_index.PYTREE_METADATA_INDEX_FILE
+    if not await async_path.exists(path):
+      return None
+    index = tree_index.TreeMetadataIndex(await async_path.read_bytes(path))
+    stat = await async_path.async_stat(directory / PYTREE_METADATA_FILE)
+    if stat.length != index.source_size:
+      logging.warning(
+          'Ignoring stale pytree metadata index: %s does not match %s.',
+          path,
+          PYTREE_METADATA_FILE,
+      )
+      return None
+    logging.vlog(
+        1,
+        'Reading pytree metadata index: %s with keypath_prefixes: %s',
+        path,
+        keypath_prefixes,
+    )
+    return index.as_internal_tree_metadata(
+        prefixes=keypath_prefixes,
+        pytree_metadata_options=self._pytree_metadata_options,
+    )
+
   async def _read_metadata_file(
-      self, directory: epath.Path
+      self,
+      directory: epath.Path,
+      *,
+      keypath_prefixes: Optional[Sequence[Sequence[str]]] = None,
   ) -> tree_metadata.InternalTreeMetadata:
     """Reads metadata file and returns a tree of restore types.
 
     Args:
       directory: directory
+      keypath_prefixes: If provided, entries that are not at or below one of
+        these keypaths may be omitted from the result. Only honored when the
+        metadata index is present.
 
     Returns:
       orbax.checkpoint.metadata.InternalTreeMetadata
@@ -1293,16 +1671,18 @@ class BasePyTreeCheckpointHandler(
           f'Metadata file (named {PYTREE_METADATA_FILE}) does not exist at'
           f' {directory}.'
       )
-    logging.vlog(
-        1,
-        'Reading pytree metadata file: %s with pytree_metadata_options: %s',
-        path,
-        self._pytree_metadata_options,
-    )
-    metadata = tree_metadata.InternalTreeMetadata.from_json(
-        json.loads(await async_path.read_text(path)),
-        pytree_metadata_options=self._pytree_metadata_options,
-    )
+    metadata = await self._read_metadata_index(directory, keypath_prefixes)
+    if metadata is None:
+      logging.vlog(
+          1,
+          'Reading pytree metadata file: %s with pytree_metadata_options: %s',
+          path,
+          self._pytree_metadata_options,
+      )
+      metadata = tree_metadata.InternalTreeMetadata.from_json(
+          json.loads(await async_path.read_text(path)),
+          pytree_metadata_options=self._pytree_metadata_options,
+      )
 
     # Log the read event for the checkpoint to the DM log.
     event_tracking.record_read_metadata_event(directory)
@@ -1415,6 +1795,10 @@ class BasePyTreeCheckpointHandler(
     """
     asyncio_utils.run_sync(self._finalize_async(directory))
 
+  def close(self):
+    """Closes the handler, releasing its pooled host buffers."""
+    self._host_buffer_pool.clear()
+
 
 @register_with_handler(BasePyTreeCheckpointHandler, for_save=True)
 @dataclasses.dataclass
@@ -503,6 +503,11 @@ class CompositeCheckpointHandler(AsyncCheckpointHandler):
     self._async_options = (
         composite_options.async_options or options_lib.AsyncOptions()
     )
+    # Item temporary paths of saves that have not been finalized, by step
+    # directory. Several saves may be committing at the same time.
+    self._temporary_paths_by_directory: Dict[
+        str, Dict[str, atomicity_types.TemporaryPath]
+    ] = {}
     logging.info(
         'Initialized registry %s.',
         self._handler_registry,
@@ -676,6 +681,9 @@ class CompositeCheckpointHandler(AsyncCheckpointHandler):
     self._current_temporary_paths = self._get_item_temporary_paths(
         directory, args
     )
+    self._temporary_paths_by_directory[str(directory)] = (
+        self._current_temporary_paths
+    )
     commit_futures = []
     if self._async_options.create_directories_asynchronously:
       commit_futures.append(
@@ -1037,12 +1045,15 @@ class CompositeCheckpointHandler(AsyncCheckpointHandler):
     )
 
   def finalize(self, directory: epath.Path):
-    if not self._current_temporary_paths:
+    temporary_paths = self._temporary_paths_by_directory.pop(
+        str(directory), self._current_temporary_paths
+    )
+    if not temporary_paths:
       raise ValueError('finalize() called before any items were saved.')
     for item_name, handler in _get_unique_registered_items_and_handlers(
         self._handler_registry
     ):
-      tmp_dir = self._current_temporary_paths.get(item_name, None)
+      tmp_dir = temporary_paths.get(item_name, None)
       if tmp_dir is None or handler is None:
         # Not an error, as some items may not have been saved.
         continue
@@ -1055,7 +1066,7 @@ class CompositeCheckpointHandler(AsyncCheckpointHandler):
       )
 
       # Remove the temporary path once it has been finalized.
-      self._current_temporary_paths.pop(item_name)
+      temporary_paths.pop(item_name)
 
   def close(self):
     for _, handler in _get_unique_registered_items_and_handlers(
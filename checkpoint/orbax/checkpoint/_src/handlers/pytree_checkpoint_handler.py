@@ -43,6 +43,7 @@ from orbax.checkpoint._src.handlers import base_pytree_checkpoint_handler
 from orbax.checkpoint._src.metadata import array_metadata_store as array_metadata_store_lib
 from orbax.checkpoint._src.metadata import empty_values
 from orbax.checkpoint._src.metadata import tree as tree_metadata
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import format_utils
 from orbax.checkpoint._src.path import types as path_types
 from orbax.checkpoint._src.serialization import limits
@@ -261,14 +262,19 @@ def _get_restore_parameters(
     ):
       # Empty node, ParamInfo should not be returned.
       return meta_or_value
-    elif not isinstance(meta_or_value, tree_metadata.ValueMetadataEntry):
+    parent_dir = directory
+    data_ref = None
+    if not isinstance(meta_or_value, tree_metadata.ValueMetadataEntry):
       # Aggregated value.
       skip_deserialize = True
     else:
       skip_deserialize = meta_or_value.skip_deserialize
+      if meta_or_value.data_ref is not None:
+        data_ref = meta_or_value.data_ref
+        parent_dir = data_references.resolve_reference(directory, data_ref)
     return ParamInfo(
         name=name,
-        parent_dir=directory,
+        parent_dir=parent_dir,
         skip_deserialize=skip_deserialize,
         is_ocdbt_checkpoint=is_ocdbt_checkpoint,
         byte_limiter=byte_limiter,
@@ -277,6 +283,7 @@ def _get_restore_parameters(
         # Skip raising array data missing error on this code path, since it
         # almost exclusively handles legacy use cases.
         raise_array_data_missing_error=False,
+        data_ref=data_ref,
     )
 
   if partial_restore:
@@ -521,6 +528,8 @@ class PyTreeCheckpointHandler(
       is_prioritized_key_fn: Optional[
           serialization_types.IsPrioritizedKeyFn
       ] = None,
+      enable_incremental_save: bool = False,
+      host_buffer_pool_gb: Optional[int] = None,
   ):
     """Creates PyTreeCheckpointHandler.
 
@@ -575,6 +584,13 @@ class PyTreeCheckpointHandler(
         not prioritized. Note that any "prioritized" keys are assumed to be
         lightweight, and `save_device_host_concurrent_gb` will be ignored for
         them.
+      enable_incremental_save: If True, arrays unchanged since the previous
+        save by this handler are not written again, and the checkpoint
+        references the checkpoint holding their data instead. See
+        `BasePyTreeCheckpointHandler`.
+      host_buffer_pool_gb: The budget in GB of the pool of host buffers reused
+        across saves. `None` uses a default budget, and 0 disables the pool.
+        See `BasePyTreeCheckpointHandler`.
     """
 
     self._aggregate_handler = MsgpackHandler(
@@ -611,9 +627,18 @@ class PyTreeCheckpointHandler(
         array_metadata_validator=array_metadata_validator,
         enable_pinned_host_transfer=enable_pinned_host_transfer,
         is_prioritized_key_fn=is_prioritized_key_fn,
+        enable_incremental_save=enable_incremental_save,
+        host_buffer_pool_bytes=_concurrent_bytes(  # pyrefly: ignore[bad-argument-type]
+            host_buffer_pool_gb, use_default_if_none=False
+        ),
     )
     self._pytree_metadata_options = pytree_metadata_options
 
+  @property
+  def enable_incremental_save(self) -> bool:
+    """Whether saves reference unchanged data in earlier checkpoints."""
+    return self._handler_impl.enable_incremental_save
+
   async def async_save(
       self,
       directory: epath.Path | path_types.PathAwaitingCreation,
@@ -19,6 +19,7 @@ import copy
 import dataclasses
 import datetime
 import functools
+import gc
 import json
 import re
 import threading
@@ -54,9 +55,11 @@ from orbax.checkpoint._src.metadata import array_metadata_store as array_metadat
 from orbax.checkpoint._src.metadata import empty_values
 from orbax.checkpoint._src.metadata import sharding as sharding_metadata
 from orbax.checkpoint._src.metadata import tree as tree_metadata
+from orbax.checkpoint._src.metadata import tree_index
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import atomicity
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.serialization import limits
 from orbax.checkpoint._src.serialization import replica_slices
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
@@ -168,6 +171,7 @@ class PyTreeCheckpointHandlerTest(
           ARRAY_METADATA_STORE
       ),
       use_compression: bool = True,
+      enable_incremental_save: bool = False,
   ):
     """Registers handlers with OCDBT support and resets when done."""
     handler_registry = copy.deepcopy(
@@ -184,6 +188,7 @@ class PyTreeCheckpointHandlerTest(
         pytree_metadata_options=pytree_metadata_options,
         enable_pinned_host_transfer=enable_pinned_host_transfer,
         use_compression=use_compression,
+        enable_incremental_save=enable_incremental_save,
     )
     try:
       yield handler
@@ -2060,6 +2065,7 @@ class PyTreeCheckpointHandlerTest(
         min_slice_bytes_for_replica_parallel,
         max_replicas_for_replica_parallel,
         enable_pinned_host_transfer,
+        host_buffer_pool,
     ):
       nonlocal true_count, false_count
       if enable_pinned_host_transfer:
@@ -2073,6 +2079,7 @@ class PyTreeCheckpointHandlerTest(
           min_slice_bytes_for_replica_parallel=min_slice_bytes_for_replica_parallel,
           max_replicas_for_replica_parallel=max_replicas_for_replica_parallel,
           enable_pinned_host_transfer=enable_pinned_host_transfer,
+          host_buffer_pool=host_buffer_pool,
       )
 
     with mock.patch.object(
@@ -2227,6 +2234,103 @@ class PyTreeCheckpointHandlerTest(
           expected_tree_with_write_shapes, tree_with_write_shapes
       )
 
+  @parameterized.product(use_ocdbt=(True, False))
+  def test_incremental_save(self, use_ocdbt: bool):
+    """Test case."""
+    first = self.directory / 'first'
+    second = self.directory / 'second'
+    third = self.directory / 'third'
+    for directory in (first, second, third):
+      directory.mkdir(exist_ok=True)
+    with self.ocdbt_checkpoint_handler(
+        use_ocdbt, enable_incremental_save=True
+    ) as checkpoint_handler:
+      checkpoint_handler.save(first, args=PyTreeSaveArgs(self.pytree))
+      checkpoint_handler.finalize(first)
+      updated = dict(self.pytree, a=self.pytree['a'] + 1)
+      checkpoint_handler.save(second, args=PyTreeSaveArgs(updated))
+      checkpoint_handler.finalize(second)
+
+      internal_metadata = tree_metadata.InternalTreeMetadata.from_json(
+          json.loads((second / PYTREE_METADATA_FILE).read_text())
+      )
+      data_refs = {
+          entry.keypath: entry.value_metadata.data_ref
+          for entry in internal_metadata.tree_metadata_entries
+      }
+      self.assertEqual(
+          {
+              "('a',)": None,
+              "('b',)": '../first',
+              "('c', 'a')": '../first',
+              "('c', 'e')": '../first',
+          },
+          data_refs,
+      )
+      self.assertEqual(
+          ['../first'],
+          json.loads(
+              (second / data_references.DATA_REFERENCES_FILE).read_text()
+          ),
+      )
+      if not use_ocdbt:
+        self.assertTrue((second / 'a').exists())
+        self.assertFalse((second / 'b').exists())
+
+      self.validate_save(
+          second, updated, checkpoint_handler, restore_args=self.restore_args
+      )
+      metadata = checkpoint_handler.metadata(second)
+      self.assertEqual((2,), metadata.tree['b'].storage.write_shape)
+
+      # Referenced data that no longer exists is written again.
+      test_utils.sync_global_processes('test_incremental_save:validated')
+      if multihost.process_index() == 0:
+        first.rmtree()
+      test_utils.sync_global_processes('test_incremental_save:deleted')
+      checkpoint_handler.save(third, args=PyTreeSaveArgs(updated))
+      checkpoint_handler.finalize(third)
+      self.assertEqual(
+          ['../second'],
+          json.loads(
+              (third / data_references.DATA_REFERENCES_FILE).read_text()
+          ),
+      )
+      self.validate_save(
+          third, updated, checkpoint_handler, restore_args=self.restore_args
+      )
+
+  def test_save_reuses_pooled_pinned_host_buffers(self):
+    """Test case."""
+    checkpoint_handler = PyTreeCheckpointHandler(
+        enable_pinned_host_transfer=True, host_buffer_pool_gb=1
+    )
+    self.addCleanup(checkpoint_handler.close)
+    pool = checkpoint_handler._handler_impl._host_buffer_pool
+    self.assertEqual(10**9, pool.max_bytes)
+
+    for name in ('first', 'second'):
+      directory = self.directory / name
+      directory.mkdir(exist_ok=True)
+      checkpoint_handler.save(directory, args=PyTreeSaveArgs(self.pytree))
+      checkpoint_handler.finalize(directory)
+      self.validate_save(
+          directory,
+          self.pytree,
+          checkpoint_handler,
+          restore_args=self.restore_args,
+      )
+      # Host buffers return to the pool once their host values are released.
+      gc.collect()
+    # The second save copied into the host buffers of the first.
+    self.assertGreater(pool.hits, 0)
+
+  def test_host_buffer_pool_disabled(self):
+    """Test case."""
+    checkpoint_handler = PyTreeCheckpointHandler(host_buffer_pool_gb=0)
+    self.addCleanup(checkpoint_handler.close)
+    self.assertFalse(checkpoint_handler._handler_impl._host_buffer_pool.enabled)
+
   @parameterized.product(use_ocdbt=(True, False))
   def test_array_metadata_disabled(self, use_ocdbt: bool):
     """Test case."""
@@ -2763,6 +2867,77 @@ class PyTreeCheckpointHandlerTest(
       )
       test_utils.assert_tree_equal(self, expected, restored)
 
+  @parameterized.product(use_ocdbt=(True, False))
+  def test_partial_restore_with_metadata_index(self, use_ocdbt: bool):
+    directory = self.directory / 'partial_restore'
+    directory.mkdir(parents=True, exist_ok=True)
+    pytree = {'a': 0, 'b': [1, 2], 'c': {'a': 3, 'b': 4}}
+    pytree_metadata_options = tree_metadata.PyTreeMetadataOptions(
+        write_metadata_index=True
+    )
+
+    with self.ocdbt_checkpoint_handler(
+        use_ocdbt=use_ocdbt, pytree_metadata_options=pytree_metadata_options
+    ) as handler:
+      handler.save(directory, pytree)
+      self.assertTrue(
+          (directory / tree_index.PYTREE_METADATA_INDEX_FILE).exists()
+      )
+
+      with mock.patch.object(
+          tree_index.TreeMetadataIndex,
+          'as_internal_tree_metadata',
+          autospec=True,
+          side_effect=tree_index.TreeMetadataIndex.as_internal_tree_metadata,
+      ) as mock_as_internal_tree_metadata:
+        restored = handler.restore(
+            directory,
+            args=PyTreeRestoreArgs(
+                item={'b': [0, 0], 'c': {'a': 0}}, partial_restore=True
+            ),
+        )
+        _, kwargs = mock_as_internal_tree_metadata.call_args
+        self.assertEqual(kwargs['prefixes'], [['b'], ['c', 'a']])
+      test_utils.assert_tree_equal(self, {'b': [1, 2], 'c': {'a': 3}}, restored)
+      test_utils.assert_tree_equal(self, pytree, handler.restore(directory))
+      self.assertEqual(handler.metadata(directory).tree.keys(), {'a', 'b', 'c'})
+
+      # A stale index is ignored.
+      metadata_file = directory / PYTREE_METADATA_FILE
+      metadata_file.write_text(metadata_file.read_text() + ' ')
+      with mock.patch.object(
+          tree_index.TreeMetadataIndex, 'as_internal_tree_metadata'
+      ) as mock_as_internal_tree_metadata:
+        test_utils.assert_tree_equal(self, pytree, handler.restore(directory))
+        mock_as_internal_tree_metadata.assert_not_called()
+
+  def test_param_info_plan_is_reused(self):
+    pytree = {'a': np.arange(8), 'b': [1, None, {}], 'c': {'d': 'text'}}
+    updated = {'a': np.arange(8) + 1, 'b': [2, None, {}], 'c': {'d': 'other'}}
+
+    with self.ocdbt_checkpoint_handler(use_ocdbt=True) as handler:
+      with mock.patch.object(
+          type_handler_registry,
+          'get_param_typestr',
+          autospec=True,
+          side_effect=type_handler_registry.get_param_typestr,
+      ) as mock_get_param_typestr:
+        handler.save(self.directory / '0', pytree)
+        num_calls = mock_get_param_typestr.call_count
+        self.assertGreater(num_calls, 0)
+        handler.save(self.directory / '1', updated)
+        self.assertEqual(mock_get_param_typestr.call_count, num_calls)
+        # A different leaf type requires a new plan.
+        handler.save(self.directory / '2', dict(updated, a=1.0))
+        self.assertGreater(mock_get_param_typestr.call_count, num_calls)
+
+      test_utils.assert_tree_equal(
+          self, pytree, handler.restore(self.directory / '0')
+      )
+      test_utils.assert_tree_equal(
+          self, updated, handler.restore(self.directory / '1')
+      )
+
   @parameterized.product(use_ocdbt=(True, False))
   def test_partial_restore_with_omission_empty_container(self, use_ocdbt: bool):
     """Basic save and restore test."""
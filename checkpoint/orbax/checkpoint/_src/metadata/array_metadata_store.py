@@ -29,6 +29,7 @@ from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.serialization import types
 
 
+
 class PathResolver:
   """Resolves paths for the ArrayMetadata store read and write."""
 
@@ -129,7 +130,12 @@ class Serializer:
 
 
 class Store:
-  """Storage for `array_metadata.ArrayMetadata` (not value.ArrayMetadata)."""
+  """Storage for `array_metadata.ArrayMetadata` (not value.ArrayMetadata).
+
+  Each process keeps all of its metadata in a single file. Metadata written
+  while a checkpoint is saved is accumulated in memory, and the file is written
+  once by `flush()`, when the checkpoint is committed.
+  """
 
   def __init__(
       self,
@@ -142,6 +148,25 @@ class Store:
     self._serializer = serializer
     self._primary_host = primary_host
     self._write_timeout_secs = write_timeout_secs
+    self._init_pending()
+
+  def _init_pending(self) -> None:
+    self._pending_lock = threading.Lock()
+    # Metadata not flushed yet, by checkpoint directory and process index.
+    self._pending: dict[
+        str, dict[int, Tuple[epath.Path, List[array_metadata_lib.ArrayMetadata]]]
+    ] = {}
+
+  def __getstate__(self) -> dict[str, Any]:
+    # Copies do not share locks or pending metadata.
+    state = self.__dict__.copy()
+    del state['_pending_lock']
+    del state['_pending']
+    return state
+
+  def __setstate__(self, state: dict[str, Any]) -> None:
+    self.__dict__.update(state)
+    self._init_pending()
 
   def set_primary_host(self, primary_host: int | None) -> None:
     """Sets the primary host."""
@@ -179,9 +204,10 @@ class Store:
       array_metadatas: Sequence[array_metadata_lib.ArrayMetadata],
       process_index: int,
   ) -> None:
-    """Writes `array_metadatas` to a file under `checkpoint_dir`.
+    """Adds `array_metadatas` to the metadata under `checkpoint_dir`.
 
-    See `PathResolver.get_write_file_path()` for the file path resolution.
+    See `PathResolver.get_write_file_path()` for the file path resolution. The
+    metadata is accumulated in memory until `flush()` writes it.
 
     Args:
       checkpoint_dir: The base path containing metadata for each process.
@@ -191,29 +217,49 @@ class Store:
     file_path = self._path_resolver.get_write_file_path(
         checkpoint_dir, process_index
     )
-    await self._maybe_create_base_dir(file_path.parent)
-    if await async_path.exists(file_path):
-      _, all_array_metadatas = await self._get_array_metadatas(file_path)
-      all_array_metadatas.extend(array_metadatas)  # pyrefly: ignore[bad-argument-type]
-    else:
-      all_array_metadatas = array_metadatas
-    await async_path.write_text(
-        file_path, self._serializer.serialize(all_array_metadatas)  # pyrefly: ignore[bad-argument-type]
-    )
-    logging.info(
-        '[process=%s][thread=%s] Wrote %d array_metadata.ArrayMetadata to %s',
-        multihost.process_index(),
-        threading.current_thread().name,
-        len(array_metadatas),
-        file_path,
-    )
+    with self._pending_lock:
+      pending = self._pending.setdefault(str(checkpoint_dir), {})
+      pending.setdefault(process_index, (file_path, []))[1].extend(
+          array_metadatas
+      )
 
-  async def _get_array_metadatas(
-      self,
-      array_metadatas_file_path: epath.Path,
-  ) -> Tuple[epath.Path, list[array_metadata_lib.SerializedArrayMetadata]]:
-    serialized = await async_path.read_text(array_metadatas_file_path)
-    return array_metadatas_file_path, self._serializer.deserialize(serialized)
+  async def flush(self, checkpoint_dir: epath.Path) -> None:
+    """Writes the metadata added under `checkpoint_dir` since the last flush.
+
+    Every process flushes its own metadata once its writes are complete,
+    typically when the checkpoint is committed.
+
+    Args:
+      checkpoint_dir: The base path containing metadata for each process.
+    """
+    with self._pending_lock:
+      pending = self._pending.pop(str(checkpoint_dir), {})
+    for file_path, array_metadatas in pending.values():
+      await self._maybe_create_base_dir(file_path.parent)
+      if await async_path.exists(file_path):
+        # Metadata flushed earlier for the same checkpoint.
+        existing = self._serializer.deserialize(
+            await async_path.read_text(file_path)
+        )
+        array_metadatas = [*existing, *array_metadatas]
+      await async_path.write_text(
+          file_path, self._serializer.serialize(array_metadatas)
+      )
+      logging.info(
+          '[process=%s][thread=%s] Wrote %d array_metadata.ArrayMetadata to'
+          ' %s',
+          multihost.process_index(),
+          threading.current_thread().name,
+          len(array_metadatas),
+          file_path,
+      )
+
+  async def _read_serialized(
+      self, array_metadatas_file_path: epath.Path
+  ) -> Tuple[epath.Path, str]:
+    return array_metadatas_file_path, await async_path.read_text(
+        array_metadatas_file_path
+    )
 
   async def read(
       self,
@@ -240,6 +286,8 @@ class Store:
       raise ValueError(
           f'Checkpoint directory does not exist: {checkpoint_dir}.'
       )
+    # Metadata written by this store is readable before the commit.
+    await self.flush(checkpoint_dir)
     start_time = time.time()
     file_paths = await self._path_resolver.get_read_file_paths(
         checkpoint_dir, process_index
@@ -259,7 +307,8 @@ class Store:
       return None
 
     if isinstance(file_paths, epath.Path):
-      _, result = await self._get_array_metadatas(file_paths)
+      _, serialized = await self._read_serialized(file_paths)
+      result = self._serializer.deserialize(serialized)
       logging.vlog(
           1,
           '[process=%s][thread=%s] Read %s metadata from metadata path=%s.'
@@ -272,14 +321,20 @@ class Store:
       )
       return result
 
-    getter_coros = []
-    for file_path in file_paths:
-      getter_coros.append(self._get_array_metadatas(file_path))
-    path_metadatas_pairs = await asyncio.gather(*getter_coros)
-    result = {
-        self._path_resolver.get_process_index(file_path): metadatas
-        for file_path, metadatas in path_metadatas_pairs
-    }
+    path_serialized_pairs = await asyncio.gather(
+        *[self._read_serialized(file_path) for file_path in file_paths]
+    )
+    # Processes usually write identical metadata. Each distinct content is
+    # deserialized once, and processes with identical content share the same
+    # (read-only) list.
+    deserialized = {}
+    result = {}
+    for file_path, serialized in path_serialized_pairs:
+      if serialized not in deserialized:
+        deserialized[serialized] = self._serializer.deserialize(serialized)
+      result[self._path_resolver.get_process_index(file_path)] = deserialized[
+          serialized
+      ]
     if not result:
       logging.info(
           '[process=%s][thread=%s] No metadata found for any process_index,'
@@ -378,7 +433,11 @@ class Validator:
         for array_metadata in ref_process_array_metadatas
     }
     for process_index, process_array_metadatas in array_metadatas.items():
-      if process_index == ref_process_index:
+      if (
+          process_index == ref_process_index
+          or process_array_metadatas is ref_process_array_metadatas
+          or process_array_metadatas == ref_process_array_metadatas
+      ):
         continue
       process_cache = {
           array_metadata.param_name: array_metadata
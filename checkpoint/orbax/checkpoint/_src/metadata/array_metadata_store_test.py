@@ -14,8 +14,11 @@
 
 """Tests for `array_metadata_store` module."""
 
+import copy
+import json
 from typing import List
 import unittest
+from unittest import mock
 from absl.testing import absltest
 from absl.testing import parameterized
 from etils import epath
@@ -187,6 +190,137 @@ class StoreTest(parameterized.TestCase, unittest.IsolatedAsyncioTestCase):
         },
     )
 
+  async def test_written_file_is_a_single_unversioned_document(self):
+    await self.store.write(
+        self.checkpoint_dir,
+        [
+            array_metadata_lib.ArrayMetadata(
+                param_name=param_name,
+                shape=(2,),
+                dtype=np.dtype(int),
+                write_shape=(2,),
+                chunk_shape=(1,),
+                use_ocdbt=False,
+                use_zarr3=False,
+            )
+            for param_name in ('a', 'b')
+        ],
+        process_index=0,
+    )
+    await self.store.flush(self.checkpoint_dir)
+
+    # Readable by earlier versions, which load the file as one JSON document.
+    self.assertEqual(
+        json.loads(
+            (self.checkpoint_dir / 'array_metadatas' / 'process_0').read_text()
+        ),
+        {
+            'array_metadatas': [
+                {
+                    'array_metadata': {
+                        'param_name': param_name,
+                        'write_shape': [2],
+                        'chunk_shape': [1],
+                        'ext_metadata': None,
+                    }
+                }
+                for param_name in ('a', 'b')
+            ]
+        },
+    )
+
+  async def test_write_is_accumulated_until_flush(self):
+    def array_metadata(param_name: str):
+      return array_metadata_lib.ArrayMetadata(
+          param_name=param_name,
+          shape=(2,),
+          dtype=np.dtype(int),
+          write_shape=(2,),
+          chunk_shape=(2,),
+          use_ocdbt=False,
+          use_zarr3=False,
+      )
+
+    file_path = self.checkpoint_dir / 'array_metadatas' / 'process_0'
+    for param_name in ('a', 'b', 'c'):
+      await self.store.write(
+          self.checkpoint_dir, [array_metadata(param_name)], process_index=0
+      )
+    self.assertFalse(file_path.exists())
+
+    with mock.patch.object(
+        array_metadata_store_lib.async_path,
+        'write_text',
+        autospec=True,
+        side_effect=array_metadata_store_lib.async_path.write_text,
+    ) as mock_write_text:
+      await self.store.flush(self.checkpoint_dir)
+      await self.store.flush(self.checkpoint_dir)
+    mock_write_text.assert_called_once()
+
+    # Metadata flushed again for the same checkpoint is appended.
+    await self.store.write(
+        self.checkpoint_dir, [array_metadata('d')], process_index=0
+    )
+    await self.store.flush(self.checkpoint_dir)
+    self.assertEqual(
+        [
+            m.param_name
+            for m in await self.store.read(self.checkpoint_dir, process_index=0)
+        ],
+        ['a', 'b', 'c', 'd'],
+    )
+
+  async def test_copies_do_not_share_pending_metadata(self):
+    await self.store.write(
+        self.checkpoint_dir,
+        [
+            array_metadata_lib.ArrayMetadata(
+                param_name='a',
+                shape=(2,),
+                dtype=np.dtype(int),
+                write_shape=(2,),
+                chunk_shape=(2,),
+                use_ocdbt=False,
+                use_zarr3=False,
+            )
+        ],
+        process_index=0,
+    )
+    store = copy.deepcopy(self.store)
+    self.assertIsNone(await store.read(self.checkpoint_dir, process_index=0))
+    self.assertLen(
+        await self.store.read(self.checkpoint_dir, process_index=0), 1
+    )
+
+  async def test_identical_process_metadatas_are_deserialized_once(self):
+    array_metadatas = [
+        array_metadata_lib.ArrayMetadata(
+            param_name='a',
+            shape=(10,),
+            dtype=np.dtype(int),
+            write_shape=(5,),
+            chunk_shape=(5,),
+            use_ocdbt=False,
+            use_zarr3=False,
+        ),
+    ]
+    for process_index in [0, 1, 2]:
+      await self.store.write(
+          self.checkpoint_dir, array_metadatas, process_index=process_index
+      )
+
+    with mock.patch.object(
+        array_metadata_store_lib.Serializer,
+        'deserialize',
+        autospec=True,
+        side_effect=array_metadata_store_lib.Serializer.deserialize,
+    ) as mock_deserialize:
+      result = await self.store.read(self.checkpoint_dir)
+    mock_deserialize.assert_called_once()
+    self.assertIs(result[0], result[1])
+    self.assertIs(result[0], result[2])
+
 
 class ResolveArrayMetadataStoreTest(parameterized.TestCase):
 
@@ -135,6 +135,16 @@ class CheckpointInfos:
           1, 'CheckpointInfos.delete_if: deleted steps=%s', deleted_steps
       )
 
+  def add_sorted(self, checkpoint_infos: Sequence[CheckpointInfo]) -> None:
+    """Adds `checkpoint_infos`, keeping all infos sorted by step."""
+    with self._lock:
+      self.set(
+          sorted(
+              [*self._checkpoint_infos, *checkpoint_infos],
+              key=lambda info: info.step,
+          )
+      )
+
   def append(self, checkpoint_info: CheckpointInfo) -> None:
     """Appends a CheckpointInfo."""
     self._checkpoint_infos.append(checkpoint_info)
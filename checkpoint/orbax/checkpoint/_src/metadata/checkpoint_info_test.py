@@ -60,6 +60,14 @@ class CheckpointInfoTest(absltest.TestCase):
 
     self.assertEqual([info.step for info in infos], expected_remaining_steps)
 
+  def test_add_sorted(self):
+    info_list = [build_info(i) for i in range(0, 10, 3)]
+    infos = checkpoint_info.CheckpointInfos(info_list[1:])
+
+    infos.add_sorted([info_list[0], build_info(5)])
+
+    self.assertEqual([info.step for info in infos], [0, 3, 5, 6, 9])
+
 
 class CheckpointInfoThreadSafetyTest(absltest.TestCase):
 
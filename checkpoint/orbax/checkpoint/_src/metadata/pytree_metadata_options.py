@@ -26,11 +26,17 @@ class PyTreeMetadataOptions:
       notice.] If True, supports NamedTuple and Tuple node types in the
       metadata. Otherwise, a NamedTuple node is converted to dict and Tuple node
       to list.
+    write_metadata_index: [Experimental feature: subject to change without
+      notice.] If True, additionally writes the metadata in a compact, indexed
+      binary format (see `tree_index`) alongside the JSON metadata file. Reads
+      use the index when present, so that partial restores only decode the
+      entries they need. Not supported with `support_rich_types`.
   """
 
   # TODO: b/365169723 - Support different namedtuple ser/deser strategies.
 
   support_rich_types: bool = False
+  write_metadata_index: bool = False
 
 
 # Global default options.
@@ -0,0 +1,234 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Index of the steps under a `CheckpointManager` root directory.
+
+Finding the steps of a root directory otherwise requires listing it, checking
+every step for finalization and reading the metrics of every step. The index
+records the same information in a single file, so that it can be loaded with
+one read.
+
+The index is a log of JSON lines: a header, followed by one record per added,
+updated or removed step. Changes are appended to the log, which is compacted by
+atomically rewriting it as a whole once enough records have been appended.
+Steps that are being saved are recorded as not finalized before their
+checkpoint is committed, so that readers can tell whether a step the index
+does not know about may exist.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import json
+from typing import Any, Optional, Sequence
+import uuid
+
+from absl import logging
+from etils import epath
+
+
+PyTree = Any
+
+STEP_INDEX_FILE = '_STEP_INDEX'
+_VERSION = 2
+# Minimum number of records appended to the index before it is compacted.
+_MIN_APPENDED_RECORDS = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class StepIndexEntry:
+  """A step recorded in the index.
+
+  Attributes:
+    step: Step number.
+    time: Time at which the checkpoint was saved.
+    metrics: Metrics saved with the step, if any.
+    finalized: False if the checkpoint was not yet committed when the index was
+      written. Such a step may or may not exist.
+  """
+
+  step: int
+  time: datetime.datetime
+  metrics: Optional[PyTree]
+  finalized: bool = True
+
+
+def step_index_path(directory: epath.PathLike) -> epath.Path:
+  return epath.Path(directory) / STEP_INDEX_FILE
+
+
+def _entry_line(entry: StepIndexEntry) -> str:
+  return json.dumps({
+      'step': entry.step,
+      'time': entry.time.isoformat(),
+      'metrics': entry.metrics,
+      'finalized': entry.finalized,
+  })
+
+
+def _removal_line(step: int) -> str:
+  return json.dumps({'step': step, 'removed': True})
+
+
+def write(directory: epath.PathLike, entries: Sequence[StepIndexEntry]):
+  """Atomically replaces the index of `directory` with `entries`.
+
+  Args:
+    directory: The root directory.
+    entries: The steps to record.
+
+  Raises:
+    TypeError: If the metrics of an entry are not JSON serializable.
+  """
+  lines = [json.dumps({'version': _VERSION})]
+  lines.extend(
+      _entry_line(entry)
+      for entry in sorted(entries, key=lambda entry: entry.step)
+  )
+  path = step_index_path(directory)
+  tmp_path = path.parent / f'{path.name}.{uuid.uuid4().hex}.tmp'
+  tmp_path.write_text(''.join(f'{line}\n' for line in lines))
+  tmp_path.replace(path)
+
+
+def append(
+    directory: epath.PathLike,
+    entries: Sequence[StepIndexEntry] = (),
+    removed_steps: Sequence[int] = (),
+):
+  """Appends added or updated `entries` and `removed_steps` to the index.
+
+  The index must have been created by `write`.
+
+  Args:
+    directory: The root directory.
+    entries: The steps to add or update.
+    removed_steps: The steps to remove.
+
+  Raises:
+    TypeError: If the metrics of an entry are not JSON serializable. Nothing is
+      appended in this case.
+  """
+  lines = [_entry_line(entry) for entry in entries]
+  lines.extend(_removal_line(step) for step in removed_steps)
+  if not lines:
+    return
+  with step_index_path(directory).open('a') as f:
+    f.write(''.join(f'{line}\n' for line in lines))
+
+
+def read(directory: epath.PathLike) -> Optional[list[StepIndexEntry]]:
+  """Returns the entries of the index of `directory`, sorted by step.
+
+  Args:
+    directory: The root directory.
+
+  Returns:
+    The entries, or None if there is no valid index.
+  """
+  path = step_index_path(directory)
+  try:
+    lines = path.read_text().splitlines()
+    if not lines:
+      raise ValueError('missing header')
+    header = json.loads(lines[0])
+    if header['version'] != _VERSION:
+      logging.warning(
+          'Ignoring step index %s with unsupported version %s.',
+          path,
+          header['version'],
+      )
+      return None
+    entries = {}
+    for line in lines[1:]:
+      record = json.loads(line)
+      step = int(record['step'])
+      if record.get('removed', False):
+        entries.pop(step, None)
+        continue
+      entries[step] = StepIndexEntry(
+          step=step,
+          time=datetime.datetime.fromisoformat(record['time']),
+          metrics=record['metrics'],
+          finalized=bool(record['finalized']),
+      )
+  except FileNotFoundError:
+    return None
+  except (ValueError, TypeError, KeyError) as e:
+    logging.warning('Ignoring invalid step index %s: %s', path, e)
+    return None
+  return sorted(entries.values(), key=lambda entry: entry.step)
+
+
+def remove(directory: epath.PathLike):
+  """Removes the index of `directory`, if any."""
+  step_index_path(directory).unlink(missing_ok=True)
+
+
+class Writer:
+  """Keeps the index of a directory up to date.
+
+  The first write replaces the index. Later writes append the steps that
+  changed since the previous write, until the appended records outnumber the
+  recorded steps, at which point the index is compacted by replacing it again.
+  """
+
+  def __init__(self, directory: epath.PathLike):
+    self._directory = directory
+    # Entries as of the last successful write, or None if the index must be
+    # replaced on the next write.
+    self._entries: Optional[dict[int, StepIndexEntry]] = None
+    self._appended_records = 0
+
+  def write(self, entries: Sequence[StepIndexEntry]):
+    """Records `entries` as the steps of the directory.
+
+    Args:
+      entries: The steps to record.
+
+    Raises:
+      TypeError: If the metrics of an entry are not JSON serializable.
+    """
+    new_entries = {entry.step: entry for entry in entries}
+    if self._entries is None:
+      self._replace(new_entries)
+      return
+    changed = [
+        entry
+        for step, entry in new_entries.items()
+        if self._entries.get(step) != entry
+    ]
+    removed = [step for step in self._entries if step not in new_entries]
+    num_records = len(changed) + len(removed)
+    if not num_records:
+      return
+    if self._appended_records + num_records > max(
+        len(new_entries), _MIN_APPENDED_RECORDS
+    ):
+      self._replace(new_entries)
+      return
+    append(self._directory, changed, removed)
+    self._entries = new_entries
+    self._appended_records += num_records
+
+  def reset(self):
+    """Forgets the last write, so that the next write replaces the index."""
+    self._entries = None
+    self._appended_records = 0
+
+  def _replace(self, entries: dict[int, StepIndexEntry]):
+    write(self._directory, list(entries.values()))
+    self._entries = entries
+    self._appended_records = 0
@@ -0,0 +1,151 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from absl.testing import absltest
+from etils import epath
+from orbax.checkpoint._src.metadata import step_index
+
+
+_TIME = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class StepIndexTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.directory = epath.Path(self.create_tempdir().full_path)
+
+  def test_round_trip(self):
+    entries = [
+        step_index.StepIndexEntry(
+            step=2, time=_TIME, metrics=None, finalized=False
+        ),
+        step_index.StepIndexEntry(step=1, time=_TIME, metrics={'loss': 0.5}),
+    ]
+    step_index.write(self.directory, entries)
+    self.assertEqual(
+        step_index.read(self.directory), sorted(entries, key=lambda e: e.step)
+    )
+    self.assertEqual(
+        [p.name for p in self.directory.iterdir()], [step_index.STEP_INDEX_FILE]
+    )
+
+  def test_missing(self):
+    self.assertIsNone(step_index.read(self.directory))
+    step_index.remove(self.directory)
+
+  def test_invalid(self):
+    path = step_index.step_index_path(self.directory)
+    path.write_text('')
+    self.assertIsNone(step_index.read(self.directory))
+    path.write_text('not json')
+    self.assertIsNone(step_index.read(self.directory))
+    # A truncated record invalidates the whole index.
+    step_index.write(self.directory, [])
+    with path.open('a') as f:
+      f.write('{"step": 1, "ti')
+    self.assertIsNone(step_index.read(self.directory))
+
+  def test_unsupported_version(self):
+    step_index.step_index_path(self.directory).write_text(
+        '{"version": 1, "steps": []}'
+    )
+    self.assertIsNone(step_index.read(self.directory))
+
+  def test_unserializable_metrics(self):
+    with self.assertRaises(TypeError):
+      step_index.write(
+          self.directory,
+          [step_index.StepIndexEntry(step=1, time=_TIME, metrics=object())],
+      )
+    step_index.write(self.directory, [])
+    with self.assertRaises(TypeError):
+      step_index.append(
+          self.directory,
+          [
+              step_index.StepIndexEntry(step=1, time=_TIME, metrics=None),
+              step_index.StepIndexEntry(step=2, time=_TIME, metrics=object()),
+          ],
+      )
+    self.assertEqual(step_index.read(self.directory), [])
+
+  def test_append(self):
+    step_index.write(
+        self.directory,
+        [step_index.StepIndexEntry(step=1, time=_TIME, metrics=None)],
+    )
+    step_index.append(
+        self.directory,
+        [
+            step_index.StepIndexEntry(
+                step=2, time=_TIME, metrics=None, finalized=False
+            )
+        ],
+    )
+    step_index.append(
+        self.directory,
+        [step_index.StepIndexEntry(step=2, time=_TIME, metrics={'loss': 1.0})],
+        removed_steps=[1],
+    )
+    self.assertEqual(
+        step_index.read(self.directory),
+        [step_index.StepIndexEntry(step=2, time=_TIME, metrics={'loss': 1.0})],
+    )
+
+  def test_writer_appends_changes(self):
+    writer = step_index.Writer(self.directory)
+    path = step_index.step_index_path(self.directory)
+    entries = [step_index.StepIndexEntry(step=1, time=_TIME, metrics=None)]
+    writer.write(entries)
+    num_lines = len(path.read_text().splitlines())
+    entries.append(step_index.StepIndexEntry(step=2, time=_TIME, metrics=None))
+    writer.write(entries)
+    writer.write(entries)
+    writer.write(entries[1:])
+    self.assertEqual(len(path.read_text().splitlines()), num_lines + 2)
+    self.assertEqual(step_index.read(self.directory), entries[1:])
+
+  def test_writer_compacts(self):
+    writer = step_index.Writer(self.directory)
+    path = step_index.step_index_path(self.directory)
+    for step in range(200):
+      writer.write(
+          [step_index.StepIndexEntry(step=step, time=_TIME, metrics=None)]
+      )
+      self.assertLess(len(path.read_text().splitlines()), 100)
+    self.assertEqual(
+        step_index.read(self.directory),
+        [step_index.StepIndexEntry(step=199, time=_TIME, metrics=None)],
+    )
+
+  def test_writer_reset(self):
+    writer = step_index.Writer(self.directory)
+    entry = step_index.StepIndexEntry(step=1, time=_TIME, metrics=None)
+    writer.write([entry])
+    step_index.remove(self.directory)
+    writer.reset()
+    writer.write([entry])
+    self.assertEqual(step_index.read(self.directory), [entry])
+
+  def test_remove(self):
+    step_index.write(self.directory, [])
+    self.assertEqual(step_index.read(self.directory), [])
+    step_index.remove(self.directory)
+    self.assertIsNone(step_index.read(self.directory))
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -37,6 +37,7 @@ from orbax.checkpoint._src.metadata import pytree_metadata_options as pytree_met
 from orbax.checkpoint._src.metadata import tree_rich_types
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.metadata import value_metadata_entry
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import format_utils
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
 from orbax.checkpoint._src.serialization import types
@@ -535,14 +536,20 @@ class InternalTreeMetadata:
         reference_metadata_tree
     ).items():
       param_name = '.'.join(keypath)
+      parent_dir = directory
+      if value_meta.data_ref is not None:
+        parent_dir = data_references.resolve_reference(
+            directory, value_meta.data_ref
+        )
       flat_param_infos[keypath] = types.ParamInfo(
           name=param_name,
-          parent_dir=directory,
+          parent_dir=parent_dir,
           skip_deserialize=value_meta.skip_deserialize,
           is_ocdbt_checkpoint=use_ocdbt,
           use_zarr3=self.use_zarr3,
           ts_context=ts_context,
           write_shape=value_meta.write_shape,
+          data_ref=value_meta.data_ref,
       )
       flat_restore_types[keypath] = value_meta.value_type
 
@@ -562,11 +569,13 @@ class InternalTreeMetadata:
               name=param_info.name, directory=param_info.parent_dir
           )
       else:
-        batched_keypaths[restore_type].append(keypath)
-        batched_param_infos[restore_type].append(param_info)
+        # TypeHandlers expect all ParamInfos in a batch to share `parent_dir`.
+        batch_key = (restore_type, param_info.data_ref)
+        batched_keypaths[batch_key].append(keypath)
+        batched_param_infos[batch_key].append(param_info)
 
     metadata_ops = []
-    for restore_type, param_infos in batched_param_infos.items():
+    for (restore_type, _), param_infos in batched_param_infos.items():
       handler = type_handler_registry.get(restore_type)
       metadata_ops.append(handler.metadata(param_infos))
 
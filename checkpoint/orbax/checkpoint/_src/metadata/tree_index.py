@@ -0,0 +1,377 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact, indexed binary encoding of `InternalTreeMetadata`.
+
+The JSON encoding of `InternalTreeMetadata` must be parsed in full before any
+entry can be read, which is slow for trees with many leaves. This module
+encodes the same entries as a sorted key index followed by columnar arrays, so
+that individual keys and key prefixes can be looked up without decoding the
+rest of the tree.
+
+Layout::
+
+  _MAGIC | header length (uint64) | JSON header | aligned columns...
+
+The header holds tree-level properties, string tables and the byte ranges of
+all columns. Entries are sorted by their encoded keypath: the key names at each
+level of nesting, joined by NUL bytes. All entries under a keypath prefix are
+therefore contiguous.
+
+The JSON metadata file remains the source of truth. The index records the size
+of the JSON file it was built from, and is ignored if the two disagree (e.g.
+after the JSON file was rewritten by a partial save).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import struct
+from typing import Any, Iterable, Sequence
+
+import jax
+import numpy as np
+from orbax.checkpoint._src.metadata import empty_values
+from orbax.checkpoint._src.metadata import pytree_metadata_options as pytree_metadata_options_lib
+from orbax.checkpoint._src.metadata import tree as tree_metadata
+from orbax.checkpoint._src.metadata import value_metadata_entry
+from orbax.checkpoint._src.tree import utils as tree_utils
+
+
+PYTREE_METADATA_INDEX_FILE = '_METADATA_INDEX'
+
+_MAGIC = b'OCPTIDX1'
+_HEADER_LENGTH = struct.Struct('<Q')
+_ALIGNMENT = 8
+_KEY_SEPARATOR = b'\x00'
+# Sorts after `_KEY_SEPARATOR` and before every other byte.
+_KEY_SEPARATOR_SUCCESSOR = b'\x01'
+_NONE = -1
+
+_VERSION = 'version'
+_NUM_ENTRIES = 'num_entries'
+_SOURCE_SIZE = 'source_size'
+_USE_OCDBT = 'use_ocdbt'
+_USE_ZARR3 = 'use_zarr3'
+_STORE_ARRAY_DATA_EQUAL_TO_FILL_VALUE = 'store_array_data_equal_to_fill_value'
+_CUSTOM_METADATA = 'custom_metadata'
+_VALUE_TYPES = 'value_types'
+_DATA_REFS = 'data_refs'
+_COLUMNS = 'columns'
+
+# Column names.
+_KEY_OFFSETS = 'key_offsets'
+_KEY_DATA = 'key_data'
+_KEY_TYPE_OFFSETS = 'key_type_offsets'
+_KEY_TYPES = 'key_types'
+_VALUE_TYPE = 'value_type'
+_SKIP_DESERIALIZE = 'skip_deserialize'
+_WRITE_SHAPE_NDIM = 'write_shape_ndim'
+_WRITE_SHAPE_OFFSETS = 'write_shape_offsets'
+_WRITE_SHAPE_DATA = 'write_shape_data'
+_DATA_REF = 'data_ref'
+
+KeyPathNames = Sequence[str]
+
+
+def _entry_names(entry: tree_metadata.InternalTreeMetadataEntry) -> list[str]:
+  return [
+      e.nested_key_name for e in entry.key_metadata.nested_key_metadata_entries
+  ]
+
+
+def _encode_key(names: KeyPathNames) -> bytes:
+  return _KEY_SEPARATOR.join(str(name).encode('utf-8') for name in names)
+
+
+def can_serialize(metadata: tree_metadata.InternalTreeMetadata) -> bool:
+  """Whether `metadata` can be encoded by `serialize`.
+
+  Rich typed metadata trees are not supported, nor are key names containing
+  NUL characters.
+
+  Args:
+    metadata: The metadata to encode.
+  """
+  if metadata.value_metadata_tree is not None:
+    return False
+  return not any(
+      '\x00' in name
+      for entry in metadata.tree_metadata_entries
+      for name in _entry_names(entry)
+  )
+
+
+def serialize(
+    metadata: tree_metadata.InternalTreeMetadata, *, source_size: int
+) -> bytes:
+  """Encodes `metadata` in the indexed binary format.
+
+  Args:
+    metadata: The metadata to encode. See `can_serialize`.
+    source_size: Size in bytes of the JSON metadata file holding the same
+      metadata.
+
+  Returns:
+    The encoded bytes.
+  """
+  keyed_entries = sorted(
+      [(_encode_key(_entry_names(e)), e)
+       for e in metadata.tree_metadata_entries],
+      key=lambda x: x[0],
+  )
+  num_entries = len(keyed_entries)
+
+  value_types: dict[str, int] = {}
+  data_refs: dict[str, int] = {}
+  key_types, key_type_offsets = [], [0]
+  value_type_ids, skip_deserialize = [], []
+  write_shape_ndim, write_shape_data, write_shape_offsets = [], [], [0]
+  data_ref_ids = []
+  for _, entry in keyed_entries:
+    key_types.extend(
+        e.key_type.to_json()
+        for e in entry.key_metadata.nested_key_metadata_entries
+    )
+    key_type_offsets.append(len(key_types))
+    value = entry.value_metadata
+    value_type_ids.append(
+        value_types.setdefault(value.value_type, len(value_types))
+    )
+    skip_deserialize.append(value.skip_deserialize)
+    if value.write_shape is None:
+      write_shape_ndim.append(_NONE)
+    else:
+      write_shape_ndim.append(len(value.write_shape))
+      write_shape_data.extend(value.write_shape)
+    write_shape_offsets.append(len(write_shape_data))
+    data_ref_ids.append(
+        _NONE
+        if value.data_ref is None
+        else data_refs.setdefault(value.data_ref, len(data_refs))
+    )
+
+  keys = [key for key, _ in keyed_entries]
+  columns = {
+      _KEY_OFFSETS: np.cumsum([0] + [len(k) for k in keys], dtype=np.uint64),
+      _KEY_DATA: np.frombuffer(b''.join(keys), dtype=np.uint8),
+      _KEY_TYPE_OFFSETS: np.asarray(key_type_offsets, dtype=np.uint64),
+      _KEY_TYPES: np.asarray(key_types, dtype=np.uint8),
+      _VALUE_TYPE: np.asarray(value_type_ids, dtype=np.int32),
+      _SKIP_DESERIALIZE: np.asarray(skip_deserialize, dtype=np.bool_),
+      _WRITE_SHAPE_NDIM: np.asarray(write_shape_ndim, dtype=np.int32),
+      _WRITE_SHAPE_OFFSETS: np.asarray(write_shape_offsets, dtype=np.uint64),
+      _WRITE_SHAPE_DATA: np.asarray(write_shape_data, dtype=np.int64),
+      _DATA_REF: np.asarray(data_ref_ids, dtype=np.int32),
+  }
+
+  column_ranges = {}
+  offset = 0
+  for name, column in columns.items():
+    offset += -offset % _ALIGNMENT
+    column_ranges[name] = [column.dtype.str, offset, column.size]
+    offset += column.nbytes
+  header = json.dumps({
+      _VERSION: 1,
+      _NUM_ENTRIES: num_entries,
+      _SOURCE_SIZE: source_size,
+      _USE_OCDBT: metadata.use_ocdbt,
+      _USE_ZARR3: metadata.use_zarr3,
+      _STORE_ARRAY_DATA_EQUAL_TO_FILL_VALUE: (
+          metadata.store_array_data_equal_to_fill_value
+      ),
+      _CUSTOM_METADATA: metadata.custom_metadata,
+      _VALUE_TYPES: list(value_types),
+      _DATA_REFS: list(data_refs),
+      _COLUMNS: column_ranges,
+  }).encode('utf-8')
+
+  prefix = _MAGIC + _HEADER_LENGTH.pack(len(header)) + header
+  prefix += b'\x00' * (-len(prefix) % _ALIGNMENT)
+  body = bytearray(offset)
+  for name, column in columns.items():
+    start = column_ranges[name][1]
+    body[start : start + column.nbytes] = column.tobytes()
+  return prefix + bytes(body)
+
+
+class TreeMetadataIndex:
+  """Read-only view of metadata encoded by `serialize`.
+
+  Decoding the index only reads its header; entries are decoded on lookup.
+  """
+
+  def __init__(self, data: bytes):
+    if not data.startswith(_MAGIC):
+      raise ValueError('Not a pytree metadata index.')
+    start = len(_MAGIC) + _HEADER_LENGTH.size
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, len(_MAGIC))
+    self._header = json.loads(data[start : start + header_length])
+    body_start = start + header_length
+    body_start += -body_start % _ALIGNMENT
+    self._columns = {
+        name: np.frombuffer(
+            data,
+            dtype=np.dtype(dtype),
+            count=count,
+            offset=body_start + offset,
+        )
+        for name, (dtype, offset, count) in self._header[_COLUMNS].items()
+    }
+    self._key_offsets = self._columns[_KEY_OFFSETS]
+    self._key_data = self._columns[_KEY_DATA]
+
+  @property
+  def source_size(self) -> int:
+    return self._header[_SOURCE_SIZE]
+
+  def __len__(self) -> int:
+    return self._header[_NUM_ENTRIES]
+
+  def _key(self, i: int) -> bytes:
+    return self._key_data[
+        self._key_offsets[i] : self._key_offsets[i + 1]
+    ].tobytes()
+
+  def _bisect(self, key: bytes) -> int:
+    return bisect.bisect_left(range(len(self)), key, key=self._key)
+
+  def _entry(self, i: int) -> tree_metadata.InternalTreeMetadataEntry:
+    key = self._key(i)
+    key_type_offsets = self._columns[_KEY_TYPE_OFFSETS]
+    key_types = self._columns[_KEY_TYPES][
+        key_type_offsets[i] : key_type_offsets[i + 1]
+    ]
+    names = (
+        [n.decode('utf-8') for n in key.split(_KEY_SEPARATOR)]
+        if len(key_types)
+        else []
+    )
+    write_shape = None
+    if (ndim := self._columns[_WRITE_SHAPE_NDIM][i]) != _NONE:
+      end = int(self._columns[_WRITE_SHAPE_OFFSETS][i + 1])
+      write_shape = tuple(
+          int(d) for d in self._columns[_WRITE_SHAPE_DATA][end - ndim : end]
+      )
+    data_ref_id = self._columns[_DATA_REF][i]
+    value_metadata = value_metadata_entry.ValueMetadataEntry(
+        value_type=empty_values.override_empty_value_typestr(
+            self._header[_VALUE_TYPES][self._columns[_VALUE_TYPE][i]],
+            pytree_metadata_options_lib.PyTreeMetadataOptions(
+                support_rich_types=False  # Always in legacy mode.
+            ),
+        ),
+        skip_deserialize=bool(self._columns[_SKIP_DESERIALIZE][i]),
+        write_shape=write_shape,
+        data_ref=(
+            None
+            if data_ref_id == _NONE
+            else self._header[_DATA_REFS][data_ref_id]
+        ),
+    )
+    return tree_metadata.InternalTreeMetadataEntry(
+        keypath=str(tuple(names)),
+        key_metadata=tree_metadata.KeyMetadataEntry([
+            tree_metadata.NestedKeyMetadataEntry(
+                name, tree_metadata.KeyType.from_json(int(key_type))
+            )
+            for name, key_type in zip(names, key_types)
+        ]),
+        value_metadata=value_metadata,
+    )
+
+  def get(
+      self, keypath: KeyPathNames
+  ) -> tree_metadata.InternalTreeMetadataEntry | None:
+    """Returns the entry with exactly the given key names, if any."""
+    key = _encode_key(keypath)
+    i = self._bisect(key)
+    if i < len(self) and self._key(i) == key:
+      return self._entry(i)
+    return None
+
+  def _prefix_range(self, prefix: KeyPathNames) -> range:
+    if not prefix:
+      return range(len(self))
+    key = _encode_key(prefix)
+    # Covers the prefix itself and every key continuing with a separator.
+    return range(
+        self._bisect(key), self._bisect(key + _KEY_SEPARATOR_SUCCESSOR)
+    )
+
+  def entries_with_prefix(
+      self, prefix: KeyPathNames
+  ) -> list[tree_metadata.InternalTreeMetadataEntry]:
+    """Returns entries at or below the given key names, in key order."""
+    return [self._entry(i) for i in self._prefix_range(prefix)]
+
+  def as_internal_tree_metadata(
+      self,
+      *,
+      prefixes: Iterable[KeyPathNames] | None = None,
+      pytree_metadata_options: pytree_metadata_options_lib.PyTreeMetadataOptions = (
+          pytree_metadata_options_lib.PYTREE_METADATA_OPTIONS
+      ),
+  ) -> tree_metadata.InternalTreeMetadata:
+    """Returns `InternalTreeMetadata` holding the selected entries.
+
+    Args:
+      prefixes: If provided, only entries at or below one of these keypaths
+        are decoded. Otherwise, all entries are decoded.
+      pytree_metadata_options: Options of the returned metadata.
+    """
+    if prefixes is None:
+      indices = range(len(self))
+    else:
+      indices = sorted(
+          set().union(*(self._prefix_range(p) for p in prefixes))
+      )
+    return tree_metadata.InternalTreeMetadata(
+        tree_metadata_entries=[self._entry(i) for i in indices],
+        use_ocdbt=self._header[_USE_OCDBT],
+        use_zarr3=self._header[_USE_ZARR3],
+        custom_metadata=self._header[_CUSTOM_METADATA],
+        store_array_data_equal_to_fill_value=self._header[
+            _STORE_ARRAY_DATA_EQUAL_TO_FILL_VALUE
+        ],
+        pytree_metadata_options=pytree_metadata_options,
+    )
+
+
+def keypath_prefixes(tree: Any, *, is_leaf: Any = None) -> list[list[str]]:
+  """Returns keypath prefixes covering every leaf of `tree`.
+
+  Keypaths are truncated before their first sequence index, so that whole
+  lists and tuples are always selected.
+
+  Args:
+    tree: The tree whose leaves should be looked up.
+    is_leaf: Passed to `jax.tree_util.tree_flatten_with_path`.
+
+  Returns:
+    De-duplicated key names of each prefix, as stored in an index.
+  """
+  flat_with_keys, _ = jax.tree_util.tree_flatten_with_path(
+      tree, is_leaf=is_leaf
+  )
+  prefixes = {}
+  for keypath, _ in flat_with_keys:
+    names = []
+    for key in keypath:
+      if isinstance(key, jax.tree_util.SequenceKey):
+        break
+      names.append(str(tree_utils.get_key_name(key)))
+    prefixes[tuple(names)] = names
+  return list(prefixes.values())
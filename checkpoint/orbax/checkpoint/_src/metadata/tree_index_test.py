@@ -0,0 +1,147 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from absl.testing import absltest
+from absl.testing import parameterized
+import chex
+from etils import epath
+import jax
+from orbax.checkpoint._src.metadata import tree as tree_metadata_lib
+from orbax.checkpoint._src.metadata import tree_index
+from orbax.checkpoint._src.serialization import type_handler_registry
+from orbax.checkpoint._src.serialization import types
+from orbax.checkpoint._src.testing import test_tree_utils
+from orbax.checkpoint._src.tree import utils as tree_utils
+
+
+InternalTreeMetadata = tree_metadata_lib.InternalTreeMetadata
+
+
+def _build_metadata(tree, **param_info_kwargs) -> InternalTreeMetadata:
+  param_infos = jax.tree.map(
+      lambda x: types.ParamInfo(
+          name='',
+          parent_dir=epath.Path(''),
+          value_typestr=type_handler_registry.get_param_typestr(
+              x,
+              type_handler_registry.GLOBAL_TYPE_HANDLER_REGISTRY,
+              tree_metadata_lib.PYTREE_METADATA_OPTIONS,
+          ),
+          **param_info_kwargs,
+      ),
+      tree,
+      is_leaf=tree_utils.is_empty_or_leaf,
+  )
+  return InternalTreeMetadata.build(param_infos, custom_metadata={'a': 1})
+
+
+def _round_trip(metadata: InternalTreeMetadata) -> tree_index.TreeMetadataIndex:
+  return tree_index.TreeMetadataIndex(
+      tree_index.serialize(metadata, source_size=123)
+  )
+
+
+class TreeIndexTest(parameterized.TestCase):
+
+  @parameterized.parameters(test_tree_utils.TEST_PYTREES)
+  def test_round_trip(self, test_pytree: test_tree_utils.TestPyTree):
+    metadata = _build_metadata(test_pytree.provide_tree())
+    self.assertTrue(tree_index.can_serialize(metadata))
+
+    index = _round_trip(metadata)
+    restored = index.as_internal_tree_metadata()
+
+    self.assertLen(index, len(metadata.tree_metadata_entries))
+    self.assertEqual(index.source_size, 123)
+    self.assertEqual(restored.use_ocdbt, metadata.use_ocdbt)
+    self.assertEqual(restored.use_zarr3, metadata.use_zarr3)
+    self.assertEqual(restored.custom_metadata, {'a': 1})
+    self.assertEqual(
+        restored.store_array_data_equal_to_fill_value,
+        metadata.store_array_data_equal_to_fill_value,
+    )
+    chex.assert_trees_all_equal(
+        restored.as_nested_tree(), test_pytree.expected_nested_tree_metadata
+    )
+
+  def test_value_fields(self):
+    metadata = _build_metadata(
+        {'a': 1, 'b': [2, 3]}, write_shape=(4, 2), data_ref='../../1/default'
+    )
+    index = _round_trip(metadata)
+    expected = {e.keypath: e for e in metadata.tree_metadata_entries}
+    for keypath in (['a'], ['b', '0'], ['b', '1']):
+      entry = index.get(keypath)
+      self.assertEqual(entry, expected[str(tuple(keypath))])
+      self.assertEqual(entry.value_metadata.write_shape, (4, 2))
+      self.assertEqual(entry.value_metadata.data_ref, '../../1/default')
+
+  def test_lookup(self):
+    tree = {
+        'a': {'x': 1, 'y': 2},
+        'ab': 3,
+        'b': [4, {'c': 5}],
+    }
+    index = _round_trip(_build_metadata(tree))
+
+    self.assertIsNone(index.get(['a']))
+    self.assertIsNone(index.get(['missing']))
+    self.assertEqual(index.get(['a', 'x']).keypath, "('a', 'x')")
+    self.assertEqual(
+        [e.keypath for e in index.entries_with_prefix(['a'])],
+        ["('a', 'x')", "('a', 'y')"],
+    )
+    self.assertEqual(
+        [e.keypath for e in index.entries_with_prefix(['b', '1'])],
+        ["('b', '1', 'c')"],
+    )
+    self.assertEmpty(index.entries_with_prefix(['c']))
+    self.assertLen(index.entries_with_prefix([]), 5)
+
+    partial = index.as_internal_tree_metadata(prefixes=[['ab'], ['b', '0']])
+    self.assertEqual(partial.as_nested_tree().keys(), {'ab', 'b'})
+    self.assertEqual(
+        [e.jax_keypath() for e in partial.tree_metadata_entries],
+        [
+            (jax.tree_util.DictKey('ab'),),
+            (jax.tree_util.DictKey('b'), jax.tree_util.SequenceKey(0)),
+        ],
+    )
+
+  def test_keypath_prefixes(self):
+    tree = {'a': {'x': 1, 'y': [2, 3]}, 'b': (4,)}
+    self.assertEqual(
+        tree_index.keypath_prefixes(tree),
+        [['a', 'x'], ['a', 'y'], ['b']],
+    )
+
+  def test_cannot_serialize_rich_types(self):
+    options = tree_metadata_lib.PyTreeMetadataOptions(support_rich_types=True)
+    metadata = InternalTreeMetadata.build(
+        {
+            'a': types.ParamInfo(
+                name='', parent_dir=epath.Path(''), value_typestr='np.ndarray'
+            )
+        },
+        pytree_metadata_options=options,
+    )
+    self.assertFalse(tree_index.can_serialize(metadata))
+
+  def test_invalid_data(self):
+    with self.assertRaisesRegex(ValueError, 'Not a pytree metadata index'):
+      tree_index.TreeMetadataIndex(b'{}')
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -28,6 +28,7 @@ from orbax.checkpoint._src.serialization import types
 _VALUE_TYPE = 'value_type'
 _SKIP_DESERIALIZE = 'skip_deserialize'
 _WRITE_SHAPE = 'write_shape'
+_DATA_REF = 'data_ref'
 
 
 @dataclasses.dataclass
@@ -44,6 +45,9 @@ class ValueMetadataEntry:
   value_type: str
   skip_deserialize: bool = False
   write_shape: arrays_types.Shape | None = None
+  # Directory holding the value's data, relative to the checkpoint directory,
+  # when it was not rewritten by an incremental save.
+  data_ref: str | None = None
 
   def to_json(self) -> Dict[str, Any]:
     json_dict = {
@@ -54,6 +58,8 @@ class ValueMetadataEntry:
       # Convert to list because JSON does not support tuples.
       # Make sure to convert back to tuple in `from_json`.
       json_dict[_WRITE_SHAPE] = list(self.write_shape)  # pyrefly: ignore[unsupported-operation]
+    if self.data_ref is not None:
+      json_dict[_DATA_REF] = self.data_ref
     return json_dict
 
   @classmethod
@@ -73,6 +79,7 @@ class ValueMetadataEntry:
             if _WRITE_SHAPE in json_dict
             else None
         ),
+        data_ref=json_dict.get(_DATA_REF),
     )
 
   @classmethod
@@ -92,4 +99,5 @@ class ValueMetadataEntry:
         value_type=info.value_typestr,
         skip_deserialize=skip_deserialize,
         write_shape=info.write_shape,
+        data_ref=info.data_ref,
     )
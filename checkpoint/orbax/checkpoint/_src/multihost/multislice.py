@@ -14,10 +14,13 @@
 
 """Multislice utilities."""
 
+import collections
+import dataclasses
 import functools
 import math
 import os
-from typing import Any, Optional, Set, Union
+import time
+from typing import Any, Callable, Optional, Sequence, Set, Union
 
 from absl import logging
 import jax
@@ -307,6 +310,71 @@ def _merge_globalized_replicas(
   return out_subtree
 
 
+@dataclasses.dataclass(frozen=True)
+class BroadcastGroupStats:
+  """Statistics of one group of leaves broadcast together.
+
+  Attributes:
+    group_index: Index of the group, in broadcast order.
+    num_leaves: Number of leaves in the group.
+    bytes_per_device: Bytes received by each destination device.
+    duration_secs: Time from dispatching the group to its completion. Includes
+      the time the group waited behind the previous in-flight group.
+  """
+
+  group_index: int
+  num_leaves: int
+  bytes_per_device: int
+  duration_secs: float
+
+  @property
+  def bandwidth_bytes_per_sec(self) -> float:
+    """Per-device bandwidth of the group."""
+    return self.bytes_per_device / max(self.duration_secs, 1e-9)
+
+
+def _plan_broadcast_groups(
+    leaf_sizes: Sequence[int], memory_limit_bytes: int
+) -> list[list[int]]:
+  """Bin-packs leaves into groups of at most `memory_limit_bytes` per device.
+
+  Uses first-fit decreasing, so that groups are well filled regardless of the
+  order of the leaves. Leaves larger than the limit form their own group.
+
+  Args:
+    leaf_sizes: Per-device size of each leaf, in bytes.
+    memory_limit_bytes: Maximum per-device size of a group, in bytes.
+
+  Returns:
+    Groups of leaf indices, largest leaves first. Indices within a group are
+    sorted.
+  """
+  groups: list[list[int]] = []
+  group_sizes: list[int] = []
+  for i in sorted(range(len(leaf_sizes)), key=lambda i: -leaf_sizes[i]):
+    size = leaf_sizes[i]
+    if size > memory_limit_bytes:
+      logging.warning(
+          'in_tree leaf size exceeds memory limit for broadcasting. '
+          'Leaf size: %d bytes. Allowed memory limit: %d bytes. Proceeding.',
+          size,
+          memory_limit_bytes,
+      )
+      groups.append([i])
+      # Nothing else fits in this group.
+      group_sizes.append(memory_limit_bytes)
+      continue
+    for g, group_size in enumerate(group_sizes):
+      if group_size + size <= memory_limit_bytes:
+        groups[g].append(i)
+        group_sizes[g] += size
+        break
+    else:
+      groups.append([i])
+      group_sizes.append(size)
+  return [sorted(group) for group in groups]
+
+
 def broadcast_one_replica_to_all(
     in_tree: tuple[jax.Array, ...],
     global_mesh: jax.sharding.Mesh,
@@ -314,9 +382,18 @@ def broadcast_one_replica_to_all(
     is_source: bool,
     memory_limit_bytes: Optional[Union[int, None]] = None,
     memory_scaling_factor: Optional[float] = 0.75,
+    max_in_flight_broadcasts: int = 2,
+    stats_callback: Optional[Callable[[BroadcastGroupStats], None]] = None,
 ) -> tuple[tuple[jax.Array, ...], int]:
   """One replica reads the data and broadcasts to others.
 
+  Leaves are bin-packed into groups by their per-device size, and groups are
+  pipelined: up to `max_in_flight_broadcasts` groups are dispatched before
+  waiting for the oldest one, so that preparing a group overlaps with the
+  transfer of the previous one. The oldest group is also waited for whenever
+  dispatching the next group would take the in-flight groups above the memory
+  limit.
+
   Args:
     in_tree: pytree to be broadcast. Shardings should correspond to the origin
       replica.
@@ -326,43 +403,68 @@ def broadcast_one_replica_to_all(
     memory_limit_bytes: memory limit for broadcasting in bytes.
     memory_scaling_factor: indicates the fraction of the estimated available
       memory to be used when broadcasting data.
+    max_in_flight_broadcasts: maximum number of groups being broadcast at the
+      same time. 1 disables pipelining.
+    stats_callback: if provided, called with the statistics of each group once
+      it completes.
 
   Returns:
      Tuple containing:
       - pytree with broadcasted data
       - number of broadcasts performed.
   """
+  if max_in_flight_broadcasts < 1:
+    raise ValueError(
+        'max_in_flight_broadcasts must be at least 1, got'
+        f' {max_in_flight_broadcasts}.'
+    )
   if memory_limit_bytes is None:
     memory_limit_bytes = get_available_memory(in_tree, memory_scaling_factor)  # pyrefly: ignore[bad-argument-type]
     logging.info('Using available memory of %d bytes.', memory_limit_bytes)
 
-  tree_len = len(in_tree)
-  start = 0
-  out_tree = []
-  num_broadcasts = 0
-  while start < tree_len:
-    subtree = []
-    current_memory = 0
-    end = start
-    if tree_memory_per_device(in_tree[start]) > memory_limit_bytes:
-      logging.warning(
-          'in_tree leaf size exceeds memory limit for broadcasting. '
-          'Leaf size: %d bytes. Allowed memory limit: %d bytes. Proceeding.',
-          tree_memory_per_device(in_tree[start]),
-          memory_limit_bytes,
-      )
-      subtree.append(in_tree[end])
-      end += 1
-    else:
-      while end < tree_len and (
-          current_memory + tree_memory_per_device(in_tree[end])
-          <= memory_limit_bytes
-      ):
-        subtree.append(in_tree[end])
-        current_memory += tree_memory_per_device(in_tree[end])
-        end += 1
-    subtree = tuple(subtree)
-    num_broadcasts += 1
+  leaf_sizes = [tree_memory_per_device(leaf) for leaf in in_tree]
+  groups = _plan_broadcast_groups(leaf_sizes, memory_limit_bytes)
+
+  out_tree: list[Optional[jax.Array]] = [None] * len(in_tree)
+  in_flight = collections.deque()
+  in_flight_bytes = 0
+  total_bytes_per_device = 0
+  start_time = time.time()
+
+  def _wait_for_oldest():
+    nonlocal in_flight_bytes
+    group_index, indices, dispatch_time = in_flight.popleft()
+    jax.block_until_ready([out_tree[i] for i in indices])
+    stats = BroadcastGroupStats(
+        group_index=group_index,
+        num_leaves=len(indices),
+        bytes_per_device=sum(leaf_sizes[i] for i in indices),
+        duration_secs=time.time() - dispatch_time,
+    )
+    in_flight_bytes -= stats.bytes_per_device
+    logging.vlog(
+        1,
+        'Broadcast group %d: %d leaves, %d bytes per device in %.3fs'
+        ' (%.2f MiB/s).',
+        stats.group_index,
+        stats.num_leaves,
+        stats.bytes_per_device,
+        stats.duration_secs,
+        stats.bandwidth_bytes_per_sec / 2**20,
+    )
+    if stats_callback is not None:
+      stats_callback(stats)
+
+  for group_index, indices in enumerate(groups):
+    group_bytes = sum(leaf_sizes[i] for i in indices)
+    # A group larger than the limit is still dispatched, on its own.
+    while in_flight and (
+        len(in_flight) >= max_in_flight_broadcasts
+        or in_flight_bytes + group_bytes > memory_limit_bytes
+    ):
+      _wait_for_oldest()
+    dispatch_time = time.time()
+    subtree = tuple(in_tree[i] for i in indices)
     globalized_sharded_subtree = jax.tree.map(
         functools.partial(
             _globalize_single_replica_arrays,
@@ -374,15 +476,29 @@ def broadcast_one_replica_to_all(
     )
     # Delete immediately to conserve memory.
     jax.tree.map(lambda x: x.delete(), subtree)
+    del subtree
     out_subtree = _merge_globalized_replicas(
         globalized_sharded_subtree, global_mesh
     )
-    out_tree.extend(out_subtree)
-    jax.block_until_ready(out_subtree)
-    start = end
-
+    for i, out in zip(indices, out_subtree):
+      out_tree[i] = out
+    total_bytes_per_device += group_bytes
+    in_flight_bytes += group_bytes
+    in_flight.append((group_index, indices, dispatch_time))
+  while in_flight:
+    _wait_for_oldest()
+
+  num_broadcasts = len(groups)
   if is_source:
-    logging.info('Total number of broadcasts: %d', num_broadcasts)
+    duration_secs = time.time() - start_time
+    logging.info(
+        'Total number of broadcasts: %d. Broadcast %d bytes per device in'
+        ' %.3fs (%.2f MiB/s).',
+        num_broadcasts,
+        total_bytes_per_device,
+        duration_secs,
+        total_bytes_per_device / max(duration_secs, 1e-9) / 2**20,
+    )
   return tuple(out_tree), num_broadcasts
 
 
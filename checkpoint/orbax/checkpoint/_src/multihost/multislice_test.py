@@ -213,9 +213,76 @@ class UtilsTest(parameterized.TestCase):
         replica_axis_index,
         is_in_primary_replica,
         memory_limit_bytes=broadcast_memory_limit_bytes,
+        max_in_flight_broadcasts=1,
     )
     self.assertEqual(num_broadcasts, 2)
 
+  def test_plan_broadcast_groups(self):
+    # First-fit decreasing fills groups regardless of the leaf order.
+    self.assertEqual(
+        multislice._plan_broadcast_groups([2, 5, 3, 5, 1], 6),
+        [[1, 4], [3], [0, 2]],
+    )
+    # Leaves above the limit are broadcast alone.
+    self.assertEqual(
+        multislice._plan_broadcast_groups([1, 10, 1], 4), [[1], [0, 2]]
+    )
+    self.assertEqual(multislice._plan_broadcast_groups([], 4), [])
+
+  def test_pipelined_broadcast(self):
+    num_devices_per_replica = len(jax.devices()) // 2
+    arr = [
+        np.arange(8 * num_devices_per_replica * (i + 1)).reshape(
+            (8, num_devices_per_replica * (i + 1))
+        )
+        for i in range(4)
+    ]
+    arrays, mesh, _ = setup_replica_sharded_arrays(
+        arr, (2, num_devices_per_replica)  # pyrefly: ignore[bad-argument-type]
+    )
+    single_replica_mesh = jax.sharding.Mesh(
+        multislice.local_replica_devices(mesh), mesh.axis_names[1:]
+    )
+    single_replica_arrays = tuple(
+        jax.device_put(
+            a,
+            jax.sharding.NamedSharding(
+                single_replica_mesh,
+                jax.sharding.PartitionSpec(None, mesh.axis_names[1]),
+            ),
+        )
+        for a in arr
+    )
+    _, primary_replica_pids = multislice.get_primary_replica_ids_and_pids(
+        replica_axis_idx=0, mesh=mesh, primary_replica_id=0
+    )
+    memory_limit_bytes = 2 * max(
+        multislice.get_leaf_memory_per_device(a) for a in arrays
+    )
+    stats = []
+    out, num_broadcasts = multislice.broadcast_one_replica_to_all(
+        single_replica_arrays,
+        mesh,
+        0,
+        multihost.process_index() in primary_replica_pids,
+        memory_limit_bytes=memory_limit_bytes,
+        stats_callback=stats.append,
+    )
+    self.assertEqual(num_broadcasts, len(stats))
+    self.assertEqual(
+        [s.group_index for s in stats], list(range(num_broadcasts))
+    )
+    # Groups are planned against the whole limit rather than a share of it.
+    self.assertLessEqual(
+        max(s.bytes_per_device for s in stats), memory_limit_bytes
+    )
+    self.assertGreater(
+        max(s.bytes_per_device for s in stats), memory_limit_bytes // 2
+    )
+    self.assertEqual(sum(s.num_leaves for s in stats), len(arr))
+    for expected, actual in zip(arr, out):
+      np.testing.assert_array_equal(expected, actual)
+
   def test_globalize_single_replica_arrays_under_active_mesh(self):
     if len(jax.devices()) < 2:
       self.skipTest('Need at least 2 devices for this test')
@@ -0,0 +1,134 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""References from one checkpoint to data stored in another checkpoint.
+
+Incremental saves do not rewrite values that are unchanged since the previous
+save. Instead, the checkpoint records a reference to the directory that holds
+the data. References are stored as paths relative to the referencing directory
+(e.g. `../../5/default`), so that checkpoints remain valid when the root
+directory is moved or copied as a whole.
+
+Every directory containing references also lists them in a
+`DATA_REFERENCES_FILE`, so that garbage collection can keep referenced
+checkpoints alive without parsing handler-specific metadata.
+"""
+
+import json
+from typing import Iterable
+
+from etils import epath
+from orbax.checkpoint._src.path import async_path
+from orbax.checkpoint._src.path import atomicity_types
+
+
+DATA_REFERENCES_FILE = '_DATA_REFERENCES'
+_PARENT = '..'
+_SEPARATOR = '/'
+
+
+def _ancestors(path: epath.Path) -> list[epath.Path]:
+  """Returns `path` followed by its parents, up to the root."""
+  result = [path]
+  while (parent := result[-1].parent) != result[-1]:
+    result.append(parent)
+  return result
+
+
+def get_final_path(path: epath.Path) -> epath.Path:
+  """Returns the location `path` will have once its checkpoint is finalized.
+
+  Strips the temporary-directory suffix from every component of `path`, e.g.
+  `root/5.orbax-checkpoint-tmp/default` becomes `root/5/default`.
+
+  Args:
+    path: A path, possibly inside a temporary checkpoint directory.
+  """
+  ancestors = _ancestors(path)
+  if not any(atomicity_types.TMP_DIR_SUFFIX in p.name for p in ancestors):
+    return path
+  result = ancestors[-1]
+  for p in reversed(ancestors[:-1]):
+    name = p.name
+    if (idx := name.find(atomicity_types.TMP_DIR_SUFFIX)) != -1:
+      name = name[:idx]
+    result = result / name
+  return result
+
+
+def relative_reference(
+    directory: epath.Path, target: epath.Path
+) -> str | None:
+  """Returns a reference to `target` relative to `directory`.
+
+  Args:
+    directory: The referencing directory.
+    target: The referenced directory.
+
+  Returns:
+    The relative reference, or None if the paths share no common ancestor
+    below the root.
+  """
+  target_ancestors = {str(p): i for i, p in enumerate(_ancestors(target))}
+  for up, ancestor in enumerate(_ancestors(directory)):
+    if ancestor.parent == ancestor:
+      return None
+    if (down := target_ancestors.get(str(ancestor))) is not None:
+      names = [p.name for p in _ancestors(target)[:down]]
+      return _SEPARATOR.join([_PARENT] * up + list(reversed(names))) or '.'
+  return None
+
+
+def resolve_reference(directory: epath.Path, reference: str) -> epath.Path:
+  """Resolves a reference produced by `relative_reference`."""
+  for name in reference.split(_SEPARATOR):
+    if name == _PARENT:
+      directory = directory.parent
+    elif name and name != '.':
+      directory = directory / name
+  return directory
+
+
+async def write_references(
+    directory: epath.Path, references: Iterable[str]
+) -> None:
+  """Writes the sorted, de-duplicated `references` of `directory`."""
+  await async_path.write_text(
+      directory / DATA_REFERENCES_FILE,
+      json.dumps(sorted(set(references))),
+  )
+
+
+def read_referenced_directories(directory: epath.Path) -> set[epath.Path]:
+  """Returns directories referenced from `directory` or its children.
+
+  Looks for a `DATA_REFERENCES_FILE` in `directory` itself (e.g. a checkpoint
+  saved by a single handler) and in its immediate subdirectories (e.g. items of
+  a step saved by `CheckpointManager`).
+
+  Args:
+    directory: A checkpoint directory.
+  """
+  if not directory.exists():
+    return set()
+  candidates = [directory / DATA_REFERENCES_FILE] + [
+      p / DATA_REFERENCES_FILE for p in directory.iterdir() if p.is_dir()
+  ]
+  result = set()
+  for path in candidates:
+    if not path.exists():
+      continue
+    for reference in json.loads(path.read_text()):
+      result.add(resolve_reference(path.parent, reference))
+  return result
@@ -0,0 +1,74 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from absl.testing import absltest
+from absl.testing import parameterized
+from etils import epath
+from orbax.checkpoint._src.path import data_references
+
+
+class DataReferencesTest(parameterized.TestCase):
+
+  @parameterized.parameters(
+      ('/root/5.orbax-checkpoint-tmp/default', '/root/5/default'),
+      ('/root/5.orbax-checkpoint-tmp-1234/default', '/root/5/default'),
+      ('/root/5/default', '/root/5/default'),
+      ('gs://bucket/5.orbax-checkpoint-tmp', 'gs://bucket/5'),
+  )
+  def test_get_final_path(self, path, expected):
+    self.assertEqual(
+        epath.Path(expected),
+        data_references.get_final_path(epath.Path(path)),
+    )
+
+  @parameterized.parameters(
+      ('/root/7/default', '/root/5/default', '../../5/default'),
+      ('/root/7', '/root/5', '../5'),
+      ('/root/7', '/root/7', '.'),
+      ('gs://bucket/7/default', 'gs://bucket/5/default', '../../5/default'),
+  )
+  def test_relative_reference(self, directory, target, expected):
+    directory = epath.Path(directory)
+    target = epath.Path(target)
+    reference = data_references.relative_reference(directory, target)
+    self.assertEqual(expected, reference)
+    self.assertEqual(
+        target, data_references.resolve_reference(directory, reference)
+    )
+
+  def test_relative_reference_without_common_ancestor(self):
+    self.assertIsNone(
+        data_references.relative_reference(
+            epath.Path('/a/b'), epath.Path('/c/d')
+        )
+    )
+
+  def test_read_referenced_directories(self):
+    root = epath.Path(self.create_tempdir().full_path)
+    step = root / '7'
+    (step / 'default').mkdir(parents=True)
+    (step / 'other').mkdir()
+    (step / 'default' / data_references.DATA_REFERENCES_FILE).write_text(
+        '["../../5/default", "../../6/default"]'
+    )
+    self.assertEqual(
+        {root / '5' / 'default', root / '6' / 'default'},
+        data_references.read_referenced_directories(step),
+    )
+    self.assertEqual(
+        set(), data_references.read_referenced_directories(root / '8')
+    )
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -17,12 +17,13 @@
 import concurrent.futures
 import dataclasses
 import datetime
+import json
 import os
 import pathlib
 import queue
 import threading
 import time
-from typing import Optional, Protocol, Sequence
+from typing import Callable, Optional, Protocol, Sequence
 from urllib import parse
 
 from absl import logging
@@ -30,6 +31,8 @@ from etils import epath
 import jax
 from orbax.checkpoint._src.logging import event_tracking
 from orbax.checkpoint._src.multihost import multihost
+from orbax.checkpoint._src.path import atomicity_types
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import gcs_utils
 from orbax.checkpoint._src.path import step as step_lib
 from orbax.checkpoint._src.path import utils as path_utils
@@ -46,6 +49,34 @@ _STANDARD_DELETE_DURATION = (
     '/jax/orbax/checkpoint_manager/standard_checkpoint_deleter/duration'
 )
 
+# Lists the steps whose deletion is deferred because other checkpoints
+# reference their data.
+DEFERRED_DELETIONS_FILE = '_DEFERRED_DELETIONS'
+
+
+def read_deferred_steps(directory: epath.Path) -> set[int]:
+  """Returns steps under `directory` that are deleted but still referenced.
+
+  Such steps remain on disk until the last checkpoint referencing their data is
+  deleted, but are no longer checkpoints themselves.
+
+  Args:
+    directory: The root directory of the steps.
+  """
+  path = directory / DEFERRED_DELETIONS_FILE
+  if not path.exists():
+    return set()
+  return set(json.loads(path.read_text()))
+
+
+def _step_dir_name(directory: epath.Path, path: epath.Path) -> Optional[str]:
+  """Returns the name of the subdirectory of `directory` containing `path`."""
+  try:
+    relative = PurePosixPath(str(path)).relative_to(str(directory))
+  except ValueError:
+    return None
+  return relative.parts[0] if relative.parts else None
+
 
 class CheckpointDeleter(Protocol):
   """A protocol defined a CheckpointDeleter."""
@@ -65,112 +96,117 @@ class CheckpointDeleter(Protocol):
 
 @dataclasses.dataclass
 class _DeletionNode:
+  """A directory being deleted.
+
+  Attributes:
+    path: The directory path.
+    parent: The parent directory, or None for the root of the deletion.
+    pending: Number of outstanding tasks (its own scan, plus one per
+      subdirectory) before the directory itself can be removed.
+  """
+
   path: str
-  files: list[str]
+  parent: Optional['_DeletionNode']
+  pending: int = 1
 
 
 class _ParallelDirectoryDeleter:
-  """A class to handle parallel file deletion for local directories."""
+  """A class to handle parallel file deletion for local directories.
+
+  Every directory is a task on a shared thread pool: it lists the directory,
+  submits a task per subdirectory and unlinks its own files. Idle threads pick
+  up whichever directory is next, so scanning and deletion are both spread
+  across all threads. A directory is removed as soon as its last subdirectory
+  is, bottom-up, and the caller is woken when the root is removed.
+  """
 
   def __init__(self, num_threads: int):
     self._num_threads = num_threads
-    self._ready_queue = queue.Queue()
-    self._scan_done = threading.Event()
-    self._active_counter = [0]
-    self._active_lock = threading.Lock()
-
-  def __getstate__(self):
-    return {'_num_threads': self._num_threads}
-
-  def __setstate__(self, state):
-    self._num_threads = state['_num_threads']
-    self._ready_queue = queue.Queue()
-    self._scan_done = threading.Event()
-    self._active_counter = [0]
-    self._active_lock = threading.Lock()
-
-  def _dfs_scan(self, path: str):
-    """Recursively scan path and enqueue files for deletion."""
-    try:
-      with os.scandir(path) as entries_iter:
-        entries = list(entries_iter)
-    except OSError as e:
-      logging.warning('Error scanning %s: %s', path, e)
-      return
-
-    subdirs = []
-    files = []
-    for entry in entries:
-      if entry.is_dir(follow_symlinks=False):
-        subdirs.append(entry.path)
-      else:
-        files.append(entry.path)
-
-    node = _DeletionNode(path=path, files=files)
-    self._ready_queue.put(node)
-
-    for subdir in subdirs:
-      self._dfs_scan(subdir)
-
-  def _process_node(self, node: _DeletionNode):
-    """Worker function. Deletes all files in a single directory node."""
-    with self._active_lock:
-      self._active_counter[0] += 1
 
+  def _process_node(
+      self,
+      executor: concurrent.futures.Executor,
+      node: _DeletionNode,
+      lock: threading.Lock,
+      done: threading.Event,
+  ):
+    """Worker function. Scans a directory node and deletes its files."""
     try:
-      # Delete files
-      for file_path in node.files:
+      try:
+        with os.scandir(node.path) as entries_iter:
+          entries = list(entries_iter)
+      except OSError as e:
+        logging.warning('Error scanning %s: %s', node.path, e)
+        entries = []
+
+      subdirs = []
+      files = []
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          subdirs.append(entry.path)
+        else:
+          files.append(entry.path)
+
+      with lock:
+        node.pending += len(subdirs)
+      for subdir in subdirs:
+        executor.submit(
+            self._process_node,
+            executor,
+            _DeletionNode(path=subdir, parent=node),
+            lock,
+            done,
+        )
+
+      for file_path in files:
         try:
           os.unlink(file_path)
         except OSError as e:
           if not isinstance(e, FileNotFoundError):
             logging.warning('Failed to delete file %s: %s', file_path, e)
     finally:
-      with self._active_lock:
-        self._active_counter[0] -= 1
+      self._complete_task(node, lock, done)
+
+  def _complete_task(
+      self,
+      node: Optional[_DeletionNode],
+      lock: threading.Lock,
+      done: threading.Event,
+  ):
+    """Removes directories whose tasks are all complete, bottom-up."""
+    while node is not None:
+      with lock:
+        node.pending -= 1
+        if node.pending > 0:
+          return
+      try:
+        os.rmdir(node.path)
+      except OSError as e:
+        if not isinstance(e, FileNotFoundError):
+          logging.warning('Failed to delete directory %s: %s', node.path, e)
+      if node.parent is None:
+        done.set()
+      node = node.parent
 
-  def _run_scheduler(self):
-    """Pulls nodes from ready_queue, submits to ThreadPoolExecutor."""
+  def delete(self, path: epath.Path):
+    """Deletes all files and directories recursively under path in parallel."""
+    lock = threading.Lock()
+    done = threading.Event()
     with concurrent.futures.ThreadPoolExecutor(
         max_workers=self._num_threads, thread_name_prefix='Worker'
     ) as executor:
-      while True:
-        try:
-          node = self._ready_queue.get(timeout=0.1)
-        except queue.Empty:
-          if (
-              self._scan_done.is_set()
-              and self._active_counter[0] == 0
-              and self._ready_queue.empty()
-          ):
-            break
-          continue
-
-        executor.submit(self._process_node, node)
-        self._ready_queue.task_done()
-
-  def delete(self, path: epath.Path):
-    """Deletes all files recursively under path in parallel, then rmtrees it."""
-    self._ready_queue = queue.Queue()
-    self._scan_done.clear()
-    self._active_counter[0] = 0
-
-    root_dir = str(path)
-
-    def scan_target():
-      self._dfs_scan(root_dir)
-      self._scan_done.set()
-
-    scan_thread = threading.Thread(target=scan_target, name='ScanThread')
-    scan_thread.start()
-
-    # Run scheduler
-    self._run_scheduler()
-
-    scan_thread.join()
+      executor.submit(
+          self._process_node,
+          executor,
+          _DeletionNode(path=str(path), parent=None),
+          lock,
+          done,
+      )
+      done.wait()
 
-    # Clean up the directory structure itself
-    path.rmtree()
+    # Anything left over failed to delete above; retry to surface the error.
+    if path.exists():
+      path.rmtree()
 
 
 def _is_local_path(path: epath.Path) -> bool:
@@ -182,7 +218,14 @@ def _is_local_path(path: epath.Path) -> bool:
 
 
 class StandardCheckpointDeleter:
-  """A StandardCheckpointDeleter."""
+  """A StandardCheckpointDeleter.
+
+  If `is_reference_counted` returns True, deletion is reference counted: a step
+  holding data referenced by another checkpoint under `directory` (see
+  `data_references`) stays on disk until the last checkpoint referencing it is
+  deleted. Deferred steps are recorded in `DEFERRED_DELETIONS_FILE`, so that
+  later deleters, including those of later runs, complete their deletion.
+  """
 
   def __init__(
       self,
@@ -194,6 +237,7 @@ class StandardCheckpointDeleter:
       todelete_full_path: Optional[str] = None,
       duration_metric: Optional[str] = _STANDARD_DELETE_DURATION,
       num_threads: Optional[int] = None,
+      is_reference_counted: Optional[Callable[[], bool]] = None,
   ):
     """StandardCheckpointDeleter constructor.
 
@@ -205,6 +249,9 @@ class StandardCheckpointDeleter:
       todelete_full_path: refer to CheckpointManagerOptions.todelete_full_path
       duration_metric: the name of the total delete duration metric
       num_threads: number of threads to use for parallel file deletion
+      is_reference_counted: returns whether checkpoints under `directory` may
+        reference data in other checkpoints, in which case deletion is
+        reference counted. Not reference counted if None.
     """
     self._primary_host = primary_host
     self._directory = directory
@@ -221,6 +268,10 @@ class StandardCheckpointDeleter:
     self._parallel_deleter = None
     if self._num_threads > 1 and _is_local_path(self._directory):
       self._parallel_deleter = _ParallelDirectoryDeleter(self._num_threads)
+    self._is_reference_counted = is_reference_counted
+    # Finalized checkpoints are immutable, so their references are cached by
+    # directory name.
+    self._references_cache: dict[str, frozenset[str]] = {}
 
   def _rmtree(self, path: epath.Path):
     """Recursively deletes a path.
@@ -238,11 +289,104 @@ class StandardCheckpointDeleter:
   def delete(self, step: int) -> None:
     """Deletes step dir or renames it if options are set.
 
-    See `CheckpointManagerOptions.todelete_subdir` for details.
+    See `CheckpointManagerOptions.todelete_subdir` for details. If deletion is
+    reference counted, a step that is still referenced is deleted later.
 
     Args:
       step: checkpointing step number.
     """
+    self._delete_steps([step])
+
+  def _read_references(self, path: epath.Path) -> frozenset[str]:
+    """Returns names of the step directories referenced from `path`."""
+    is_tmp = atomicity_types.TMP_DIR_SUFFIX in path.name
+    if not is_tmp and path.name in self._references_cache:
+      return self._references_cache[path.name]
+    references = frozenset(
+        name
+        for p in data_references.read_referenced_directories(path)
+        if (name := _step_dir_name(self._directory, p)) is not None
+    )
+    if not is_tmp:
+      self._references_cache[path.name] = references
+    return references
+
+  def _delete_unreferenced(self, steps: Sequence[int]) -> None:
+    """Deletes `steps` and deferred steps that are no longer referenced.
+
+    References only point to older checkpoints, so steps are considered from
+    newest to oldest: deleting a step may release the steps it references.
+    Checkpoints that are still being saved count as referencing.
+
+    Args:
+      steps: steps to delete.
+    """
+    if not multihost.is_primary_host(self._primary_host):
+      logging.info(
+          'Not primary host(%s), skipping deletion of steps %s.',
+          self._primary_host,
+          steps,
+      )
+      return
+    deferred_steps = read_deferred_steps(self._directory)
+    targets = {}
+    for step in {*steps, *deferred_steps}:
+      if (delete_target := self._find_delete_target(step)) is not None:
+        targets[step] = delete_target
+    target_names = {delete_target.name for delete_target in targets.values()}
+    # A single listing of the root directory per batch of deletions.
+    referenced = set()
+    for path in self._directory.iterdir():
+      if (
+          path.name not in target_names
+          and path.name != self._todelete_subdir
+          and path.is_dir()
+      ):
+        referenced.update(self._read_references(path))
+
+    still_deferred = set()
+    for step in sorted(targets, reverse=True):
+      delete_target = targets[step]
+      if delete_target.name in referenced:
+        still_deferred.add(step)
+        referenced.update(self._read_references(delete_target))
+      else:
+        self._references_cache.pop(delete_target.name, None)
+        self._delete(step, delete_target)
+    if still_deferred:
+      logging.info(
+          'Deferring deletion of steps %s, which hold data referenced by other'
+          ' checkpoints.',
+          sorted(still_deferred),
+      )
+    if still_deferred != deferred_steps:
+      deferred_path = self._directory / DEFERRED_DELETIONS_FILE
+      if still_deferred:
+        deferred_path.write_text(json.dumps(sorted(still_deferred)))
+      else:
+        deferred_path.unlink(missing_ok=True)
+
+  def _find_delete_target(self, step: int) -> Optional[epath.Path]:
+    """Returns the directory of `step`, or None if it does not exist."""
+    try:
+      return step_lib.find_step_path(
+          self._directory,
+          self._name_format,
+          step=step,
+          include_uncommitted=True,
+      )
+    except ValueError as e:
+      logging.warning(
+          'Unable to find the step %d for deletion or renaming, err=%s',
+          step,
+          e,
+      )
+      return None
+
+  def _delete(
+      self, step: int, delete_target: Optional[epath.Path] = None
+  ) -> None:
+    """Deletes a single step, at `delete_target` if already found."""
     start = time.time()
     try:
       if multihost.is_primary_host(self._primary_host):
@@ -259,20 +403,10 @@ class StandardCheckpointDeleter:
         )
         return
 
-      try:
-        delete_target = step_lib.find_step_path(
-            self._directory,
-            self._name_format,
-            step=step,
-            include_uncommitted=True,
-        )
-      except ValueError as e:
-        logging.warning(
-            'Unable to find the step %d for deletion or renaming, err=%s',
-            step,
-            e,
-        )
-        return
+      if delete_target is None:
+        delete_target = self._find_delete_target(step)
+        if delete_target is None:
+          return
 
       # Attempt to rename using GCS HNS API if configured.
       if self._todelete_full_path is not None:
@@ -373,8 +507,14 @@ class StandardCheckpointDeleter:
 
   def delete_steps(self, steps: Sequence[int]) -> None:
     logging.info('Queuing deletion of steps: %s.', steps)
+    self._delete_steps(steps)
+
+  def _delete_steps(self, steps: Sequence[int]) -> None:
+    if self._is_reference_counted is not None and self._is_reference_counted():
+      self._delete_unreferenced(steps)
+      return
     for step in steps:
-      self.delete(step)
+      self._delete(step)
 
   def close(self) -> None:
     pass
@@ -392,8 +532,22 @@ class ThreadedCheckpointDeleter:
       todelete_subdir: Optional[str] = None,
       todelete_full_path: Optional[str] = None,
       num_threads: Optional[int] = None,
+      on_deleted: Optional[Callable[[int], None]] = None,
+      is_reference_counted: Optional[Callable[[], bool]] = None,
   ):
-    """ThreadedCheckpointDeleter deletes checkpoints in a background thread."""
+    """ThreadedCheckpointDeleter deletes checkpoints in a background thread.
+
+    Args:
+      directory: refer to CheckpointManager.directory
+      name_format: refer to CheckpointManager._name_format
+      primary_host: refer to CheckpointManager.primary_host
+      todelete_subdir: refer to CheckpointManagerOptions.todelete_subdir
+      todelete_full_path: refer to CheckpointManagerOptions.todelete_full_path
+      num_threads: number of threads to use for parallel file deletion
+      on_deleted: called in the background thread with each step whose
+        deletion has completed.
+      is_reference_counted: see `StandardCheckpointDeleter`.
+    """
     self._standard_deleter = StandardCheckpointDeleter(
         primary_host=primary_host,
         directory=directory,
@@ -402,7 +556,9 @@ class ThreadedCheckpointDeleter:
         name_format=name_format,
         duration_metric=_THREADED_DELETE_DURATION,
         num_threads=num_threads,
+        is_reference_counted=is_reference_counted,
     )
+    self._on_deleted = on_deleted
     self._delete_queue = queue.Queue()
     self._exception = None
     # Turn on daemon=True so the thread won't block the main thread and die
@@ -424,6 +580,8 @@ class ThreadedCheckpointDeleter:
         if step < 0:
           break
         self._standard_deleter.delete(step)
+        if self._on_deleted is not None:
+          self._on_deleted(step)
       except Exception as e:  # pylint: disable=broad-exception-caught
         self._exception = e
         break
@@ -458,8 +616,26 @@ def create_checkpoint_deleter(
     todelete_full_path: Optional[str] = None,
     enable_background_delete: bool = False,
     num_threads: Optional[int] = None,
+    on_deleted: Optional[Callable[[int], None]] = None,
+    is_reference_counted: Optional[Callable[[], bool]] = None,
 ) -> CheckpointDeleter:
-  """Creates a CheckpointDeleter."""
+  """Creates a CheckpointDeleter.
+
+  Args:
+    directory: refer to CheckpointManager.directory
+    name_format: refer to CheckpointManager._name_format
+    primary_host: refer to CheckpointManager.primary_host
+    todelete_subdir: refer to CheckpointManagerOptions.todelete_subdir
+    todelete_full_path: refer to CheckpointManagerOptions.todelete_full_path
+    enable_background_delete: whether to delete checkpoints in a background
+      thread.
+    num_threads: number of threads to use for parallel file deletion
+    on_deleted: with `enable_background_delete`, called in the background
+      thread with each step whose deletion has completed. Other deleters
+      complete deletions before returning.
+    is_reference_counted: returns whether deletion is reference counted, see
+      `StandardCheckpointDeleter`.
+  """
 
   if enable_background_delete:
     return ThreadedCheckpointDeleter(
@@ -469,6 +645,8 @@ def create_checkpoint_deleter(
         todelete_subdir=todelete_subdir,
         todelete_full_path=todelete_full_path,
         num_threads=num_threads,
+        on_deleted=on_deleted,
+        is_reference_counted=is_reference_counted,
     )
   else:
     return StandardCheckpointDeleter(
@@ -478,4 +656,5 @@ def create_checkpoint_deleter(
         todelete_subdir=todelete_subdir,
         todelete_full_path=todelete_full_path,
         num_threads=num_threads,
+        is_reference_counted=is_reference_counted,
     )
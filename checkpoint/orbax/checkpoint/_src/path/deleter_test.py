@@ -14,6 +14,7 @@
 
 """To test Orbax in single-host setup."""
 
+import json
 import os
 from typing import Any
 import unittest
@@ -22,6 +23,7 @@ from unittest import mock
 from absl.testing import absltest
 from absl.testing import parameterized
 from etils import epath
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import deleter as deleter_lib
 from orbax.checkpoint._src.path import step as step_lib
 
@@ -66,6 +68,41 @@ class CheckpointDeleterTest(parameterized.TestCase):
 
     deleter.close()
 
+  @parameterized.parameters((False,), (True,))
+  def test_reference_counted_delete(self, threaded):
+    """Test referenced steps are deleted with their last reference."""
+    for step in range(3):
+      (self.ckpt_dir / str(step) / 'default').mkdir(parents=True)
+    # Step 1 references step 0, and step 2 references step 1.
+    for step in (1, 2):
+      path = self.ckpt_dir / str(step) / 'default'
+      (path / data_references.DATA_REFERENCES_FILE).write_text(
+          json.dumps([f'../../{step - 1}/default'])
+      )
+
+    def create_deleter():
+      return deleter_lib.create_checkpoint_deleter(
+          self.ckpt_dir,
+          name_format=step_lib.standard_name_format(),
+          primary_host=None,
+          enable_background_delete=threaded,
+          is_reference_counted=lambda: True,
+      )
+
+    deleter = create_deleter()
+    deleter.delete_steps([0, 1])
+    deleter.close()
+    self.assertTrue((self.ckpt_dir / '0').exists())
+    self.assertTrue((self.ckpt_dir / '1').exists())
+    self.assertEqual({0, 1}, deleter_lib.read_deferred_steps(self.ckpt_dir))
+
+    # Deferred deletions are completed by later deleters.
+    deleter = create_deleter()
+    deleter.delete(2)
+    deleter.close()
+    self.assertEmpty(list(self.ckpt_dir.iterdir()))
+    self.assertEmpty(deleter_lib.read_deferred_steps(self.ckpt_dir))
+
   def test_checkpoint_deleter_parallel_delete(self):
     """Test parallel deletion works and deletes all files."""
     deleter = deleter_lib.create_checkpoint_deleter(
@@ -103,6 +140,23 @@ class CheckpointDeleterTest(parameterized.TestCase):
     # Assert the entire step_dir is deleted
     self.assertFalse(step_dir.exists())
 
+  def test_parallel_directory_deleter_nested_tree(self):
+    root = self.ckpt_dir / 'tree'
+    for i in range(5):
+      for j in range(4):
+        leaf = root / f'd{i}' / f'e{j}' / 'f'
+        leaf.mkdir(parents=True)
+        for k in range(3):
+          (leaf.parent / f'file{k}').write_text('x')
+      (root / f'd{i}' / 'empty').mkdir()
+    (root / 'root_file').write_text('x')
+    os.symlink(root / 'd0', root / 'link_to_dir')
+
+    deleter_lib._ParallelDirectoryDeleter(num_threads=4).delete(root)
+
+    self.assertFalse(root.exists())
+    self.assertTrue(self.ckpt_dir.exists())
+
   def test_is_local_path(self):
     self.assertTrue(deleter_lib._is_local_path(epath.Path('/tmp/foo')))
     self.assertTrue(deleter_lib._is_local_path(epath.Path('foo/bar')))
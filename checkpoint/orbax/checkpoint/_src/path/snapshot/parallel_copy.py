@@ -0,0 +1,304 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel copy of local directory trees, used to create snapshots.
+
+Files are copied by a thread pool. Files larger than `CopyOptions.chunk_bytes`
+are split into ranged copies that run concurrently. Each range is copied with
+the cheapest mechanism the filesystem supports:
+
+1. A reflink (`FICLONE`), which shares data blocks copy-on-write, is attempted
+   once per file on Linux.
+2. `os.copy_file_range`, which copies in kernel space.
+3. Plain `os.pread` / `os.pwrite`.
+
+Alternatively, `CopyMode.HARDLINK` links files instead of copying them. Only use
+it when neither the source nor the snapshot is modified in place afterwards,
+since both names refer to the same data.
+"""
+
+import concurrent.futures
+import dataclasses
+import enum
+import errno
+import os
+import threading
+import time
+from typing import Iterable
+from urllib import parse
+
+from absl import logging
+from etils import epath
+import jax
+
+
+_FICLONE = 0x40049409
+# Errors indicating that a fast path is unsupported, rather than a failure.
+_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EPERM,
+    errno.EBADF,
+})
+_IO_BLOCK_BYTES = 8 * 1024**2
+
+
+class CopyMode(enum.Enum):
+  COPY = 'copy'
+  HARDLINK = 'hardlink'
+
+
+@dataclasses.dataclass(frozen=True)
+class CopyOptions:
+  """Options for `copy_tree`.
+
+  Attributes:
+    mode: Whether to copy or hardlink files. Hardlinking falls back to copying
+      for files on a different filesystem.
+    num_threads: Number of copy threads. Defaults to the number of CPUs, at
+      most 32.
+    chunk_bytes: Files larger than this are copied as concurrent ranges of
+      this size.
+    enable_reflink: Whether to attempt copy-on-write clones.
+  """
+
+  mode: CopyMode = CopyMode.COPY
+  num_threads: int | None = None
+  chunk_bytes: int = 256 * 1024**2
+  enable_reflink: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class CopyStats:
+  num_files: int
+  num_bytes: int
+  duration_secs: float
+
+
+def is_supported(path: epath.Path) -> bool:
+  """Whether `copy_tree` supports `path`, i.e. it is on a local filesystem."""
+  return not parse.urlparse(os.fspath(path)).scheme
+
+
+def _is_unsupported(e: OSError) -> bool:
+  return e.errno in _UNSUPPORTED_ERRNOS
+
+
+class _FileCopier:
+  """Copies the ranges of a single file, possibly from several threads."""
+
+  def __init__(self, src: str, dst: str, size: int, options: CopyOptions):
+    self._src = src
+    self._dst = dst
+    self._size = size
+    self._options = options
+    self._src_fd = os.open(src, os.O_RDONLY)
+    self._dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    self._lock = threading.Lock()
+    self._pending = 0
+    self._use_copy_file_range = hasattr(os, 'copy_file_range')
+    self.start_time = time.time()
+
+  def try_reflink(self) -> bool:
+    """Clones the whole file, if supported by the filesystem."""
+    if not self._options.enable_reflink or not self._size:
+      return False
+    try:
+      import fcntl  # pylint: disable=g-import-not-at-top
+
+      fcntl.ioctl(self._dst_fd, _FICLONE, self._src_fd)
+      return True
+    except ImportError:
+      return False
+    except OSError as e:
+      if _is_unsupported(e):
+        return False
+      raise
+
+  def ranges(self) -> list[tuple[int, int]]:
+    """Returns the ranges to copy, and preallocates the destination."""
+    chunk_bytes = max(self._options.chunk_bytes, 1)
+    ranges = [
+        (offset, min(chunk_bytes, self._size - offset))
+        for offset in range(0, self._size, chunk_bytes)
+    ]
+    if len(ranges) > 1:
+      os.ftruncate(self._dst_fd, self._size)
+    self._pending = len(ranges)
+    return ranges
+
+  def copy_range(self, offset: int, length: int) -> None:
+    end = offset + length
+    while offset < end:
+      copied = None
+      if self._use_copy_file_range:
+        try:
+          copied = os.copy_file_range(
+              self._src_fd, self._dst_fd, end - offset, offset, offset
+          )
+        except OSError as e:
+          if not _is_unsupported(e):
+            raise
+          self._use_copy_file_range = False
+      if copied is None:
+        data = os.pread(
+            self._src_fd, min(_IO_BLOCK_BYTES, end - offset), offset
+        )
+        copied = os.pwrite(self._dst_fd, data, offset) if data else 0
+      if not copied:
+        raise OSError(
+            errno.EIO, f'Unexpected end of file while copying {self._src}.'
+        )
+      offset += copied
+
+  def finish_range(self) -> bool:
+    """Marks a range as done; returns whether the file is complete."""
+    with self._lock:
+      self._pending -= 1
+      return self._pending <= 0
+
+  def close(self) -> None:
+    os.close(self._src_fd)
+    os.close(self._dst_fd)
+
+
+def _list_files(
+    src: str, dst: str, skip_paths: set[str]
+) -> list[tuple[str, str, int]]:
+  """Creates the destination directories and returns files to copy."""
+  files = []
+  for root, dirs, filenames in os.walk(src):
+    relative_path = os.path.relpath(root, src)
+    if relative_path == os.curdir:
+      relative_path = ''
+    if relative_path in skip_paths:
+      dirs[:] = []
+      continue
+    # Prune dirs that are in skip_paths to prevent traversal.
+    dirs[:] = [
+        d for d in dirs if os.path.join(relative_path, d) not in skip_paths
+    ]
+    dst_root = os.path.join(dst, relative_path)
+    os.makedirs(dst_root, exist_ok=True)
+    for filename in filenames:
+      if os.path.join(relative_path, filename) in skip_paths:
+        continue
+      src_file = os.path.join(root, filename)
+      dst_file = os.path.join(dst_root, filename)
+      files.append((src_file, dst_file, os.path.getsize(src_file)))
+  return files
+
+
+def copy_tree(
+    src: epath.PathLike,
+    dst: epath.PathLike,
+    *,
+    options: CopyOptions = CopyOptions(),
+    skip_paths: Iterable[str] | None = None,
+) -> CopyStats:
+  """Recursively copies the local directory `src` to `dst` in parallel.
+
+  Args:
+    src: The source directory to copy from.
+    dst: The destination directory to copy to.
+    options: See `CopyOptions`.
+    skip_paths: An optional iterable of relative paths to skip.
+
+  Returns:
+    Statistics of the copy.
+  """
+  start_time = time.time()
+  src, dst = os.fspath(src), os.fspath(dst)
+  files = _list_files(src, dst, set(skip_paths or ()))
+  num_files = len(files)
+  num_bytes = sum(size for _, _, size in files)
+
+  if options.mode == CopyMode.HARDLINK:
+    to_copy = []
+    for src_file, dst_file, size in files:
+      try:
+        os.link(src_file, dst_file)
+      except OSError as e:
+        if not _is_unsupported(e):
+          raise
+        to_copy.append((src_file, dst_file, size))
+    if len(to_copy) < len(files):
+      logging.info(
+          'Hardlinked %d of %d files from %s to %s.',
+          len(files) - len(to_copy),
+          len(files),
+          src,
+          dst,
+      )
+    files = to_copy
+
+  num_threads = options.num_threads or min(32, os.cpu_count() or 1)
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=num_threads, thread_name_prefix='snapshot_copy'
+  ) as executor:
+
+    def _copy_range(copier: _FileCopier, offset: int, length: int):
+      try:
+        copier.copy_range(offset, length)
+      finally:
+        if copier.finish_range():
+          copier.close()
+          jax.monitoring.record_event_duration_secs(
+              '/jax/orbax/snapshot/copy_file_duration_secs',
+              time.time() - copier.start_time,
+          )
+
+    def _start_file(src_file: str, dst_file: str, size: int):
+      copier = _FileCopier(src_file, dst_file, size, options)
+      try:
+        if copier.try_reflink():
+          ranges = []
+        else:
+          ranges = copier.ranges()
+      except BaseException:
+        copier.close()
+        raise
+      if not ranges:
+        copier.close()
+        return []
+      # Copies the first range on this thread and schedules the others.
+      futures = [
+          executor.submit(_copy_range, copier, offset, length)
+          for offset, length in ranges[1:]
+      ]
+      _copy_range(copier, *ranges[0])
+      return futures
+
+    file_futures = [executor.submit(_start_file, *f) for f in files]
+    range_futures = []
+    for f in file_futures:
+      range_futures.extend(f.result())
+    for f in range_futures:
+      f.result()
+
+  duration_secs = time.time() - start_time
+  jax.monitoring.record_event_duration_secs(
+      '/jax/orbax/snapshot/copy_duration_secs', duration_secs
+  )
+  if duration_secs > 0:
+    jax.monitoring.record_scalar(
+        '/jax/orbax/snapshot/copy_gbytes_per_sec',
+        num_bytes / 1024**3 / duration_secs,
+    )
+  return CopyStats(
+      num_files=num_files, num_bytes=num_bytes, duration_secs=duration_secs
+  )
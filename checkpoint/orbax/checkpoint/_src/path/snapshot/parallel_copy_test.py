@@ -0,0 +1,109 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import parameterized
+from etils import epath
+from orbax.checkpoint._src.path.snapshot import parallel_copy
+
+
+class ParallelCopyTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.root = epath.Path(self.create_tempdir().full_path)
+    self.src = self.root / 'src'
+    self.dst = self.root / 'dst'
+    (self.src / 'a' / 'b').mkdir(parents=True)
+    (self.src / 'empty_dir').mkdir()
+    self.contents = {
+        'small.txt': b'small',
+        'empty.txt': b'',
+        'a/large.bin': os.urandom(10_000),
+        'a/b/medium.bin': os.urandom(2_500),
+    }
+    for name, data in self.contents.items():
+      (self.src / name).write_bytes(data)
+
+  def assert_copied(self, skipped=()):
+    for name, data in self.contents.items():
+      if name in skipped:
+        self.assertFalse((self.dst / name).exists())
+      else:
+        self.assertEqual((self.dst / name).read_bytes(), data)
+    self.assertTrue((self.dst / 'empty_dir').is_dir())
+
+  @parameterized.product(
+      chunk_bytes=(1000, 1 << 20),
+      enable_reflink=(True, False),
+      num_threads=(1, 4),
+  )
+  def test_copy_tree(self, chunk_bytes, enable_reflink, num_threads):
+    stats = parallel_copy.copy_tree(
+        self.src,
+        self.dst,
+        options=parallel_copy.CopyOptions(
+            chunk_bytes=chunk_bytes,
+            enable_reflink=enable_reflink,
+            num_threads=num_threads,
+        ),
+    )
+    self.assert_copied()
+    self.assertEqual(stats.num_files, 4)
+    self.assertEqual(
+        stats.num_bytes, sum(len(d) for d in self.contents.values())
+    )
+    self.assertFalse(
+        os.path.samefile(self.src / 'small.txt', self.dst / 'small.txt')
+    )
+
+  def test_fallback_without_copy_file_range(self):
+    with mock.patch.object(
+        os, 'copy_file_range', side_effect=OSError(18, 'EXDEV')
+    ):
+      parallel_copy.copy_tree(
+          self.src,
+          self.dst,
+          options=parallel_copy.CopyOptions(
+              chunk_bytes=1000, enable_reflink=False
+          ),
+      )
+    self.assert_copied()
+
+  def test_hardlink(self):
+    parallel_copy.copy_tree(
+        self.src,
+        self.dst,
+        options=parallel_copy.CopyOptions(mode=parallel_copy.CopyMode.HARDLINK),
+    )
+    self.assert_copied()
+    self.assertTrue(
+        os.path.samefile(self.src / 'a/large.bin', self.dst / 'a/large.bin')
+    )
+
+  def test_skip_paths(self):
+    parallel_copy.copy_tree(self.src, self.dst, skip_paths=['a/b', 'small.txt'])
+    self.assert_copied(skipped=('a/b/medium.bin', 'small.txt'))
+    self.assertFalse((self.dst / 'a' / 'b').exists())
+
+  def test_is_supported(self):
+    self.assertTrue(parallel_copy.is_supported(epath.Path('/tmp/foo')))
+    self.assertFalse(parallel_copy.is_supported(epath.Path('gs://bucket/foo')))
+
+
+if __name__ == '__main__':
+  absltest.main()
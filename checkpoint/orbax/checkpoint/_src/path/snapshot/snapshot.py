@@ -25,6 +25,7 @@ from etils import epath
 from orbax.checkpoint._src.logging import event_tracking
 from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.path import utils as ocp_path_utils
+from orbax.checkpoint._src.path.snapshot import parallel_copy
 
 
 
@@ -79,9 +80,12 @@ class _DefaultSnapshot(Snapshot):
       self,
       src: epath.PathLike,
       dst: epath.PathLike,
+      *,
+      copy_options: parallel_copy.CopyOptions | None = None,
   ):
     self._source = epath.Path(src)
     self._snapshot = epath.Path(dst)
+    self._copy_options = copy_options or parallel_copy.CopyOptions()
 
   async def create_snapshot(self) -> None:
     """Creates a deep copy of the checkpoint."""
@@ -95,11 +99,29 @@ class _DefaultSnapshot(Snapshot):
     event_tracking.record_read_metadata_event(self._source)
 
     t = ocp_path_utils.Timer()
-    await asyncio.to_thread(
-        ocp_path_utils.recursively_copy_files,
-        self._source,
-        self._snapshot,
-    )
+    if parallel_copy.is_supported(self._source) and parallel_copy.is_supported(
+        self._snapshot
+    ):
+      stats = await asyncio.to_thread(
+          parallel_copy.copy_tree,
+          self._source,
+          self._snapshot,
+          options=self._copy_options,
+      )
+      logging.info(
+          "Snapshot copy of %d files (%d bytes) from %s to %s: %fs",
+          stats.num_files,
+          stats.num_bytes,
+          self._source,
+          self._snapshot,
+          stats.duration_secs,
+      )
+    else:
+      await asyncio.to_thread(
+          ocp_path_utils.recursively_copy_files,
+          self._source,
+          self._snapshot,
+      )
     logging.debug(
         "Snapshot copy: %fs",
         t.get_duration(),
@@ -192,9 +214,10 @@ def create_instance(
     *,
     set_immutable: bool | None = None,
     snapshot_type: SnapshotType = SnapshotType.IN_PLACE,
+    copy_options: parallel_copy.CopyOptions | None = None,
 ):
   """Creates a snapshot instance according to the provided options."""
   if snapshot_type == SnapshotType.EMPTY:
     return _EmptySnapshot(source, snapshot)
 
-  return _DefaultSnapshot(source, snapshot)
+  return _DefaultSnapshot(source, snapshot, copy_options=copy_options)
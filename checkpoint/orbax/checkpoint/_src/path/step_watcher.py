@@ -0,0 +1,348 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watches a root directory for newly finalized checkpoint steps.
+
+Listing a root directory is cheap compared to checking every step for
+finalization, which needs at least one request per step on object stores. The
+watcher keeps a cursor on the latest finalized step, and only checks steps
+above it, newest first.
+
+On local Linux filesystems, waiting for changes is driven by inotify, so new
+steps are found as soon as they are renamed into place. The names reported by
+inotify are then the only entries checked, and the directory is only listed
+again if notifications may have been lost. Elsewhere, the watcher polls at a
+fixed interval and lists the directory on every check: step names are not
+zero-padded by default, so they do not sort in step order and a listing cannot
+start after the latest step.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import AsyncIterator, Iterable, Optional
+
+from absl import logging
+from etils import epath
+from etils import epy
+from orbax.checkpoint._src.path import step as step_lib
+
+
+# See inotify(7).
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_WATCH_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_IN_READ_SIZE = 64 * 1024
+# struct inotify_event: wd, mask, cookie, len, followed by `len` name bytes.
+_IN_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _parse_step(name: str) -> Optional[int]:
+  """Returns the step of a step directory name, or None."""
+  # Same names as `step.checkpoint_steps`; excludes temporary directories.
+  if name.isdigit():
+    return int(name)
+  suffix = name.split('_')[-1]
+  if suffix.isdigit():
+    return int(suffix)
+  return None
+
+
+def _is_local_path(directory: epath.Path) -> bool:
+  return '://' not in os.fspath(directory)
+
+
+class _Notifier:
+  """Blocks until a directory may have changed."""
+
+  def watch(self):
+    """Starts reporting changes, if possible."""
+
+  def wait(self, timeout: float) -> bool:
+    """Waits for up to `timeout` seconds; returns True if woken by a change."""
+    time.sleep(timeout)
+    return False
+
+  def drain(self) -> Optional[list[str]]:
+    """Consumes pending notifications.
+
+    Returns:
+      The names of the entries added since the previous call, or None if they
+      are not known.
+    """
+    return None
+
+  def close(self):
+    pass
+
+
+class _InotifyNotifier(_Notifier):
+  """Notifier backed by an inotify watch on the directory."""
+
+  def __init__(self, directory: epath.Path):
+    self._directory = directory
+    self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if self._fd < 0:
+      raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+    self._watching = False
+    # Whether all changes since the previous drain have been notified.
+    self._complete = False
+
+  def _maybe_add_watch(self) -> bool:
+    if not self._watching:
+      wd = self._libc.inotify_add_watch(
+          self._fd, os.fsencode(os.fspath(self._directory)), _IN_WATCH_MASK
+      )
+      # The directory may not exist yet.
+      self._watching = wd >= 0
+      # Changes made before the watch was added are unknown.
+      self._complete = False
+    return self._watching
+
+  def watch(self):
+    self._maybe_add_watch()
+
+  def wait(self, timeout: float) -> bool:
+    if not self._maybe_add_watch():
+      return super().wait(timeout)
+    readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+    return bool(readable)
+
+  def drain(self) -> Optional[list[str]]:
+    complete = self._complete
+    names = []
+    while True:
+      try:
+        events = os.read(self._fd, _IN_READ_SIZE)
+      except BlockingIOError:
+        break
+      if not events:
+        break
+      offset = 0
+      while offset + _IN_EVENT_HEADER.size <= len(events):
+        _, mask, _, name_len = _IN_EVENT_HEADER.unpack_from(events, offset)
+        if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+          # Re-add the watch if the directory was removed or moved.
+          self._watching = False
+          complete = False
+        if mask & _IN_Q_OVERFLOW:
+          complete = False
+        name_start = offset + _IN_EVENT_HEADER.size
+        offset = name_start + name_len
+        if name_len:
+          names.append(
+              os.fsdecode(events[name_start:offset].rstrip(b'\0'))
+          )
+    self._complete = self._watching
+    return names if complete else None
+
+  def close(self):
+    os.close(self._fd)
+
+
+def _create_notifier(directory: epath.Path, use_inotify: bool) -> _Notifier:
+  if use_inotify and sys.platform == 'linux' and _is_local_path(directory):
+    try:
+      return _InotifyNotifier(directory)
+    except (OSError, AttributeError) as e:
+      logging.warning(
+          'inotify is unavailable (%s); polling %s instead.', e, directory
+      )
+  return _Notifier()
+
+
+class StepWatcher(epy.ContextManager):
+  """Watches `directory` for newly finalized checkpoint steps.
+
+  Steps are recognized by name, as in `step.checkpoint_steps`. Only steps newer
+  than the latest finalized step seen so far are reported; if several steps are
+  finalized between two checks, only the newest one is reported.
+
+  Usage::
+
+    with StepWatcher(directory) as watcher:
+      async for step in watcher:
+        evaluate(step)
+  """
+
+  def __init__(
+      self,
+      directory: epath.PathLike,
+      *,
+      poll_interval_secs: float = 1.0,
+      coalesce_secs: float = 0.1,
+      use_inotify: bool = True,
+  ):
+    """Constructor.
+
+    Args:
+      directory: The root directory containing step directories.
+      poll_interval_secs: Maximum time between two checks for new steps.
+      coalesce_secs: Time to wait after a change notification before checking
+        for new steps, so that bursts of changes are handled by one check.
+      use_inotify: If True, uses inotify to be notified of changes to local
+        directories on Linux.
+    """
+    self._directory = epath.Path(directory)
+    self._poll_interval_secs = poll_interval_secs
+    self._coalesce_secs = coalesce_secs
+    self._notifier = _create_notifier(self._directory, use_inotify)
+    self._latest_step: Optional[int] = None
+    # Steps above `latest_step` that were not finalized when last checked.
+    self._candidates: dict[int, epath.Path] = {}
+    # Names of entries added since the last check, or None if the directory
+    # must be listed.
+    self._added_names: Optional[set[str]] = None
+    self._lock = threading.Lock()
+
+  @property
+  def directory(self) -> epath.Path:
+    return self._directory
+
+  @property
+  def latest_step(self) -> Optional[int]:
+    """Returns the latest finalized step seen so far."""
+    return self._latest_step
+
+  def reset(self):
+    """Forgets the latest step, e.g. after it was deleted."""
+    with self._lock:
+      self._latest_step = None
+      self._added_names = None
+
+  def _collect_added_names(self):
+    names = self._notifier.drain()
+    if names is None:
+      self._added_names = None
+    elif self._added_names is not None:
+      self._added_names.update(names)
+
+  def _new_steps(self) -> Iterable[tuple[int, epath.Path]]:
+    """Returns the steps above `latest_step` to check, newest first."""
+    # Watch before listing, so that no later change goes unnoticed.
+    self._notifier.watch()
+    self._collect_added_names()
+    names = self._added_names
+    self._added_names = set()
+    if names is None:
+      self._candidates.clear()
+      try:
+        names = [path.name for path in self._directory.iterdir()]
+      except FileNotFoundError:
+        names = []
+    for name in names:
+      step = _parse_step(name)
+      if step is not None and (
+          self._latest_step is None or step > self._latest_step
+      ):
+        self._candidates[step] = self._directory / name
+    return sorted(self._candidates.items(), reverse=True)
+
+  def poll(self) -> Optional[int]:
+    """Checks once for new finalized steps.
+
+    Returns:
+      The newest finalized step above `latest_step`, or None.
+    """
+    with self._lock:
+      for step, path in self._new_steps():
+        if not path.is_dir():
+          del self._candidates[step]
+        elif step_lib.is_path_finalized(path):
+          logging.vlog(1, 'Found new step %d in %s.', step, self._directory)
+          self._latest_step = step
+          self._candidates = {
+              s: p for s, p in self._candidates.items() if s > step
+          }
+          return step
+      return None
+
+  def wait_for_change(self, timeout: float) -> bool:
+    """Waits for up to `timeout` seconds for the directory to change.
+
+    Without change notifications, always waits for `timeout` seconds.
+
+    Args:
+      timeout: Maximum number of seconds to wait.
+
+    Returns:
+      True if the directory may have changed before `timeout` expired.
+    """
+    changed = self._notifier.wait(timeout)
+    if changed:
+      time.sleep(self._coalesce_secs)
+    with self._lock:
+      self._collect_added_names()
+    return changed
+
+  def wait_for_new_step(self, timeout: Optional[float] = None) -> Optional[int]:
+    """Blocks until a new finalized step is found.
+
+    Args:
+      timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+    Returns:
+      The new step, or None if `timeout` expired.
+    """
+    stop_time = None if timeout is None else time.time() + timeout
+    while True:
+      step = self.poll()
+      if step is not None:
+        return step
+      wait_secs = self._poll_interval_secs
+      if stop_time is not None:
+        remaining = stop_time - time.time()
+        if remaining <= 0:
+          return None
+        wait_secs = min(wait_secs, remaining)
+      self.wait_for_change(wait_secs)
+
+  async def __aiter__(self) -> AsyncIterator[int]:
+    """Yields new finalized steps as they are found."""
+    while True:
+      # Bounded waits, so that the thread does not outlive a cancelled task.
+      step = await asyncio.to_thread(
+          self.wait_for_new_step, self._poll_interval_secs
+      )
+      if step is not None:
+        yield step
+
+  def close(self):
+    self._notifier.close()
+
+  def __contextmanager__(self):
+    try:
+      yield self
+    finally:
+      self.close()
@@ -0,0 +1,135 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import parameterized
+from etils import epath
+from orbax.checkpoint._src.path import step_watcher as step_watcher_lib
+
+
+class StepWatcherTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.directory = epath.Path(self.create_tempdir().full_path)
+
+  def test_poll(self):
+    (self.directory / '1').mkdir()
+    (self.directory / 'checkpoint_2').mkdir()
+    (self.directory / '3.orbax-checkpoint-tmp-123').mkdir()
+    (self.directory / '4').touch()
+    with step_watcher_lib.StepWatcher(self.directory) as watcher:
+      self.assertEqual(watcher.poll(), 2)
+      self.assertEqual(watcher.latest_step, 2)
+      self.assertIsNone(watcher.poll())
+      (self.directory / '3.orbax-checkpoint-tmp-123').rename(
+          self.directory / '3'
+      )
+      (self.directory / '5').mkdir()
+      (self.directory / '6').mkdir()
+      self.assertEqual(watcher.poll(), 6)
+      self.assertIsNone(watcher.poll())
+
+      watcher.reset()
+      self.assertEqual(watcher.poll(), 6)
+
+  def test_missing_directory(self):
+    directory = self.directory / 'missing'
+    with step_watcher_lib.StepWatcher(
+        directory, poll_interval_secs=0.01
+    ) as watcher:
+      self.assertIsNone(watcher.poll())
+      self.assertIsNone(watcher.wait_for_new_step(timeout=0.05))
+      (directory / '1').mkdir(parents=True)
+      self.assertEqual(watcher.wait_for_new_step(timeout=1), 1)
+
+  @parameterized.parameters(True, False)
+  def test_wait_for_new_step(self, use_inotify):
+    poll_interval_secs = 0.5 if use_inotify else 0.05
+    with step_watcher_lib.StepWatcher(
+        self.directory,
+        poll_interval_secs=poll_interval_secs,
+        coalesce_secs=0.0,
+        use_inotify=use_inotify,
+    ) as watcher:
+      self.assertIsNone(watcher.wait_for_new_step(timeout=0.1))
+      timer = threading.Timer(0.1, (self.directory / '7').mkdir)
+      timer.start()
+      self.assertEqual(watcher.wait_for_new_step(timeout=10), 7)
+      timer.join()
+
+  def test_inotify_wakes_on_change(self):
+    with step_watcher_lib.StepWatcher(
+        self.directory, coalesce_secs=0.0
+    ) as watcher:
+      if not isinstance(
+          watcher._notifier, step_watcher_lib._InotifyNotifier  # pylint: disable=protected-access
+      ):
+        self.skipTest('inotify is unavailable.')
+      timer = threading.Timer(0.1, (self.directory / '1').mkdir)
+      timer.start()
+      start = time.time()
+      self.assertTrue(watcher.wait_for_change(10))
+      self.assertLess(time.time() - start, 5)
+      timer.join()
+      self.assertFalse(watcher.wait_for_change(0.01))
+
+  def test_inotify_lists_directory_once(self):
+    (self.directory / '1').mkdir()
+    with step_watcher_lib.StepWatcher(self.directory) as watcher:
+      if not isinstance(
+          watcher._notifier, step_watcher_lib._InotifyNotifier  # pylint: disable=protected-access
+      ):
+        self.skipTest('inotify is unavailable.')
+      path_cls = type(self.directory)
+      with mock.patch.object(
+          path_cls, 'iterdir', autospec=True, side_effect=path_cls.iterdir
+      ) as iterdir:
+        self.assertEqual(watcher.poll(), 1)
+        (self.directory / '2.orbax-checkpoint-tmp-1').mkdir()
+        self.assertIsNone(watcher.poll())
+        (self.directory / '2.orbax-checkpoint-tmp-1').rename(
+            self.directory / '2'
+        )
+        self.assertEqual(watcher.poll(), 2)
+        self.assertEqual(iterdir.call_count, 1)
+
+        watcher.reset()
+        self.assertEqual(watcher.poll(), 2)
+        self.assertEqual(iterdir.call_count, 2)
+
+  def test_async_iteration(self):
+    async def _next_steps(watcher, n):
+      steps = []
+      async for step in watcher:
+        steps.append(step)
+        (self.directory / str(step + 1)).mkdir()
+        if len(steps) == n:
+          break
+      return steps
+
+    (self.directory / '0').mkdir()
+    with step_watcher_lib.StepWatcher(
+        self.directory, poll_interval_secs=0.05
+    ) as watcher:
+      self.assertEqual(asyncio.run(_next_steps(watcher, 3)), [0, 1, 2])
+
+
+if __name__ == '__main__':
+  absltest.main()
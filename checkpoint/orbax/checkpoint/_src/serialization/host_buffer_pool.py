@@ -0,0 +1,219 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of reusable host buffers for device-to-host transfers.
+
+Periodic saves transfer the same set of (shape, dtype) arrays to host over and
+over again. Instead of allocating fresh host memory for every save, transfers
+copy into host buffers kept from a previous transfer with a matching key, by
+donating them to the copy.
+
+The host values of a transfer are usually zero-copy views of its host buffers,
+so a buffer only goes back to the pool once its host value is no longer used,
+e.g. once it has been written.
+
+Pools are owned by checkpoint handlers, which size them with their
+`host_buffer_pool_bytes` option, and are passed explicitly to
+`replica_slices.transfer_arrays_to_host`.
+"""
+
+import collections
+import dataclasses
+import functools
+import threading
+import weakref
+
+from absl import logging
+import jax
+import numpy as np
+from orbax.checkpoint._src.arrays import types
+from orbax.checkpoint._src.sharding_utils import make_single_device_sharding
+
+
+Shape = types.Shape
+
+# Default byte budget of the pool of a checkpoint handler.
+DEFAULT_MAX_BYTES = 4 * 1024**3
+
+
+@dataclasses.dataclass(frozen=True)
+class BufferKey:
+  """Identifies interchangeable staging buffers."""
+
+  shape: Shape
+  dtype: np.dtype
+  memory_kind: str | None
+  device: jax.Device
+
+
+def get_buffer_key(arr: jax.Array) -> BufferKey:
+  return BufferKey(
+      shape=tuple(arr.shape),
+      dtype=np.dtype(arr.dtype),
+      memory_kind=arr.sharding.memory_kind,
+      device=arr.device,  # pyrefly: ignore[bad-argument-type]
+  )
+
+
+def _nbytes(key: BufferKey) -> int:
+  return int(np.prod(key.shape, dtype=np.int64)) * key.dtype.itemsize
+
+
+class HostBufferPool:
+  """A size-bounded, LRU-evicted pool of single-device host arrays.
+
+  Buffers are keyed by `BufferKey`. The pool never retains more than `max_bytes`
+  in total; when releasing a buffer would exceed the budget, the least recently
+  used keys are evicted first. Thread-safe.
+  """
+
+  def __init__(self, max_bytes: int = 0):
+    if max_bytes < 0:
+      raise ValueError(f'Must provide non-negative `max_bytes`: {max_bytes}')
+    self._max_bytes = max_bytes
+    self._nbytes = 0
+    self._buffers: collections.OrderedDict[BufferKey, list[jax.Array]] = (
+        collections.OrderedDict()
+    )
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+
+  @property
+  def max_bytes(self) -> int:
+    return self._max_bytes
+
+  @property
+  def nbytes(self) -> int:
+    """Total bytes currently retained by the pool."""
+    return self._nbytes
+
+  @property
+  def enabled(self) -> bool:
+    return self._max_bytes > 0
+
+  @property
+  def hits(self) -> int:
+    return self._hits
+
+  @property
+  def misses(self) -> int:
+    return self._misses
+
+  def set_max_bytes(self, max_bytes: int):
+    """Updates the budget, evicting buffers if it shrank."""
+    if max_bytes < 0:
+      raise ValueError(f'Must provide non-negative `max_bytes`: {max_bytes}')
+    with self._lock:
+      self._max_bytes = max_bytes
+      self._evict_locked(max_bytes)
+
+  def trim(self, max_bytes: int):
+    """Evicts least recently used buffers until at most `max_bytes` remain."""
+    with self._lock:
+      self._evict_locked(max_bytes)
+
+  def clear(self):
+    self.trim(0)
+
+  def acquire(self, key: BufferKey) -> jax.Array | None:
+    """Removes and returns a pooled buffer matching `key`, if any."""
+    with self._lock:
+      buffers = self._buffers.get(key)
+      if not buffers:
+        self._misses += 1
+        return None
+      buffer = buffers.pop()
+      if not buffers:
+        del self._buffers[key]
+      self._nbytes -= _nbytes(key)
+      self._hits += 1
+    if buffer.is_deleted():
+      return None
+    return buffer
+
+  def release(self, buffer: jax.Array) -> bool:
+    """Returns `buffer` to the pool.
+
+    The caller must not use `buffer` afterwards; it may be donated to a later
+    transfer.
+
+    Args:
+      buffer: A single-device array no longer referenced by the caller.
+
+    Returns:
+      Whether the buffer was retained.
+    """
+    key = get_buffer_key(buffer)
+    nbytes = _nbytes(key)
+    with self._lock:
+      if nbytes > self._max_bytes:
+        return False
+      self._evict_locked(self._max_bytes - nbytes)
+      self._buffers.setdefault(key, []).append(buffer)
+      self._buffers.move_to_end(key)
+      self._nbytes += nbytes
+    return True
+
+  def release_when_unused(self, buffer: jax.Array, host_value: np.ndarray):
+    """Returns `buffer` to the pool once `host_value` no longer uses it.
+
+    Args:
+      buffer: A single-device array no longer referenced by the caller, other
+        than through `host_value`.
+      host_value: The host value of `buffer`, which may be a zero-copy view of
+        its memory.
+    """
+    if aliases(host_value, buffer):
+      weakref.finalize(host_value, self.release, buffer)
+    else:
+      self.release(buffer)
+
+  def _evict_locked(self, max_bytes: int):
+    while self._nbytes > max_bytes and self._buffers:
+      key, buffers = self._buffers.popitem(last=False)
+      self._nbytes -= _nbytes(key) * len(buffers)
+      if logging.vlog_is_on(1):
+        logging.vlog(
+            1, 'Evicting %d host staging buffers for %s', len(buffers), key
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _copy_into_fn(device: jax.Device, memory_kind: str):
+  sharding = make_single_device_sharding(device, memory_kind=memory_kind)
+
+  def _copy_into(src: jax.Array, dst: jax.Array) -> jax.Array:
+    src = jax.device_put(src, sharding)
+    return jax.lax.dynamic_update_slice(dst, src, (0,) * src.ndim)
+
+  return jax.jit(_copy_into, donate_argnums=1, out_shardings=sharding)
+
+
+def copy_into(src: jax.Array, dst: jax.Array) -> jax.Array:
+  """Copies single-device `src` into donated `dst`, reusing its memory."""
+  return _copy_into_fn(dst.device, dst.sharding.memory_kind)(src, dst)
+
+
+def aliases(host_value: np.ndarray, buffer: jax.Array) -> bool:
+  """Whether `host_value` is a zero-copy view of `buffer`'s memory."""
+  try:
+    return (
+        host_value.__array_interface__['data'][0]
+        == buffer.unsafe_buffer_pointer()
+    )
+  except Exception:  # pylint: disable=broad-except
+    # If unknown, assume the memory is shared.
+    return True
+
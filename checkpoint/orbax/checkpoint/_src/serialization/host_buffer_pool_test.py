@@ -0,0 +1,109 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+from absl.testing import absltest
+import jax
+import numpy as np
+from orbax.checkpoint._src.serialization import host_buffer_pool
+
+
+def _pinned(x: np.ndarray) -> jax.Array:
+  return jax.device_put(
+      x,
+      jax.sharding.SingleDeviceSharding(
+          jax.devices()[0], memory_kind='pinned_host'
+      ),
+  )
+
+
+class HostBufferPoolTest(absltest.TestCase):
+
+  def test_disabled_by_default(self):
+    pool = host_buffer_pool.HostBufferPool()
+    self.assertFalse(pool.enabled)
+    self.assertFalse(pool.release(_pinned(np.zeros((4,), np.float32))))
+    self.assertEqual(pool.nbytes, 0)
+
+  def test_acquire_matching_key(self):
+    pool = host_buffer_pool.HostBufferPool(max_bytes=1024)
+    buffer = _pinned(np.zeros((4,), np.float32))
+    key = host_buffer_pool.get_buffer_key(buffer)
+    self.assertTrue(pool.release(buffer))
+    self.assertEqual(pool.nbytes, 16)
+
+    other_key = host_buffer_pool.BufferKey(
+        shape=(4,),
+        dtype=np.dtype(np.int32),
+        memory_kind=key.memory_kind,
+        device=key.device,
+    )
+    self.assertIsNone(pool.acquire(other_key))
+    self.assertIs(pool.acquire(key), buffer)
+    self.assertIsNone(pool.acquire(key))
+    self.assertEqual(pool.nbytes, 0)
+    self.assertEqual(pool.hits, 1)
+    self.assertEqual(pool.misses, 2)
+
+  def test_lru_eviction(self):
+    pool = host_buffer_pool.HostBufferPool(max_bytes=48)
+    a = _pinned(np.zeros((4,), np.float32))
+    b = _pinned(np.zeros((5,), np.float32))
+    c = _pinned(np.zeros((6,), np.float32))
+    pool.release(a)
+    pool.release(b)
+    # Exceeds the budget, so the least recently released key is evicted.
+    pool.release(c)
+    self.assertEqual(pool.nbytes, 20 + 24)
+    self.assertIsNone(pool.acquire(host_buffer_pool.get_buffer_key(a)))
+    self.assertIs(pool.acquire(host_buffer_pool.get_buffer_key(b)), b)
+
+  def test_trim(self):
+    pool = host_buffer_pool.HostBufferPool(max_bytes=1024)
+    pool.release(_pinned(np.zeros((4,), np.float32)))
+    pool.release(_pinned(np.zeros((4,), np.float32)))
+    pool.trim(16)
+    self.assertEqual(pool.nbytes, 0)
+    pool.release(_pinned(np.zeros((4,), np.float32)))
+    pool.set_max_bytes(0)
+    self.assertEqual(pool.nbytes, 0)
+    self.assertFalse(pool.enabled)
+
+  def test_release_when_unused(self):
+    pool = host_buffer_pool.HostBufferPool(max_bytes=1024)
+    buffer = _pinned(jax.numpy.zeros((4,), np.float32))
+    host_value = np.asarray(buffer)
+    pool.release_when_unused(buffer, host_value)
+    if host_buffer_pool.aliases(host_value, buffer):
+      # The buffer is pooled once its zero-copy host value is gone.
+      self.assertEqual(pool.nbytes, 0)
+      del host_value
+      gc.collect()
+    self.assertEqual(pool.nbytes, 16)
+
+  def test_copy_into_reuses_buffer(self):
+    src = jax.numpy.arange(8, dtype=np.float32)
+    # Staged from device memory, like real staging buffers. Buffers created
+    # from numpy arrays may alias numpy memory, which cannot be donated.
+    dst = _pinned(jax.numpy.zeros((8,), np.float32))
+    ptr = dst.unsafe_buffer_pointer()
+    out = host_buffer_pool.copy_into(src, dst)
+    np.testing.assert_array_equal(np.asarray(out), np.arange(8))
+    self.assertEqual(out.sharding.memory_kind, 'pinned_host')
+    self.assertEqual(out.unsafe_buffer_pointer(), ptr)
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -41,6 +41,7 @@ from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.multihost import multislice
 from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.path import utils as path_utils
+from orbax.checkpoint._src.serialization import host_buffer_pool as host_buffer_pool_lib
 from orbax.checkpoint._src.serialization import jax_array_restore_args
 from orbax.checkpoint._src.serialization import limits
 from orbax.checkpoint._src.serialization import ocdbt_utils
@@ -468,17 +469,13 @@ def _get_deprioritized_batches_to_serialize(
       assert arrays_saved_count < len(deprioritized_params)
       logging.info(
           'Scheduling serialization of %d deprioritized arrays. Already'
-          ' completed %d / %d arrays. Included keys: %s',
+          ' scheduled %d / %d arrays. Included keys: %s',
           len(batch),
           arrays_saved_count,
           len(deprioritized_params),
           [tree_utils.str_keypath(info.keypath) for _, info, _ in batch],
       )
       yield zip(*batch)
-      logging.info(
-          'Serialization of %d deprioritized jax.Array completed.',
-          len(batch),
-      )
       arrays_saved_count += len(batch)
 
     assert arrays_saved_count == len(deprioritized_params)
@@ -507,6 +504,7 @@ def _serialize_arrays_batches_without_dispatcher(
     enable_replica_parallel_separate_folder: bool,
     ext_metadata: Dict[str, Any],
     enable_pinned_host_transfer: bool,
+    host_buffer_pool: host_buffer_pool_lib.HostBufferPool | None,
     callback: types.SerializationStatusCallback,
 ) -> future.Future:
   """Serializes arrays batches without dispatcher."""
@@ -516,6 +514,7 @@ def _serialize_arrays_batches_without_dispatcher(
       replica_id=replica_id,
       use_replica_parallel=use_replica_parallel,
       enable_pinned_host_transfer=enable_pinned_host_transfer,
+      host_buffer_pool=host_buffer_pool,
       min_slice_bytes_for_replica_parallel=min_slice_bytes_for_replica_parallel,
       max_replicas_for_replica_parallel=max_replicas_for_replica_parallel,
   )
@@ -559,38 +558,72 @@ def _serialize_arrays_batches_without_dispatcher(
     total_start_time = time.time()
     logical_bytes = 0
 
-    if prioritized_values_on_host:
-      logical_bytes += sum(v.nbytes for v in prioritized_values_on_host)
+    async def _write_batch(values_on_host, b_infos, b_args):
       await async_serialize_replica_slices_batch(
-          prioritized_values_on_host,
-          prioritized_infos,
-          prioritized_args,
+          values_on_host, b_infos, b_args
       )
-      _on_batch_callback(prioritized_infos, callback.on_write_end)
-    if deprioritized:
-      assert device_host_max_bytes is not None
-      for (
-          b_arrays,
-          b_infos,
-          b_args,
-      ) in _get_deprioritized_batches_to_serialize(
-          deprioritized,
-          device_host_max_bytes=device_host_max_bytes,
-          # TODO(b/436858989): We overestimate memory usage for now if replica
-          # parallel is enabled, as each host has a non-trivial calculation for
-          # bytes transferred to host.
-          replica_id=None if use_replica_parallel else replica_id,
-          dispatcher=None,
-      ):
-        b_arrays_on_host = replica_slices_transfer_arrays_to_host(b_arrays)
-        _on_batch_callback(b_infos, callback.on_transfer_end)
-        logical_bytes += sum(v.nbytes for v in b_arrays_on_host)
-        await async_serialize_replica_slices_batch(
-            b_arrays_on_host,
+      _on_batch_callback(b_infos, callback.on_write_end)
+      logging.info('Serialization of %d jax.Array completed.', len(b_infos))
+
+    # The D2H transfer of a deprioritized batch overlaps with the write of the
+    # previous batch (or of the prioritized values) only if both fit in the
+    # memory budget together. Batches get half of the budget, so that this is
+    # the case unless a single array exceeds it.
+    write_task = None
+    in_flight_bytes = 0
+    try:
+      if prioritized_values_on_host:
+        in_flight_bytes = sum(v.nbytes for v in prioritized_values_on_host)
+        logical_bytes += in_flight_bytes
+        write_task = asyncio.create_task(
+            _write_batch(
+                prioritized_values_on_host, prioritized_infos, prioritized_args
+            )
+        )
+      if deprioritized:
+        assert device_host_max_bytes is not None
+        # TODO(b/436858989): We overestimate memory usage for now if replica
+        # parallel is enabled, as each host has a non-trivial calculation for
+        # bytes transferred to host.
+        budget_replica_id = None if use_replica_parallel else replica_id
+        for (
+            b_arrays,
             b_infos,
             b_args,
-        )
-        _on_batch_callback(b_infos, callback.on_write_end)
+        ) in _get_deprioritized_batches_to_serialize(
+            deprioritized,
+            device_host_max_bytes=max(1, device_host_max_bytes // 2),
+            replica_id=budget_replica_id,
+            dispatcher=None,
+        ):
+          if write_task is not None and (
+              in_flight_bytes
+              + worker_memory_utils.estimate_process_memory_usage(
+                  b_arrays, replica_id=budget_replica_id
+              )
+              > device_host_max_bytes
+          ):
+            await write_task
+            write_task = None
+          # Transfers in a thread, so that the event loop keeps driving the
+          # write of the previous batch.
+          b_arrays_on_host = await asyncio.to_thread(
+              replica_slices_transfer_arrays_to_host, b_arrays
+          )
+          _on_batch_callback(b_infos, callback.on_transfer_end)
+          in_flight_bytes = sum(v.nbytes for v in b_arrays_on_host)
+          logical_bytes += in_flight_bytes
+          if write_task is not None:
+            await write_task
+          write_task = asyncio.create_task(
+              _write_batch(b_arrays_on_host, b_infos, b_args)
+          )
+      if write_task is not None:
+        await write_task
+    finally:
+      # Does not leave a write running in the background if a transfer failed.
+      if write_task is not None and not write_task.done():
+        await asyncio.gather(write_task, return_exceptions=True)
 
     info_sample = prioritized[0][1] if prioritized else deprioritized[0][1]
     _log_io_metrics(
@@ -670,6 +703,7 @@ def _serialize_arrays(
         enable_replica_parallel_separate_folder,
         ext_metadata,
         infos[0].enable_pinned_host_transfer,
+        infos[0].host_buffer_pool,
         callback,
     )
   else:
@@ -764,6 +798,10 @@ def _serialize_arrays(
             dispatcher=dispatcher,
         ):
           _serialize_batch(b_infos, b_args, b_arrays)
+          logging.info(
+              'Serialization of %d deprioritized jax.Array completed.',
+              len(b_infos),
+          )
 
     return future.CommitFutureAwaitingContractedSignals(
         _serialize(),
@@ -16,11 +16,16 @@
 
 import asyncio
 import contextlib
-from typing import AsyncIterator, Optional, Protocol
+import contextvars
+from typing import AsyncIterator, Iterator, Optional, Protocol
 from absl import logging
 import humanize
 
 
+# Number of saves between which save budgets are split, see `split_save_budget`.
+_CONCURRENT_SAVES = contextvars.ContextVar('concurrent_saves', default=1)
+
+
 class ByteLimiter(Protocol):
 
   async def wait_for_bytes(self, requested_bytes: int):
@@ -97,6 +102,38 @@ def get_byte_limiter(concurrent_bytes: Optional[int] = None) -> ByteLimiter:
   return LimitInFlightBytes(concurrent_bytes)
 
 
+@contextlib.contextmanager
+def split_save_budget(num_saves: int) -> Iterator[None]:
+  """Splits save byte budgets between `num_saves` concurrent saves.
+
+  Saves started within this context get an equal share of the budgets passed to
+  `get_save_byte_limiter`, so that up to `num_saves` saves committing in the
+  background at the same time stay within the configured budget in total.
+
+  Args:
+    num_saves: The maximum number of saves that may hold a budget at once.
+
+  Yields:
+    None.
+  """
+  if num_saves < 1:
+    raise ValueError(f'Must provide positive `num_saves`. Found: {num_saves}')
+  token = _CONCURRENT_SAVES.set(num_saves)
+  try:
+    yield
+  finally:
+    _CONCURRENT_SAVES.reset(token)
+
+
+def get_save_byte_limiter(
+    concurrent_bytes: Optional[int] = None,
+) -> ByteLimiter:
+  """Returns a limiter for this save's share of `concurrent_bytes`."""
+  if concurrent_bytes is not None and concurrent_bytes > 0:
+    concurrent_bytes = max(1, concurrent_bytes // _CONCURRENT_SAVES.get())
+  return get_byte_limiter(concurrent_bytes)
+
+
 @contextlib.asynccontextmanager
 async def reserved_bytes(
     byte_limiter: ByteLimiter,
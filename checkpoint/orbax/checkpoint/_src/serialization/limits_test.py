@@ -0,0 +1,50 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from absl.testing import absltest
+from orbax.checkpoint._src.serialization import limits
+
+
+class LimitsTest(absltest.TestCase):
+
+  def test_save_byte_limiter_uses_full_budget_by_default(self):
+    limiter = limits.get_save_byte_limiter(100)
+    self.assertIsInstance(limiter, limits.LimitInFlightBytes)
+    self.assertEqual(limiter.max_bytes, 100)
+
+  def test_split_save_budget(self):
+    with limits.split_save_budget(4):
+      self.assertEqual(limits.get_save_byte_limiter(100).max_bytes, 25)
+      self.assertIsInstance(
+          limits.get_save_byte_limiter(None), limits.UnlimitedInFlightBytes
+      )
+    self.assertEqual(limits.get_save_byte_limiter(100).max_bytes, 100)
+
+  def test_split_save_budget_is_visible_in_coroutines(self):
+    async def _max_bytes():
+      return limits.get_save_byte_limiter(100).max_bytes
+
+    with limits.split_save_budget(2):
+      self.assertEqual(asyncio.run(_max_bytes()), 50)
+
+  def test_split_save_budget_invalid(self):
+    with self.assertRaisesRegex(ValueError, 'positive'):
+      with limits.split_save_budget(0):
+        pass
+
+
+if __name__ == '__main__':
+  absltest.main()
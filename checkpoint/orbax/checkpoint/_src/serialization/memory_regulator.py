@@ -21,6 +21,7 @@ import dataclasses
 
 from absl import logging
 import humanize
+from orbax.checkpoint._src.serialization import host_buffer_pool as host_buffer_pool_lib
 
 # CONSTANT
 _BYTES_TO_GIB = 1024.0**3
@@ -131,6 +132,8 @@ class MemoryRegulator:
     kp: Proportional coefficient
     ki: Integral coefficient
     kd: Derivative coefficient
+    host_buffer_pool: Pool of host buffers for device-to-host transfers, trimmed
+      to the memory limit whenever the limit is updated.
     integral: Integral term accumulated over time
     prev_error: Error term from the previous step
     integral_windup_limit: Upper and lower bounds for the integral term to
@@ -143,6 +146,7 @@ class MemoryRegulator:
   kp: float = 0.4
   ki: float = 0.05
   kd: float = 0.1
+  host_buffer_pool: host_buffer_pool_lib.HostBufferPool | None = None
 
   integral: float = dataclasses.field(init=False)
   prev_error: float = dataclasses.field(init=False)
@@ -290,6 +294,10 @@ class MemoryRegulator:
         total_memory_gib=total_memory_gib,
     )
     next_limit_bytes = int(next_limit_gib * 1024**3)
+    # Pooled host buffers count towards host memory usage, so never retain
+    # more than the budget allowed for device-to-host transfers.
+    if self.host_buffer_pool is not None:
+      self.host_buffer_pool.trim(next_limit_bytes)
     logging.info(
         'MemoryRegulated: Updated device_host_concurrent_bytes to %s'
         ' (peak=%f GiB, total=%f GiB)',
@@ -18,12 +18,13 @@ import asyncio
 import re
 import threading
 import time
-from typing import Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 from absl import logging
 from etils import epath
 from jax import monitoring as jax_monitoring
 from orbax.checkpoint._src.multihost import multihost
+from orbax.checkpoint._src.path import async_path
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
 import tensorstore as ts
 
@@ -31,8 +32,98 @@ import tensorstore as ts
 # Optional separator `(?:^|/)` so a bare top-level leaf (empty param name '')
 # parses correctly: its keys are prefix-less (`.zarray`, `0`, …) rather
 # than `name/.zarray`, `name/0`. Both strip to the empty param name ''.
-_SHARDING_SUFFIX_RE = r'(?:^|/)\d+(\.\d+)*$'
-_ZARRAY_SUFFIX_RE = r'(?:^|/)\.zarray$'
+_SHARDING_SUFFIX_RE = re.compile(r'(?:^|/)\d+(\.\d+)*$')
+_ZARRAY_SUFFIX_RE = re.compile(r'(?:^|/)\.zarray$')
+_ZARRAY_SUFFIX = '.zarray'
+
+# Maximum number of KvStores merged into one KvStore by a single transaction.
+# More per-process KvStores are merged hierarchically, through intermediate
+# KvStores.
+DEFAULT_MAX_MERGE_FAN_IN = 64
+
+
+class _ParamsValidator:
+  """Validates the params of a KvStore from incrementally listed keys.
+
+  Supports zarr2.
+  """
+
+  def __init__(self):
+    # [a/.zarray, a/0, b.zarray, b/0.0, b/0.1, c/0, d/.zarray] -> {a, b, d}
+    self._with_zarray = set()
+    # [a/.zarray, a/0, b.zarray, b/0.0, b/0.1, c/0, d/.zarray] -> {a, b, c}
+    self._without_zarray = set()
+    self._num_keys = 0
+
+  def add(self, raw_ts_params: Sequence[bytes]) -> None:
+    """Classifies params as either having a .zarray suffix or not."""
+    self._num_keys += len(raw_ts_params)
+    vlog = logging.vlog_is_on(1)
+    for ts_param in raw_ts_params:
+      ts_param = ts_param.decode('utf-8')
+      # For a bare leaf (`.zarray`), `name` strips to `''`. For a container
+      # (`a/.zarray`), `name` strips to `'a'`.
+      if ts_param.endswith(_ZARRAY_SUFFIX) and _ZARRAY_SUFFIX_RE.search(
+          ts_param
+      ):
+        name = _ZARRAY_SUFFIX_RE.sub('', ts_param)
+        self._with_zarray.add(name)
+      else:
+        # Extract parameter name from data chunks. For a bare leaf chunk (`0`),
+        # `_SHARDING_SUFFIX_RE` strips `^0$` to `''`. For a container chunk
+        # (`a/0`), it strips `/0$` to `'a'`.
+        name = _SHARDING_SUFFIX_RE.sub('', ts_param)
+        self._without_zarray.add(name)
+      if vlog:
+        logging.vlog(
+            1,
+            '[process=%s][thread=%s] Collected param %s from raw param: %s',
+            multihost.process_index(),
+            threading.current_thread().name,
+            name,
+            ts_param,
+        )
+
+  def validate(self, ts_kv_store: Any) -> None:
+    """Raises if any param added so far is incomplete.
+
+    Args:
+      ts_kv_store: Description of the validated KvStore, for error messages.
+    """
+    if not self._num_keys:
+      # TODO: b/361090820 - Raise error once we confirm that Bennu writing empty
+      # states is a bug.
+      # e.g. //learning/deepmind/jax/roc/formats/roc_orbax:roc_orbax_test
+      logging.info(
+          'Skipping param validation: No params found in TensorStore'
+          ' KvStore: %s.',
+          ts_kv_store,
+      )
+      return
+
+    unique = self._with_zarray | self._without_zarray
+    logging.vlog(
+        1,
+        '[process=%s][thread=%s] Validating params in TensorStore KvStore.',
+        multihost.process_index(),
+        threading.current_thread().name,
+    )
+    missing_params = unique - self._without_zarray
+    if missing_params:
+      formatted_missing_params = ' \n'.join(sorted(missing_params))
+      raise ValueError(
+          f'Save failed: {len(missing_params)}/{len(unique)} params are missing'
+          f' in checkpoint:\n{formatted_missing_params}.\nTensorstore KvStore:'
+          f' {ts_kv_store}.'
+      )
+    missing_zarrays = unique - self._with_zarray
+    if missing_zarrays:
+      formatted_missing_zarrays = ' \n'.join(sorted(missing_zarrays))
+      raise ValueError(
+          f'Save failed: {len(missing_zarrays)}/{len(unique)} params are'
+          f' missing .zarray in checkpoint:\n{formatted_missing_zarrays}.'
+          f'\nTensorstore KvStore: {ts_kv_store}.'
+      )
 
 
 async def _validate_params(
@@ -56,86 +147,57 @@ async def _validate_params(
     )
     return
 
-  raw_ts_params = await ts_kv_store.list()
-  if not raw_ts_params:
-    # TODO: b/361090820 - Raise error once we confirm that Bennu writing empty
-    # states is a bug.
-    # e.g. //learning/deepmind/jax/roc/formats/roc_orbax:roc_orbax_test
-    logging.info(
-        'Skipping param validation: No params found in TensorStore'
-        ' KvStore: %s.',
-        ts_kv_store,
-    )
-    return
+  validator = _ParamsValidator()
+  validator.add(await ts_kv_store.list())
+  validator.validate(ts_kv_store)
 
-  process_index = multihost.process_index()
-  current_thread_name = threading.current_thread().name
-  # [a/.zarray, a/0, b.zarray, b/0.0, b/0.1, c/0, d/.zarray] -> {a, b, d}
-  with_zarray = set()
-  # [a/.zarray, a/0, b.zarray, b/0.0, b/0.1, c/0, d/.zarray] -> {a, b, c}
-  without_zarray = set()
-  for ts_param in raw_ts_params:
-    ts_param = ts_param.decode('utf-8')
-    if logging.vlog_is_on(1):
-      logging.vlog(
-          1,
-          '[process=%s][thread=%s] Validating raw param: %s',
-          process_index,
-          current_thread_name,
-          ts_param,
-      )
-    # Classify params as either having a .zarray suffix or not.
-    # For a bare leaf (`.zarray`), `name` strips to `''`. For a container
-    # (`a/.zarray`), `name` strips to `'a'`.
-    if re.search(_ZARRAY_SUFFIX_RE, ts_param):
-      name = re.sub(_ZARRAY_SUFFIX_RE, '', ts_param)
-      with_zarray.add(name)
-      if logging.vlog_is_on(1):
-        logging.vlog(
-            1,
-            '[process=%s][thread=%s] Collecting param with .zarray: %s',
-            process_index,
-            current_thread_name,
-            name,
-        )
-    else:
-      # Extract parameter name from data chunks. For a bare leaf chunk (`0`),
-      # `_SHARDING_SUFFIX_RE` strips `^0$` to `''`. For a container chunk
-      # (`a/0`), it strips `/0$` to `'a'`.
-      name = re.sub(_SHARDING_SUFFIX_RE, '', ts_param)
-      without_zarray.add(name)
-      if logging.vlog_is_on(1):
-        logging.vlog(
-            1,
-            '[process=%s][thread=%s] Collecting param without .zarray: %s',
-            process_index,
-            current_thread_name,
-            name,
-        )
 
-  unique = with_zarray | without_zarray
-  logging.vlog(
-      1,
-      '[process=%s][thread=%s] Validating params in TensorStore KvStore.',
-      process_index,
-      current_thread_name,
+async def _merge_into(
+    sources: Sequence[ts.KvStore],
+    target: ts.KvStore,
+    *,
+    validator: Optional[_ParamsValidator] = None,
+    validate: bool = False,
+) -> None:
+  """Copies `sources` into `target` in a single atomic transaction.
+
+  Args:
+    sources: KvStores to copy from.
+    target: KvStore to copy to.
+    validator: If provided, the keys of `target` are added to it before
+      committing.
+    validate: Whether to run `validator` before committing. If it raises,
+      `target` is left unchanged.
+  """
+  txn = ts.Transaction(atomic=True)
+  target_with_txn = target.with_transaction(txn)
+  await asyncio.gather(
+      *(source.experimental_copy_range_to(target_with_txn) for source in sources)
   )
-  missing_params = unique - without_zarray
-  if missing_params:
-    formatted_missing_params = ' \n'.join(sorted(missing_params))
-    raise ValueError(
-        f'Save failed: {len(missing_params)}/{len(unique)} params are missing'
-        f' in checkpoint:\n{formatted_missing_params}.\nTensorstore KvStore:'
-        f' {ts_kv_store}.'
-    )
-  missing_zarrays = unique - with_zarray
-  if missing_zarrays:
-    formatted_missing_zarrays = ' \n'.join(sorted(missing_zarrays))
-    raise ValueError(
-        f'Save failed: {len(missing_zarrays)}/{len(unique)} params are missing'
-        f' .zarray in checkpoint:\n{formatted_missing_zarrays}.\nTensorstore'
-        f' KvStore: {ts_kv_store}.'
-    )
+  if validator is not None:
+    validator.add(await target_with_txn.list())
+    if validate:
+      validator.validate(target_with_txn)
+  await txn.commit_async()
+
+
+async def _remove_merge_dirs(merge_dirs: Sequence[epath.Path]) -> None:
+  """Removes the directories of intermediate KvStores, logging failures."""
+
+  async def _remove(merge_dir: epath.Path) -> None:
+    if await async_path.exists(merge_dir):
+      await async_path.rmtree(merge_dir)
+
+  results = await asyncio.gather(
+      *(_remove(d) for d in merge_dirs), return_exceptions=True
+  )
+  for merge_dir, result in zip(merge_dirs, results):
+    if isinstance(result, Exception):
+      logging.warning(
+          'Failed to remove intermediate OCDBT merge directory %s: %s',
+          merge_dir,
+          result,
+      )
 
 
 async def merge_ocdbt_per_process_files(
@@ -143,6 +205,7 @@ async def merge_ocdbt_per_process_files(
     ts_context: ts.Context,
     use_zarr3: bool,
     enable_validation: bool = True,
+    max_fan_in: int = DEFAULT_MAX_MERGE_FAN_IN,
 ):
   """Merges OCDBT files written to per-process subdirectories.
 
@@ -153,6 +216,16 @@ async def merge_ocdbt_per_process_files(
   The original per-process subdirectories are not and should not be deleted -
   the global kvstore continues to reference them.
 
+  If there are more than `max_fan_in` per-process subdirectories, they are
+  merged as a tree: groups of at most `max_fan_in` KvStores are concurrently
+  merged into intermediate KvStores, level by level, until a single group
+  remains, which is merged into the global kvstore. Intermediate KvStores
+  share the base path of the global kvstore, but store their manifests and
+  B-tree nodes in `ocdbt.merge_*` subdirectories, which are deleted once
+  merging has completed or failed. Params
+  are validated while the first level is merged, so that no separate listing
+  of the global kvstore is needed.
+
   NOTE: If no suitable subdirs with OCDBT checkpoints are found, this function
   does not raise any error and no merged checkpoint is created.
 
@@ -163,7 +236,10 @@ async def merge_ocdbt_per_process_files(
       validation.
     enable_validation: If True, validate params after merging. May have a
       performance impact.
+    max_fan_in: Maximum number of KvStores merged by a single transaction.
   """
+  if max_fan_in < 2:
+    raise ValueError(f'max_fan_in must be at least 2, got {max_fan_in}.')
   start_time = time.time()
   open_ops = []
   for process_dir in directory.glob(f'{ts_utils.PROCESS_SUBDIR_PREFIX}*'):
@@ -191,25 +267,82 @@ async def merge_ocdbt_per_process_files(
 
   opened = await asyncio.gather(*open_ops)
   parent, children = opened[-1], opened[:-1]
-  copy_ops = []
-  txn = ts.Transaction(atomic=True)
-  for child in children:
-    copy_ops.append(
-        child.experimental_copy_range_to(parent.with_transaction(txn))
-    )
-  await asyncio.gather(*copy_ops)
-
-  # Validate merged params.
+  # TODO: b/362328389 - Add support for zarr3.
+  validator = None
   if enable_validation:
-    await _validate_params(parent.with_transaction(txn), use_zarr3=use_zarr3)
-  await txn.commit_async()
+    if use_zarr3:
+      logging.info(
+          'Param validation support for Zarr3 will be added later'
+          ' (b/362328389).'
+      )
+    else:
+      validator = _ParamsValidator()
+
+  sources = children
+  merge_dirs = []
+  level = 0
+  try:
+    while len(sources) > max_fan_in:
+      level_start_time = time.time()
+      groups = [
+          sources[i : i + max_fan_in]
+          for i in range(0, len(sources), max_fan_in)
+      ]
+      merge_ids = [f'{level}x{i}' for i in range(len(groups))]
+      intermediate_tspecs = []
+      for merge_id in merge_ids:
+        tspec = ts_utils.build_kvstore_tspec_for_intermediate_merge(
+            directory.as_posix(), merge_id
+        )
+        ts_utils.add_ocdbt_write_options(tspec)
+        intermediate_tspecs.append(tspec)
+        merge_dirs.append(
+            directory / f'{ts_utils.MERGE_SUBDIR_PREFIX}{merge_id}'
+        )
+      intermediates = await asyncio.gather(*(
+          ts_utils.open_kv_store(tspec, ts_context)
+          for tspec in intermediate_tspecs
+      ))
+      await asyncio.gather(*(
+          _merge_into(
+              group, intermediate, validator=validator if level == 0 else None
+          )
+          for group, intermediate in zip(groups, intermediates)
+      ))
+      jax_monitoring.record_event_duration_secs(
+          '/jax/orbax/write/merge_ocdbt_level_secs',
+          time.time() - level_start_time,
+          level=level,
+      )
+      sources = intermediates
+      level += 1
+
+    level_start_time = time.time()
+    if level == 0:
+      await _merge_into(sources, parent, validator=validator, validate=True)
+    else:
+      # All keys were added to the validator while merging the first level.
+      if validator is not None:
+        validator.validate(parent)
+      await _merge_into(sources, parent)
+    jax_monitoring.record_event_duration_secs(
+        '/jax/orbax/write/merge_ocdbt_level_secs',
+        time.time() - level_start_time,
+        level=level,
+    )
+  finally:
+    # Intermediate KvStores are no longer referenced after merging, and must
+    # not be left behind if merging fails.
+    await _remove_merge_dirs(merge_dirs)
 
   duration_secs = time.time() - start_time
   logging.info(
-      'Merged %d TensorStore OCDBT files under directory %s in %.2fs.',
+      'Merged %d TensorStore OCDBT files under directory %s in %.2fs'
+      ' (%d levels).',
       len(children),
       directory,
       duration_secs,
+      level + 1,
   )
   jax_monitoring.record_event_duration_secs(
       '/jax/orbax/write/merge_ocdbt_per_process_files_secs',
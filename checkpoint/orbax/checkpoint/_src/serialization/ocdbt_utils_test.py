@@ -0,0 +1,113 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from absl.testing import absltest
+from absl.testing import parameterized
+from etils import epath
+from orbax.checkpoint._src.serialization import ocdbt_utils
+from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
+import tensorstore as ts
+
+
+_NUM_PROCESSES = 7
+
+
+class MergeOcdbtPerProcessFilesTest(
+    unittest.IsolatedAsyncioTestCase, parameterized.TestCase
+):
+
+  def setUp(self):
+    super().setUp()
+    self.directory = epath.Path(self.create_tempdir().full_path)
+    self.ts_context = ts_utils.get_ts_context(use_ocdbt=True)
+
+  async def _write(self, process_id: int, values: dict[str, bytes]):
+    kv_store = await ts_utils.open_kv_store(
+        ts_utils.build_kvstore_tspec(
+            self.directory.as_posix(), process_id=process_id
+        ),
+        self.ts_context,
+    )
+    for key, value in values.items():
+      await kv_store.write(key, value)
+
+  async def _open_parent(self) -> ts.KvStore:
+    return await ts_utils.open_kv_store(
+        ts_utils.build_kvstore_tspec(self.directory.as_posix()),
+        ts_utils.get_ts_context(use_ocdbt=True),
+    )
+
+  @parameterized.parameters(2, 3, _NUM_PROCESSES, 64)
+  async def test_merge(self, max_fan_in: int):
+    expected = {}
+    for i in range(_NUM_PROCESSES):
+      values = {f'p{i}/.zarray': b'{}', f'p{i}/0': bytes([i]) * 100}
+      expected.update(values)
+      await self._write(i, values)
+
+    await ocdbt_utils.merge_ocdbt_per_process_files(
+        self.directory,
+        ts_context=self.ts_context,
+        use_zarr3=False,
+        max_fan_in=max_fan_in,
+    )
+
+    parent = await self._open_parent()
+    self.assertEqual(
+        [key.decode('utf-8') for key in await parent.list()],
+        sorted(expected),
+    )
+    for key, value in expected.items():
+      self.assertEqual((await parent.read(key)).value, value)
+    self.assertEmpty(
+        list(self.directory.glob(f'{ts_utils.MERGE_SUBDIR_PREFIX}*'))
+    )
+    # Only the B-tree of the parent is written to its data files; those of
+    # intermediate KvStores are deleted with them.
+    self.assertLen(list((self.directory / 'd').iterdir()), 1)
+
+  @parameterized.parameters(2, 64)
+  async def test_validation_failure(self, max_fan_in: int):
+    for i in range(_NUM_PROCESSES):
+      await self._write(i, {f'p{i}/.zarray': b'{}', f'p{i}/0': b'0'})
+    # The chunks of `b` are written by one process and its .zarray is missing.
+    await self._write(_NUM_PROCESSES, {'b/0': b'0'})
+
+    with self.assertRaisesRegex(ValueError, r'1\/8 params are missing \.zarray'):
+      await ocdbt_utils.merge_ocdbt_per_process_files(
+          self.directory,
+          ts_context=self.ts_context,
+          use_zarr3=False,
+          max_fan_in=max_fan_in,
+      )
+    self.assertEmpty(await (await self._open_parent()).list())
+    self.assertEmpty(
+        list(self.directory.glob(f'{ts_utils.MERGE_SUBDIR_PREFIX}*'))
+    )
+    self.assertFalse((self.directory / 'd').exists())
+
+  async def test_invalid_max_fan_in(self):
+    with self.assertRaisesRegex(ValueError, 'max_fan_in'):
+      await ocdbt_utils.merge_ocdbt_per_process_files(
+          self.directory,
+          ts_context=self.ts_context,
+          use_zarr3=False,
+          max_fan_in=1,
+      )
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -0,0 +1,114 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Packs small numpy leaves into a single file.
+
+Writing every scalar or tiny array as its own TensorStore array produces at
+least one object per leaf, and reading it back at least one request per leaf.
+Instead, leaves below a size threshold can be packed into a single file per
+serialization call, stored in the `_packed_leaves` subdirectory of the
+checkpoint. Each file holds a JSON index of the leaves, mapping their names to
+the dtype, shape and offset of their data, followed by the data itself::
+
+  <index size: 8 bytes, little endian> <index: JSON> <data>
+
+Restoring lists the subdirectory once and reads every file with one request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Mapping
+import uuid
+
+from etils import epath
+import numpy as np
+from orbax.checkpoint._src.path import async_path
+
+
+PACKED_LEAVES_DIR = '_packed_leaves'
+_INDEX_SIZE_BYTES = 8
+
+
+def can_pack(value: np.ndarray, max_bytes: int | None) -> bool:
+  """Returns whether `value` should be packed given the size threshold."""
+  return (
+      max_bytes is not None
+      and value.nbytes <= max_bytes
+      and not value.dtype.hasobject
+  )
+
+
+def pack(values: Mapping[str, np.ndarray]) -> bytes:
+  """Returns the packed representation of `values`, keyed by param name."""
+  index = {}
+  data = []
+  offset = 0
+  for name, value in values.items():
+    buffer = np.ascontiguousarray(value).tobytes()
+    index[name] = {
+        'dtype': value.dtype.str,
+        'shape': list(value.shape),
+        'offset': offset,
+    }
+    data.append(buffer)
+    offset += len(buffer)
+  index = json.dumps(index).encode('utf-8')
+  return b''.join(
+      [len(index).to_bytes(_INDEX_SIZE_BYTES, 'little'), index, *data]
+  )
+
+
+def unpack(packed: bytes) -> dict[str, np.ndarray]:
+  """Inverse of `pack`."""
+  index_size = int.from_bytes(packed[:_INDEX_SIZE_BYTES], 'little')
+  data_start = _INDEX_SIZE_BYTES + index_size
+  index = json.loads(packed[_INDEX_SIZE_BYTES:data_start].decode('utf-8'))
+  result = {}
+  for name, entry in index.items():
+    dtype = np.dtype(entry['dtype'])
+    shape = tuple(entry['shape'])
+    count = int(np.prod(shape, dtype=np.int64))
+    value = np.frombuffer(
+        packed,
+        dtype=dtype,
+        count=count,
+        offset=data_start + entry['offset'],
+    )
+    # Copies, so that the result is writable and does not hold `packed`.
+    result[name] = value.reshape(shape).copy()
+  return result
+
+
+async def write(directory: epath.Path, values: Mapping[str, np.ndarray]):
+  """Writes `values` to a new packed file under `directory`."""
+  packed_dir = directory / PACKED_LEAVES_DIR
+  await async_path.mkdir(packed_dir, parents=True, exist_ok=True)
+  await async_path.write_bytes(packed_dir / uuid.uuid4().hex, pack(values))
+
+
+async def read(directory: epath.Path) -> dict[str, np.ndarray]:
+  """Returns all packed leaves under `directory`, keyed by param name."""
+  packed_dir = directory / PACKED_LEAVES_DIR
+  try:
+    paths = await asyncio.to_thread(lambda: list(packed_dir.iterdir()))
+  except FileNotFoundError:
+    return {}
+  result = {}
+  for packed in await asyncio.gather(
+      *[async_path.read_bytes(path) for path in paths]
+  ):
+    result.update(unpack(packed))
+  return result
@@ -27,6 +27,7 @@ from orbax.checkpoint._src.arrays import fragments
 from orbax.checkpoint._src.arrays import numpy_utils
 from orbax.checkpoint._src.arrays import types
 from orbax.checkpoint._src.multihost import multihost
+from orbax.checkpoint._src.serialization import host_buffer_pool as host_buffer_pool_lib
 from orbax.checkpoint._src.sharding_utils import make_single_device_sharding
 
 
@@ -389,6 +390,23 @@ def get_replica_slices(
   )
 
 
+def _pool_unpinned_host_transfers(device: jax.Device) -> bool:
+  """Whether unpinned transfers from `device` go through pooled host buffers.
+
+  On CPU, device memory already is host memory, and host values are views of
+  it, so there is nothing to pool.
+
+  Args:
+    device: The device to transfer from.
+
+  Returns:
+    Whether to transfer to pooled `unpinned_host` buffers.
+  """
+  return device.platform != 'cpu' and any(
+      m.kind == 'unpinned_host' for m in device.addressable_memories()
+  )
+
+
 def transfer_arrays_to_host(
     arrays: Sequence[jax.Array],
     replica_id: Optional[int],
@@ -397,6 +415,7 @@ def transfer_arrays_to_host(
     max_replicas_for_replica_parallel: Optional[int] = None,
     *,
     enable_pinned_host_transfer: bool = False,
+    host_buffer_pool: Optional[host_buffer_pool_lib.HostBufferPool] = None,
 ) -> Sequence[ReplicaSlices]:
   """Transfers arrays to host memory.
 
@@ -418,6 +437,9 @@ def transfer_arrays_to_host(
       True.
     enable_pinned_host_transfer: Whether to allow transfer to pinned host
       memory. Pinned memory is closely associated with a TPU device and can
+    host_buffer_pool: Pool of host buffers to transfer into, reused across
+      transfers. If None, or if the pool is disabled, host memory is allocated
+      for every transfer.
 
   Returns:
     ReplicaSlices objects, in host memory.
@@ -438,23 +460,57 @@ def transfer_arrays_to_host(
     )
     return enable_pinned_host_transfer and has_pinned_host
 
+  use_pool = host_buffer_pool is not None and host_buffer_pool.enabled
+
+  def host_memory_kind(device: jax.Device) -> str | None:
+    """Returns the memory kind to transfer to, if not a plain host copy."""
+    if use_pinned_host_transfer(device):
+      return 'pinned_host'
+    if use_pool and _pool_unpinned_host_transfers(device):
+      return 'unpinned_host'
+    return None
+
   def async_transfer_slice(
       rslice: ReplicaSlice,
-  ) -> tuple[ReplicaSlice, jax.Array]:
+  ) -> tuple[ReplicaSlice, jax.Array, bool]:
+    """Starts the D2H copy, returns whether `data` is a new host buffer."""
     assert not rslice.is_on_host
     data = rslice.data()
     assert isinstance(data, jax.Array)
     device = data.device
-    # Start the asynchronous device-to-host copy
-    if use_pinned_host_transfer(device):  # pyrefly: ignore[bad-argument-type]
-      # If available, transfer to pinned host memory
-      data = jax.device_put(
-          data,
-          make_single_device_sharding(device, memory_kind='pinned_host'),
+    memory_kind = host_memory_kind(device)  # pyrefly: ignore[bad-argument-type]
+    if memory_kind is None:
+      # Start the asynchronous device-to-host copy
+      data.copy_to_host_async()
+      return rslice, data, False
+    if data.sharding.memory_kind == memory_kind:
+      return rslice, data, False
+    # Transfer to a host buffer of a previous transfer if possible, or to newly
+    # allocated host memory.
+    host_buffer = None
+    if use_pool:
+      host_buffer = host_buffer_pool.acquire(
+          host_buffer_pool_lib.BufferKey(
+              shape=tuple(data.shape),
+              dtype=np.dtype(data.dtype),
+              memory_kind=memory_kind,
+              device=device,  # pyrefly: ignore[bad-argument-type]
+          )
       )
+    if host_buffer is not None:
+      data = host_buffer_pool_lib.copy_into(data, host_buffer)
     else:
-      data.copy_to_host_async()
-    return rslice, data
+      data = jax.device_put(
+          data, make_single_device_sharding(device, memory_kind=memory_kind)
+      )
+    return rslice, data, True
+
+  def to_numpy(data: jax.Array, is_host_buffer: bool) -> np.ndarray:
+    # Conversion to numpy arrays forces block_until_ready.
+    host_value = np.asarray(data)
+    if is_host_buffer and use_pool:
+      host_buffer_pool.release_when_unused(data, host_value)
+    return host_value
 
   # Gather the replica slices to be saved for each array.
   rslices_per_array = [
@@ -480,11 +536,10 @@ def transfer_arrays_to_host(
           replica_slices=[
               dataclasses.replace(
                   rslice_on_device,
-                  # Conversion to numpy arrays forces block_until_ready.
-                  unsliced_data=np.asarray(data),
+                  unsliced_data=to_numpy(data, is_host_buffer),
                   slice_args=None,
               )
-              for rslice_on_device, data in transfers
+              for rslice_on_device, data, is_host_buffer in transfers
           ],
       )
       for rslices, transfers in zip(rslices_per_array, transfers_per_array)
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+from unittest import mock
+
 from absl.testing import absltest
 from absl.testing import parameterized
 import jax
 import numpy as np
+from orbax.checkpoint._src.serialization import host_buffer_pool
 from orbax.checkpoint._src.serialization import replica_slices
 
 
@@ -334,6 +338,71 @@ class ReplicaSlicesTest(parameterized.TestCase):
       # With single-replica we transfer a single slice for each shard.
       self.assertLen(rslices.replica_slices, num_partitions)
 
+  def test_transfer_reuses_pooled_staging_buffers(self):
+    if jax.device_count() < 4:
+      self.skipTest('Not enough devices to test.')
+    arr, num_partitions, _ = make_multi_device_array(
+        (64, 64),
+        partitioned=True,
+    )
+    pool = host_buffer_pool.HostBufferPool(max_bytes=2**30)
+    for shard in arr.addressable_shards:
+      if shard.replica_id == 0:
+        pool.release(
+            jax.device_put(
+                np.zeros(shard.data.shape, dtype=shard.data.dtype),
+                jax.sharding.SingleDeviceSharding(
+                    shard.device, memory_kind='pinned_host'
+                ),
+            )
+        )
+    self.assertGreater(pool.nbytes, 0)
+
+    rslices = replica_slices.transfer_arrays_to_host(
+        [arr],
+        replica_id=0,
+        use_replica_parallel=False,
+        enable_pinned_host_transfer=True,
+        host_buffer_pool=pool,
+    )[0]
+
+    self.assertEqual(pool.hits, num_partitions)
+    self.assertLen(rslices.replica_slices, num_partitions)
+    for rslice in rslices.replica_slices:
+      np.testing.assert_array_equal(rslice.data(), arr[rslice.index])
+
+  def test_unpinned_transfer_reuses_host_buffers(self):
+    self.enter_context(
+        mock.patch.object(
+            replica_slices, '_pool_unpinned_host_transfers', return_value=True
+        )
+    )
+    arr, num_partitions, _ = make_multi_device_array(
+        (64, 64),
+        partitioned=True,
+    )
+    pool = host_buffer_pool.HostBufferPool(max_bytes=2**30)
+
+    def _transfer():
+      return replica_slices.transfer_arrays_to_host(
+          [arr], replica_id=0, use_replica_parallel=False, host_buffer_pool=pool
+      )[0]
+
+    rslices = _transfer()
+    for rslice in rslices.replica_slices:
+      np.testing.assert_array_equal(rslice.data(), arr[rslice.index])
+    # Host values are views of their host buffers, which are only pooled once
+    # the values are no longer used.
+    self.assertEqual(pool.nbytes, 0)
+    del rslice, rslices
+    gc.collect()
+    self.assertEqual(pool.nbytes, arr.nbytes)
+
+    rslices = _transfer()
+    self.assertEqual(pool.hits, num_partitions)
+    for rslice in rslices.replica_slices:
+      np.testing.assert_array_equal(rslice.data(), arr[rslice.index])
+
   def test_nbytes_no_slicing(self):
     rslice = replica_slices.ReplicaSlice(
         index=(slice(None),),
@@ -17,6 +17,9 @@
 import asyncio
 import collections
 from collections.abc import Mapping
+import dataclasses
+import itertools
+import math
 from typing import Any, Dict, Optional, Sequence, Union
 
 import jax
@@ -252,15 +255,38 @@ async def _read_shard(
     requested_domain: ts.IndexDomain,
     restricted_domain: ts.IndexDomain,
 ) -> np.ndarray:
-  """Reads a single shard from TensorStore into host memory."""
-  # This maybe needed because the shape the array was saved with is smaller
-  # than the requested shape of the array in which it will be reloaded. So
-  # the extra values will be filled with 0s.
-  out = np.zeros(new_shard_shape, dtype=t.dtype.numpy_dtype)
-  await ts.array(out)[ts.d[:].translate_to[requested_domain.origin]][
-      restricted_domain
-  ].write(t[restricted_domain])
-  if dtype is not None:
+  """Reads a single shard from TensorStore into host memory.
+
+  The destination buffer is only zero-filled where the stored array does not
+  cover the requested shard (padding). If `dtype` is provided, the cast is
+  fused into the TensorStore read where supported, which avoids a second pass
+  over (and a second allocation of) the host buffer.
+
+  Args:
+    t: The opened TensorStore.
+    new_shard_shape: The shape of the shard to return.
+    dtype: Optional dtype to cast the shard to.
+    requested_domain: The domain of the shard in the requested global array.
+    restricted_domain: `requested_domain` intersected with the domain of `t`.
+
+  Returns:
+    The shard as a numpy array of shape `new_shard_shape`.
+  """
+  source = _maybe_fuse_cast(t, dtype)
+  if tuple(restricted_domain.shape) == tuple(new_shard_shape):
+    # The stored array covers the whole shard, so let TensorStore allocate the
+    # (uninitialized) destination and read straight into it.
+    out = await source[restricted_domain].translate_to[0].read()
+  else:
+    # The shape the array was saved with is smaller than the requested shape
+    # of the array in which it will be reloaded. The extra values will be
+    # filled with 0s.
+    out = np.empty(new_shard_shape, dtype=source.dtype.numpy_dtype)
+    _zero_fill_padding(out, requested_domain, restricted_domain)
+    await ts.array(out)[ts.d[:].translate_to[requested_domain.origin]][
+        restricted_domain
+    ].write(source[restricted_domain])
+  if dtype is not None and out.dtype != dtype:
     # Cast while reloading on process to avoid 2 copies on device if the
     # casting is done on device.
     def _cast(x: np.ndarray) -> np.ndarray:
@@ -269,20 +295,41 @@ async def _read_shard(
   return out
 
 
-async def _read_array_index_and_device_put(
-    devices: list[jax.Device],
-    index: Index,
+def _maybe_fuse_cast(
+    t: ts.TensorStore, dtype: Optional[jnp.dtype]
+) -> ts.TensorStore:
+  """Returns a view of `t` that casts to `dtype` on read, if supported."""
+  if dtype is None or t.dtype.numpy_dtype == dtype:
+    return t
+  try:
+    return ts.cast(t, np.dtype(dtype))
+  except (TypeError, ValueError):
+    # Conversion not supported by TensorStore, fall back to numpy casting.
+    return t
+
+
+def _zero_fill_padding(
+    out: np.ndarray,
+    requested_domain: ts.IndexDomain,
+    restricted_domain: ts.IndexDomain,
+):
+  """Zero-fills the region of `out` not covered by `restricted_domain`."""
+  for i in range(out.ndim):
+    lower = restricted_domain.origin[i] - requested_domain.origin[i]
+    upper = lower + restricted_domain.shape[i]
+    prefix = (slice(None),) * i
+    out[prefix + (slice(None, lower),)] = 0
+    out[prefix + (slice(upper, None),)] = 0
+
+
+def _get_read_domains(
     t: ts.TensorStore,
+    index: Index,
     *,
     global_shape: Shape,
-    new_shard_shape: Shape,
-    dtype: jnp.dtype,
-    byte_limiter: limits.ByteLimiter,
     strict: bool,
-    dll,
-    memory_kind: Optional[str],
-) -> tuple[list[jax.Array], int]:
-  """Callback that reads an array index and places on the devices."""
+) -> tuple[ts.IndexDomain, ts.IndexDomain]:
+  """Returns the requested and restricted (stored) domains for an index."""
   for sl in index:
     if sl.step is not None and sl.step != 1:
       raise ValueError(
@@ -293,8 +340,7 @@ async def _read_array_index_and_device_put(
   if strict:
     if t.shape == global_shape:
       domain = ts.IndexDomain(shape=global_shape)[ts.d[:][index]]
-      requested_domain = domain
-      restricted_domain = domain
+      return domain, domain
     else:
       raise ValueError(
           f'Requested shape: {global_shape} is not compatible with the stored'
@@ -303,21 +349,150 @@ async def _read_array_index_and_device_put(
           ' or `enable_padding_and_truncation=True` in `ArrayOptions.Loading`'
           ' in v1 API.'
       )
-  else:
-    requested_domain = ts.IndexTransform(input_shape=global_shape)[index].domain
-    restricted_domain = t.domain.intersect(requested_domain)
+  requested_domain = ts.IndexTransform(input_shape=global_shape)[index].domain
+  return requested_domain, t.domain.intersect(requested_domain)
+
+
+@dataclasses.dataclass
+class _ReadRegion:
+  """A box-shaped region of the global array that is read in one request.
+
+  Attributes:
+    bounds: Per-dimension `(start, stop)` bounds of the region.
+    shards: The local shard indices contained in the region, along with the
+      devices each of them must be placed on.
+  """
+
+  bounds: types.IndexBounds
+  shards: list[tuple[Index, list[jax.Device]]]
+
+  @property
+  def index(self) -> Index:
+    return tuple(slice(start, stop) for start, stop in self.bounds)
+
+  @property
+  def size(self) -> int:
+    return math.prod(stop - start for start, stop in self.bounds)
+
+
+def _bounding_bounds(
+    a: types.IndexBounds, b: types.IndexBounds
+) -> types.IndexBounds:
+  return tuple(
+      (min(a_start, b_start), max(a_stop, b_stop))
+      for (a_start, a_stop), (b_start, b_stop) in zip(a, b)
+  )
+
+
+def _bounds_intersect(a: types.IndexBounds, b: types.IndexBounds) -> bool:
+  return all(
+      a_start < b_stop and b_start < a_stop
+      for (a_start, a_stop), (b_start, b_stop) in zip(a, b)
+  )
+
+
+def _plan_read_regions(
+    t: ts.TensorStore,
+    local_indices_devices_map: Mapping[types.HashableIndex, list[jax.Device]],
+    *,
+    global_shape: Shape,
+    strict: bool,
+    byte_limiter: limits.ByteLimiter,
+) -> list[_ReadRegion]:
+  """Groups local shard indices into regions that are read only once.
+
+  When resharding, neighbouring local shards frequently map onto the same
+  stored chunks, so reading each shard separately reads (and decodes) those
+  chunks multiple times. Two regions are merged if together they form a box,
+  and reading the box touches fewer chunk-aligned bytes than reading them
+  separately. Merging stops before a single read would exceed the capacity of
+  `byte_limiter`.
+
+  Args:
+    t: The opened TensorStore.
+    local_indices_devices_map: Unique local indices mapped to their devices.
+    global_shape: The requested global shape.
+    strict: Whether padding/truncation is disallowed.
+    byte_limiter: Limiter used for reads of this array.
+
+  Returns:
+    A list of regions covering all local indices.
+  """
+
+  def _footprint(bounds: types.IndexBounds) -> int:
+    index = tuple(slice(start, stop) for start, stop in bounds)
+    _, restricted_domain = _get_read_domains(
+        t, index, global_shape=global_shape, strict=strict
+    )
+    return estimate_read_memory_footprint(t, restricted_domain)
+
+  regions = []
+  for idx, devices in local_indices_devices_map.items():
+    index = np_utils.from_hashable_index(idx)
+    # Validates the index, raising for unsupported or incompatible requests.
+    _get_read_domains(t, index, global_shape=global_shape, strict=strict)
+    bounds = tuple((start, stop) for start, stop, _ in idx)
+    regions.append(_ReadRegion(bounds=bounds, shards=[(index, devices)]))
+  if len(regions) <= 1:
+    return regions
+
+  max_bytes = (
+      byte_limiter.max_bytes
+      if isinstance(byte_limiter, limits.LimitInFlightBytes)
+      else None
+  )
+  footprints = [_footprint(r.bounds) for r in regions]
+  merged = True
+  while merged:
+    merged = False
+    for i, j in itertools.combinations(range(len(regions)), 2):
+      a, b = regions[i], regions[j]
+      if _bounds_intersect(a.bounds, b.bounds):
+        continue
+      bounds = _bounding_bounds(a.bounds, b.bounds)
+      if math.prod(stop - start for start, stop in bounds) != a.size + b.size:
+        continue
+      footprint = _footprint(bounds)
+      if footprint >= footprints[i] + footprints[j]:
+        continue
+      if max_bytes is not None and footprint >= max_bytes:
+        continue
+      regions[i] = _ReadRegion(bounds=bounds, shards=a.shards + b.shards)
+      footprints[i] = footprint
+      del regions[j]
+      del footprints[j]
+      merged = True
+      break
+  return regions
+
+
+async def _read_region_and_device_put(
+    region: _ReadRegion,
+    t: ts.TensorStore,
+    *,
+    global_shape: Shape,
+    new_shard_shape: Shape,
+    dtype: jnp.dtype,
+    byte_limiter: limits.ByteLimiter,
+    strict: bool,
+    dll,
+    memory_kind: Optional[str],
+) -> tuple[list[jax.Array], int]:
+  """Reads a region once and places each contained shard on its devices."""
+  requested_domain, restricted_domain = _get_read_domains(
+      t, region.index, global_shape=global_shape, strict=strict
+  )
+  if len(region.shards) > 1:
+    new_shard_shape = tuple(stop - start for start, stop in region.bounds)
 
   requested_bytes = estimate_read_memory_footprint(t, restricted_domain)
   result = []
-  # Limit the bytes read for every shard.
-  # Perform read for index once, and place it on all relevant devices within
-  # the `reserved_bytes` context.
-  # TODO(b/381111280) This de-duplication of reads does not fully solve the
-  # problem of read amplification, since we can still run into problems if
-  # we are resharding. See b/381111280 for details.
+  # Limit the bytes read for every region.
+  # Perform read for the region once, and place the shards it contains on all
+  # relevant devices within the `reserved_bytes` context.
   async with limits.reserved_bytes(byte_limiter, requested_bytes):
     try:
-      shard = await _read_shard(
+      region_data = await _read_shard(
           t=t,
           new_shard_shape=new_shard_shape,
           dtype=dtype,
@@ -326,12 +501,19 @@ async def _read_array_index_and_device_put(
       )
     except BaseException as e:
       raise Exception(  # pylint: disable=broad-exception-raised
-          f'Encountered error while reading array index: {index}. See full'
-          f' TensorStore details: {t.spec}.'
+          f'Encountered error while reading array index: {region.index}. See'
+          f' full TensorStore details: {t.spec}.'
       ) from e
-    for device in devices:
-      sharding = make_single_device_sharding(device, memory_kind=memory_kind)
-      result.append(jax.device_put(shard, Format(dll, sharding)))  # pytype: disable=wrong-arg-types
+    for index, devices in region.shards:
+      shard = region_data[
+          tuple(
+              slice(sl.start - start, sl.stop - start)
+              for sl, (start, _) in zip(index, region.bounds)
+          )
+      ]
+      for device in devices:
+        sharding = make_single_device_sharding(device, memory_kind=memory_kind)
+        result.append(jax.device_put(shard, Format(dll, sharding)))  # pytype: disable=wrong-arg-types
   return result, requested_bytes
 
 
@@ -362,10 +544,16 @@ async def _read_and_create_array(
           np_utils.to_hashable_index(idx, shape=global_shape)
       ].append(d)
 
+  read_regions = _plan_read_regions(
+      t,
+      local_indices_devices_map,
+      global_shape=global_shape,
+      strict=strict,
+      byte_limiter=byte_limiter,
+  )
   read_array_coros = [
-      _read_array_index_and_device_put(
-          devices,
-          np_utils.from_hashable_index(idx),
+      _read_region_and_device_put(
+          region,
           t,
           global_shape=global_shape,
           new_shard_shape=new_shard_shape,
@@ -375,7 +563,7 @@ async def _read_and_create_array(
           dll=dll,
           memory_kind=sharding.memory_kind,
       )
-      for idx, devices in local_indices_devices_map.items()
+      for region in read_regions
   ]
   shards_and_bytes_read = await asyncio.gather(*read_array_coros)
   all_shards = []
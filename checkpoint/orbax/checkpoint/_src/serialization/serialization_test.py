@@ -630,6 +630,35 @@ class CheckpointTest(parameterized.TestCase):
       for shard in restored.addressable_shards:
         self.assertArraysEqual(np.asarray(shard.data), np.arange(8))
 
+  @parameterized.product(
+      restore_shape=[(4, 8), (8, 8), (8, 16)],
+      restore_dtype=[None, np.float32, jnp.bfloat16],
+  )
+  def test_padding_and_casting(self, restore_shape, restore_dtype):
+    data = np.arange(32, dtype=np.int32).reshape(4, 8)
+    global_mesh = create_global_mesh((2,), 'x')
+    sharding = NamedSharding(global_mesh, P('x'))
+    array = jax.make_array_from_callback(
+        data.shape, sharding, lambda idx: data[idx]
+    )
+    ckpt_paths = [str(self.ckpt_dir)]
+    tspecs_write = [self._get_write_spec(path, array) for path in ckpt_paths]
+    tspecs_read = [self._get_read_spec(path) for path in ckpt_paths]
+    serialize([array], tspecs_write)
+
+    (restored,) = deserialize(
+        [sharding],
+        tspecs_read,
+        [restore_shape],
+        dtypes=[restore_dtype],
+        strict=False,
+    )
+    expected = np.zeros(restore_shape, dtype=np.int32)
+    expected[:4, :8] = data
+    if restore_dtype is not None:
+      expected = expected.astype(restore_dtype)
+    self.assertArraysEqual(np.asarray(restored), expected)
+
   def test_odd_resharding(self):
     data = np.arange(12)
     global_shape = data.shape
@@ -769,6 +798,70 @@ class CheckpointTest(parameterized.TestCase):
     self.assertArraysEqual(restored_arr, data)
     self.assertEqual(io_read_byte_size, data.nbytes)
 
+  @parameterized.named_parameters(
+      dict(testcase_name='row_sharded', pspec=('x', None)),
+      dict(testcase_name='fully_sharded', pspec=('x', 'y')),
+  )
+  def test_resharding_reads_each_chunk_once(self, pspec):
+    shape = (16, 16)
+    dtype = np.int32
+    data = np.arange(math.prod(shape), dtype=dtype).reshape(shape)
+    # Saved chunks are (8, 16), restored shards are smaller and straddle them.
+    save_sharding = NamedSharding(create_global_mesh((2,), 'x'), P('x'))
+    arr = jax.make_array_from_callback(
+        shape, save_sharding, lambda idx: data[idx]
+    )
+    ckpt_paths = [str(self.ckpt_dir)]
+    tspecs_write = [self._get_write_spec(path, arr) for path in ckpt_paths]
+    tspecs_read = [self._get_read_spec(path) for path in ckpt_paths]
+    serialize([arr], tspecs_write)
+
+    restore_sharding = NamedSharding(
+        create_global_mesh((4, 2), ('x', 'y')), P(*pspec)
+    )
+
+    async def _deserialize():
+      return await serialization.async_deserialize(
+          restore_sharding, tspecs_read[0], shape, dtype
+      )
+
+    restored_arr, io_read_byte_size = asyncio_utils.run_sync(_deserialize())
+
+    self.assertArraysEqual(restored_arr, data)
+    self.assertEqual(restored_arr.sharding, restore_sharding)
+    self.assertEqual(io_read_byte_size, data.nbytes)
+
+  def test_resharding_respects_byte_limiter(self):
+    shape = (16, 16)
+    dtype = np.int32
+    data = np.arange(math.prod(shape), dtype=dtype).reshape(shape)
+    save_sharding = NamedSharding(create_global_mesh((2,), 'x'), P('x'))
+    arr = jax.make_array_from_callback(
+        shape, save_sharding, lambda idx: data[idx]
+    )
+    ckpt_paths = [str(self.ckpt_dir)]
+    tspecs_write = [self._get_write_spec(path, arr) for path in ckpt_paths]
+    tspecs_read = [self._get_read_spec(path) for path in ckpt_paths]
+    serialize([arr], tspecs_write)
+
+    restore_sharding = NamedSharding(create_global_mesh((4,), 'x'), P('x'))
+    # Only a single stored chunk (8 * 16 * 4 bytes) fits within the limit.
+    byte_limiter = limits.LimitInFlightBytes(8 * 16 * 4 + 1)
+
+    async def _deserialize():
+      return await serialization.async_deserialize(
+          restore_sharding,
+          tspecs_read[0],
+          shape,
+          dtype,
+          byte_limiter=byte_limiter,
+      )
+
+    restored_arr, io_read_byte_size = asyncio_utils.run_sync(_deserialize())
+
+    self.assertArraysEqual(restored_arr, data)
+    self.assertEqual(io_read_byte_size, data.nbytes)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -49,6 +49,7 @@ DEFAULT_DRIVER = FILE_DRIVER
 
 PROCESS_SUBDIR_PREFIX = 'ocdbt.process_'
 REPLICA_SUBDIR_SUFFIX = 'replica_'
+MERGE_SUBDIR_PREFIX = 'ocdbt.merge_'
 
 # OCDBT-specific options.
 _OCDBT_PROCESS_ID_RE = r'[A-Za-z0-9]+'
@@ -294,6 +295,40 @@ def build_kvstore_tspec_for_merge(
   )
 
 
+def build_kvstore_tspec_for_intermediate_merge(
+    directory: str,
+    merge_id: str,
+) -> JsonSpec:
+  """Constructs a spec for an intermediate KvStore of a hierarchical merge.
+
+  The KvStore shares its base path with the OCDBT KvStore at `directory`, so
+  that it can be merged into the latter. Its manifest and B-tree nodes, which
+  the merged KvStore does not reference, are stored separately under
+  `{directory}/ocdbt.merge_{merge_id}`, so that deleting that directory leaves
+  no orphaned files behind.
+
+  Args:
+    directory: Base path of the KvStore that is eventually merged into.
+    merge_id: Identifier of the intermediate KvStore.
+
+  Returns:
+    A Tensorstore KvStore spec in dictionary form.
+  """
+  kv_spec = build_kvstore_tspec(directory, use_ocdbt=True)
+  manifest_dir = os.path.join(
+      os.path.normpath(directory).replace('gs:/', 'gs://'),
+      f'{MERGE_SUBDIR_PREFIX}{merge_id}',
+  )
+  if manifest_dir.startswith('gs://'):
+    kv_spec['manifest'] = _get_kvstore_for_gcs(manifest_dir)
+  else:
+    kv_spec['manifest'] = {'driver': DEFAULT_DRIVER, 'path': manifest_dir}
+  node_data_prefix = f'{MERGE_SUBDIR_PREFIX}{merge_id}/'
+  kv_spec['btree_node_data_prefix'] = node_data_prefix
+  kv_spec['version_tree_node_data_prefix'] = node_data_prefix
+  return kv_spec
+
+
 def _get_backend_ocdbt_target_data_file_size(
     kvstore_spec: JsonSpec | None,
 ) -> int:
@@ -29,6 +29,7 @@ from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import format_utils
 from orbax.checkpoint._src.serialization import jax_array_handlers
 from orbax.checkpoint._src.serialization import ocdbt_utils
+from orbax.checkpoint._src.serialization import packed_leaves
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
 from orbax.checkpoint._src.serialization import types
 import tensorstore as ts
@@ -63,6 +64,7 @@ class NumpyHandler(types.TypeHandler):
       self,
       metadata_key: Optional[str] = None,
       ocdbt_process_id: str | None = None,
+      pack_below_bytes: int | None = None,
   ):
     """Constructor.
 
@@ -72,19 +74,36 @@ class NumpyHandler(types.TypeHandler):
         systems to write in OCDBT format. The checkpoints are written in a
         subdir with this name to avoid collisions with the subdir names used by
         other host processes managed by this controller.
+      pack_below_bytes: If set, values of at most this many bytes are packed
+        into a single file per call to `serialize` instead of being written as
+        separate Tensorstore arrays. See `packed_leaves`. Packed values are
+        always restored, regardless of this option.
     """
     self._metadata_key = metadata_key
     self._override_ocdbt_process_id = ocdbt_process_id
+    self._pack_below_bytes = pack_below_bytes
 
   def typestr(self) -> str:
     return 'np.ndarray'
 
+  async def _read_packed(
+      self, infos: Sequence[types.ParamInfo]
+  ) -> Dict[str, np.ndarray]:
+    """Returns packed values, keyed by name; all infos share `parent_dir`."""
+    if not infos:
+      return {}
+    await infos[0].await_path_creation()
+    return await packed_leaves.read(infos[0].parent_dir)
+
   async def metadata(
       self, infos: Sequence[types.ParamInfo]
   ) -> Sequence[value_metadata.ArrayMetadata]:
+    packed = await self._read_packed(infos)
     open_ops = []
     for info in infos:
       await info.await_path_creation()
+      if info.name in packed:
+        continue
       # Use OCDBT flag from the existing checkpoint.
       use_ocdbt = info.is_ocdbt_checkpoint
       array_read_spec = ts_utils.build_array_read_spec(
@@ -98,11 +117,27 @@ class NumpyHandler(types.TypeHandler):
           ts.open(ts.Spec(tspec), open=True, context=info.ts_context)
       )
 
-    tensorstores = await asyncio.gather(*open_ops)
-    return [
-        ts_utils.array_metadata_from_tensorstore(t, info, sharding=None)
-        for t, info in zip(tensorstores, infos)
-    ]
+    tensorstores = iter(await asyncio.gather(*open_ops))
+    result = []
+    for info in infos:
+      if info.name in packed:
+        value = packed[info.name]
+        result.append(
+            value_metadata.ArrayMetadata(
+                name=info.name,
+                directory=info.parent_dir,
+                shape=value.shape,
+                dtype=value.dtype,
+                sharding=None,
+            )
+        )
+      else:
+        result.append(
+            ts_utils.array_metadata_from_tensorstore(
+                next(tensorstores), info, sharding=None
+            )
+        )
+    return result
 
   async def _open_and_write(
       self, value: np.ndarray, tspec: Dict[str, Any], ts_context: ts.Context
@@ -121,8 +156,12 @@ class NumpyHandler(types.TypeHandler):
   ):
     """Serializes numpy arrays in a background thread."""
     write_coros = []
+    packed = {}
     for value, info, arg in zip(values, infos, args):  # pyrefly: ignore[bad-argument-type]
       await info.await_path_creation()
+      if packed_leaves.can_pack(value, self._pack_below_bytes):
+        packed[info.name] = value
+        continue
       array_write_spec = ts_utils.build_array_write_spec(
           info=info,
           arg=arg,
@@ -144,6 +183,8 @@ class NumpyHandler(types.TypeHandler):
       if multihost.process_index() == 0:
         ts_context = info.ts_context
         write_coros.append(self._open_and_write(value, tspec, ts_context))  # pyrefly: ignore[bad-argument-type]
+    if packed and multihost.process_index() == 0:
+      write_coros.append(packed_leaves.write(infos[0].parent_dir, packed))
     await asyncio.gather(*write_coros)
 
   async def serialize(
@@ -174,9 +215,12 @@ class NumpyHandler(types.TypeHandler):
     """Deserializes the array using Tensorstore."""
     args = args or [RestoreArgs()] * len(infos)
     types.check_input_arguments(infos, args)
+    packed = await self._read_packed(infos)
     open_futures = []
     for info, arg in zip(infos, args):
       await info.await_path_creation()
+      if info.name in packed:
+        continue
       if not info.is_ocdbt_checkpoint:
         await ts_utils.assert_parameter_files_exist(
             info.parent_dir / info.name, self._metadata_key, info.use_zarr3  # pyrefly: ignore[bad-argument-type]
@@ -201,7 +245,14 @@ class NumpyHandler(types.TypeHandler):
       ]
     tensorstores = await asyncio.gather(*open_futures)
     read_ops = [t.read() for t in tensorstores]
-    ret = await asyncio.gather(*read_ops)
+    read_results = iter(await asyncio.gather(*read_ops))
+    ret = []
+    for info, arg in zip(infos, args):
+      if info.name in packed:
+        value = packed[info.name]
+        ret.append(value if arg.dtype is None else value.astype(arg.dtype))
+      else:
+        ret.append(next(read_results))
 
     if logging.vlog_is_on(1):
       for a in ret:
@@ -37,6 +37,7 @@ from orbax.checkpoint._src.path import atomicity
 from orbax.checkpoint._src.serialization import jax_array_handlers
 from orbax.checkpoint._src.serialization import limits
 from orbax.checkpoint._src.serialization import ocdbt_utils
+from orbax.checkpoint._src.serialization import packed_leaves
 from orbax.checkpoint._src.serialization import replica_slices
 from orbax.checkpoint._src.serialization import serialization
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
@@ -682,6 +683,48 @@ class NumpyHandlerTest(
       chunk_shapes.append(m.storage.chunk_shape)
     self.assertListEqual(chunk_shapes, [v.shape for v in values])
 
+  async def test_pack_below_bytes(self):
+    if multihost.process_index() != 0:
+      self.skipTest('Only run on host 0')
+
+    handler = type_handlers.NumpyHandler(pack_below_bytes=16)
+    values = [
+        np.arange(4, dtype=np.int32),
+        np.arange(12, dtype=np.float32).reshape((3, 4)),
+        np.float64(2.5) * np.ones((), dtype=np.float64),
+    ]
+    path = epath.Path(self.create_tempdir().full_path)
+    ts_context = ts_utils.get_ts_context()
+    param_infos = [
+        get_param_info(
+            str(i),
+            path,
+            is_ocdbt=True,
+            ts_context=ts_context,
+        )
+        for i in range(len(values))
+    ]
+    commit_futures = await handler.serialize(values, param_infos)
+    for f in commit_futures:
+      f.result()
+    await ocdbt_utils.merge_ocdbt_per_process_files(
+        path, ts_context=ts_context, use_zarr3=False
+    )
+    self.assertLen(list((path / packed_leaves.PACKED_LEAVES_DIR).iterdir()), 1)
+
+    metadatas = await handler.metadata(param_infos)
+    self.assertListEqual(
+        [m.shape for m in metadatas], [a.shape for a in values]
+    )
+    self.assertListEqual(
+        [m.dtype for m in metadatas], [a.dtype for a in values]
+    )
+    # Packed values are restored regardless of `pack_below_bytes`.
+    restored = await type_handlers.NumpyHandler().deserialize(param_infos)
+    for r, v in zip(restored, values):
+      np.testing.assert_array_equal(r, v)
+      self.assertEqual(r.dtype, v.dtype)
+
 
 class ScalarHandlerTest(parameterized.TestCase):
   """Test class."""
@@ -797,6 +840,96 @@ class ArrayHandlerCallbackTest(
     ]
     self.assertEqual(cb.events, expected_events)
 
+  async def test_deprioritized_batches_are_pipelined(self):
+    cb = self.TestCallback(types.TransferPriority.ASYNCHRONOUS_DEPRIORITIZED)
+    handler = type_handlers.ArrayHandler(
+        callback=cb, use_replica_parallel=False
+    )
+    directory = epath.Path(self.create_tempdir().full_path)
+    arrays = jax.tree.leaves(self.pytree)[:2]
+    # Half of the memory budget only fits one array per batch, but the whole
+    # budget fits both batches at once.
+    max_bytes = sum(arr.nbytes for arr in arrays)
+    infos = [
+        get_param_info(name, directory).replace(
+            keypath=(jax.tree_util.DictKey(name),),
+            device_host_byte_limiter=limits.LimitInFlightBytes(max_bytes),
+        )
+        for name in ('a', 'b')
+    ]
+
+    real_transfer = replica_slices.transfer_arrays_to_host
+    real_serialize = serialization.async_serialize_from_host
+    num_transfers = 0
+    second_transfer_started = threading.Event()
+    overlapped = []
+
+    def mock_transfer(*args, **kwargs):
+      nonlocal num_transfers
+      num_transfers += 1
+      if num_transfers == 2:
+        second_transfer_started.set()
+      return real_transfer(*args, **kwargs)
+
+    async def mock_serialize(*args, **kwargs):
+      if not overlapped:
+        # The write of the first batch waits for the transfer of the second.
+        overlapped.append(
+            await asyncio.to_thread(second_transfer_started.wait, 10)
+        )
+      return await real_serialize(*args, **kwargs)
+
+    with mock.patch.object(
+        replica_slices, 'transfer_arrays_to_host', side_effect=mock_transfer
+    ), mock.patch.object(
+        serialization, 'async_serialize_from_host', side_effect=mock_serialize
+    ):
+      futures = await handler.serialize(arrays, infos)
+      for f in futures:
+        f.result()
+
+    self.assertEqual(num_transfers, 2)
+    self.assertEqual(overlapped, [True])
+    self.assertCountEqual(
+        [event for event, _ in cb.events],
+        ['register'] * 2 + ['on_transfer_end'] * 2 + ['on_write_end'] * 2,
+    )
+
+  async def test_oversized_batches_are_not_pipelined(self):
+    cb = self.TestCallback(types.TransferPriority.ASYNCHRONOUS_DEPRIORITIZED)
+    handler = type_handlers.ArrayHandler(
+        callback=cb, use_replica_parallel=False
+    )
+    directory = epath.Path(self.create_tempdir().full_path)
+    arrays = jax.tree.leaves(self.pytree)[:2]
+    # Every array exceeds the memory budget on its own.
+    infos = [
+        get_param_info(name, directory).replace(
+            keypath=(jax.tree_util.DictKey(name),),
+            device_host_byte_limiter=limits.LimitInFlightBytes(16),
+        )
+        for name in ('a', 'b')
+    ]
+
+    real_transfer = replica_slices.transfer_arrays_to_host
+    num_writes_before_transfer = []
+
+    def mock_transfer(*args, **kwargs):
+      num_writes_before_transfer.append(
+          len([event for event, _ in cb.events if event == 'on_write_end'])
+      )
+      return real_transfer(*args, **kwargs)
+
+    with mock.patch.object(
+        replica_slices, 'transfer_arrays_to_host', side_effect=mock_transfer
+    ):
+      futures = await handler.serialize(arrays, infos)
+      for f in futures:
+        f.result()
+
+    # The second batch is only transferred once the first one is written.
+    self.assertEqual(num_writes_before_transfer, [0, 1])
+
   @parameterized.parameters(
       types.TransferPriority.SYNCHRONOUS,
       types.TransferPriority.ASYNCHRONOUS_DEPRIORITIZED,
@@ -33,6 +33,7 @@ from orbax.checkpoint._src.metadata import empty_values
 from orbax.checkpoint._src.metadata import pytree_metadata_options as pytree_metadata_options_lib
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.path import types as path_types
+from orbax.checkpoint._src.serialization import host_buffer_pool as host_buffer_pool_lib
 from orbax.checkpoint._src.serialization import limits
 from orbax.checkpoint._src.tree import types as tree_types
 import tensorstore as ts
@@ -219,15 +220,18 @@ class ParamInfo:
       be a directory. Accessing this property raises ValueError if the
       underlying path is a PathAwaitingCreation that has not been resolved via
       await_path_creation().
-    path: Automatically set to parent_dir / name. Accessing this property raises
-      ValueError if the underlying path is a PathAwaitingCreation that has not
-      been resolved via await_path_creation().
+    path: Defaults to parent_dir / name, computed when first accessed.
+      Accessing this property raises ValueError if the underlying path is a
+      PathAwaitingCreation that has not been resolved via
+      await_path_creation().
     skip_deserialize: If specified, skips deserialization of the given parameter
       using the TypeHandler.
     byte_limiter: Object to limit the number of bytes that can be read or
       written in parallel.
     device_host_byte_limiter: Object to limit the number of bytes that can be
       transferred from device to host memory in parallel.
+    host_buffer_pool: Pool of host buffers that arrays are transferred into on
+      save.
     is_ocdbt_checkpoint: Indicates whether the checkpoint path uses OCDBT format
       or not. Only used for restoration.
     use_compression: When True, turn on zstd compression. Default is True.
@@ -239,6 +243,9 @@ class ParamInfo:
     enable_pinned_host_transfer: If False, disables transfer to pinned host.
     raise_array_data_missing_error: Only used for restoring.
     write_shape: Shape of the array shard. Used in the subchunking context.
+    data_ref: If set, the value's data is not stored under `parent_dir` but in
+      another checkpoint directory, given relative to `parent_dir`. See
+      `data_references`.
     is_prioritized_key_fn: See ``IsPrioritizedKeyFn`` definition.
     keypath: Tuple of keys identifying the parameter's position in the PyTree.
   """
@@ -253,6 +260,7 @@ class ParamInfo:
       skip_deserialize: Optional[bool] = None,
       byte_limiter: Optional[limits.ByteLimiter] = None,
       device_host_byte_limiter: Optional[limits.ByteLimiter] = None,
+      host_buffer_pool: Optional[host_buffer_pool_lib.HostBufferPool] = None,
       is_ocdbt_checkpoint: Optional[bool] = None,
       use_compression: bool | None = True,
       use_zarr3: Optional[bool] = False,
@@ -262,15 +270,19 @@ class ParamInfo:
       enable_pinned_host_transfer: bool = False,
       raise_array_data_missing_error: bool = True,
       write_shape: arrays_types.Shape | None = None,
+      data_ref: str | None = None,
       is_prioritized_key_fn: Optional[IsPrioritizedKeyFn] = None,
   ):
     self.name = name
     self._parent_dir = parent_dir
-    self._path = path if path is not None else parent_dir / name
+    # Joining paths is costly on trees with many leaves, and most handlers only
+    # use parent_dir and name, so the default path is computed lazily.
+    self._path = path
     self.keypath = keypath
     self.skip_deserialize = skip_deserialize
     self.byte_limiter = byte_limiter
     self.device_host_byte_limiter = device_host_byte_limiter
+    self.host_buffer_pool = host_buffer_pool
     self.is_ocdbt_checkpoint = is_ocdbt_checkpoint
     self.use_compression = use_compression
     self.use_zarr3 = use_zarr3
@@ -280,6 +292,7 @@ class ParamInfo:
     self.enable_pinned_host_transfer = enable_pinned_host_transfer
     self.raise_array_data_missing_error = raise_array_data_missing_error
     self.write_shape = write_shape
+    self.data_ref = data_ref
     self.is_prioritized_key_fn = is_prioritized_key_fn
 
   @property
@@ -297,13 +310,13 @@ class ParamInfo:
 
   @property
   def path(self) -> epath.Path:
+    if self._path is None:
+      self._path = self._parent_dir / self.name
     if isinstance(self._path, path_types.PathAwaitingCreation):
       raise ValueError(
           'path is a PathAwaitingCreation and has not been resolved yet. '
           'Call `await info.await_path_creation()` first.'
       )
-    if self._path is None:
-      raise ValueError('path is None.')
     return self._path
 
   @path.setter
@@ -320,7 +333,7 @@ class ParamInfo:
     if isinstance(self._parent_dir, path_types.PathAwaitingCreation):
       resolved_path = await self._parent_dir.await_creation()
       self._parent_dir = resolved_path
-      self._path = resolved_path / self.name
+      self._path = None
 
 
 @dataclasses.dataclass
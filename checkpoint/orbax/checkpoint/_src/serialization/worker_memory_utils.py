@@ -234,3 +234,33 @@ def next_memory_budgeted_batch(
         _humanize_worker_memory_usage(current_worker_memory_usage),
     )
     yield current_batch
+
+
+def estimate_process_memory_usage(
+    arrays: Sequence[jax.Array],
+    *,
+    replica_id: int | None,
+) -> int:
+  """Estimates memory used by the arrays on this process after transfer.
+
+  Args:
+    arrays: The arrays to estimate memory usage for.
+    replica_id: The replica id to use for estimation. If None, all replicas are
+      used.
+
+  Returns:
+    The estimated memory usage in bytes, as accounted for by
+    `next_memory_budgeted_batch` without a dispatcher.
+  """
+  device_to_worker_ids_map = {
+      d.id: multihost.process_index_from_device(d) for d in jax.devices()
+  }
+  process_index = multihost.process_index()
+  return sum(
+      _estimate_worker_memory_usage(
+          arr,
+          replica_id=replica_id,
+          device_to_worker_ids_map=device_to_worker_ids_map,
+      )[process_index]
+      for arr in arrays
+  )
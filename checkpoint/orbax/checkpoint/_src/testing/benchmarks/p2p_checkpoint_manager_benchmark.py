@@ -37,6 +37,7 @@ from orbax.checkpoint._src.tree import utils
 from orbax.checkpoint.experimental.emergency.p2p import args as p2p_args_lib
 from orbax.checkpoint.experimental.emergency.p2p import checkpoint_manager as p2p_checkpoint_manager
 from orbax.checkpoint.experimental.emergency.p2p import options as p2p_options
+from orbax.checkpoint.experimental.emergency.p2p import protocol as p2p_protocol
 
 
 # ==============================================================================
@@ -141,6 +142,7 @@ def _restore_and_validate(
   with metrics.measure(f'{prefix}sync_global_processes_{step}'):
     multihost.sync_global_processes(f'{prefix}save_completed_{step}')
 
+  connections_opened = p2p_protocol.TCPClient.num_connections_opened()
   with metrics.measure(f'{prefix}restore_{step}'):
     restored = manager.restore(  # pyrefly: ignore[unsupported-operation]
         step,
@@ -151,6 +153,11 @@ def _restore_and_validate(
             )
         ),
     )['state']
+  logging.info(
+      'P2P connections opened during restore of step %d: %d',
+      step,
+      p2p_protocol.TCPClient.num_connections_opened() - connections_opened,
+  )
   logging.info('Assert Restored Pytree')
   pytree_utils.assert_pytree_equal(pytree, restored)
   with metrics.measure(f'{prefix}reload_after_restore_{step}'):
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import collections
 import concurrent
 import dataclasses
 import datetime
@@ -54,6 +55,7 @@ from orbax.checkpoint._src.logging import step_statistics
 from orbax.checkpoint._src.metadata import checkpoint
 from orbax.checkpoint._src.metadata import checkpoint_info
 from orbax.checkpoint._src.metadata import root_metadata_serialization
+from orbax.checkpoint._src.metadata import step_index
 from orbax.checkpoint._src.metadata import step_metadata_serialization
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import atomicity_types
@@ -370,6 +372,13 @@ class CheckpointManagerOptions:
     useful to improve init performance when there are O(1k) or more existing
     checkpoint steps present and checkpoint info properties like `time` and
     `metrics` are not needed.
+  enable_step_index: If True, maintains an index of the steps (see
+    `step_index`) in the root directory, updated when steps are saved or
+    deleted. Loading checkpoint infos then reads the index instead of listing
+    the directory and reading the metadata of every step, unless the index is
+    missing or records a step whose save or deletion did not complete. All
+    managers saving to the same directory must enable this option, as the
+    index is otherwise not kept up to date.
   """
 
   save_interval_steps: int = 1
@@ -412,6 +421,7 @@ class CheckpointManagerOptions:
   enable_should_save_is_saving_in_progress_check: bool = True
   enable_per_process_directory_creation: bool = False
   lightweight_initialize: bool = False
+  enable_step_index: bool = False
 
   def __post_init__(self):
     step_name_format_single_host_load_and_broadcast = (
@@ -880,6 +890,11 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
         )
     )
 
+    # Steps whose save or deletion has not completed, recorded as not finalized
+    # in the step index.
+    self._step_index_lock = threading.Lock()
+    self._unfinalized_step_index_entries: dict[int, CheckpointInfo] = {}
+    self._step_index_writer = step_index.Writer(self.directory)
     self._checkpoints = checkpoint_info.CheckpointInfos(
         self._load_checkpoint_infos(
             skip_metadata_read=self._options.lightweight_initialize
@@ -901,6 +916,11 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
 
     # TODO: b/359854428 - Move Finalize biz logic to a separate class/module.
     self._finalize_thread = threading_lib.OptionalRef[_FinalizeThread]()
+    # Finalize threads of saves that may still be committing, oldest first.
+    # Only used if the checkpointer allows several concurrent commits.
+    self._finalize_threads: collections.deque[_FinalizeThread] = (
+        collections.deque()
+    )
 
     self._checkpoint_deleter: deleter.CheckpointDeleter = (
         deleter.create_checkpoint_deleter(
@@ -911,6 +931,8 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
             todelete_full_path=self._options.todelete_full_path,
             enable_background_delete=self._options.enable_background_delete,
             num_threads=self._options.num_deletion_threads,
+            on_deleted=self._on_step_deleted,
+            is_reference_counted=self._data_references_enabled,
         )
     )
 
@@ -1268,7 +1290,10 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
     """See superclass documentation.
 
     Delete can be run asynchronously if
-    CheckpointManagerOptions.enable_background_delete is set to True.
+    CheckpointManagerOptions.enable_background_delete is set to True. If the
+    step holds data referenced by later checkpoints saved incrementally, it is
+    no longer a checkpoint, but its data is only deleted with the last
+    checkpoint referencing it.
 
     Args:
       step: The step to delete.
@@ -1283,6 +1308,13 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
       raise FileNotFoundError(
           f'Requested deleting a non-existent step: {step}.'
       )
+    self._update_step_index(
+        unfinalized=[info for info in self._checkpoints if info.step == step]
+    )
+    if self._options.enable_background_delete:
+      # The step must be gone by the time its deletion is recorded in the step
+      # index, see `_on_step_deleted`.
+      self._checkpoints.delete_if(lambda info: info.step == step)
     self._checkpoint_deleter.delete(step)
     multihost.sync_global_processes(
         multihost.unique_barrier_key(
@@ -1294,6 +1326,8 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
         processes=self._multiprocessing_options.active_processes,
     )
     self._checkpoints.delete_if(lambda info: info.step == step)
+    if not self._options.enable_background_delete:
+      self._update_step_index(resolved=[step])
 
   def _validate_args(
       self,
@@ -1449,7 +1483,10 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
               self._is_continuous_checkpointing_enabled()
           ),
       )
-    self.wait_until_finished()
+    if self._max_concurrent_commits() > 1:
+      self._wait_for_commit_capacity()
+    else:
+      self.wait_until_finished()
     step_stats.wait_for_prev_duration_secs = self._wait_for_prev_save_duration
     self._wait_for_prev_save_duration = 0.0
     if (
@@ -1462,8 +1499,11 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
           step_stats.wait_for_prev_duration_secs,
       )
     # We consider the save in progress only when we have finished waiting for
-    # previous save to complete.
-    self._save_progress_tracker.set(True)
+    # previous save to complete. With concurrent commits, finalize threads may
+    # overlap with this point, so the progress is not tracked: a new save only
+    # blocks when the commit queue is full.
+    if self._max_concurrent_commits() == 1:
+      self._save_progress_tracker.set(True)
     if step in self.all_steps():
       raise StepAlreadyExistsError(
           f'Checkpoint for step {step} already exists.'
@@ -1530,10 +1570,35 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
           '/jax/orbax/write/validation_duration_secs',
           validation_duration,
       )
+    # The step must be recorded in the step index before its checkpoint can be
+    # committed. Async checkpointers write the index in the background, right
+    # before committing.
+    save_kwargs = {}
+    index_in_background = (
+        self._options.enable_step_index
+        and isinstance(self._checkpointer, async_checkpointer.AsyncCheckpointer)
+    )
+    if index_in_background:
+      save_kwargs['pre_commit_callback'] = self._update_step_index
+    self._update_step_index(
+        unfinalized=[
+            CheckpointInfo(
+                step, datetime.datetime.now(tz=datetime.timezone.utc), metrics
+            )
+        ],
+        write=not index_in_background,
+    )
     step_stats.checkpointer_blocking_start_time = time.time()
     self._checkpointer.save(
-        save_directory, args=args, custom_metadata=custom_metadata, force=True
+        save_directory,
+        args=args,
+        custom_metadata=custom_metadata,
+        force=True,
+        **save_kwargs,
     )
+    wait_for_commit = None
+    if self._max_concurrent_commits() > 1:
+      wait_for_commit = self._checkpointer.get_commit_waiter()  # pytype: disable=attribute-error
     step_stats.checkpointer_blocking_duration_secs = (
         time.time() - step_stats.checkpointer_blocking_start_time
     )
@@ -1550,6 +1615,12 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
         step_stats.get_old_steps_duration_secs,
     )
 
+    checkpoints_to_remove = [
+        info for info in self._checkpoints if info.step in steps_to_remove
+    ]
+    # Until they are deleted or retained during finalize, these steps are
+    # recorded as not finalized by any write of the step index.
+    self._update_step_index(unfinalized=checkpoints_to_remove, write=False)
     self._checkpoints.delete_if(lambda info: info.step in steps_to_remove)
     # Sync needed to ensure that old steps to remove are retrieved before
     # actually deleting them during finalize, since retrieval can involve
@@ -1570,7 +1641,7 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
         is_finalize_in_progress = self._finalize_thread.map(
             lambda t: t is not None and t.is_alive()
         )
-        assert not is_finalize_in_progress, (
+        assert wait_for_commit is not None or not is_finalize_in_progress, (
             'Save finalization already in progress for'
             f' step={self._finalize_thread.get_not_none().step()}'
         )
@@ -1587,15 +1658,25 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
             step=step,
             name=finalize_thread_name,
             target=self._finalize,
-            args=(step, steps_to_remove),
+            args=(step, checkpoints_to_remove),
+            kwargs=(
+                None
+                if wait_for_commit is None
+                else dict(
+                    wait_for_commit=wait_for_commit,
+                    predecessor=self._finalize_thread.get(),
+                )
+            ),
         )
         finalize_thread.start()
         return finalize_thread
 
       self._finalize_thread.set_from(launch_finalize_thread)
+      if wait_for_commit is not None:
+        self._finalize_threads.append(self._finalize_thread.get_not_none())
 
     else:
-      self._finalize(step, steps_to_remove)
+      self._finalize(step, checkpoints_to_remove)
       logging.info(
           '[process=%s][thread=%s][step=%s] Finished synchronous save.',
           process_index,
@@ -1821,7 +1902,25 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
     if not self.directory.exists():
       return []
     start = time.time()
+    if self._options.enable_step_index:
+      checkpoint_infos = self._read_step_index()
+      if checkpoint_infos is not None:
+        jax.monitoring.record_event_duration_secs(
+            '/jax/checkpoint/read/load_all_step_metadata_duration_secs',
+            time.time() - start,
+        )
+        logging.info(
+            'Found %d checkpoint steps in step index of %s',
+            len(checkpoint_infos),
+            self.directory,
+        )
+        return checkpoint_infos
     step_metadatas = self._step_name_format.find_all(self.directory)
+    # Deleted steps whose data is still referenced are not checkpoints.
+    if deferred_steps := deleter.read_deferred_steps(self.directory):
+      step_metadatas = [
+          m for m in step_metadatas if m.step not in deferred_steps
+      ]
 
     def build_checkpoint_info(step_metadata):
       if skip_metadata_read:
@@ -1853,6 +1952,108 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
       )
       return checkpoint_infos
 
+  def _read_step_index(self) -> Optional[List[CheckpointInfo]]:
+    """Returns CheckpointInfos from the step index, if it can be trusted.
+
+    Returns:
+      a list of CheckpointInfo, sorted by increasing step, or None if the index
+      is missing or records steps that may or may not exist.
+    """
+    entries = step_index.read(self.directory)
+    if entries is None:
+      logging.info('No step index found in %s.', self.directory)
+      return None
+    unfinalized = [entry.step for entry in entries if not entry.finalized]
+    if unfinalized:
+      logging.info(
+          'Step index of %s records unfinalized steps %s; listing the'
+          ' directory instead.',
+          self.directory,
+          unfinalized,
+      )
+      return None
+    return [
+        CheckpointInfo(step=entry.step, time=entry.time, metrics=entry.metrics)
+        for entry in entries
+    ]
+
+  def _write_step_index(self, checkpoint_infos: Iterable[CheckpointInfo]):
+    """Updates the step index from `checkpoint_infos`.
+
+    Steps with an incomplete save or deletion are recorded as not finalized.
+    Only the primary host writes the index.
+
+    Args:
+      checkpoint_infos: The existing checkpoints.
+    """
+    if self._options.read_only or not utils.is_primary_host(
+        self._multiprocessing_options.primary_host
+    ):
+      return
+    write_metrics = self._track_best and not self._options.prevent_write_metrics
+
+    def build_entry(info: CheckpointInfo, finalized: bool):
+      return step_index.StepIndexEntry(
+          step=info.step,
+          time=info.time,
+          metrics=info.metrics if write_metrics else None,
+          finalized=finalized,
+      )
+
+    with self._step_index_lock:
+      unfinalized = self._unfinalized_step_index_entries
+      entries = [
+          build_entry(info, finalized=True)
+          for info in checkpoint_infos
+          if info.step not in unfinalized
+      ]
+      entries.extend(
+          build_entry(info, finalized=False) for info in unfinalized.values()
+      )
+      try:
+        self._step_index_writer.write(entries)
+      except Exception:  # pylint: disable=broad-except
+        # A stale index would hide steps saved or deleted since; without one,
+        # loading checkpoint infos falls back to listing the directory.
+        logging.exception(
+            'Failed to write step index of %s; removing it.', self.directory
+        )
+        self._step_index_writer.reset()
+        try:
+          step_index.remove(self.directory)
+        except Exception:  # pylint: disable=broad-except
+          logging.exception(
+              'Failed to remove step index of %s.', self.directory
+          )
+
+  def _update_step_index(
+      self,
+      unfinalized: Sequence[CheckpointInfo] = (),
+      resolved: Sequence[int] = (),
+      write: bool = True,
+  ):
+    """Updates the step index, if enabled.
+
+    Args:
+      unfinalized: Checkpoints whose save or deletion is starting.
+      resolved: Steps whose save or deletion has completed.
+      write: Whether to write the index, or only record the changes for the
+        next write.
+    """
+    if not self._options.enable_step_index:
+      return
+    with self._step_index_lock:
+      for info in unfinalized:
+        self._unfinalized_step_index_entries[info.step] = info
+      for step in resolved:
+        self._unfinalized_step_index_entries.pop(step, None)
+    if write:
+      self._write_step_index(self._checkpoints)
+
+  def _on_step_deleted(self, step: int):
+    """Records the completion of a background deletion in the step index."""
+    self._update_step_index(resolved=[step])
+
   def _add_checkpoint_info(self, step: int, metrics: Optional[PyTree]):
     self._checkpoints.append(
         CheckpointInfo(
@@ -2019,6 +2220,31 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
     if is_async_checkpointer(self._checkpointer):
       self._checkpointer.wait_until_finished()  # pytype: disable=attribute-error
 
+  def _max_concurrent_commits(self) -> int:
+    return getattr(self._checkpointer, 'max_concurrent_commits', 1)
+
+  def _wait_for_commit_capacity(self):
+    """Blocks until another save can commit without exceeding the limit.
+
+    Raises the error of any save that failed while waiting.
+    """
+    start_time = time.time()
+    try:
+      # Only depends on the number of saves, so that all hosts agree.
+      while len(self._finalize_threads) >= self._max_concurrent_commits():
+        finalize_thread = self._finalize_threads.popleft()
+        logging.info(
+            '[process=%s][thread=%s][step=%s] Waiting for Save Finalize thread'
+            ' (%s) to free up a commit slot.',
+            multihost.process_index(),
+            threading.current_thread().name,
+            finalize_thread.step(),
+            finalize_thread.name,
+        )
+        finalize_thread.join()
+    finally:
+      self._wait_for_prev_save_duration += time.time() - start_time
+
   def wait_until_finished(self):
     """Blocks until any incomplete save operations are completed.
 
@@ -2062,6 +2288,7 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
       # Don't call join() with a lock otherwise we will end up serializing the
       # access to the finalize thread.
       self._finalize_thread.get_not_none().join()
+      self._finalize_threads.clear()
       logging.info(
           '[process=%s][thread=%s][step=%s][wait_until_finished] Done'
           ' waiting for Save Finalize thread (%s) running at step=%d.',
@@ -2080,6 +2307,7 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
           step,
           finalize_thread_name,
       )
+      self._finalize_threads.clear()
       self._checkpoints.delete_if(lambda info: info.step == step)
       raise
     finally:
@@ -2123,7 +2351,9 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
     if is_async_checkpointer(self._checkpointer):
       self._checkpointer.check_for_errors()  # pytype: disable=attribute-error
 
-  def _finalize_checkpoint(self, step: int):
+  def _finalize_checkpoint(
+      self, step: int, *, check_for_errors: bool = True
+  ) -> bool:
     """Executes final actions just before the checkpoint write completes.
 
     * Logs error if any.
@@ -2131,10 +2361,16 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
 
     Args:
       step: finalized checkpoint step.
+      check_for_errors: Whether to check the checkpointer for errors. Disabled
+        if the caller has already checked the commit of `step`.
+
+    Returns:
+      False if the checkpointer failed, True otherwise.
     """
     if utils.is_primary_host(self._multiprocessing_options.primary_host):
       try:
-        self.check_for_errors()
+        if check_for_errors:
+          self.check_for_errors()
       except Exception:  # pylint: disable=broad-except
         logging.exception(
             (
@@ -2143,7 +2379,7 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
             ),
             step,
         )
-        return None
+        return False
       # If at a preemption step, record the time since the previous checkpoint.
       # This represents training time that would otherwise have been wasted.
       # If another checkpoint has not been previously saved, measures the time
@@ -2159,19 +2395,69 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
             '/jax/checkpoint/write/preempt/duration_saved_secs',
             duration.total_seconds(),
         )
+    return True
+
+  def _data_references_enabled(self) -> bool:
+    """Whether a registered handler saves incrementally.
+
+    Only incremental saves reference data in other checkpoints, so references
+    are not read otherwise.
+    """
+    handler = self._checkpointer.handler
+    if not isinstance(handler, CompositeCheckpointHandler):
+      return False
+    registry = handler._handler_registry  # pylint: disable=protected-access
+    return any(
+        getattr(item_handler, 'enable_incremental_save', False)
+        for item_handler in registry.get_all_entries().values()
+    )
 
-  def _finalize(self, step: int, steps_to_remove: List[int]):
-    """Finalizes individual items and starts garbage collection."""
+  def _finalize(
+      self,
+      step: int,
+      checkpoints_to_remove: List[CheckpointInfo],
+      *,
+      wait_for_commit: Optional[Callable[[], None]] = None,
+      predecessor: Optional[_FinalizeThread] = None,
+  ):
+    """Finalizes individual items and starts garbage collection.
+
+    Args:
+      step: The saved step.
+      checkpoints_to_remove: Checkpoints selected for removal after this save.
+      wait_for_commit: If set, waits for the commit of only this step, which
+        runs concurrently with commits of other steps. Raises if the commit
+        failed.
+      predecessor: The finalize thread of the previous save, if it may still
+        be running. Steps are finalized in save order, and this step fails if
+        the previous one did.
+    """
     process_index = multihost.process_index()
     current_thread = threading.current_thread()
     try:
       self._non_blocking_metadata_store.wait_until_finished()
-      self._wait_for_checkpointers()
-      # If an error is encountered while waiting for commit futures to complete,
-      # we will not proceed past this point.
-      self._finalize_checkpoint(step)
+      if wait_for_commit is None:
+        self._wait_for_checkpointers()
+        # If an error is encountered while waiting for commit futures to
+        # complete, we will not proceed past this point.
+        finalized = self._finalize_checkpoint(step)
+      else:
+        try:
+          if predecessor is not None:
+            predecessor.join()
+          wait_for_commit()
+        except BaseException:
+          self._checkpoints.delete_if(lambda info: info.step == step)
+          raise
+        finalized = self._finalize_checkpoint(step, check_for_errors=False)
       remove_steps_start_time = time.time()
+      steps_to_remove = [info.step for info in checkpoints_to_remove]
+      self._update_step_index(resolved=[step] if finalized else [])
+      # Steps holding data referenced by remaining checkpoints stay on disk
+      # until they are no longer referenced, see `deleter`.
       self._checkpoint_deleter.delete_steps(steps_to_remove)
+      if steps_to_remove and not self._options.enable_background_delete:
+        self._update_step_index(resolved=steps_to_remove)
       jax.monitoring.record_event_duration_secs(
           '/jax/checkpoint/write/remove_steps_duration_secs',
           time.time() - remove_steps_start_time,
@@ -2185,7 +2471,8 @@ class CheckpointManager(AbstractCheckpointManager, epy.ContextManager):
           step,
       )
       # Set save in progress does a barrier sync so we don't need to do it here.
-      self._save_progress_tracker.set(False)
+      if wait_for_commit is None:
+        self._save_progress_tracker.set(False)
       logging.info(
           '[process=%s][thread=%s][step=%s] CheckpointManager Save Finalize is'
           ' done on all hosts.',
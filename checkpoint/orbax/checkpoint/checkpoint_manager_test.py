@@ -16,6 +16,7 @@ import ast
 from concurrent import futures
 import datetime
 import os
+import threading
 import time
 import typing
 from typing import Optional, Sequence
@@ -54,10 +55,12 @@ from orbax.checkpoint._src.metadata import array_metadata_store as array_metadat
 from orbax.checkpoint._src.metadata import checkpoint as metadata_lib
 from orbax.checkpoint._src.metadata import root_metadata_serialization
 from orbax.checkpoint._src.metadata import sharding as sharding_metadata
+from orbax.checkpoint._src.metadata import step_index
 from orbax.checkpoint._src.metadata import step_metadata_serialization
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import atomicity
+from orbax.checkpoint._src.path import data_references
 from orbax.checkpoint._src.path import gcs_utils
 from orbax.checkpoint._src.path import step as step_lib
 from orbax.checkpoint._src.serialization import type_handler_registry
@@ -565,6 +568,162 @@ class CheckpointManagerTest(
           light_manager._checkpoints[1].time, datetime.datetime.min
       )
 
+  def test_step_index(self):
+    options = CheckpointManagerOptions(
+        enable_step_index=True,
+        max_to_keep=2,
+        best_fn=lambda metrics: metrics['loss'],
+        best_mode='min',
+    )
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      for step, loss in enumerate([3.0, 1.0, 2.0]):
+        self.assertTrue(
+            manager.save(
+                step,
+                args=args.Composite(params=args.PyTreeSave(self.pytree)),
+                metrics={'loss': loss},
+            )
+        )
+      self.wait_if_async(manager)
+
+    entries = step_index.read(self.directory)
+    self.assertEqual([entry.step for entry in entries], [1, 2])
+    self.assertTrue(all(entry.finalized for entry in entries))
+    self.assertEqual(entries[0].metrics, {'loss': 1.0})
+
+    with mock.patch.object(
+        step_lib.NameFormat, 'find_all', autospec=True
+    ) as find_all:
+      with CheckpointManager(
+          self.directory, item_names=('params',), options=options
+      ) as manager:
+        self.assertSameElements([1, 2], manager.all_steps())
+        self.assertEqual(manager.best_step(), 1)
+      find_all.assert_not_called()
+
+  def test_step_index_written_in_background(self):
+    options = CheckpointManagerOptions(enable_step_index=True)
+    writes = []
+    original_write = step_index.write
+    original_append = step_index.append
+
+    def _record(entries):
+      writes.append((
+          threading.current_thread() is threading.main_thread(),
+          {entry.step: entry.finalized for entry in entries},
+          (self.directory / '0').exists(),
+      ))
+
+    def _write(directory, entries):
+      _record(entries)
+      original_write(directory, entries)
+
+    def _append(directory, entries=(), removed_steps=()):
+      _record(entries)
+      original_append(directory, entries, removed_steps)
+
+    with mock.patch.object(
+        step_index, 'write', side_effect=_write
+    ), mock.patch.object(step_index, 'append', side_effect=_append):
+      with CheckpointManager(
+          self.directory, item_names=('params',), options=options
+      ) as manager:
+        manager.save(0, args=args.Composite(params=args.PyTreeSave(self.pytree)))
+        manager.wait_until_finished()
+
+    # Recorded as not finalized before the commit, then finalized, both off the
+    # main thread. The update is appended to the index.
+    self.assertEqual(
+        writes, [(False, {0: False}, False), (False, {0: True}, True)]
+    )
+    self.assertTrue(step_index.read(self.directory)[0].finalized)
+
+  def test_step_index_removed_on_write_failure(self):
+    options = CheckpointManagerOptions(enable_step_index=True)
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      manager.save(0, args=args.Composite(params=args.PyTreeSave(self.pytree)))
+      self.wait_if_async(manager)
+      self.assertIsNotNone(step_index.read(self.directory))
+      with mock.patch.object(
+          step_index, 'append', side_effect=OSError('append failed')
+      ), mock.patch.object(
+          step_index, 'write', side_effect=OSError('write failed')
+      ):
+        manager.save(
+            1, args=args.Composite(params=args.PyTreeSave(self.pytree))
+        )
+        self.wait_if_async(manager)
+      self.assertIsNone(step_index.read(self.directory))
+      # The next update replaces the removed index.
+      manager.save(2, args=args.Composite(params=args.PyTreeSave(self.pytree)))
+      self.wait_if_async(manager)
+      self.assertEqual(
+          [entry.step for entry in step_index.read(self.directory)], [0, 1, 2]
+      )
+    step_index.remove(self.directory)
+
+    # Falls back to listing the directory.
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      self.assertSameElements([0, 1, 2], manager.all_steps())
+
+  def test_step_index_background_delete(self):
+    options = CheckpointManagerOptions(
+        enable_step_index=True, max_to_keep=1, enable_background_delete=True
+    )
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      for step in range(3):
+        manager.save(
+            step, args=args.Composite(params=args.PyTreeSave(self.pytree))
+        )
+      manager.wait_until_finished()
+      # Deletions are recorded as they complete, before the manager is closed.
+      deadline = time.time() + 60
+      while time.time() < deadline:
+        entries = step_index.read(self.directory)
+        if [(e.step, e.finalized) for e in entries] == [(2, True)]:
+          break
+        time.sleep(0.1)
+      self.assertEqual(
+          [(entry.step, entry.finalized) for entry in entries], [(2, True)]
+      )
+
+  def test_step_index_unfinalized_falls_back_to_listing(self):
+    options = CheckpointManagerOptions(enable_step_index=True)
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      for step in range(2):
+        manager.save(
+            step, args=args.Composite(params=args.PyTreeSave(self.pytree))
+        )
+      self.wait_if_async(manager)
+
+    entries = step_index.read(self.directory)
+    step_index.write(
+        self.directory,
+        entries
+        + [
+            step_index.StepIndexEntry(
+                step=2,
+                time=datetime.datetime.now(tz=datetime.timezone.utc),
+                metrics=None,
+                finalized=False,
+            )
+        ],
+    )
+    with CheckpointManager(
+        self.directory, item_names=('params',), options=options
+    ) as manager:
+      self.assertSameElements([0, 1], manager.all_steps())
+
   @parameterized.parameters((False, 1), (True, 2))
   def test_latest_step(self, enable_async, save_interval_steps):
     options = CheckpointManagerOptions(
@@ -652,6 +811,87 @@ class CheckpointManagerTest(
 
     test_utils.sync_global_processes(f'test_removes_old_saves_{self.id()}')
 
+  @parameterized.parameters((False,), (True,))
+  def test_retains_steps_referenced_by_incremental_saves(self, enable_async):
+    """Test steps holding data referenced by kept steps are not removed."""
+    handler = handlers.PyTreeCheckpointHandler(enable_incremental_save=True)
+    handler_registry = handler_registration.DefaultCheckpointHandlerRegistry()
+    handler_registry.add('params', args.PyTreeSave, handler)
+    handler_registry.add('params', args.PyTreeRestore, handler)
+    options = CheckpointManagerOptions(
+        enable_async_checkpointing=enable_async, max_to_keep=2
+    )
+    read_references = mock.Mock(
+        wraps=data_references.read_referenced_directories
+    )
+    with CheckpointManager(
+        self.directory, options=options, handler_registry=handler_registry
+    ) as manager, mock.patch.object(
+        data_references, 'read_referenced_directories', read_references
+    ):
+      for step in range(4):
+        pytree = dict(self.pytree, a=self.pytree['a'] + step)
+        self.assertTrue(self.save_params(step, manager, pytree))
+      self.wait_if_async(manager)
+      # Only `a` changes between saves; step 0 holds the data of the others,
+      # so it stays on disk although it is no longer a checkpoint.
+      self.assertSameElements([2, 3], manager.all_steps())
+      self.assertTrue((self.directory / '0').exists())
+      self.assertFalse((self.directory / '1').exists())
+      # References of each finalized step are read at most once.
+      read_dirs = [str(c.args[0]) for c in read_references.call_args_list]
+      self.assertLen(set(read_dirs), len(read_dirs))
+      restored = self.restore_params(3, manager)
+      test_utils.assert_tree_equal(self, pytree, restored)
+
+    test_utils.sync_global_processes(
+        f'test_retains_steps_referenced_by_incremental_saves_{self.id()}'
+    )
+
+  def test_delete_referenced_step(self):
+    handler = handlers.PyTreeCheckpointHandler(enable_incremental_save=True)
+    handler_registry = handler_registration.DefaultCheckpointHandlerRegistry()
+    handler_registry.add('params', args.PyTreeSave, handler)
+    handler_registry.add('params', args.PyTreeRestore, handler)
+    with CheckpointManager(
+        self.directory, handler_registry=handler_registry
+    ) as manager:
+      for step in range(2):
+        self.assertTrue(self.save_params(step, manager, self.pytree))
+      manager.wait_until_finished()
+      manager.delete(0)
+      self.assertSameElements([1], manager.all_steps())
+      # Step 1 still reads the data of step 0.
+      self.assertTrue((self.directory / '0').exists())
+      restored = self.restore_params(1, manager)
+      test_utils.assert_tree_equal(self, self.pytree, restored)
+      manager.reload()
+      self.assertSameElements([1], manager.all_steps())
+      manager.delete(1)
+      self.assertEmpty(manager.all_steps())
+      self.assertFalse((self.directory / '0').exists())
+
+    test_utils.sync_global_processes(
+        f'test_delete_referenced_step_{self.id()}'
+    )
+
+  def test_data_references_not_read_without_incremental_saves(self):
+    options = CheckpointManagerOptions(max_to_keep=1)
+    with CheckpointManager(
+        self.directory, options=options
+    ) as manager, mock.patch.object(
+        data_references, 'read_referenced_directories'
+    ) as read_references:
+      for step in range(3):
+        self.assertTrue(self.save_params(step, manager, self.pytree))
+      manager.wait_until_finished()
+      self.assertSameElements([2], manager.all_steps())
+      read_references.assert_not_called()
+
+    test_utils.sync_global_processes(
+        f'test_data_references_not_read_without_incremental_saves_{self.id()}'
+    )
+
 
   @parameterized.parameters((None, Checkpointer), ('ttl=1h', AsyncCheckpointer))
   def test_max_to_keep_zero(self, todelete_subdir, ckptr):
@@ -2102,6 +2342,61 @@ class CheckpointManagerTest(
         for waiter in waiters:
           waiter.result(timeout=5)
 
+  def test_concurrent_commits_do_not_block_save(self):
+    async_options = checkpoint_manager.AsyncOptions(max_concurrent_commits=2)
+    with CheckpointManager(
+        self.directory,
+        AsyncCheckpointer(
+            PyTreeCheckpointHandler(), async_options=async_options
+        ),
+        options=CheckpointManagerOptions(
+            max_to_keep=2, async_options=async_options
+        ),
+    ) as manager:
+      with mock.patch.object(
+          manager, 'wait_until_finished', autospec=True
+      ) as wait_until_finished:
+        for step in range(3):
+          self.assertTrue(manager.save(step, {'a': step, 'b': 2}))
+        wait_until_finished.assert_not_called()
+        # At most two saves are committing at any time.
+        self.assertLessEqual(len(manager._finalize_threads), 2)  # pylint: disable=protected-access
+      manager.wait_until_finished()
+      self.assertSameElements([1, 2], manager.all_steps())
+      self.assertEqual(
+          {'a': 2, 'b': 2},
+          manager.restore(2, args=args.PyTreeRestore()),
+      )
+
+  def test_concurrent_commits_error(self):
+    async_options = checkpoint_manager.AsyncOptions(
+        timeout_secs=10, max_concurrent_commits=2
+    )
+    with (
+        futures.ThreadPoolExecutor(max_workers=1) as executor,
+        CheckpointManager(
+            self.directory,
+            AsyncCheckpointer(
+                test_utils.ErrorCheckpointHandler(
+                    PyTreeCheckpointHandler(), executor=executor
+                ),
+                async_options=async_options,
+            ),
+            options=CheckpointManagerOptions(
+                max_to_keep=1, async_options=async_options
+            ),
+        ) as manager,
+    ):
+      # Neither save blocks on the other, and both fail.
+      self.assertTrue(manager.save(0, {'a': 1, 'b': 2}))
+      self.assertTrue(manager.save(1, {'a': 1, 'b': 2}))
+      with self.assertRaises(SystemError):
+        manager.wait_until_finished()
+      self.assertEmpty(manager.all_steps())
+      self.assertLen(step_lib.all_temporary_paths(manager.directory), 2)
+      # Error is cleared so it is not re-raised.
+      manager.wait_until_finished()
+
   def test_legacy_handler_default_item(self):
     if multihost.is_pathways_backend():
       self.skipTest('Not applicable to Pathways.')
@@ -23,13 +23,13 @@ from etils import epath
 import jax
 from jax.experimental import layout
 import numpy as np
-from orbax.checkpoint import utils
 from orbax.checkpoint._src import asyncio_utils
 from orbax.checkpoint._src.arrays import sharding as arrays_sharding_lib
 from orbax.checkpoint._src.metadata import tree as tree_metadata
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint._src.path import step as step_lib
+from orbax.checkpoint._src.path import step_watcher as step_watcher_lib
 from orbax.checkpoint._src.path.snapshot import snapshot as snapshot_lib
 from orbax.checkpoint._src.serialization import type_handlers
 
@@ -170,19 +170,20 @@ def _wait_for_new_checkpoint(
     snapshot_dir: Optional[epath.Path] = None,
     set_immutable: bool | None = None,
     ignore_snapshot_errors: bool | None = None,
+    watcher: Optional[step_watcher_lib.StepWatcher] = None,
 ) -> int:
   """See documentation for wait_for_new_checkpoint."""
   start = time.time()
   stop_time = start + timeout if timeout is not None else None
 
-  def _sleep_and_maybe_exit():
+  def _sleep_and_maybe_exit(watcher: step_watcher_lib.StepWatcher):
     if stop_time is not None and time.time() + seconds_to_sleep > stop_time:
       if timeout_fn is None:
         return True
       elif timeout_fn():  # Only exit when timeout_fn indicates completion.
         return True
-    logging.info('Sleeping for %d seconds.', seconds_to_sleep)
-    time.sleep(seconds_to_sleep)
+    logging.info('Waiting for up to %d seconds.', seconds_to_sleep)
+    watcher.wait_for_change(seconds_to_sleep)
     return False
 
   log_str = f'Waiting for new checkpoint at {checkpoint_dir}. '
@@ -194,28 +195,33 @@ def _wait_for_new_checkpoint(
 
   result = -1
   if multihost.process_index() == 0:
-    while True:
-      if not checkpoint_dir.exists():
-        if _sleep_and_maybe_exit():
+    with contextlib.ExitStack() as stack:
+      if watcher is None:
+        watcher = stack.enter_context(
+            step_watcher_lib.StepWatcher(
+                checkpoint_dir, poll_interval_secs=seconds_to_sleep
+            )
+        )
+      while True:
+        # Only checks steps newer than the latest step seen by `watcher`.
+        watcher.poll()
+        checkpoint_step = watcher.latest_step
+        if _reached_desired_step(checkpoint_step, until_step):  # pyrefly: ignore[bad-argument-type]
+          if not _snapshot_checkpoint(
+              checkpoint_dir,
+              checkpoint_step,  # pyrefly: ignore[bad-argument-type]
+              step_name_format,
+              snapshot_dir,
+              set_immutable=set_immutable,
+              ignore_file_not_found_error=ignore_snapshot_errors,
+          ):
+            # The step was likely deleted; look for the latest step again.
+            watcher.reset()
+            continue
+          result = checkpoint_step
+          break
+        elif _sleep_and_maybe_exit(watcher):
           break
-        continue  # continue waiting until directory creation or timeout.
-
-      steps = utils.checkpoint_steps(checkpoint_dir)
-      checkpoint_step = max(steps) if steps else None
-      if _reached_desired_step(checkpoint_step, until_step):  # pyrefly: ignore[bad-argument-type]
-        if not _snapshot_checkpoint(
-            checkpoint_dir,
-            checkpoint_step,  # pyrefly: ignore[bad-argument-type]
-            step_name_format,
-            snapshot_dir,
-            set_immutable=set_immutable,
-            ignore_file_not_found_error=ignore_snapshot_errors,
-        ):
-          continue
-        result = checkpoint_step
-        break
-      elif _sleep_and_maybe_exit():
-        break
 
   result = multihost.broadcast_one_to_all(np.int32(result)).item()  # pyrefly: ignore[bad-argument-type]
   wait_duration = time.time() - start
@@ -244,6 +250,7 @@ def wait_for_new_checkpoint(
     snapshot_dir: Optional[epath.Path] = None,
     set_immutable: bool | None = None,
     ignore_snapshot_errors: bool | None = True,
+    watcher: Optional[step_watcher_lib.StepWatcher] = None,
 ):
   """Waits until a new checkpoint file is found.
 
@@ -274,6 +281,9 @@ def wait_for_new_checkpoint(
       immutable.
     ignore_snapshot_errors: If True, ignore errors when creating/releasing
       snapshots.
+    watcher: Optional `StepWatcher` of `checkpoint_dir`, used on process 0.
+      Reusing a watcher across calls avoids checking steps that were already
+      seen for finalization. If not provided, a new one is created.
 
   Yields:
     a new checkpoint step, or -1 if the timeout was reached.
@@ -293,6 +303,7 @@ def wait_for_new_checkpoint(
       snapshot_dir=snapshot_dir,
       set_immutable=set_immutable,
       ignore_snapshot_errors=ignore_snapshot_errors,
+      watcher=watcher,
   )
   try:
     yield step
@@ -410,6 +421,43 @@ def checkpoints_iterator(
           ),
       ):
         asyncio_utils.run_sync(snapshot_impl.release_snapshot())
+  watcher = None
+  if multihost.process_index() == 0:
+    watcher = step_watcher_lib.StepWatcher(
+        checkpoint_dir, poll_interval_secs=seconds_to_sleep
+    )
+  try:
+    yield from _checkpoints_iterator(
+        checkpoint_dir,
+        watcher=watcher,
+        min_interval_secs=min_interval_secs,
+        seconds_to_sleep=seconds_to_sleep,
+        timeout=timeout,
+        timeout_fn=timeout_fn,
+        step_name_format=step_name_format,
+        snapshot_dir=snapshot_dir,
+        set_immutable=set_immutable,
+        ignore_snapshot_errors=ignore_snapshot_errors,
+    )
+  finally:
+    if watcher is not None:
+      watcher.close()
+
+
+def _checkpoints_iterator(
+    checkpoint_dir: epath.Path,
+    *,
+    watcher: Optional[step_watcher_lib.StepWatcher],
+    min_interval_secs: int,
+    seconds_to_sleep: int,
+    timeout: Optional[int],
+    timeout_fn: Optional[Callable[[], bool]],
+    step_name_format: step_lib.NameFormat[step_lib.Metadata],
+    snapshot_dir: epath.Path,
+    set_immutable: bool | None,
+    ignore_snapshot_errors: bool | None,
+) -> Iterator[int]:
+  """See documentation for checkpoints_iterator."""
   checkpoint_step = None
   while True:
     until_step = checkpoint_step + 1 if checkpoint_step is not None else None
@@ -423,6 +471,7 @@ def checkpoints_iterator(
         snapshot_dir=snapshot_dir,
         set_immutable=set_immutable,
         ignore_snapshot_errors=ignore_snapshot_errors,
+        watcher=watcher,
     ) as new_checkpoint_step:
       if new_checkpoint_step == -1:
         if not timeout_fn:
@@ -148,10 +148,10 @@ class _P2PSubsystem:
       self._bkg_fetch_event.set()
 
   def _fetch_from_peers(self, step: int) -> bool:
-    """Finds the optimal peer and downloads the shard."""
+    """Finds the peers holding the shard and downloads it from them."""
     assert self._peer_selector is not None
-    peer_info = self._peer_selector.get_source_peer(step, self._process_index)
-    if not peer_info:
+    peers = self._peer_selector.get_source_peers(step, self._process_index)
+    if not peers:
       logging.warning(
           'Step %d found in P2P registry, but no source peer found for my'
           ' shard (%d).',
@@ -163,9 +163,7 @@ class _P2PSubsystem:
 
     # TODO(exlin): optimization to process when peer is localhost
 
-    return self._p2p_node.fetch_shard_from_peer(
-        peer_info.ip, peer_info.port, step, peer_info.process_index
-    )
+    return self._p2p_node.fetch_shard_from_peers(peers, step)
 
   def get_latest_complete_step(self) -> int | None:
     """Returns the latest step that is complete in the P2P network."""
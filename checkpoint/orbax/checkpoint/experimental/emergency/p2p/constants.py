@@ -20,11 +20,35 @@ STATE_SUBDIR = 'state'
 DATA_ITER_KEY = 'data_iter'
 PROCESS_SUBDIR_PREFIX = 'ocdbt.process_'
 PYGRAIN_STATES_FILENAME = 'pygrain_states.json'
+CHECKSUMS_FILENAME = '_P2P_CHECKSUMS'
 
 # Tuning for high-throughput networks (16MB buffers)
 SOCKET_BUFFER_SIZE = 16 * 1024 * 1024
 CHUNK_SIZE = 4 * 1024 * 1024
 
+# Connections: clients keep up to CONNECTIONS_PER_PEER persistent connections
+# to every peer, each carrying several concurrent requests. Servers handle
+# requests with SERVER_WORKERS threads, and close connections idle for
+# IDLE_TIMEOUT_SECONDS.
+CONNECTIONS_PER_PEER = 2
+SERVER_WORKERS = 16
+IDLE_TIMEOUT_SECONDS = 300
+
+# Striped downloads: files are split into ranges of RANGE_SIZE bytes, with up
+# to REQUESTS_PER_PEER ranges in flight to every source peer. A range is
+# attempted at most MAX_RANGE_ATTEMPTS times, preferring peers on which it has
+# not failed yet.
+RANGE_SIZE = 64 * 1024 * 1024
+REQUESTS_PER_PEER = 8
+MAX_RANGE_ATTEMPTS = 3
+
+# Integrity: the CRC32 checksums of the consecutive blocks of
+# CHECKSUM_BLOCK_SIZE bytes of every saved file are recorded in a
+# CHECKSUMS_FILENAME sidecar when the local checkpoint is finalized. Manifests
+# carry them, and they are verified while the blocks are received. RANGE_SIZE
+# must be a multiple of CHECKSUM_BLOCK_SIZE.
+CHECKSUM_BLOCK_SIZE = 4 * 1024 * 1024
+
 # Timeouts
 CONNECT_TIMEOUT_SECONDS = 5
 TRANSFER_TIMEOUT_SECONDS = 60
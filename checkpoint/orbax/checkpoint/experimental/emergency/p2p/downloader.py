@@ -0,0 +1,325 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Downloads files striped across several peers.
+
+Files are split into byte ranges, which are put in a shared queue. Every source
+peer is served by a few worker threads, which take ranges from the queue and
+download them over the pooled connections to the peer. Faster peers thus
+naturally serve more ranges. A range that fails is put back in the queue, and
+is preferably retried on a peer on which it has not failed yet.
+
+When the checksums of a file are known, its ranges are aligned on checksum
+blocks, which are verified as they are received. A range served with corrupted
+content thus fails like a truncated one, without reading the file back.
+"""
+
+import collections
+import dataclasses
+import os
+import threading
+import time
+from typing import BinaryIO, NamedTuple, Sequence
+import zlib
+
+from absl import logging
+from etils import epath
+from orbax.checkpoint.experimental.emergency.p2p import constants
+from orbax.checkpoint.experimental.emergency.p2p import protocol
+
+
+Peer = tuple[str, int]
+
+
+class FileToDownload(NamedTuple):
+  """A file to download, and where to write it."""
+
+  rel_path: str
+  size: int
+  dest_path: epath.Path
+  # CRC32 checksums of the consecutive checksum blocks of the file, if known.
+  checksums: Sequence[int] | None = None
+
+
+@dataclasses.dataclass
+class _Range:
+  file: FileToDownload
+  offset: int
+  length: int
+  failed_peers: set[Peer] = dataclasses.field(default_factory=set)
+  attempts: int = 0
+
+
+def _split(
+    file: FileToDownload, range_size: int, checksum_block_size: int
+) -> list[_Range]:
+  if file.checksums is not None:
+    # Ranges are aligned on checksum blocks, so that they can be verified.
+    range_size = max(
+        checksum_block_size,
+        range_size // checksum_block_size * checksum_block_size,
+    )
+  return [
+      _Range(file, offset, min(range_size, file.size - offset))
+      for offset in range(0, file.size, range_size)
+  ]
+
+
+class _VerifyingWriter:
+  """Writes a range to a file, checksumming its blocks on the fly."""
+
+  def __init__(self, f: BinaryIO, r: _Range, block_size: int):
+    self._f = f
+    self._block_size = block_size
+    self._block_index = r.offset // block_size
+    self._checksums = r.file.checksums
+    self._block_pos = 0
+    self._crc = 0
+    self.mismatched_blocks: list[int] = []
+
+  def write(self, data) -> int:
+    written = self._f.write(data)
+    view = memoryview(data)
+    while view:
+      nbytes = min(len(view), self._block_size - self._block_pos)
+      self._crc = zlib.crc32(view[:nbytes], self._crc)
+      self._block_pos += nbytes
+      view = view[nbytes:]
+      if self._block_pos == self._block_size:
+        self._end_block()
+    return written
+
+  def _end_block(self):
+    if self._crc != self._checksums[self._block_index]:
+      self.mismatched_blocks.append(self._block_index)
+    self._block_index += 1
+    self._block_pos = 0
+    self._crc = 0
+
+  def verify(self) -> bool:
+    """Returns whether all blocks written match their checksums."""
+    # Only the last block of a file can be partial.
+    if self._block_pos:
+      self._end_block()
+    return not self.mismatched_blocks
+
+
+class StripedDownloader:
+  """Downloads files from several peers serving identical copies of them."""
+
+  def __init__(
+      self,
+      peers: Sequence[Peer],
+      *,
+      range_size: int = constants.RANGE_SIZE,
+      requests_per_peer: int = constants.REQUESTS_PER_PEER,
+      max_range_attempts: int = constants.MAX_RANGE_ATTEMPTS,
+      checksum_block_size: int = constants.CHECKSUM_BLOCK_SIZE,
+  ):
+    """Initializes StripedDownloader.
+
+    Args:
+      peers: The (ip, port) of the peers to download from. All of them must
+        serve the same files.
+      range_size: Maximum size of the byte ranges files are split into.
+      requests_per_peer: Number of concurrent range requests to each peer.
+      max_range_attempts: Maximum number of attempts to download a range, over
+        all peers.
+      checksum_block_size: Size of the blocks the checksums of files are
+        computed over.
+    """
+    if not peers:
+      raise ValueError('At least one peer is required.')
+    if (
+        range_size <= 0
+        or requests_per_peer <= 0
+        or max_range_attempts <= 0
+        or checksum_block_size <= 0
+    ):
+      raise ValueError(
+          'range_size, requests_per_peer, max_range_attempts and'
+          ' checksum_block_size must be positive.'
+      )
+    self._peers = list(dict.fromkeys(peers))
+    self._range_size = range_size
+    self._requests_per_peer = requests_per_peer
+    self._max_range_attempts = max_range_attempts
+    self._checksum_block_size = checksum_block_size
+
+    self._cv = threading.Condition()
+    self._pending: collections.deque[_Range] = collections.deque()
+    self._in_flight = 0
+    self._failed = False
+    self._live_peers: set[Peer] = set()
+    self._bytes_per_peer: dict[Peer, int] = {}
+
+  def _next_range(self, peer: Peer) -> _Range | None:
+    """Returns the next range for `peer` to download, or None when done."""
+    with self._cv:
+      while True:
+        if self._failed or peer not in self._live_peers:
+          return None
+        if not self._pending and not self._in_flight:
+          return None
+        # Prefers ranges that have not failed on this peer. A range that failed
+        # on every live peer is retried anyway, until it runs out of attempts.
+        fallback = None
+        for i, r in enumerate(self._pending):
+          if peer not in r.failed_peers:
+            del self._pending[i]
+            self._in_flight += 1
+            return r
+          if fallback is None and self._live_peers <= r.failed_peers:
+            fallback = i
+        if fallback is not None:
+          r = self._pending[fallback]
+          del self._pending[fallback]
+          self._in_flight += 1
+          return r
+        self._cv.wait()
+
+  def _finish_range(self, peer: Peer, r: _Range, ok: bool):
+    with self._cv:
+      self._in_flight -= 1
+      if ok:
+        self._bytes_per_peer[peer] += r.length
+      else:
+        r.attempts += 1
+        r.failed_peers.add(peer)
+        if r.attempts >= self._max_range_attempts:
+          logging.error(
+              'Giving up on range [%d, %d) of %s after %d attempts.',
+              r.offset,
+              r.offset + r.length,
+              r.file.rel_path,
+              r.attempts,
+          )
+          self._failed = True
+        else:
+          self._pending.appendleft(r)
+      self._cv.notify_all()
+
+  def _remove_peer(self, peer: Peer):
+    with self._cv:
+      if peer in self._live_peers:
+        logging.warning('Not downloading from peer %s:%d anymore.', *peer)
+        self._live_peers.discard(peer)
+        if not self._live_peers:
+          self._failed = True
+      self._cv.notify_all()
+
+  def _worker(self, peer: Peer):
+    """Downloads ranges from `peer`, one at a time."""
+    consecutive_failures = 0
+    while (r := self._next_range(peer)) is not None:
+      ok = False
+      try:
+        # epath does not support updating files in place, so the builtin open
+        # is used for local destination files.
+        with open(os.fspath(r.file.dest_path), 'r+b') as f:
+          f.seek(r.offset)
+          writer = f
+          if r.file.checksums is not None:
+            writer = _VerifyingWriter(f, r, self._checksum_block_size)
+          ok = (
+              protocol.TCPClient.download_range(
+                  *peer, r.file.rel_path, r.offset, r.length, writer
+              )
+              == r.length
+          )
+          if ok and isinstance(writer, _VerifyingWriter):
+            ok = writer.verify()
+            if not ok:
+              logging.error(
+                  'Peer %s:%d served corrupted blocks %s of %s.',
+                  *peer,
+                  writer.mismatched_blocks,
+                  r.file.rel_path,
+              )
+      except OSError as e:
+        logging.error('Failed to write %s: %s', r.file.dest_path, e)
+      except Exception:  # pylint: disable=broad-exception-caught
+        logging.exception(
+            'Failed to download range [%d, %d) of %s from peer %s:%d.',
+            r.offset,
+            r.offset + r.length,
+            r.file.rel_path,
+            *peer,
+        )
+      finally:
+        # Always accounted for, so that other workers do not wait forever.
+        self._finish_range(peer, r, ok)
+      consecutive_failures = 0 if ok else consecutive_failures + 1
+      if consecutive_failures >= self._max_range_attempts:
+        self._remove_peer(peer)
+
+  def download(self, files: Sequence[FileToDownload]) -> bool:
+    """Downloads `files`.
+
+    Destination files are created with their final size, and filled in place.
+
+    Args:
+      files: The files to download.
+
+    Returns:
+      True if all files were downloaded, False otherwise.
+
+    Raises:
+      ValueError: If the number of checksums of a file does not match its size.
+    """
+    for file in files:
+      num_blocks = -(-file.size // self._checksum_block_size)
+      if file.checksums is not None and len(file.checksums) != num_blocks:
+        raise ValueError(
+            f'{file.rel_path} of size {file.size} has'
+            f' {len(file.checksums)} checksums, expected {num_blocks}.'
+        )
+    for file in files:
+      file.dest_path.parent.mkdir(parents=True, exist_ok=True)
+      with file.dest_path.open('wb') as f:
+        f.truncate(file.size)
+
+    with self._cv:
+      self._pending = collections.deque(
+          r
+          for file in files
+          for r in _split(file, self._range_size, self._checksum_block_size)
+      )
+      self._in_flight = 0
+      self._failed = False
+      self._live_peers = set(self._peers)
+      self._bytes_per_peer = {peer: 0 for peer in self._peers}
+      num_ranges = len(self._pending)
+
+    start_time = time.time()
+    threads = [
+        threading.Thread(target=self._worker, args=(peer,), daemon=True)
+        for peer in self._peers
+        for _ in range(min(self._requests_per_peer, num_ranges))
+    ]
+    for t in threads:
+      t.start()
+    for t in threads:
+      t.join()
+
+    duration = time.time() - start_time
+    for peer, num_bytes in self._bytes_per_peer.items():
+      logging.info(
+          'Downloaded %.2f MB from peer %s:%d in %.2fs.',
+          num_bytes / 1024 / 1024,
+          *peer,
+          duration,
+      )
+    with self._cv:
+      return not self._failed and not self._pending and not self._in_flight
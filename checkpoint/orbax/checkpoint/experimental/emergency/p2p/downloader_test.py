@@ -0,0 +1,203 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest import mock
+import zlib
+
+from absl.testing import absltest
+from etils import epath
+from orbax.checkpoint.experimental.emergency.p2p import constants
+from orbax.checkpoint.experimental.emergency.p2p import downloader
+from orbax.checkpoint.experimental.emergency.p2p import protocol
+from orbax.checkpoint.experimental.emergency.p2p import service
+
+
+_FILES = {
+    '1/small': b'0123',
+    '1/empty': b'',
+    '1/subdir/large': os.urandom(1000),
+}
+
+
+class StripedDownloaderTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.enter_context(
+        mock.patch.object(service.multihost, 'process_index', return_value=0)
+    )
+    self.enter_context(
+        mock.patch.object(
+            service,
+            '_get_primary_ip',
+            return_value=(service.socket.AF_INET, '127.0.0.1'),
+        )
+    )
+    self.dest_dir = epath.Path(self.create_tempdir().full_path)
+
+  def _start_peer(self, files: dict[str, bytes]) -> tuple[str, int]:
+    directory = epath.Path(self.create_tempdir().full_path)
+    for rel_path, content in files.items():
+      (directory / rel_path).parent.mkdir(parents=True, exist_ok=True)
+      (directory / rel_path).write_bytes(content)
+    node = service.P2PNode(directory)
+    node.start()
+    self.addCleanup(node.stop)
+    return ('127.0.0.1', node.port)
+
+  def _files_to_download(
+      self, checksum_block_size: int | None = None
+  ) -> list[downloader.FileToDownload]:
+    files = []
+    for rel_path, content in _FILES.items():
+      checksums = None
+      if checksum_block_size is not None:
+        checksums = [
+            zlib.crc32(content[i : i + checksum_block_size])
+            for i in range(0, len(content), checksum_block_size)
+        ]
+      files.append(
+          downloader.FileToDownload(
+              rel_path, len(content), self.dest_dir / rel_path, checksums
+          )
+      )
+    return files
+
+  def _assert_downloaded(self):
+    for rel_path, content in _FILES.items():
+      self.assertEqual((self.dest_dir / rel_path).read_bytes(), content)
+
+  def test_download_single_peer(self):
+    peer = self._start_peer(_FILES)
+    self.assertTrue(
+        downloader.StripedDownloader([peer], range_size=64).download(
+            self._files_to_download()
+        )
+    )
+    self._assert_downloaded()
+
+  def test_download_multiple_peers(self):
+    peers = [self._start_peer(_FILES) for _ in range(3)]
+    num_connections = protocol.TCPClient.num_connections_opened()
+    self.assertTrue(
+        downloader.StripedDownloader(
+            peers, range_size=16, requests_per_peer=4
+        ).download(self._files_to_download())
+    )
+    self._assert_downloaded()
+    # Requests are multiplexed over a few pooled connections.
+    self.assertLessEqual(
+        protocol.TCPClient.num_connections_opened() - num_connections,
+        len(peers) * constants.CONNECTIONS_PER_PEER,
+    )
+
+  def test_download_with_interleaved_chunks(self):
+    # Concurrent ranges on the same connection are sent in many interleaved
+    # chunks.
+    self.enter_context(mock.patch.object(constants, 'CHUNK_SIZE', 16))
+    peer = self._start_peer(_FILES)
+    self.assertTrue(
+        downloader.StripedDownloader(
+            [peer], range_size=256, requests_per_peer=8, checksum_block_size=64
+        ).download(self._files_to_download(checksum_block_size=64))
+    )
+    self._assert_downloaded()
+
+  def test_failed_ranges_are_retried_on_other_peers(self):
+    # The first peer is missing the large file, and the second one has a
+    # truncated copy of it.
+    peers = [
+        self._start_peer({'1/small': _FILES['1/small']}),
+        self._start_peer(_FILES | {'1/subdir/large': b'truncated'}),
+        self._start_peer(_FILES),
+    ]
+    self.assertTrue(
+        downloader.StripedDownloader(peers, range_size=64).download(
+            self._files_to_download()
+        )
+    )
+    self._assert_downloaded()
+
+  def test_corrupted_ranges_are_retried_on_other_peers(self):
+    large = bytearray(_FILES['1/subdir/large'])
+    large[500] ^= 0xFF
+    peers = [
+        self._start_peer(_FILES | {'1/subdir/large': bytes(large)}),
+        self._start_peer(_FILES),
+    ]
+    self.assertTrue(
+        downloader.StripedDownloader(
+            peers, range_size=100, checksum_block_size=32
+        ).download(self._files_to_download(checksum_block_size=32))
+    )
+    self._assert_downloaded()
+
+  def test_unexpected_errors_do_not_stall_other_workers(self):
+    peers = [self._start_peer(_FILES), self._start_peer(_FILES)]
+    download_range = protocol.TCPClient.download_range
+    calls = []
+
+    def _flaky_download_range(*args, **kwargs):
+      calls.append(args)
+      if len(calls) == 1:
+        raise RuntimeError('unexpected')
+      return download_range(*args, **kwargs)
+
+    with mock.patch.object(
+        protocol.TCPClient, 'download_range', side_effect=_flaky_download_range
+    ):
+      self.assertTrue(
+          downloader.StripedDownloader(peers, range_size=64).download(
+              self._files_to_download()
+          )
+      )
+    self._assert_downloaded()
+
+  def test_download_fails_with_corrupted_peer(self):
+    large = bytearray(_FILES['1/subdir/large'])
+    large[-1] ^= 0xFF
+    peer = self._start_peer(_FILES | {'1/subdir/large': bytes(large)})
+    self.assertFalse(
+        downloader.StripedDownloader(
+            [peer], range_size=64, checksum_block_size=64
+        ).download(self._files_to_download(checksum_block_size=64))
+    )
+
+  def test_download_fails_without_valid_peer(self):
+    peer = self._start_peer({'1/small': _FILES['1/small']})
+    self.assertFalse(
+        downloader.StripedDownloader([peer], range_size=64).download(
+            self._files_to_download()
+        )
+    )
+
+  def test_invalid_checksums(self):
+    files = [
+        downloader.FileToDownload(
+            '1/small', 4, self.dest_dir / '1/small', [1, 2]
+        )
+    ]
+    with self.assertRaises(ValueError):
+      downloader.StripedDownloader(
+          [('127.0.0.1', 0)], checksum_block_size=64
+      ).download(files)
+
+  def test_no_peers(self):
+    with self.assertRaises(ValueError):
+      downloader.StripedDownloader([])
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -110,6 +110,41 @@ if utils.pygrain() is not None:
     item: Any
 
 
+class _LocalPyTreeCheckpointHandler(ocp.PyTreeCheckpointHandler):
+  """Records the block checksums of the saved files when finalizing.
+
+  Peers serve the recorded checksums with the files, so that a file corrupted
+  after it was saved fails verification when it is downloaded.
+  """
+
+  def finalize(self, directory: epath.Path) -> None:
+    super().finalize(directory)
+    utils.write_checksums(directory)
+
+
+@ocp.args.register_with_handler(_LocalPyTreeCheckpointHandler, for_save=True)
+@dataclasses.dataclass
+class LocalPyTreeSave(args_lib.PyTreeSave):
+  pass
+
+
+@ocp.args.register_with_handler(
+    _LocalPyTreeCheckpointHandler, for_restore=True
+)
+@dataclasses.dataclass
+class LocalPyTreeRestore(args_lib.PyTreeRestore):
+  pass
+
+
+def _as_local_args(args: Any, local_args_cls: type[Any]) -> Any:
+  """Converts PyTree args to the args registered with the local handler."""
+  return local_args_cls(**{
+      field.name: getattr(args, field.name)
+      for field in dataclasses.fields(args)
+      if field.init
+  })
+
+
 def _prepare_state_restore_args(
     state: args_lib.PyTreeRestore,
 ) -> args_lib.PyTreeRestore:
@@ -179,7 +214,7 @@ class LocalCheckpointManager:
         ),
     ))
 
-    handler = ocp.PyTreeCheckpointHandler(
+    handler = _LocalPyTreeCheckpointHandler(
         use_ocdbt=True,
         use_zarr3=True,
         multiprocessing_options=mp_options,
@@ -244,13 +279,14 @@ class LocalCheckpointManager:
       custom_metadata: dict[str, Any] | None = None,
   ) -> bool:
     """Saves the checkpoint."""
+    args_dict = dict(args.items())
+    args_dict['state'] = _as_local_args(args.state, LocalPyTreeSave)
     if utils.pygrain() is not None and constants.DATA_ITER_KEY in args:
       original_save = args[constants.DATA_ITER_KEY]
-      args_dict = dict(args.items())
       args_dict[constants.DATA_ITER_KEY] = LocalPyGrainSave(
           item=original_save.item
       )
-      args = args_lib.Composite(**args_dict)  # pyrefly: ignore[bad-assignment]
+    args = args_lib.Composite(**args_dict)  # pyrefly: ignore[bad-assignment]
 
     return self._manager.save(
         step, args=args, force=force, custom_metadata=custom_metadata
@@ -282,7 +318,9 @@ class LocalCheckpointManager:
         raise ValueError(error_msg)
 
     args_dict = dict(args.items())
-    args_dict['state'] = _prepare_state_restore_args(args.state)
+    args_dict['state'] = _as_local_args(
+        _prepare_state_restore_args(args.state), LocalPyTreeRestore
+    )
 
     if utils.pygrain() is not None and args and constants.DATA_ITER_KEY in args:
       original_restore = args[constants.DATA_ITER_KEY]
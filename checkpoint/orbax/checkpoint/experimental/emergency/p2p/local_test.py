@@ -21,8 +21,10 @@ import numpy as np
 from orbax.checkpoint import args as args_lib
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint.experimental.emergency.p2p import args as p2p_args_lib
+from orbax.checkpoint.experimental.emergency.p2p import constants
 from orbax.checkpoint.experimental.emergency.p2p import local
 from orbax.checkpoint.experimental.emergency.p2p import options as options_lib
+from orbax.checkpoint.experimental.emergency.p2p import utils
 
 Mesh = jax.sharding.Mesh
 P = jax.sharding.PartitionSpec
@@ -104,6 +106,13 @@ class LocalCheckpointManagerTest(absltest.TestCase):
     )
     manager.wait_until_finished()
 
+    # The block checksums of the saved files are recorded with the step.
+    state_dir = self.directory / '1' / constants.STATE_SUBDIR
+    checksums = utils.read_checksums(state_dir)
+    self.assertNotEmpty(checksums)
+    for rel_path, (size, _) in checksums.items():
+      self.assertEqual((state_dir / rel_path).stat().length, size)
+
     abstract_state = jax.tree.map(
         lambda x: jax.ShapeDtypeStruct(x.shape, x.dtype, sharding=x.sharding),
         state,
@@ -115,22 +115,31 @@ class PeerSelector:
     """Returns all steps known to the registry."""
     return list(self._registry.iter_steps())
 
-  def get_source_peer(
+  def get_source_peers(
       self, step: int, target_process_index: int
-  ) -> protocol.PeerDiscoveryInfo | None:
-    """Finds a peer holding the data, preferring Local Replica > Deterministic LB."""
+  ) -> list[protocol.PeerDiscoveryInfo]:
+    """Returns all peers holding the data, best first.
+
+    The first peer is the one returned by `get_source_peer`. The other peers
+    hold the same logical shard, and can serve as additional sources.
+
+    Args:
+      step: The checkpoint step.
+      target_process_index: The process index whose shard is requested.
+    """
     if not self._registry.has_step(step):
-      return None
+      return []
 
+    peers = []
     # 1. Try Direct Match (Fastest/Simplest)
     direct_peer = self._registry.get_peer(step, target_process_index)
     if direct_peer:
-      return direct_peer
+      peers.append(direct_peer)
 
     # 2. Topology Match (Find a different process holding the same data)
     target_meta = self._process_map.get(target_process_index)
     if not target_meta:
-      return None
+      return peers
 
     target_relative_id = target_meta["relative"]
     target_replica = target_meta["replica"]
@@ -149,7 +158,7 @@ class PeerSelector:
         candidates.append(peer)
 
     if not candidates:
-      return None
+      return peers
 
     # Deterministic Selection for Load Balancing
     # Sort by replica_id to ensure every node sees the same list order
@@ -157,7 +166,17 @@ class PeerSelector:
 
     # Consumer from Replica N prefers Provider from Replica N (or N mod M)
     idx = target_replica % len(candidates)
-    return candidates[idx]
+    for peer in candidates[idx:] + candidates[:idx]:
+      if peer.process_index != target_process_index:
+        peers.append(peer)
+    return peers
+
+  def get_source_peer(
+      self, step: int, target_process_index: int
+  ) -> protocol.PeerDiscoveryInfo | None:
+    """Finds a peer holding the data, preferring Local Replica > Deterministic LB."""
+    peers = self.get_source_peers(step, target_process_index)
+    return peers[0] if peers else None
 
   def visualize_topology(self, step: int) -> str:
     """Renders a clean, tabular visualization of the P2P mesh state."""
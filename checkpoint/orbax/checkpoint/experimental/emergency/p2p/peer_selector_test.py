@@ -262,6 +262,30 @@ class PeerSelectorTest(parameterized.TestCase):
     # p1(Rep0,Rel1) needs step 1 data. No one has it.
     self.assertIsNone(selector.get_source_peer(1, 1))
 
+  def test_get_source_peers(self):
+    mesh = get_mock_mesh(replicas=3, processes_per_replica=2)
+    metadata = [
+        {'process_index': 0, 'steps': [1], 'ip': 'ip0', 'port': 1234},
+        {'process_index': 2, 'steps': [1], 'ip': 'ip2', 'port': 1234},
+        {'process_index': 3, 'steps': [1], 'ip': 'ip3', 'port': 1234},
+        {'process_index': 4, 'steps': [1], 'ip': 'ip4', 'port': 1234},
+    ]
+    selector = peer_selector.PeerSelector(
+        mesh, replica_axis_index=0, raw_metadata_list=metadata
+    )
+    # Direct match first, then the other Rel0 holders.
+    self.assertEqual(
+        [p.process_index for p in selector.get_source_peers(1, 0)], [0, 2, 4]
+    )
+    # p2(Rep1,Rel0): direct match, then candidates starting at 1 % 3.
+    self.assertEqual(
+        [p.process_index for p in selector.get_source_peers(1, 2)], [2, 4, 0]
+    )
+    self.assertEqual(
+        [p.process_index for p in selector.get_source_peers(1, 1)], [3]
+    )
+    self.assertEqual(selector.get_source_peers(2, 0), [])
+
   def test_get_source_peer_load_balancing(self):
     # 3 replicas, 2 processes per replica.
     # p0(Rep0,Rel0), p1(Rep0,Rel1), p2(Rep1,Rel0), p3(Rep1,Rel1),
@@ -14,18 +14,25 @@
 
 """Defines the internal wire protocol for P2P checkpoint transfer."""
 
+import collections
+import concurrent.futures
 import dataclasses
 import json
 import socket
 import struct
+import threading
 import typing
-from typing import Any, Final
+from typing import Any, BinaryIO, Final
+import weakref
 from absl import logging
 from etils import epath
 from orbax.checkpoint.experimental.emergency.p2p import constants
+from typing_extensions import NotRequired
 from typing_extensions import Self
 
-_HEADER_STRUCT = struct.Struct('!B I')
+# Opcode, request ID, payload length. Responses carry the ID of their request,
+# so that several requests can be in flight on the same connection.
+_HEADER_STRUCT = struct.Struct('!B I I')
 _HEADER_SIZE = _HEADER_STRUCT.size  # pylint: disable=invalid-name
 
 OP_ERROR: Final = 0
@@ -33,6 +40,25 @@ OP_GET_MANIFEST: Final = 1
 OP_DOWNLOAD_FILE: Final = 2
 OP_RESPONSE_JSON: Final = 3
 OP_FILE_STREAM: Final = 4
+OP_DOWNLOAD_RANGE: Final = 5
+# A chunk of the content of a file stream, of at most `constants.CHUNK_SIZE`
+# bytes. Chunks of concurrent file streams are interleaved on a connection.
+OP_FILE_CHUNK: Final = 6
+
+# Serializes messages and file chunks sent on the same socket by concurrent
+# threads.
+_send_locks: weakref.WeakKeyDictionary[socket.socket, threading.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+_send_locks_lock = threading.Lock()
+
+
+def _send_lock(sock: socket.socket) -> threading.Lock:
+  with _send_locks_lock:
+    lock = _send_locks.get(sock)
+    if lock is None:
+      lock = _send_locks[sock] = threading.Lock()
+    return lock
 
 
 @dataclasses.dataclass(frozen=True)
@@ -66,6 +92,9 @@ class ManifestEntry(typing.TypedDict):
 
   rel_path: str
   size: int
+  # CRC32 checksums of the consecutive blocks of the file, of
+  # `constants.CHECKSUM_BLOCK_SIZE` bytes.
+  checksums: NotRequired[list[int]]
 
 
 Manifest = list[ManifestEntry]
@@ -88,57 +117,104 @@ class TCPMessage:
   """Framing utility."""
 
   @staticmethod
-  def send_json(sock: socket.socket, opcode: int, data: Any = None) -> None:
+  def send_json(
+      sock: socket.socket,
+      opcode: int,
+      data: Any = None,
+      request_id: int = 0,
+  ) -> None:
     """Sends a JSON-serialized message over the socket.
 
     Args:
       sock: The socket to send the message over.
       opcode: The message opcode.
       data: The JSON-serializable data to send.
+      request_id: The ID of the request, or of the request being responded to.
     """
     payload = json.dumps(data).encode('utf-8') if data else b''
-    header = _HEADER_STRUCT.pack(opcode, len(payload))
-    sock.sendall(header + payload)
+    header = _HEADER_STRUCT.pack(opcode, request_id, len(payload))
+    with _send_lock(sock):
+      sock.sendall(header + payload)
 
   @staticmethod
-  def send_file(sock: socket.socket, filepath: epath.Path) -> None:
-    """Sends a file over the socket.
-
-    If the file exists, it sends an OP_FILE_STREAM message with the file size,
-    followed by the file content. If the file does not exist, it sends
+  def send_file(
+      sock: socket.socket,
+      filepath: epath.Path,
+      offset: int = 0,
+      length: int | None = None,
+      request_id: int = 0,
+  ) -> None:
+    """Sends a file, or a byte range of a file, over the socket.
+
+    If the file exists, it sends an OP_FILE_STREAM message with the number of
+    bytes to be sent, followed by OP_FILE_CHUNK messages carrying the bytes. If
+    the file does not exist or the range exceeds the file, it sends
     OP_FILE_STREAM with size 0.
 
+    The socket is only locked while sending a single message or chunk, so that
+    the chunks of files sent concurrently on the same socket are interleaved.
+
     Args:
       sock: The socket to send the file over.
       filepath: The path to the file to send.
+      offset: The offset of the first byte to send.
+      length: The number of bytes to send, or None to send until the end of the
+        file.
+      request_id: The ID of the request being responded to.
     """
+    header = _HEADER_STRUCT.pack(OP_FILE_STREAM, request_id, 8)
     try:
       filesize = filepath.stat().length
     except OSError as e:
       logging.error('Failed to stat file %s, sending size 0: %s', filepath, e)
-      header = _HEADER_STRUCT.pack(OP_FILE_STREAM, 8)
-      sock.sendall(header + struct.pack('!Q', 0))
+      filesize = None
+    if length is None and filesize is not None:
+      length = filesize - offset
+    if (
+        filesize is None
+        or offset < 0
+        or length is None
+        or length < 0
+        or offset + length > filesize
+    ):
+      if filesize is not None:
+        logging.error(
+            'Invalid range [%d, %d + %s) of file %s of size %d, sending size 0.',
+            offset,
+            offset,
+            length,
+            filepath,
+            filesize,
+        )
+      with _send_lock(sock):
+        sock.sendall(header + struct.pack('!Q', 0))
       return
 
-    header = _HEADER_STRUCT.pack(OP_FILE_STREAM, 8)
-    size_payload = struct.pack('!Q', filesize)
-    sock.sendall(header + size_payload)
-
     with filepath.open('rb') as f:
+      with _send_lock(sock):
+        sock.sendall(header + struct.pack('!Q', length))
+      sent = 0
       try:
-        sock.sendfile(f)
-      except (BrokenPipeError, ConnectionResetError) as e:
+        while sent < length:
+          n = min(constants.CHUNK_SIZE, length - sent)
+          with _send_lock(sock):
+            sock.sendall(_HEADER_STRUCT.pack(OP_FILE_CHUNK, request_id, n))
+            if sock.sendfile(f, offset + sent, n) != n:
+              # The peer expects `n` bytes, which can no longer be sent
+              # without corrupting the stream.
+              sock.shutdown(socket.SHUT_RDWR)
+              raise ConnectionError(f'File {filepath} was truncated.')
+          sent += n
+      except ConnectionError as e:
         logging.error(
             'Connection closed while sending file %s: %s', filepath, e
         )
 
   @staticmethod
   def recv(sock: socket.socket) -> tuple[int, Any]:
-    """Receives a message from the socket.
+    """Receives a message from the socket, ignoring its request ID.
 
-    Reads the message header to determine the opcode and payload length.
-    If opcode is OP_FILE_STREAM, it reads and returns the file size.
-    Otherwise, it reads the JSON payload and returns it.
+    See `recv_message`.
 
     Args:
       sock: The socket to receive message from.
@@ -147,30 +223,54 @@ class TCPMessage:
       A tuple of (opcode, data). If an error occurs, (OP_ERROR, None) is
       returned.
     """
+    opcode, _, data = TCPMessage.recv_message(sock)
+    return opcode, data
+
+  @staticmethod
+  def recv_message(
+      sock: socket.socket, *, eof_ok: bool = False
+  ) -> tuple[int, int, Any] | None:
+    """Receives a message from the socket.
+
+    Reads the message header to determine the opcode, request ID and payload
+    length. If opcode is OP_FILE_STREAM, it reads and returns the file size. If
+    opcode is OP_FILE_CHUNK, it returns the length of the chunk, whose content
+    is left on the socket. Otherwise, it reads the JSON payload and returns it.
+
+    Args:
+      sock: The socket to receive message from.
+      eof_ok: If True, returns None without logging an error if the peer closed
+        the connection before sending a new message.
+
+    Returns:
+      A tuple of (opcode, request_id, data). If an error occurs,
+      (OP_ERROR, 0, None) is returned.
+    """
     try:
       peer = str(sock.getpeername())
     except OSError:
       peer = 'unknown'
-    header_data = TCPMessage._recv_exact(sock, _HEADER_SIZE)
-    if not header_data:
+    first_byte = sock.recv(1)
+    if not first_byte and eof_ok:
+      return None
+    rest = TCPMessage._recv_exact(sock, _HEADER_SIZE - 1) if first_byte else None
+    if rest is None:
       logging.error('Failed to receive header from peer=%s', peer)
-      return OP_ERROR, None
-    try:
-      opcode, length = _HEADER_STRUCT.unpack(header_data)
-    except struct.error as e:
-      logging.error('Failed to unpack header from peer=%s: %s', peer, e)
-      return OP_ERROR, None
+      return OP_ERROR, 0, None
+    opcode, request_id, length = _HEADER_STRUCT.unpack(first_byte + rest)
 
     if opcode == OP_FILE_STREAM:
       size_data = TCPMessage._recv_exact(sock, 8)
       if not size_data:
         logging.error('Failed to receive filesize from peer=%s', peer)
-        return OP_ERROR, None
-      try:
-        return opcode, struct.unpack('!Q', size_data)[0]
-      except struct.error as e:
-        logging.error('Failed to unpack filesize from peer=%s: %s', peer, e)
-        return OP_ERROR, None
+        return OP_ERROR, 0, None
+      return opcode, request_id, struct.unpack('!Q', size_data)[0]
+
+    if opcode == OP_FILE_CHUNK:
+      return opcode, request_id, length
+
+    if length == 0:
+      return opcode, request_id, None
 
     payload_data = TCPMessage._recv_exact(sock, length)
     if not payload_data:
@@ -180,13 +280,10 @@ class TCPMessage:
           peer,
           opcode,
       )
-      return OP_ERROR, None
-
-    if length == 0:
-      return opcode, None
+      return OP_ERROR, 0, None
 
     try:
-      return opcode, json.loads(payload_data.decode('utf-8'))
+      return opcode, request_id, json.loads(payload_data.decode('utf-8'))
     except json.JSONDecodeError as e:
       logging.error(
           'Failed to decode JSON payload from peer=%s for opcode=%d: %s',
@@ -194,7 +291,32 @@ class TCPMessage:
           opcode,
           e,
       )
-      return OP_ERROR, None
+      return OP_ERROR, 0, None
+
+  @staticmethod
+  def recv_to_file(sock: socket.socket, f: BinaryIO, size: int) -> int:
+    """Receives `size` bytes from the socket and writes them to `f`.
+
+    Args:
+      sock: The socket to receive from.
+      f: The file to write to, at its current position.
+      size: The number of bytes to receive.
+
+    Returns:
+      The number of bytes received, which is less than `size` if the connection
+      was closed prematurely.
+    """
+    received = 0
+    buf = bytearray(max(1, min(constants.CHUNK_SIZE, size)))
+    view = memoryview(buf)
+    while received < size:
+      to_read = min(len(buf), size - received)
+      nbytes = sock.recv_into(view[:to_read])
+      if nbytes == 0:
+        break
+      f.write(view[:nbytes])
+      received += nbytes
+    return received
 
   @staticmethod
   def _recv_exact(sock: socket.socket, n: int) -> bytes | None:
@@ -219,8 +341,252 @@ class TCPMessage:
     return bytes(data)
 
 
+class Connection:
+  """A persistent connection to a peer, multiplexing concurrent requests.
+
+  Requests can be sent from any thread. Each request gets an ID, and a reader
+  thread routes responses to their requests by ID; file content is written by
+  the reader thread directly to the file of the request, chunk by chunk, as
+  the chunks of concurrent downloads are interleaved.
+
+  The connection is closed when the peer closes it, or when a response is not
+  received within `constants.TRANSFER_TIMEOUT_SECONDS`; all pending requests
+  then fail with `ConnectionError`.
+  """
+
+  def __init__(self, host: str, port: int):
+    self.host = host
+    self.port = port
+    self._sock = socket.create_connection(
+        (host, port), timeout=constants.CONNECT_TIMEOUT_SECONDS
+    )
+    self._sock.settimeout(constants.TRANSFER_TIMEOUT_SECONDS)
+    optimize_socket(self._sock)
+    # Guards sending requests and `_pending`.
+    self._lock = threading.Lock()
+    self._pending: dict[
+        int, tuple[concurrent.futures.Future[Any], BinaryIO | None]
+    ] = {}
+    # Size and number of bytes received so far of the file streams being
+    # received, by request ID. Only accessed by the reader thread.
+    self._streams: dict[int, tuple[int, int]] = {}
+    self._next_request_id = 0
+    self._error: Exception | None = None
+    self._reader = threading.Thread(
+        target=self._read_responses,
+        name=f'p2p_connection_{host}:{port}',
+        daemon=True,
+    )
+    self._reader.start()
+
+  @property
+  def closed(self) -> bool:
+    return self._error is not None
+
+  @property
+  def num_pending(self) -> int:
+    return len(self._pending)
+
+  def _send(
+      self, opcode: int, payload: Any, f: BinaryIO | None = None
+  ) -> concurrent.futures.Future[Any]:
+    future = concurrent.futures.Future()
+    with self._lock:
+      if self._error is not None:
+        raise ConnectionError(
+            f'Connection to {self.host}:{self.port} is closed: {self._error}'
+        )
+      self._next_request_id = self._next_request_id % 0xFFFFFFFF + 1
+      request_id = self._next_request_id
+      self._pending[request_id] = (future, f)
+      try:
+        TCPMessage.send_json(self._sock, opcode, payload, request_id)
+      except OSError:
+        del self._pending[request_id]
+        raise
+    return future
+
+  def _read_responses(self):
+    """Reads responses and routes them to their requests, until closed."""
+    try:
+      while True:
+        try:
+          message = TCPMessage.recv_message(self._sock, eof_ok=True)
+        except TimeoutError:
+          if not self._pending:
+            continue
+          raise
+        if message is None:
+          raise ConnectionError('Connection closed by peer.')
+        opcode, request_id, data = message
+        if opcode == OP_ERROR and request_id == 0:
+          raise ConnectionError('Failed to receive response.')
+        if opcode == OP_FILE_CHUNK:
+          self._read_chunk(request_id, data)
+          continue
+        with self._lock:
+          future, f = self._pending.pop(request_id, (None, None))
+          if opcode == OP_FILE_STREAM and f is not None and data:
+            # Pending until all the chunks of the file are received.
+            self._pending[request_id] = (future, f)
+        if future is None:
+          raise ConnectionError(f'Unexpected response ID {request_id}.')
+        if opcode == OP_FILE_STREAM:
+          if f is None:
+            # The file content cannot be skipped reliably.
+            future.set_result((opcode, data))
+            raise ConnectionError('Unexpected file stream.')
+          if data:
+            self._streams[request_id] = (data, 0)
+          else:
+            future.set_result(0)
+        elif f is not None:
+          future.set_result(0)
+        else:
+          future.set_result((opcode, data))
+    except OSError as e:
+      self._fail(e)
+
+  def _read_chunk(self, request_id: int, size: int):
+    """Receives a chunk of a file stream into the file of its request."""
+    stream_size, received = self._streams.get(request_id, (0, 0))
+    with self._lock:
+      future, f = self._pending.get(request_id, (None, None))
+    if future is None or f is None or received + size > stream_size:
+      raise ConnectionError(f'Unexpected file chunk for ID {request_id}.')
+    if TCPMessage.recv_to_file(self._sock, f, size) != size:
+      raise ConnectionError('Connection closed while receiving file.')
+    received += size
+    if received < stream_size:
+      self._streams[request_id] = (stream_size, received)
+      return
+    del self._streams[request_id]
+    with self._lock:
+      if self._pending.pop(request_id, None) is None:
+        return
+    future.set_result(received)
+
+  def _fail(self, error: Exception):
+    with self._lock:
+      if self._error is None:
+        self._error = error
+      pending = list(self._pending.values())
+      self._pending.clear()
+    for future, _ in pending:
+      if not future.done():
+        future.set_exception(
+            ConnectionError(
+                f'Connection to {self.host}:{self.port} failed: {error}'
+            )
+        )
+    try:
+      self._sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+      pass
+    self._sock.close()
+
+  def request(self, opcode: int, payload: Any = None) -> tuple[int, Any]:
+    """Sends a request, and returns the opcode and JSON data of the response."""
+    return self._send(opcode, payload).result()
+
+  def download(
+      self,
+      rel_path: str,
+      f: BinaryIO,
+      offset: int | None = None,
+      length: int | None = None,
+  ) -> int:
+    """Downloads a file, or a byte range of it, into `f` at its position.
+
+    Args:
+      rel_path: The relative path of the file to download.
+      f: The file to write to.
+      offset: The offset of the range to download, or None for the whole file.
+      length: The length of the range to download, if `offset` is set.
+
+    Returns:
+      The number of bytes downloaded. It is 0 if the peer could not serve the
+      file or range.
+    """
+    if offset is None:
+      return self._send(OP_DOWNLOAD_FILE, {'rel_path': rel_path}, f).result()
+    return self._send(
+        OP_DOWNLOAD_RANGE,
+        {'rel_path': rel_path, 'offset': offset, 'length': length},
+        f,
+    ).result()
+
+  def close(self):
+    self._fail(ConnectionError('Connection closed.'))
+    if self._reader is not threading.current_thread():
+      self._reader.join()
+
+
+class ConnectionPool:
+  """Keeps a few persistent connections to every peer.
+
+  A request uses the least loaded open connection to its peer. A new
+  connection is opened only if all existing ones are busy, up to
+  `max_connections_per_peer`.
+  """
+
+  def __init__(
+      self, max_connections_per_peer: int = constants.CONNECTIONS_PER_PEER
+  ):
+    self._max_connections_per_peer = max_connections_per_peer
+    self._cv = threading.Condition()
+    self._connections: dict[tuple[str, int], list[Connection]] = (
+        collections.defaultdict(list)
+    )
+    # Number of connections being opened, per peer.
+    self._connecting: dict[tuple[str, int], int] = collections.defaultdict(int)
+    self.num_connections_opened = 0
+
+  def get(self, host: str, port: int) -> Connection:
+    """Returns a connection to the peer."""
+    key = (host, port)
+    with self._cv:
+      while True:
+        connections = [c for c in self._connections[key] if not c.closed]
+        self._connections[key] = connections
+        can_connect = (
+            len(connections) + self._connecting[key]
+            < self._max_connections_per_peer
+        )
+        if connections and (
+            not can_connect or any(not c.num_pending for c in connections)
+        ):
+          return min(connections, key=lambda c: c.num_pending)
+        if can_connect:
+          self._connecting[key] += 1
+          break
+        self._cv.wait()
+    # Connects without holding the lock.
+    connection = None
+    try:
+      connection = Connection(host, port)
+    finally:
+      with self._cv:
+        self._connecting[key] -= 1
+        if connection is not None:
+          self._connections[key].append(connection)
+          self.num_connections_opened += 1
+        self._cv.notify_all()
+    return connection
+
+  def close(self):
+    with self._cv:
+      connections = [c for cs in self._connections.values() for c in cs]
+      self._connections.clear()
+    for c in connections:
+      c.close()
+
+
+_POOL = ConnectionPool()
+
+
 class TCPClient:
-  """TCP client for P2P communication."""
+  """TCP client for P2P communication, over pooled persistent connections."""
 
   @staticmethod
   def request(host: str, port: int, opcode: int, payload: Any = None) -> Any:
@@ -235,113 +601,122 @@ class TCPClient:
     Returns:
       The JSON response from the server, or None if an error occurs.
     """
+    # A pooled connection may have been closed by the peer while idle, so
+    # requests are retried once on a fresh connection.
+    for attempt in range(2):
+      try:
+        resp_op, resp_data = _POOL.get(host, port).request(opcode, payload)
+        break
+      except OSError as e:
+        if attempt == 0:
+          continue
+        logging.error(
+            'Failed to connect to or communicate with %s:%d for opcode=%d: %s',
+            host,
+            port,
+            opcode,
+            e,
+        )
+        return None
+    if resp_op == OP_RESPONSE_JSON:
+      return resp_data
+    logging.error(
+        'Received unexpected opcode %d from %s:%d in response to opcode=%d',
+        resp_op,
+        host,
+        port,
+        opcode,
+    )
+    return None
+
+  @staticmethod
+  def download(
+      host: str, port: int, rel_path: str, dest_path: epath.Path
+  ) -> int:
+    """Downloads a file from the given host and port.
+
+    Args:
+      host: The host to connect to.
+      port: The port to connect to.
+      rel_path: The relative path of the file to download.
+      dest_path: The destination path to save the file to.
+
+    Returns:
+      The number of bytes downloaded, or 0 if an error occurs.
+    """
     try:
-      with socket.create_connection(
-          (host, port), timeout=constants.CONNECT_TIMEOUT_SECONDS
-      ) as sock:
-        optimize_socket(sock)
-        TCPMessage.send_json(sock, opcode, payload)
-        resp_op, resp_data = TCPMessage.recv(sock)
-        if resp_op == OP_RESPONSE_JSON:
-          return resp_data
-        else:
-          logging.error(
-              'Received unexpected opcode %d from %s:%d in response to'
-              ' opcode=%d',
-              resp_op,
-              host,
-              port,
-              opcode,
-          )
-          return None
+      dest_path.parent.mkdir(parents=True, exist_ok=True)
+      with dest_path.open('wb') as f:
+        received = _POOL.get(host, port).download(rel_path, f)
     except OSError as e:
       logging.error(
-          'Failed to connect to or communicate with %s:%d for opcode=%d: %s',
+          'Failed to download %s from %s:%d: %s', rel_path, host, port, e
+      )
+      return 0
+    if received == 0:
+      logging.error(
+          'Peer %s:%d reported filesize=0 for %s. This may indicate the'
+          ' file is missing or invalid on the peer.',
           host,
           port,
-          opcode,
-          e,
+          rel_path,
       )
-      return None
+    return received
 
   @staticmethod
-  def download(
-      host: str, port: int, rel_path: str, dest_path: epath.Path
+  def download_range(
+      host: str,
+      port: int,
+      rel_path: str,
+      offset: int,
+      length: int,
+      f: BinaryIO,
   ) -> int:
-    """Downloads a file from the given host and port.
+    """Downloads a byte range of a file into `f`, at its current position.
 
     Args:
       host: The host to connect to.
       port: The port to connect to.
       rel_path: The relative path of the file to download.
-      dest_path: The destination path to save the file to.
+      offset: The offset of the range in the file.
+      length: The number of bytes of the range.
+      f: The file to write to.
 
     Returns:
       The number of bytes downloaded, or 0 if an error occurs.
     """
     try:
-      with socket.create_connection(
-          (host, port), timeout=constants.TRANSFER_TIMEOUT_SECONDS
-      ) as sock:
-        optimize_socket(sock)
-        TCPMessage.send_json(sock, OP_DOWNLOAD_FILE, {'rel_path': rel_path})
-        opcode, filesize = TCPMessage.recv(sock)
-
-        if opcode != OP_FILE_STREAM:
-          logging.error(
-              'Received unexpected opcode %d from %s:%d when downloading %s',
-              opcode,
-              host,
-              port,
-              rel_path,
-          )
-          return 0
-        if filesize == 0:
-          logging.error(
-              'Peer %s:%d reported filesize=0 for %s. This may indicate the'
-              ' file is missing or invalid on the peer.',
-              host,
-              port,
-              rel_path,
-          )
-          return 0
-
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with dest_path.open('wb') as f:
-          received = 0
-          buf = bytearray(constants.CHUNK_SIZE)
-          view = memoryview(buf)
-          while received < filesize:
-            to_read = min(constants.CHUNK_SIZE, filesize - received)
-            nbytes = sock.recv_into(view[:to_read])
-            if nbytes == 0:
-              logging.error(
-                  'Connection closed prematurely by peer %s:%d while'
-                  ' downloading %s. Received %d/%d bytes.',
-                  host,
-                  port,
-                  rel_path,
-                  received,
-                  filesize,
-              )
-              break
-            f.write(view[:nbytes])
-            received += nbytes
-
-        if received != filesize:
-          logging.error(
-              'Failed to download %s from %s:%d. Expected %d bytes, received'
-              ' %d.',
-              rel_path,
-              host,
-              port,
-              filesize,
-              received,
-          )
-          return 0
-        return received
+      received = _POOL.get(host, port).download(rel_path, f, offset, length)
     except OSError as e:
       logging.error(
-          'Failed to download %s from %s:%d: %s', rel_path, host, port, e
+          'Failed to download range [%d, %d) of %s from %s:%d: %s',
+          offset,
+          offset + length,
+          rel_path,
+          host,
+          port,
+          e,
+      )
+      return 0
+    if received != length:
+      logging.error(
+          'Peer %s:%d failed to serve range [%d, %d) of %s: received %d bytes.',
+          host,
+          port,
+          offset,
+          offset + length,
+          rel_path,
+          received,
       )
       return 0
+    return received
+
+  @staticmethod
+  def num_connections_opened() -> int:
+    """Returns the number of connections opened so far."""
+    return _POOL.num_connections_opened
+
+  @staticmethod
+  def close_connections():
+    """Closes all pooled connections."""
+    _POOL.close()
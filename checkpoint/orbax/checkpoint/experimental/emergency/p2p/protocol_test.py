@@ -0,0 +1,134 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the P2P wire protocol."""
+
+import concurrent.futures
+import io
+import socket
+from unittest import mock
+
+from absl.testing import absltest
+from etils import epath
+from orbax.checkpoint.experimental.emergency.p2p import protocol
+
+
+class TCPMessageTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.enter_context(mock.patch.object(protocol.constants, 'CHUNK_SIZE', 4))
+    self.sender, self.receiver = socket.socketpair()
+    self.addCleanup(self.sender.close)
+    self.addCleanup(self.receiver.close)
+
+  def test_send_file_in_chunks(self):
+    path = epath.Path(self.create_tempdir().full_path) / 'file'
+    path.write_bytes(b'0123456789')
+    protocol.TCPMessage.send_file(
+        self.sender, path, offset=1, length=9, request_id=7
+    )
+    self.assertEqual(
+        protocol.TCPMessage.recv_message(self.receiver),
+        (protocol.OP_FILE_STREAM, 7, 9),
+    )
+    for expected in (b'1234', b'5678', b'9'):
+      self.assertEqual(
+          protocol.TCPMessage.recv_message(self.receiver),
+          (protocol.OP_FILE_CHUNK, 7, len(expected)),
+      )
+      f = io.BytesIO()
+      protocol.TCPMessage.recv_to_file(self.receiver, f, len(expected))
+      self.assertEqual(f.getvalue(), expected)
+
+  def test_send_missing_file(self):
+    path = epath.Path(self.create_tempdir().full_path) / 'missing'
+    protocol.TCPMessage.send_file(self.sender, path, request_id=7)
+    self.assertEqual(
+        protocol.TCPMessage.recv_message(self.receiver),
+        (protocol.OP_FILE_STREAM, 7, 0),
+    )
+
+
+class ConnectionTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.server = socket.create_server(('127.0.0.1', 0))
+    self.addCleanup(self.server.close)
+    self.connection = protocol.Connection(
+        '127.0.0.1', self.server.getsockname()[1]
+    )
+    self.addCleanup(self.connection.close)
+    self.peer, _ = self.server.accept()
+    self.addCleanup(self.peer.close)
+
+  def _send_chunk(self, request_id: int, data: bytes):
+    self.peer.sendall(
+        protocol._HEADER_STRUCT.pack(
+            protocol.OP_FILE_CHUNK, request_id, len(data)
+        )
+        + data
+    )
+
+  def test_interleaved_file_streams(self):
+    files = {'a': io.BytesIO(), 'b': io.BytesIO()}
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+      futures = {
+          name: executor.submit(self.connection.download, name, f)
+          for name, f in files.items()
+      }
+      request_ids = {}
+      for _ in files:
+        opcode, request_id, payload = protocol.TCPMessage.recv_message(
+            self.peer
+        )
+        self.assertEqual(opcode, protocol.OP_DOWNLOAD_FILE)
+        request_ids[payload['rel_path']] = request_id
+      for name in files:
+        self.peer.sendall(
+            protocol._HEADER_STRUCT.pack(
+                protocol.OP_FILE_STREAM, request_ids[name], 8
+            )
+            + (6).to_bytes(8, 'big')
+        )
+      self._send_chunk(request_ids['a'], b'aaa')
+      self._send_chunk(request_ids['b'], b'bbbb')
+      self._send_chunk(request_ids['a'], b'AAA')
+      # A JSON response in the middle of the file streams.
+      json_future = executor.submit(
+          self.connection.request, protocol.OP_GET_MANIFEST
+      )
+      _, json_request_id, _ = protocol.TCPMessage.recv_message(self.peer)
+      protocol.TCPMessage.send_json(
+          self.peer, protocol.OP_RESPONSE_JSON, ['c'], json_request_id
+      )
+      self.assertEqual(
+          json_future.result(), (protocol.OP_RESPONSE_JSON, ['c'])
+      )
+      self.assertEqual(futures['a'].result(), 6)
+      self.assertFalse(futures['b'].done())
+      self._send_chunk(request_ids['b'], b'BB')
+      self.assertEqual(futures['b'].result(), 6)
+    self.assertEqual(files['a'].getvalue(), b'aaaAAA')
+    self.assertEqual(files['b'].getvalue(), b'bbbbBB')
+
+  def test_unexpected_chunk_closes_connection(self):
+    self._send_chunk(1, b'data')
+    with self.assertRaises(ConnectionError):
+      self.connection.request(protocol.OP_GET_MANIFEST)
+
+
+if __name__ == '__main__':
+  absltest.main()
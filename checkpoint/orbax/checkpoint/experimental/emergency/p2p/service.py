@@ -22,12 +22,13 @@ import socket
 import socketserver
 import threading
 import time
-from typing import Any, final
+from typing import Any, Sequence, final
 
 from absl import logging
 from etils import epath
 from orbax.checkpoint._src.multihost import multihost
 from orbax.checkpoint.experimental.emergency.p2p import constants
+from orbax.checkpoint.experimental.emergency.p2p import downloader
 from orbax.checkpoint.experimental.emergency.p2p import protocol
 from orbax.checkpoint.experimental.emergency.p2p import utils
 
@@ -72,10 +73,20 @@ def _safe_path_join(base: epath.Path, rel_path: str) -> epath.Path | None:
 class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
   """A ThreadingTCPServer that holds a reference to a P2PNode."""
 
+  # Connections are long-lived; stopping the server closes them instead of
+  # waiting for their threads.
+  daemon_threads = True
+
 
 @final
 class NodeHandler(socketserver.BaseRequestHandler):
-  """Handles incoming Data Plane requests."""
+  """Handles incoming Data Plane requests.
+
+  A connection carries any number of requests, possibly concurrent. The
+  handler thread only reads requests; they are processed by the bounded worker
+  pool of the P2PNode, and responses are tagged with the ID of their request.
+  File responses are sent in chunks, interleaved with the other responses.
+  """
 
   server: _ThreadingTCPServer
   _service: 'P2PNode'
@@ -94,19 +105,87 @@ class NodeHandler(socketserver.BaseRequestHandler):
   def setup(self):
     protocol.optimize_socket(self.request)
 
-  def handle(self):
+  def _handle_request(self, opcode: int, request_id: int, payload: Any):
+    """Processes one request, and sends its response."""
     try:
-      opcode, payload = protocol.TCPMessage.recv(self.request)
-
       if opcode == protocol.OP_GET_MANIFEST:
         resp = self._service.handle_get_manifest(payload)
         protocol.TCPMessage.send_json(
-            self.request, protocol.OP_RESPONSE_JSON, resp
+            self.request, protocol.OP_RESPONSE_JSON, resp, request_id
         )
       elif opcode == protocol.OP_DOWNLOAD_FILE:
-        self._service.handle_download(self.request, payload)
+        self._service.handle_download(self.request, payload, request_id)
+      elif opcode == protocol.OP_DOWNLOAD_RANGE:
+        self._service.handle_download_range(self.request, payload, request_id)
+      else:
+        logging.error(
+            'Unknown opcode %d from [%s]', opcode, self.client_address
+        )
+        protocol.TCPMessage.send_json(
+            self.request, protocol.OP_ERROR, None, request_id
+        )
     except (OSError, ValueError) as e:
+      logging.error('P2P Request Error [%s]: %s', self.client_address, e)
+
+  def handle(self):
+    in_flight = []
+    try:
+      self.request.settimeout(constants.IDLE_TIMEOUT_SECONDS)
+      while True:
+        message = protocol.TCPMessage.recv_message(self.request, eof_ok=True)
+        if message is None:
+          return
+        opcode, request_id, payload = message
+        if opcode == protocol.OP_ERROR:
+          return
+        in_flight = [f for f in in_flight if not f.done()]
+        in_flight.append(
+            self._service.submit(
+                self._handle_request, opcode, request_id, payload
+            )
+        )
+    except TimeoutError:
+      logging.vlog(1, 'Closing idle P2P connection [%s]', self.client_address)
+    except (OSError, ValueError, RuntimeError) as e:
       logging.error('P2P Handshake Error [%s]: %s', self.client_address, e)
+    finally:
+      # The connection is closed when this returns.
+      concurrent.futures.wait(in_flight)
+
+
+def _merge_manifests(
+    a: protocol.Manifest, b: protocol.Manifest
+) -> protocol.Manifest | None:
+  """Merges the manifests of two peers, if they serve the same files.
+
+  Files must have the same paths and sizes, and the same checksums when both
+  peers recorded them. Checksums missing from one manifest, e.g. for a step
+  saved without recording them, are taken from the other one.
+
+  Args:
+    a: The manifest of a peer.
+    b: The manifest of another peer.
+
+  Returns:
+    The merged manifest, or None if the peers serve different files.
+  """
+  b_entries = {entry['rel_path']: entry for entry in b}
+  if len(b_entries) != len(a):
+    return None
+  merged = []
+  for entry in a:
+    other = b_entries.get(entry['rel_path'])
+    if other is None or other['size'] != entry['size']:
+      return None
+    checksums = entry.get('checksums')
+    other_checksums = other.get('checksums')
+    if checksums is not None and other_checksums is not None:
+      if checksums != other_checksums:
+        return None
+    elif other_checksums is not None:
+      entry = entry | {'checksums': other_checksums}
+    merged.append(entry)
+  return merged
 
 
 def _get_primary_ip():
@@ -155,11 +234,22 @@ class P2PNode:
     self.port = self.server.server_address[1]
 
     self._thread: threading.Thread | None = None
+    self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+  def submit(self, fn, *args) -> concurrent.futures.Future[Any]:
+    """Runs a request handler in the bounded server worker pool."""
+    if self._executor is None:
+      raise RuntimeError('P2P node is not running.')
+    return self._executor.submit(fn, *args)
 
   def start(self):
     """Starts the P2P server in a background thread."""
     if self._thread is not None:
       return
+    self._executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=constants.SERVER_WORKERS,
+        thread_name_prefix='p2p_server',
+    )
     self._thread = threading.Thread(
         target=self.server.serve_forever, daemon=True
     )
@@ -180,15 +270,25 @@ class P2PNode:
     self.server.server_close()
     self._thread.join(timeout=2.0)
     self._thread = None
+    if self._executor is not None:
+      self._executor.shutdown(wait=False, cancel_futures=True)
+      self._executor = None
+    protocol.TCPClient.close_connections()
 
   def handle_get_manifest(self, payload: dict[str, Any]) -> protocol.Manifest:
     """Handles GET_MANIFEST request.
 
+    The manifest carries the checksums recorded when the step was saved (see
+    `utils.write_checksums`), so that files corrupted since fail verification
+    on the peer downloading them. If a recorded file is missing or its size
+    changed, the shard is not served.
+
     Args:
       payload: The request payload, containing step and process_index.
 
     Returns:
-      A list of file metadata dicts, containing rel_path and size.
+      A list of file metadata dicts, containing rel_path, size and, if they were
+      recorded, checksums. Empty if the shard cannot be served.
     """
     logging.info('handle_get_manifest %s', payload)
     step = payload.get('step')
@@ -215,15 +315,42 @@ class P2PNode:
       )
       return []
 
-    files = []
+    paths = []
+    recorded = {}
     for root, _, filenames in step_dir.walk():
-      for filename in filenames:
-        abs_path = root / filename
-        rel_path = abs_path.relative_to(self.directory)
-        files.append({
-            'rel_path': str(rel_path),
-            'size': abs_path.stat().length,
-        })
+      paths.extend(root / filename for filename in filenames)
+      if constants.CHECKSUMS_FILENAME in filenames:
+        for rel_path, size_and_checksums in (
+            utils.read_checksums(root) or {}
+        ).items():
+          recorded[root / rel_path] = size_and_checksums
+
+    files = []
+    for abs_path in paths:
+      entry: protocol.ManifestEntry = {
+          'rel_path': str(abs_path.relative_to(self.directory)),
+          'size': abs_path.stat().length,
+      }
+      if abs_path in recorded:
+        size, checksums = recorded.pop(abs_path)
+        if entry['size'] != size:
+          logging.error(
+              'Not serving step=%d: %s has %d bytes, but %d bytes were saved.',
+              step,
+              abs_path,
+              entry['size'],
+              size,
+          )
+          return []
+        entry['checksums'] = checksums
+      files.append(entry)
+    if recorded:
+      logging.error(
+          'Not serving step=%d: saved files %s are missing.',
+          step,
+          sorted(str(path) for path in recorded),
+      )
+      return []
     if not files:
       logging.error(
           'No files found for step=%d, process_index=%d',
@@ -233,7 +360,9 @@ class P2PNode:
 
     return files
 
-  def handle_download(self, sock, payload: dict[str, Any]):
+  def handle_download(
+      self, sock, payload: dict[str, Any], request_id: int = 0
+  ):
     """Handles DOWNLOAD_FILE request.
 
     Sends the requested file to the client if it exists and is safe to send.
@@ -241,6 +370,7 @@ class P2PNode:
     Args:
       sock: The socket to send the file to.
       payload: The request payload, containing rel_path of file to download.
+      request_id: The ID of the request.
     """
     rel_path_str = payload.get('rel_path')
 
@@ -249,13 +379,84 @@ class P2PNode:
     )
     if full_path is None:
       logging.error('Blocked unsafe P2P path request: %s', rel_path_str)
-      protocol.TCPMessage.send_file(sock, epath.Path('__INVALID__'))
+      protocol.TCPMessage.send_file(
+          sock, epath.Path('__INVALID__'), request_id=request_id
+      )
+      return
+    if full_path.exists() and full_path.is_file():
+      protocol.TCPMessage.send_file(sock, full_path, request_id=request_id)
+    else:
+      logging.error('Requested file not found: %s', full_path)
+      protocol.TCPMessage.send_file(
+          sock, epath.Path('__MISSING__'), request_id=request_id
+      )
+
+  def handle_download_range(
+      self, sock, payload: dict[str, Any], request_id: int = 0
+  ):
+    """Handles DOWNLOAD_RANGE request.
+
+    Sends the requested byte range of a file to the client if it exists and is
+    safe to send.
+
+    Args:
+      sock: The socket to send the range to.
+      payload: The request payload, containing rel_path, offset and length of
+        the range to download.
+      request_id: The ID of the request.
+    """
+    rel_path_str = payload.get('rel_path')
+    offset = payload.get('offset')
+    length = payload.get('length')
+
+    full_path = (
+        _safe_path_join(self.directory, rel_path_str) if rel_path_str else None
+    )
+    if (
+        full_path is None
+        or not isinstance(offset, int)
+        or not isinstance(length, int)
+    ):
+      logging.error('Blocked invalid P2P range request: %s', payload)
+      protocol.TCPMessage.send_file(
+          sock, epath.Path('__INVALID__'), request_id=request_id
+      )
       return
     if full_path.exists() and full_path.is_file():
-      protocol.TCPMessage.send_file(sock, full_path)
+      protocol.TCPMessage.send_file(
+          sock, full_path, offset, length, request_id=request_id
+      )
     else:
       logging.error('Requested file not found: %s', full_path)
-      protocol.TCPMessage.send_file(sock, epath.Path('__MISSING__'))
+      protocol.TCPMessage.send_file(
+          sock, epath.Path('__MISSING__'), request_id=request_id
+      )
+
+  def _get_manifest(
+      self, peer: protocol.PeerDiscoveryInfo, step: int
+  ) -> protocol.Manifest | None:
+    """Requests the manifest of a shard from a peer."""
+    logging.info(
+        'Requesting manifest from %s:%d for step %d', peer.ip, peer.port, step
+    )
+    manifest: protocol.Manifest = protocol.TCPClient.request(
+        peer.ip,
+        peer.port,
+        protocol.OP_GET_MANIFEST,
+        {'step': step, 'process_index': peer.process_index},
+    )
+    if not manifest:
+      logging.error(
+          'Failed to get manifest from peer %s:%d for step=%d,'
+          ' process_index=%d. The peer may not have the requested shard or it'
+          ' returned an empty manifest.',
+          peer.ip,
+          peer.port,
+          step,
+          peer.process_index,
+      )
+      return None
+    return manifest
 
   def fetch_shard_from_peer(
       self, ip: str, port: int, step: int, stored_process_index: int
@@ -273,26 +474,73 @@ class P2PNode:
     Returns:
       True if the shard was fetched successfully, False otherwise.
     """
-    logging.info('Requesting manifest from %s:%d for step %d', ip, port, step)
-
-    manifest: protocol.Manifest = protocol.TCPClient.request(
-        ip,
-        port,
-        protocol.OP_GET_MANIFEST,
-        {'step': step, 'process_index': stored_process_index},
+    return self.fetch_shard_from_peers(
+        [
+            protocol.PeerDiscoveryInfo(
+                ip=ip, port=port, process_index=stored_process_index
+            )
+        ],
+        step,
     )
 
-    if not manifest:
-      logging.error(
-          'Failed to get manifest from peer %s:%d for step=%d,'
-          ' process_index=%d. The peer may not have the requested shard or it'
-          ' returned an empty manifest.',
-          ip,
-          port,
-          step,
-          stored_process_index,
-      )
-      return False
+  def fetch_shard_from_peers(
+      self, peers: Sequence[protocol.PeerDiscoveryInfo], step: int
+  ) -> bool:
+    """Fetches checkpoint shard from one or more peers.
+
+    Peers serving the same files, with the same checksums when they are known,
+    are interchangeable sources: large files are split into byte ranges, which
+    are striped across the connections to all of them, and a range that fails
+    or is corrupted on one source is retried on another. Groups of identical
+    peers are tried from the largest one, so that a replica whose sizes or
+    checksums disagree with the others is only used if the others fail.
+
+    Args:
+      peers: The peers holding the shard, in order of preference.
+      step: The checkpoint step to fetch.
+
+    Returns:
+      True if the shard was fetched successfully, False otherwise.
+    """
+    groups: list[
+        tuple[protocol.Manifest, list[protocol.PeerDiscoveryInfo]]
+    ] = []
+    for peer in peers:
+      manifest = self._get_manifest(peer, step)
+      if manifest is None:
+        continue
+      for i, (group_manifest, sources) in enumerate(groups):
+        merged = _merge_manifests(group_manifest, manifest)
+        if merged is not None:
+          groups[i] = (merged, sources + [peer])
+          break
+      else:
+        groups.append((manifest, [peer]))
+    # Stable, so that peers of the same group size keep their preference.
+    groups.sort(key=lambda group: -len(group[1]))
+
+    for i, (manifest, sources) in enumerate(groups):
+      if i:
+        logging.warning(
+            'Retrying download of step=%d from peers %s, which serve different'
+            ' files.',
+            step,
+            [f'{peer.ip}:{peer.port}' for peer in sources],
+        )
+      if self._download_shard(manifest, sources, step):
+        return True
+    return False
+
+  def _download_shard(
+      self,
+      manifest: protocol.Manifest,
+      sources: Sequence[protocol.PeerDiscoveryInfo],
+      step: int,
+  ) -> bool:
+    """Downloads the files of `manifest` from `sources`, which serve them."""
+    primary = sources[0]
+    stored_process_index = primary.process_index
+    ip, port = primary.ip, primary.port
 
     stage_dir = self.directory / f'stage_{step}_{stored_process_index}'
     if stage_dir.exists():
@@ -302,41 +550,42 @@ class P2PNode:
     start_time = time.time()
 
     try:
-      with concurrent.futures.ThreadPoolExecutor(max_workers=8) as exc:
-        futures = []
-        for f_meta in manifest:
-          rel_path_str = f_meta['rel_path']
-          dest_path = _safe_path_join(stage_dir, rel_path_str)
-          if dest_path is None:
-            logging.error(
-                'Rejecting unsafe manifest entry from peer %s:%d for'
-                ' step=%d, process_index=%d: %r',
-                ip,
-                port,
-                step,
-                stored_process_index,
-                rel_path_str,
-            )
-            return False
-          futures.append(
-              exc.submit(
-                  protocol.TCPClient.download, ip, port, rel_path_str, dest_path
-              )
-          )
-
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
-        if any(r == 0 and m['size'] > 0 for r, m in zip(results, manifest)):
+      files = []
+      for f_meta in manifest:
+        rel_path_str = f_meta['rel_path']
+        dest_path = _safe_path_join(stage_dir, rel_path_str)
+        if dest_path is None:
           logging.error(
-              'Incomplete download from peer %s:%d for step=%d,'
-              ' process_index=%d. Aborting.',
+              'Rejecting unsafe manifest entry from peer %s:%d for'
+              ' step=%d, process_index=%d: %r',
               ip,
               port,
               step,
               stored_process_index,
+              rel_path_str,
           )
           return False
+        files.append(
+            downloader.FileToDownload(
+                rel_path_str, f_meta['size'], dest_path, f_meta.get('checksums')
+            )
+        )
+
+      striped_downloader = downloader.StripedDownloader(
+          [(peer.ip, peer.port) for peer in sources]
+      )
+      if not striped_downloader.download(files):
+        logging.error(
+            'Incomplete download from peer %s:%d for step=%d,'
+            ' process_index=%d. Aborting.',
+            ip,
+            port,
+            step,
+            stored_process_index,
+        )
+        return False
 
-        total_bytes = sum(results)
+      total_bytes = sum(f.size for f in files)
 
       final_dir = self.directory / constants.P2P_RESTORE_DIR_NAME / str(step)
       if final_dir.exists():
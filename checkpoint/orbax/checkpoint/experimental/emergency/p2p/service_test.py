@@ -14,10 +14,12 @@
 
 """Unit tests for P2PNode service."""
 
+import concurrent.futures
 import functools
 import os
 import threading
 from unittest import mock
+import zlib
 
 from absl.testing import absltest
 from etils import epath
@@ -106,13 +108,17 @@ class PathTraversalRegressionTest(absltest.TestCase):
     ]:
       mock_send_file.reset_mock()
       self.node.handle_download(sock, {'rel_path': bad})
-      mock_send_file.assert_called_once_with(sock, epath.Path('__INVALID__'))
+      mock_send_file.assert_called_once_with(
+          sock, epath.Path('__INVALID__'), request_id=0
+      )
 
   @mock.patch.object(service.shutil, 'rmtree', autospec=True)
   @mock.patch.object(service.shutil, 'move', autospec=True)
   @mock.patch.object(service.time, 'time', autospec=True)
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_rejects_malicious_manifest(
       self,
       mock_download,
@@ -125,7 +131,7 @@ class PathTraversalRegressionTest(absltest.TestCase):
 
     A malicious peer returns a manifest whose ``rel_path`` tries to escape the
     staging directory (e.g., writing a ``.pth`` file into site-packages).
-    ``fetch_shard_from_peer`` must abort before any ``download`` call.
+    ``fetch_shard_from_peer`` must abort before downloading anything.
 
     Args:
       mock_download: Mock for download.
@@ -144,7 +150,9 @@ class PathTraversalRegressionTest(absltest.TestCase):
   @mock.patch.object(service.shutil, 'move', autospec=True)
   @mock.patch.object(service.time, 'time', autospec=True)
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_rejects_absolute_path(
       self,
       mock_download,
@@ -193,17 +201,26 @@ class NodeHandlerTest(absltest.TestCase):
     self.handler.setup()
     mock_optimize_socket.assert_called_once_with(self.mock_request)
 
-  @mock.patch.object(service.protocol.TCPMessage, 'recv', autospec=True)
+  def _run_submitted(self, fn, *args):
+    future = concurrent.futures.Future()
+    future.set_result(fn(*args))
+    return future
+
+  @mock.patch.object(service.protocol.TCPMessage, 'recv_message', autospec=True)
   @mock.patch.object(service.protocol.TCPMessage, 'send_json', autospec=True)
-  def test_handle_get_manifest(self, mock_send_json, mock_recv):
-    mock_recv.return_value = (service.protocol.OP_GET_MANIFEST, {'step': 1})
+  def test_handle_get_manifest(self, mock_send_json, mock_recv_message):
+    mock_recv_message.side_effect = [
+        (service.protocol.OP_GET_MANIFEST, 7, {'step': 1}),
+        None,
+    ]
+    self.mock_node_service.submit.side_effect = self._run_submitted
     self.mock_node_service.handle_get_manifest.return_value = [
         {'rel_path': 'foo'}
     ]
 
     service.NodeHandler.handle(self.handler)
 
-    mock_recv.assert_called_once_with(self.mock_request)
+    mock_recv_message.assert_called_with(self.mock_request, eof_ok=True)
     self.mock_node_service.handle_get_manifest.assert_called_once_with(
         {'step': 1}
     )
@@ -211,24 +228,64 @@ class NodeHandlerTest(absltest.TestCase):
         self.mock_request,
         service.protocol.OP_RESPONSE_JSON,
         [{'rel_path': 'foo'}],
+        7,
     )
 
-  @mock.patch.object(service.protocol.TCPMessage, 'recv', autospec=True)
-  def test_handle_download_file(self, mock_recv):
-    mock_recv.return_value = (
-        service.protocol.OP_DOWNLOAD_FILE,
-        {'rel_path': 'foo'},
-    )
+  @mock.patch.object(service.protocol.TCPMessage, 'recv_message', autospec=True)
+  def test_handle_download_file(self, mock_recv_message):
+    mock_recv_message.side_effect = [
+        (service.protocol.OP_DOWNLOAD_FILE, 3, {'rel_path': 'foo'}),
+        None,
+    ]
+    self.mock_node_service.submit.side_effect = self._run_submitted
 
     service.NodeHandler.handle(self.handler)
 
-    mock_recv.assert_called_once_with(self.mock_request)
     self.mock_node_service.handle_download.assert_called_once_with(
-        self.mock_request, {'rel_path': 'foo'}
+        self.mock_request, {'rel_path': 'foo'}, 3
+    )
+
+  @mock.patch.object(service.protocol.TCPMessage, 'recv_message', autospec=True)
+  def test_handle_multiple_requests(self, mock_recv_message):
+    payloads = [
+        {'rel_path': 'foo', 'offset': 0, 'length': 4},
+        {'rel_path': 'foo', 'offset': 4, 'length': 4},
+    ]
+    mock_recv_message.side_effect = [
+        (service.protocol.OP_DOWNLOAD_RANGE, 1, payloads[0]),
+        (service.protocol.OP_DOWNLOAD_RANGE, 2, payloads[1]),
+        None,
+    ]
+    self.mock_node_service.submit.side_effect = self._run_submitted
+
+    service.NodeHandler.handle(self.handler)
+
+    self.assertEqual(mock_recv_message.call_count, 3)
+    self.assertEqual(
+        self.mock_node_service.handle_download_range.call_args_list,
+        [
+            mock.call(self.mock_request, payloads[0], 1),
+            mock.call(self.mock_request, payloads[1], 2),
+        ],
+    )
+
+  @mock.patch.object(service.protocol.TCPMessage, 'recv_message', autospec=True)
+  @mock.patch.object(service.protocol.TCPMessage, 'send_json', autospec=True)
+  def test_handle_unknown_opcode(self, mock_send_json, mock_recv_message):
+    mock_recv_message.side_effect = [(100, 5, None), None]
+    self.mock_node_service.submit.side_effect = self._run_submitted
+
+    service.NodeHandler.handle(self.handler)
+
+    mock_send_json.assert_called_once_with(
+        self.mock_request, service.protocol.OP_ERROR, None, 5
     )
 
   @mock.patch.object(
-      service.protocol.TCPMessage, 'recv', side_effect=ValueError, autospec=True
+      service.protocol.TCPMessage,
+      'recv_message',
+      side_effect=ValueError,
+      autospec=True,
   )
   def test_handle_error(self, _):
     with self.assertLogs(level='ERROR') as log_output:
@@ -346,11 +403,35 @@ class P2PNodeTest(absltest.TestCase):
     (shard_dir / 'subdir').mkdir()
     (shard_dir / 'subdir' / 'file2').write_text('bar_baz')
 
+    # Steps saved without recording checksums are served without them.
+    manifest = self.node.handle_get_manifest({'step': 1, 'process_index': 10})
+    self.assertCountEqual(
+        manifest,
+        [
+            {'rel_path': '1/state/ocdbt.process_10/file1', 'size': 3},
+            {'rel_path': '1/state/ocdbt.process_10/subdir/file2', 'size': 7},
+        ],
+    )
+
+    service.utils.write_checksums(step_dir / 'state')
     manifest = self.node.handle_get_manifest({'step': 1, 'process_index': 10})
-    self.assertLen(manifest, 2)
     expected_files = [
-        {'rel_path': '1/state/ocdbt.process_10/file1', 'size': 3},
-        {'rel_path': '1/state/ocdbt.process_10/subdir/file2', 'size': 7},
+        {
+            'rel_path': '1/state/ocdbt.process_10/file1',
+            'size': 3,
+            'checksums': [zlib.crc32(b'foo')],
+        },
+        {
+            'rel_path': '1/state/ocdbt.process_10/subdir/file2',
+            'size': 7,
+            'checksums': [zlib.crc32(b'bar_baz')],
+        },
+        {
+            'rel_path': f'1/state/{service.constants.CHECKSUMS_FILENAME}',
+            'size': (
+                step_dir / 'state' / service.constants.CHECKSUMS_FILENAME
+            ).stat().length,
+        },
     ]
     self.assertCountEqual(manifest, expected_files)
 
@@ -358,21 +439,74 @@ class P2PNodeTest(absltest.TestCase):
     manifest = self.node.handle_get_manifest({'step': 1, 'process_index': 11})
     self.assertEmpty(manifest)
 
+  def test_handle_get_manifest_serves_recorded_checksums(self):
+    state_dir = self.temp_dir / '1' / 'state'
+    shard_dir = state_dir / 'ocdbt.process_10'
+    shard_dir.mkdir(parents=True)
+    (shard_dir / 'file1').write_text('foo')
+    service.utils.write_checksums(state_dir)
+
+    with mock.patch.object(
+        service.utils, 'file_checksums', autospec=True
+    ) as mock_checksums:
+      # A file corrupted after it was saved keeps its recorded checksums, so
+      # that downloading it fails verification.
+      (shard_dir / 'file1').write_text('bar')
+      manifest = self.node.handle_get_manifest(
+          {'step': 1, 'process_index': 10}
+      )
+      mock_checksums.assert_not_called()
+    entry = next(e for e in manifest if e['rel_path'].endswith('file1'))
+    self.assertEqual(entry['checksums'], [zlib.crc32(b'foo')])
+
+  def test_handle_get_manifest_size_mismatch(self):
+    state_dir = self.temp_dir / '1' / 'state'
+    shard_dir = state_dir / 'ocdbt.process_10'
+    shard_dir.mkdir(parents=True)
+    (shard_dir / 'file1').write_text('foo')
+    service.utils.write_checksums(state_dir)
+
+    (shard_dir / 'file1').write_text('fo')
+    with self.assertLogs(level='ERROR'):
+      self.assertEmpty(
+          self.node.handle_get_manifest({'step': 1, 'process_index': 10})
+      )
+
+  def test_handle_get_manifest_missing_file(self):
+    state_dir = self.temp_dir / '1' / 'state'
+    shard_dir = state_dir / 'ocdbt.process_10'
+    shard_dir.mkdir(parents=True)
+    (shard_dir / 'file1').write_text('foo')
+    (shard_dir / 'file2').write_text('bar')
+    service.utils.write_checksums(state_dir)
+
+    (shard_dir / 'file2').unlink()
+    with self.assertLogs(level='ERROR'):
+      self.assertEmpty(
+          self.node.handle_get_manifest({'step': 1, 'process_index': 10})
+      )
+
   @mock.patch.object(service.protocol.TCPMessage, 'send_file', autospec=True)
   def test_handle_download_unsafe_path(self, mock_send_file):
     sock = mock.Mock()
     self.node.handle_download(sock, {'rel_path': '../unsafe'})
-    mock_send_file.assert_called_once_with(sock, epath.Path('__INVALID__'))
+    mock_send_file.assert_called_once_with(
+        sock, epath.Path('__INVALID__'), request_id=0
+    )
 
     mock_send_file.reset_mock()
     self.node.handle_download(sock, {'rel_path': '/unsafe'})
-    mock_send_file.assert_called_once_with(sock, epath.Path('__INVALID__'))
+    mock_send_file.assert_called_once_with(
+        sock, epath.Path('__INVALID__'), request_id=0
+    )
 
   @mock.patch.object(service.protocol.TCPMessage, 'send_file', autospec=True)
   def test_handle_download_missing_file(self, mock_send_file):
     sock = mock.Mock()
     self.node.handle_download(sock, {'rel_path': '1/missing'})
-    mock_send_file.assert_called_once_with(sock, epath.Path('__MISSING__'))
+    mock_send_file.assert_called_once_with(
+        sock, epath.Path('__MISSING__'), request_id=0
+    )
 
   @mock.patch.object(service.protocol.TCPMessage, 'send_file', autospec=True)
   def test_handle_download_success(self, mock_send_file):
@@ -381,13 +515,17 @@ class P2PNodeTest(absltest.TestCase):
     step_dir.mkdir()
     (step_dir / 'file1').write_text('foo')
     self.node.handle_download(sock, {'rel_path': '1/file1'})
-    mock_send_file.assert_called_once_with(sock, self.temp_dir / '1/file1')
+    mock_send_file.assert_called_once_with(
+        sock, self.temp_dir / '1/file1', request_id=0
+    )
 
   @mock.patch.object(service.shutil, 'rmtree', autospec=True)
   @mock.patch.object(service.shutil, 'move', autospec=True)
   @mock.patch.object(service.time, 'time', autospec=True)
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_no_manifest(
       self,
       unused_mock_download,
@@ -409,7 +547,9 @@ class P2PNodeTest(absltest.TestCase):
   @mock.patch.object(service.shutil, 'move', autospec=True)
   @mock.patch.object(service.time, 'time', autospec=True)
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_incomplete_download(
       self,
       mock_download,
@@ -419,7 +559,7 @@ class P2PNodeTest(absltest.TestCase):
       mock_rmtree,
   ):
     mock_request.return_value = [{'rel_path': '1/file1', 'size': 10}]
-    mock_download.return_value = 0  # 0 bytes downloaded for file of size 10
+    mock_download.return_value = False
     mock_time.return_value = 0
     self.assertFalse(self.node.fetch_shard_from_peer('peer', 123, 1, 10))
     mock_download.assert_called_once()
@@ -435,7 +575,9 @@ class P2PNodeTest(absltest.TestCase):
       autospec=True,
   )
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_success(
       self,
       mock_download,
@@ -450,38 +592,245 @@ class P2PNodeTest(absltest.TestCase):
     ]
     mock_request.return_value = manifest
 
-    def download_side_effect(unused_ip, unused_port, rel_path, dest_path):
-      dest_path.parent.mkdir(parents=True, exist_ok=True)
-      if rel_path == '1/file1':
-        dest_path.write_text('0123456789')
-        return 10
-      elif rel_path == '1/subdir/file2':
-        dest_path.write_text('01234567890123456789')
-        return 20
-      return 0
+    def download_side_effect(unused_self, files):
+      for f in files:
+        f.dest_path.parent.mkdir(parents=True, exist_ok=True)
+        f.dest_path.write_text('0' * f.size)
+      return True
 
     mock_download.side_effect = download_side_effect
 
     self.assertTrue(self.node.fetch_shard_from_peer('peer', 123, 1, 10))
 
     stage_dir = self.temp_dir / 'stage_1_10'
-    mock_download.assert_has_calls(
+    mock_download.assert_called_once_with(
+        mock.ANY,
         [
-            mock.call('peer', 123, '1/file1', stage_dir / '1/file1'),
-            mock.call(
-                'peer', 123, '1/subdir/file2', stage_dir / '1/subdir/file2'
+            service.downloader.FileToDownload(
+                '1/file1', 10, stage_dir / '1/file1'
+            ),
+            service.downloader.FileToDownload(
+                '1/subdir/file2', 20, stage_dir / '1/subdir/file2'
             ),
         ],
-        any_order=True,
     )
 
     final_dir = self.temp_dir / service.constants.P2P_RESTORE_DIR_NAME / '1'
     mock_move.assert_called_once_with(str(stage_dir / '1'), str(final_dir))
     mock_rmtree.assert_called_with(str(stage_dir), ignore_errors=True)
 
+  @mock.patch.object(service.protocol.TCPMessage, 'send_file', autospec=True)
+  def test_handle_download_range(self, mock_send_file):
+    sock = mock.Mock()
+    (self.temp_dir / '1').mkdir()
+    (self.temp_dir / '1' / 'file1').write_text('foobar')
+    self.node.handle_download_range(
+        sock, {'rel_path': '1/file1', 'offset': 2, 'length': 3}
+    )
+    mock_send_file.assert_called_once_with(
+        sock, self.temp_dir / '1/file1', 2, 3, request_id=0
+    )
+
+    mock_send_file.reset_mock()
+    self.node.handle_download_range(
+        sock, {'rel_path': '../unsafe', 'offset': 2, 'length': 3}
+    )
+    mock_send_file.assert_called_once_with(
+        sock, epath.Path('__INVALID__'), request_id=0
+    )
+
+    mock_send_file.reset_mock()
+    self.node.handle_download_range(sock, {'rel_path': '1/file1'})
+    mock_send_file.assert_called_once_with(
+        sock, epath.Path('__INVALID__'), request_id=0
+    )
+
   @mock.patch.object(service.shutil, 'rmtree', autospec=True)
+  @mock.patch.object(service.shutil, 'move', autospec=True)
+  @mock.patch.object(service.time, 'time', return_value=0, autospec=True)
   @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
-  @mock.patch.object(service.protocol.TCPClient, 'download', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, '__init__', autospec=True
+  )
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
+  def test_fetch_shard_from_peers_uses_matching_peers(
+      self,
+      mock_download,
+      mock_downloader_init,
+      mock_request,
+      unused_mock_time,
+      unused_mock_move,
+      unused_mock_rmtree,
+  ):
+    manifests = {
+        'peer0': [{'rel_path': '1/file1', 'size': 10}],
+        'peer1': [{'rel_path': '1/file1', 'size': 10}],
+        'peer2': [{'rel_path': '1/other', 'size': 10}],
+        'peer3': [],
+    }
+    mock_request.side_effect = (
+        lambda ip, port, opcode, payload: manifests[ip]
+    )
+    mock_downloader_init.return_value = None
+    mock_download.return_value = True
+    peers = [
+        service.protocol.PeerDiscoveryInfo(ip=ip, port=123, process_index=i)
+        for i, ip in enumerate(manifests)
+    ]
+
+    self.assertTrue(self.node.fetch_shard_from_peers(peers, 1))
+
+    mock_downloader_init.assert_called_once_with(
+        mock.ANY, [('peer0', 123), ('peer1', 123)]
+    )
+
+  @mock.patch.object(service.shutil, 'rmtree', autospec=True)
+  @mock.patch.object(service.shutil, 'move', autospec=True)
+  @mock.patch.object(service.time, 'time', return_value=0, autospec=True)
+  @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, '__init__', autospec=True
+  )
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
+  def test_fetch_shard_from_peers_merges_missing_checksums(
+      self,
+      mock_download,
+      mock_downloader_init,
+      mock_request,
+      unused_mock_time,
+      unused_mock_move,
+      unused_mock_rmtree,
+  ):
+    manifests = {
+        # Peer 0 did not record checksums.
+        'peer0': [{'rel_path': '1/file1', 'size': 10}],
+        'peer1': [{'rel_path': '1/file1', 'size': 10, 'checksums': [1]}],
+        'peer2': [{'rel_path': '1/file1', 'size': 10, 'checksums': [2]}],
+    }
+    mock_request.side_effect = (
+        lambda ip, port, opcode, payload: manifests[ip]
+    )
+    mock_downloader_init.return_value = None
+    mock_download.return_value = True
+    peers = [
+        service.protocol.PeerDiscoveryInfo(ip=ip, port=123, process_index=10)
+        for ip in manifests
+    ]
+
+    self.assertTrue(self.node.fetch_shard_from_peers(peers, 1))
+
+    mock_downloader_init.assert_called_once_with(
+        mock.ANY, [('peer0', 123), ('peer1', 123)]
+    )
+    stage_dir = self.temp_dir / 'stage_1_10'
+    mock_download.assert_called_once_with(
+        mock.ANY,
+        [
+            service.downloader.FileToDownload(
+                '1/file1', 10, stage_dir / '1/file1', [1]
+            )
+        ],
+    )
+
+  @mock.patch.object(service.shutil, 'rmtree', autospec=True)
+  @mock.patch.object(service.shutil, 'move', autospec=True)
+  @mock.patch.object(service.time, 'time', return_value=0, autospec=True)
+  @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, '__init__', autospec=True
+  )
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
+  def test_fetch_shard_from_peers_falls_back_to_other_replicas(
+      self,
+      mock_download,
+      mock_downloader_init,
+      mock_request,
+      unused_mock_time,
+      unused_mock_move,
+      unused_mock_rmtree,
+  ):
+    manifests = {
+        'peer0': [{'rel_path': '1/file1', 'size': 10, 'checksums': [1]}],
+        'peer1': [{'rel_path': '1/file1', 'size': 10, 'checksums': [2]}],
+    }
+    mock_request.side_effect = (
+        lambda ip, port, opcode, payload: manifests[ip]
+    )
+    mock_downloader_init.return_value = None
+    mock_download.side_effect = [False, True]
+    peers = [
+        service.protocol.PeerDiscoveryInfo(ip=ip, port=123, process_index=10)
+        for ip in manifests
+    ]
+
+    self.assertTrue(self.node.fetch_shard_from_peers(peers, 1))
+
+    mock_downloader_init.assert_has_calls([
+        mock.call(mock.ANY, [('peer0', 123)]),
+        mock.call(mock.ANY, [('peer1', 123)]),
+    ])
+    stage_dir = self.temp_dir / 'stage_1_10'
+    mock_download.assert_called_with(
+        mock.ANY,
+        [
+            service.downloader.FileToDownload(
+                '1/file1', 10, stage_dir / '1/file1', [2]
+            )
+        ],
+    )
+
+  @mock.patch.object(service.shutil, 'rmtree', autospec=True)
+  @mock.patch.object(service.shutil, 'move', autospec=True)
+  @mock.patch.object(service.time, 'time', return_value=0, autospec=True)
+  @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, '__init__', autospec=True
+  )
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
+  def test_fetch_shard_from_peers_prefers_agreeing_replicas(
+      self,
+      mock_download,
+      mock_downloader_init,
+      mock_request,
+      unused_mock_time,
+      unused_mock_move,
+      unused_mock_rmtree,
+  ):
+    manifests = {
+        # Peer 0 disagrees with the other replicas.
+        'peer0': [{'rel_path': '1/file1', 'size': 10, 'checksums': [1]}],
+        'peer1': [{'rel_path': '1/file1', 'size': 10, 'checksums': [2]}],
+        'peer2': [{'rel_path': '1/file1', 'size': 10, 'checksums': [2]}],
+    }
+    mock_request.side_effect = (
+        lambda ip, port, opcode, payload: manifests[ip]
+    )
+    mock_downloader_init.return_value = None
+    mock_download.return_value = True
+    peers = [
+        service.protocol.PeerDiscoveryInfo(ip=ip, port=123, process_index=10)
+        for ip in manifests
+    ]
+
+    self.assertTrue(self.node.fetch_shard_from_peers(peers, 1))
+
+    mock_downloader_init.assert_called_once_with(
+        mock.ANY, [('peer1', 123), ('peer2', 123)]
+    )
+
+  @mock.patch.object(service.shutil, 'rmtree', autospec=True)
+  @mock.patch.object(service.protocol.TCPClient, 'request', autospec=True)
+  @mock.patch.object(
+      service.downloader.StripedDownloader, 'download', autospec=True
+  )
   def test_fetch_shard_from_peer_exception_cleanup(
       self,
       mock_download,
@@ -14,7 +14,9 @@
 
 """Utils for P2P checkpointing."""
 
+import json
 from typing import Any
+import zlib
 
 from absl import logging
 from etils import epath
@@ -58,4 +60,76 @@ def detect_process_index(directory: epath.Path, step: int) -> int | None:
   return None
 
 
+def file_checksums(
+    path: epath.Path, block_size: int = constants.CHECKSUM_BLOCK_SIZE
+) -> list[int]:
+  """Returns the CRC32 checksums of the consecutive blocks of a file."""
+  checksums = []
+  buf = bytearray(block_size)
+  view = memoryview(buf)
+  with path.open('rb') as f:
+    while nbytes := f.readinto(buf):
+      checksums.append(zlib.crc32(view[:nbytes]))
+  return checksums
 
+
+def write_checksums(
+    directory: epath.Path, block_size: int = constants.CHECKSUM_BLOCK_SIZE
+):
+  """Records the sizes and block checksums of the files under `directory`.
+
+  They are written to a `constants.CHECKSUMS_FILENAME` sidecar in `directory`,
+  keyed by the paths of the files relative to it.
+
+  Args:
+    directory: The directory, e.g. of a checkpoint item being finalized.
+    block_size: The size of the checksummed blocks.
+  """
+  files = {}
+  for root, _, filenames in directory.walk():
+    for filename in filenames:
+      path = root / filename
+      rel_path = str(path.relative_to(directory))
+      if rel_path == constants.CHECKSUMS_FILENAME:
+        continue
+      files[rel_path] = {
+          'size': path.stat().length,
+          'checksums': file_checksums(path, block_size),
+      }
+  (directory / constants.CHECKSUMS_FILENAME).write_text(
+      json.dumps({'block_size': block_size, 'files': files})
+  )
+
+
+def read_checksums(
+    directory: epath.Path,
+) -> dict[str, tuple[int, list[int]]] | None:
+  """Returns the sizes and block checksums recorded by `write_checksums`.
+
+  Args:
+    directory: The directory containing the sidecar.
+
+  Returns:
+    The size and block checksums of every recorded file, by path relative to
+    `directory`, or None if the sidecar is missing, invalid or was written with
+    another block size.
+  """
+  path = directory / constants.CHECKSUMS_FILENAME
+  try:
+    content = json.loads(path.read_text())
+    if content['block_size'] != constants.CHECKSUM_BLOCK_SIZE:
+      logging.warning(
+          'Ignoring checksums %s of blocks of %s bytes.',
+          path,
+          content['block_size'],
+      )
+      return None
+    return {
+        rel_path: (int(entry['size']), [int(c) for c in entry['checksums']])
+        for rel_path, entry in content['files'].items()
+    }
+  except FileNotFoundError:
+    return None
+  except (ValueError, TypeError, KeyError) as e:
+    logging.warning('Ignoring invalid checksums %s: %s', path, e)
+    return None
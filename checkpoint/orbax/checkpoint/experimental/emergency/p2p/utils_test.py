@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import zlib
 
 from absl.testing import absltest
 from etils import epath
@@ -31,5 +32,36 @@ class UtilsTest(absltest.TestCase):
     self.assertEqual(utils.detect_process_index(self.directory, 1), 42)
     self.assertIsNone(utils.detect_process_index(self.directory, 2))
 
+  def test_file_checksums(self):
+    path = self.directory / 'file'
+    path.write_bytes(b'0123456789')
+    self.assertEqual(
+        utils.file_checksums(path, block_size=4),
+        [zlib.crc32(b'0123'), zlib.crc32(b'4567'), zlib.crc32(b'89')],
+    )
+    path.write_bytes(b'')
+    self.assertEmpty(utils.file_checksums(path, block_size=4))
+
+  def test_write_and_read_checksums(self):
+    (self.directory / 'subdir').mkdir()
+    (self.directory / 'subdir' / 'file').write_bytes(b'0123456789')
+    utils.write_checksums(self.directory)
+    self.assertEqual(
+        utils.read_checksums(self.directory),
+        {'subdir/file': (10, [zlib.crc32(b'0123456789')])},
+    )
+    # The sidecar does not record itself.
+    utils.write_checksums(self.directory)
+    self.assertLen(utils.read_checksums(self.directory), 1)
+
+  def test_read_checksums_invalid(self):
+    self.assertIsNone(utils.read_checksums(self.directory))
+    path = self.directory / utils.constants.CHECKSUMS_FILENAME
+    path.write_text('not json')
+    self.assertIsNone(utils.read_checksums(self.directory))
+    # Checksums of blocks of another size cannot be verified.
+    utils.write_checksums(self.directory, block_size=4)
+    self.assertIsNone(utils.read_checksums(self.directory))
+
 if __name__ == '__main__':
   absltest.main()
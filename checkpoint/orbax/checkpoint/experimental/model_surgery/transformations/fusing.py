@@ -23,6 +23,7 @@ from absl import logging
 import jax
 import jax.numpy as jnp
 import numpy as np
+from orbax.checkpoint.experimental.model_surgery.transformations import lazy
 from orbax.checkpoint.experimental.model_surgery.transformations import types
 
 
@@ -48,7 +49,9 @@ def _fuse_keys(
   """Fuses values of keys_to_fuse into fused_key in params_dict."""
   vals_to_fuse = [params_dict[k] for k in keys_to_fuse]
 
-  if all(_is_host_array(x) for x in vals_to_fuse):
+  if any(lazy.is_lazy(x) for x in vals_to_fuse):
+    fused_val = lazy.concatenate(vals_to_fuse, axis=axis)
+  elif all(_is_host_array(x) for x in vals_to_fuse):
     logging.info("DEBUG: Fusing %s on CPU", fused_key)
     # Force concatenation on CPU using JAX to avoid touching TPU
     fused_val = _cpu_concat(vals_to_fuse, axis=axis)
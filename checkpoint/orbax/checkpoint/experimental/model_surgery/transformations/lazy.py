@@ -0,0 +1,472 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy arrays for load-time model surgery.
+
+A `LazyArray` describes an array without holding its data: it can only read
+slices of itself. Source arrays read slices straight from storage (TensorStore
+or safetensors), and the arrays produced by `stack`, `concatenate` and `repeat`
+read only the slices of their sources that the requested slice covers.
+
+The transformations in this package accept `LazyArray` values and then return
+`LazyArray` values, so that a chain of transformations builds a plan instead
+of materializing intermediate arrays. `materialize` then fills every shard of
+the destination array by reading the corresponding slices of the sources. Each
+distinct slice is read once, transferred to the devices holding it and released
+from host memory, and the bytes held on host at once are bounded by a budget
+rather than by the size of the sources or of the local shards.
+
+Example::
+
+  params = lazy.open_safetensors(path)
+  params = stacking.stack(r"layers\\.(\\d+\\.)")(params)
+  params = fusing.fuse_by_pattern(...)(params)
+  arrays = lazy.materialize_tree(params, shardings)
+"""
+
+import abc
+import asyncio
+from collections.abc import Callable, Mapping, Sequence
+import json
+from typing import Any
+
+from etils import epath
+import jax
+import numpy as np
+from orbax.checkpoint._src import asyncio_utils
+from orbax.checkpoint._src.serialization import limits
+from orbax.checkpoint.experimental.v1._src.layout import safetensors_layout
+import tensorstore as ts
+
+
+Index = tuple[slice, ...]
+
+
+def _resolve_index(index: Any, shape: tuple[int, ...]) -> Index:
+  """Returns `index` with explicit start, stop and step for every dimension."""
+  if index is Ellipsis or index is None:
+    index = ()
+  elif not isinstance(index, tuple):
+    index = (index,)
+  if len(index) > len(shape):
+    raise ValueError(f"Index {index} has too many dimensions for {shape}.")
+  resolved = []
+  for s, n in zip(index + (slice(None),) * (len(shape) - len(index)), shape):
+    if not isinstance(s, slice):
+      raise ValueError(f"Only slices are supported, got {s}.")
+    s = slice(*s.indices(n))
+    if s.step <= 0:
+      raise ValueError(f"Only positive steps are supported, got {s}.")
+    resolved.append(s)
+  return tuple(resolved)
+
+
+def _length(s: slice) -> int:
+  return len(range(s.start, s.stop, s.step))
+
+
+def _replace(index: Index, axis: int, s: slice) -> Index:
+  return index[:axis] + (s,) + index[axis + 1 :]
+
+
+class LazyArray(abc.ABC):
+  """An array whose data is only read slice by slice, on demand."""
+
+  def __init__(self, shape: Sequence[int], dtype: Any):
+    self._shape = tuple(shape)
+    self._dtype = np.dtype(dtype)
+
+  @property
+  def shape(self) -> tuple[int, ...]:
+    return self._shape
+
+  @property
+  def dtype(self) -> np.dtype:
+    return self._dtype
+
+  @property
+  def ndim(self) -> int:
+    return len(self._shape)
+
+  @property
+  def size(self) -> int:
+    return int(np.prod(self._shape, dtype=np.int64))
+
+  @property
+  def nbytes(self) -> int:
+    return self.size * self._dtype.itemsize
+
+  def read(self, index: Any = ()) -> np.ndarray:
+    """Reads the slice `index` of the array, e.g. `(slice(0, 2), slice(None))`.
+
+    Args:
+      index: A slice or tuple of slices. Missing trailing dimensions are read
+        entirely. Steps must be positive.
+
+    Returns:
+      The data of the slice.
+    """
+    index = _resolve_index(index, self._shape)
+    if any(_length(s) == 0 for s in index):
+      return np.empty([_length(s) for s in index], dtype=self._dtype)
+    return self._read(index)
+
+  @abc.abstractmethod
+  def _read(self, index: Index) -> np.ndarray:
+    """Reads a non-empty slice given with explicit starts, stops and steps."""
+
+  def __repr__(self):
+    return f"{type(self).__name__}(shape={self._shape}, dtype={self._dtype})"
+
+
+class _SourceArray(LazyArray):
+  """A lazy array reading slices with a function."""
+
+  def __init__(
+      self,
+      shape: Sequence[int],
+      dtype: Any,
+      read_fn: Callable[[Index], np.ndarray],
+  ):
+    super().__init__(shape, dtype)
+    self._read_fn = read_fn
+
+  def _read(self, index: Index) -> np.ndarray:
+    return np.asarray(self._read_fn(index), dtype=self._dtype)
+
+
+def is_lazy(x: Any) -> bool:
+  return isinstance(x, LazyArray)
+
+
+def from_array(x: np.ndarray | jax.Array) -> LazyArray:
+  """Wraps an in-memory array."""
+  return _SourceArray(x.shape, x.dtype, lambda index: np.asarray(x[index]))
+
+
+def full(shape: Sequence[int], dtype: Any, fill_value: Any) -> LazyArray:
+  """Returns a lazy array filled with `fill_value`."""
+  return _SourceArray(
+      shape,
+      dtype,
+      lambda index: np.full(
+          [_length(s) for s in index], fill_value, dtype=dtype
+      ),
+  )
+
+
+def from_tensorstore(t: ts.TensorStore) -> LazyArray:
+  """Returns a lazy array reading slices of an open TensorStore."""
+  t = t[ts.d[:].translate_to[0]]
+  return _SourceArray(
+      t.shape,
+      t.dtype.numpy_dtype,
+      lambda index: t[index].read().result(),
+  )
+
+
+class _SafetensorsArray(LazyArray):
+  """A tensor of a safetensors file, read with byte-range reads."""
+
+  def __init__(
+      self,
+      path: epath.Path,
+      shape: Sequence[int],
+      dtype: Any,
+      tensor_base: int,
+  ):
+    super().__init__(shape, dtype)
+    self._path = path
+    self._tensor_base = tensor_base
+
+  def _read(self, index: Index) -> np.ndarray:
+    # Reads the bounding box of the slice, then applies the steps.
+    bounds = tuple((s.start, s.stop) for s in index)
+    runs = safetensors_layout.index_domain_to_byte_runs(
+        bounds, self.shape, self.dtype.itemsize, self._tensor_base
+    )
+    with self._path.open("rb") as f:
+      data = bytearray()
+      for offset, length in runs:
+        f.seek(offset)
+        data += f.read(length)
+    box = np.frombuffer(data, dtype=self.dtype).reshape(
+        [stop - start for start, stop in bounds]
+    )
+    return box[tuple(slice(None, None, s.step) for s in index)]
+
+
+def open_safetensors(path: epath.PathLike) -> dict[str, LazyArray]:
+  """Returns lazy arrays for the tensors of safetensors files.
+
+  Only the headers are read.
+
+  Args:
+    path: A `.safetensors` file, or a directory containing such files.
+
+  Returns:
+    A flat dict from tensor name to lazy array.
+  """
+  path = epath.Path(path)
+  if path.is_dir():
+    files = sorted(path.glob(f"*{safetensors_layout.SAFETENSORS_SUFFIX}"))
+  else:
+    files = [path]
+  dtypes = safetensors_layout._get_dtypes()  # pylint: disable=protected-access
+  result = {}
+  for file in files:
+    with file.open("rb") as f:
+      header_size = int.from_bytes(
+          f.read(safetensors_layout.HEADER_NUM_BYTES), byteorder="little"
+      )
+      header = json.loads(f.read(header_size))
+    data_start = safetensors_layout.HEADER_NUM_BYTES + header_size
+    for name, info in header.items():
+      if name == "__metadata__":
+        continue
+      result[name] = _SafetensorsArray(
+          file,
+          info["shape"],
+          dtypes[info["dtype"]],
+          data_start + info["data_offsets"][0],
+      )
+  return result
+
+
+def _as_lazy(x: Any) -> LazyArray:
+  return x if is_lazy(x) else from_array(x)
+
+
+class _StackedArray(LazyArray):
+  """Lazy equivalent of `np.stack`."""
+
+  def __init__(self, items: Sequence[LazyArray], axis: int):
+    shape = list(items[0].shape)
+    shape.insert(axis, len(items))
+    super().__init__(shape, items[0].dtype)
+    self._items = items
+    self._axis = axis
+
+  def _read(self, index: Index) -> np.ndarray:
+    s = index[self._axis]
+    item_index = index[: self._axis] + index[self._axis + 1 :]
+    return np.stack(
+        [
+            self._items[i].read(item_index)
+            for i in range(s.start, s.stop, s.step)
+        ],
+        axis=self._axis,
+    ).astype(self.dtype, copy=False)
+
+
+def stack(items: Sequence[Any], axis: int = 0) -> LazyArray:
+  """Lazily stacks arrays along a new axis, like `np.stack`."""
+  items = [_as_lazy(x) for x in items]
+  if any(x.shape != items[0].shape for x in items):
+    raise ValueError(
+        f"Cannot stack arrays of shapes {[x.shape for x in items]}."
+    )
+  axis = axis % (items[0].ndim + 1)
+  return _StackedArray(items, axis)
+
+
+class _ConcatenatedArray(LazyArray):
+  """Lazy equivalent of `np.concatenate`."""
+
+  def __init__(self, items: Sequence[LazyArray], axis: int):
+    shape = list(items[0].shape)
+    shape[axis] = sum(x.shape[axis] for x in items)
+    super().__init__(shape, np.result_type(*[x.dtype for x in items]))
+    self._items = items
+    self._axis = axis
+    self._offsets = np.cumsum([0] + [x.shape[axis] for x in items]).tolist()
+
+  def _read(self, index: Index) -> np.ndarray:
+    s = index[self._axis]
+    start, stop = s.start, s.stop
+    parts = []
+    for item, offset, end in zip(
+        self._items, self._offsets, self._offsets[1:]
+    ):
+      lo, hi = max(start, offset), min(stop, end)
+      if lo < hi:
+        item_slice = slice(lo - offset, hi - offset)
+        parts.append(item.read(_replace(index, self._axis, item_slice)))
+    result = np.concatenate(parts, axis=self._axis).astype(
+        self.dtype, copy=False
+    )
+    if s.step != 1:
+      step_slice = slice(None, None, s.step)
+      result = result[
+          _replace((slice(None),) * self.ndim, self._axis, step_slice)
+      ]
+    return result
+
+
+def concatenate(items: Sequence[Any], axis: int = 0) -> LazyArray:
+  """Lazily concatenates arrays along an existing axis, like np.concatenate."""
+  items = [_as_lazy(x) for x in items]
+  axis = axis % items[0].ndim
+  for x in items:
+    if x.ndim != items[0].ndim or any(
+        a != b
+        for i, (a, b) in enumerate(zip(x.shape, items[0].shape))
+        if i != axis
+    ):
+      raise ValueError(
+          f"Cannot concatenate arrays of shapes {[x.shape for x in items]}"
+          f" along axis {axis}."
+      )
+  return _ConcatenatedArray(items, axis)
+
+
+class _RepeatedArray(LazyArray):
+  """Lazy equivalent of `np.repeat` with a scalar number of repeats."""
+
+  def __init__(self, item: LazyArray, repeats: int, axis: int):
+    shape = list(item.shape)
+    shape[axis] *= repeats
+    super().__init__(shape, item.dtype)
+    self._item = item
+    self._repeats = repeats
+    self._axis = axis
+
+  def _read(self, index: Index) -> np.ndarray:
+    s = index[self._axis]
+    last = s.start + (_length(s) - 1) * s.step
+    source_start = s.start // self._repeats
+    source_stop = last // self._repeats + 1
+    source = self._item.read(
+        _replace(index, self._axis, slice(source_start, source_stop))
+    )
+    repeated = np.repeat(source, self._repeats, axis=self._axis)
+    offset = source_start * self._repeats
+    return repeated[
+        _replace(
+            (slice(None),) * self.ndim,
+            self._axis,
+            slice(s.start - offset, last - offset + 1, s.step),
+        )
+    ]
+
+
+def repeat(x: Any, repeats: int, axis: int) -> LazyArray:
+  """Lazily repeats the elements of an array, like `np.repeat`."""
+  x = _as_lazy(x)
+  return _RepeatedArray(x, repeats, axis % x.ndim)
+
+
+async def _read_and_transfer(
+    x: LazyArray,
+    index: Index,
+    devices: Sequence[jax.Device],
+    byte_limiter: limits.ByteLimiter,
+) -> list[jax.Array]:
+  """Reads the slice `index` once and places it on every device of `devices`."""
+  nbytes = int(np.prod([_length(s) for s in index])) * x.dtype.itemsize
+  async with limits.reserved_bytes(byte_limiter, nbytes):
+    data = await asyncio.to_thread(x.read, index)
+    shards = [jax.device_put(data, device) for device in devices]
+    # The host copy is only released once the transfers have completed.
+    await asyncio.to_thread(jax.block_until_ready, shards)
+    del data
+  return shards
+
+
+async def _materialize_sharded(
+    x: LazyArray,
+    sharding: jax.sharding.Sharding,
+    concurrent_bytes: int | None,
+) -> jax.Array:
+  """Reads the local shards of `x`, see `materialize`."""
+  # Devices holding the same slice, e.g. with a replicated sharding, share a
+  # single read.
+  devices_by_index: dict[tuple[tuple[int, int, int], ...], list[Any]] = {}
+  for device, index in sharding.addressable_devices_indices_map(
+      x.shape
+  ).items():
+    index = _resolve_index(index, x.shape)
+    key = tuple((s.start, s.stop, s.step) for s in index)
+    devices_by_index.setdefault(key, [index, []])[1].append(device)
+  max_shard_bytes = max(
+      int(np.prod([_length(s) for s in index])) * x.dtype.itemsize
+      for index, _ in devices_by_index.values()
+  )
+  # A budget must fit the largest shard, which is then read on its own.
+  byte_limiter = limits.get_byte_limiter(
+      max(concurrent_bytes or 0, max_shard_bytes + 1)
+  )
+  shards = await asyncio.gather(*[
+      _read_and_transfer(x, index, devices, byte_limiter)
+      for index, devices in devices_by_index.values()
+  ])
+  return jax.make_array_from_single_device_arrays(
+      x.shape, sharding, [shard for group in shards for shard in group]
+  )
+
+
+def materialize(
+    x: LazyArray,
+    sharding: jax.sharding.Sharding | None = None,
+    concurrent_bytes: int | None = None,
+) -> jax.Array | np.ndarray:
+  """Reads a lazy array.
+
+  With a sharding, every distinct slice addressed by the local devices is read
+  once, even if several devices hold it, placed on those devices and then
+  released from host memory. Slices are read concurrently as long as the bytes
+  held on host stay within `concurrent_bytes`.
+
+  Args:
+    x: The lazy array.
+    sharding: If provided, returns a `jax.Array` with this sharding, each shard
+      of which is read separately. Otherwise, returns a numpy array.
+    concurrent_bytes: Maximum number of bytes read but not yet transferred to
+      the devices. Defaults to, and is at least, the size of the largest shard,
+      so that slices larger than the budget are read one at a time.
+
+  Returns:
+    The array.
+  """
+  if sharding is None:
+    return x.read()
+  return asyncio_utils.run_sync(
+      _materialize_sharded(x, sharding, concurrent_bytes)
+  )
+
+
+def materialize_tree(
+    tree: Mapping[str, Any],
+    shardings: Mapping[str, jax.sharding.Sharding | None] | None = None,
+    concurrent_bytes: int | None = None,
+) -> dict[str, Any]:
+  """Materializes the lazy arrays of a flat dict; other values are kept.
+
+  Args:
+    tree: A flat dict, e.g. as returned by a chain of transformations.
+    shardings: Optional shardings for the keys of `tree`.
+    concurrent_bytes: See `materialize`. Arrays are materialized one at a time.
+
+  Returns:
+    A flat dict with the lazy arrays replaced by arrays.
+  """
+  shardings = shardings or {}
+  return {
+      key: (
+          materialize(value, shardings.get(key), concurrent_bytes)
+          if is_lazy(value)
+          else value
+      )
+      for key, value in tree.items()
+  }
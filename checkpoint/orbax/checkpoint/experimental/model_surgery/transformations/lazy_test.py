@@ -0,0 +1,207 @@
+# Copyright 2026 The Orbax Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lazy arrays in model surgery."""
+
+import json
+
+from absl.testing import absltest
+from absl.testing import parameterized
+from etils import epath
+import jax
+import numpy as np
+from orbax.checkpoint.experimental.model_surgery.transformations import fusing
+from orbax.checkpoint.experimental.model_surgery.transformations import lazy
+from orbax.checkpoint.experimental.model_surgery.transformations import repeating
+from orbax.checkpoint.experimental.model_surgery.transformations import stacking
+import tensorstore as ts
+
+
+_INDICES = (
+    (),
+    (slice(1, 3),),
+    (slice(None), slice(1, None)),
+    (slice(0, 4, 2), slice(2, 3)),
+    (slice(3, 1),),
+)
+
+
+def _write_safetensors(path: epath.Path, tensors: dict[str, np.ndarray]):
+  header = {}
+  data = []
+  offset = 0
+  for name, value in tensors.items():
+    header[name] = {
+        "dtype": {np.dtype(np.float32): "F32", np.dtype(np.int32): "I32"}[
+            value.dtype
+        ],
+        "shape": list(value.shape),
+        "data_offsets": [offset, offset + value.nbytes],
+    }
+    data.append(value.tobytes())
+    offset += value.nbytes
+  header = json.dumps(header).encode("utf-8")
+  path.write_bytes(
+      len(header).to_bytes(8, "little") + header + b"".join(data)
+  )
+
+
+class LazyTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.arrays = [
+        np.arange(i * 12, (i + 1) * 12, dtype=np.float32).reshape(4, 3)
+        for i in range(3)
+    ]
+
+  @parameterized.parameters(*_INDICES)
+  def test_stack(self, *index):
+    stacked = lazy.stack(self.arrays, axis=1)
+    expected = np.stack(self.arrays, axis=1)
+    self.assertEqual(stacked.shape, expected.shape)
+    np.testing.assert_array_equal(stacked.read(index), expected[index])
+
+  @parameterized.parameters(*_INDICES)
+  def test_concatenate(self, *index):
+    concatenated = lazy.concatenate(self.arrays, axis=0)
+    expected = np.concatenate(self.arrays, axis=0)
+    self.assertEqual(concatenated.shape, expected.shape)
+    np.testing.assert_array_equal(concatenated.read(index), expected[index])
+
+  @parameterized.parameters(*_INDICES)
+  def test_repeat(self, *index):
+    repeated = lazy.repeat(self.arrays[0], 3, axis=0)
+    expected = np.repeat(self.arrays[0], 3, axis=0)
+    self.assertEqual(repeated.shape, expected.shape)
+    np.testing.assert_array_equal(repeated.read(index), expected[index])
+
+  def test_reads_only_requested_slices(self):
+    reads = []
+
+    def _read(x):
+      def read_fn(index):
+        reads.append(index)
+        return x[index]
+
+      # pylint: disable-next=protected-access
+      return lazy._SourceArray(x.shape, x.dtype, read_fn)
+
+    stacked = lazy.stack([_read(x) for x in self.arrays])
+    np.testing.assert_array_equal(
+        stacked.read((slice(1, 2), slice(0, 2))), self.arrays[1][None, 0:2]
+    )
+    self.assertEqual(reads, [(slice(0, 2, 1), slice(0, 3, 1))])
+
+  def _counting_source(self, x: np.ndarray, reads: list[tuple[slice, ...]]):
+    def read_fn(index):
+      reads.append(index)
+      return x[index]
+
+    # pylint: disable-next=protected-access
+    return lazy._SourceArray(x.shape, x.dtype, read_fn)
+
+  @parameterized.parameters(None, 1, 1 << 20)
+  def test_materialize_sharded(self, concurrent_bytes):
+    devices = np.asarray(jax.devices())
+    mesh = jax.sharding.Mesh(devices.reshape(1, -1), ("x", "y"))
+    x = np.arange(4 * 3 * len(devices), dtype=np.float32).reshape(4, -1)
+    reads = []
+    result = lazy.materialize(
+        self._counting_source(x, reads),
+        jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec("x", "y")),
+        concurrent_bytes=concurrent_bytes,
+    )
+    np.testing.assert_array_equal(result, x)
+    self.assertLen(reads, len(devices))
+
+  def test_materialize_replicated_reads_once(self):
+    devices = np.asarray(jax.devices())
+    mesh = jax.sharding.Mesh(devices, ("x",))
+    reads = []
+    result = lazy.materialize(
+        self._counting_source(self.arrays[0], reads),
+        jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec()),
+    )
+    np.testing.assert_array_equal(result, self.arrays[0])
+    self.assertLen(result.addressable_shards, len(devices))
+    self.assertEqual(reads, [(slice(0, 4, 1), slice(0, 3, 1))])
+
+  def test_from_tensorstore(self):
+    t = ts.open(
+        {"driver": "array", "array": self.arrays[0], "dtype": "float32"}
+    ).result()
+    x = lazy.from_tensorstore(t)
+    np.testing.assert_array_equal(
+        x.read((slice(1, 3),)), self.arrays[0][1:3]
+    )
+
+  def test_open_safetensors(self):
+    path = epath.Path(self.create_tempdir().full_path) / "model.safetensors"
+    tensors = {"a": self.arrays[0], "b": np.arange(5, dtype=np.int32)}
+    _write_safetensors(path, tensors)
+    arrays = lazy.open_safetensors(path.parent)
+    self.assertSameElements(arrays.keys(), tensors.keys())
+    for name, value in tensors.items():
+      self.assertEqual(arrays[name].dtype, value.dtype)
+      np.testing.assert_array_equal(arrays[name].read(), value)
+    np.testing.assert_array_equal(
+        arrays["a"].read((slice(1, 4, 2), slice(1, 3))),
+        tensors["a"][1:4:2, 1:3],
+    )
+
+  def test_transformations(self):
+    params = {
+        "layers.0.gate": lazy.from_array(self.arrays[0]),
+        "layers.0.up": lazy.from_array(self.arrays[1]),
+        "layers.1.gate": lazy.from_array(self.arrays[2]),
+        "layers.1.up": lazy.from_array(self.arrays[0]),
+    }
+    params = fusing.fuse_by_pattern(
+        pattern=r"^layers\.\d+\.(gate|up)$",
+        unique_parts=["gate", "up"],
+        fused_unique_part="gate_up",
+    )(params)
+    params = repeating.repeat_by_pattern(
+        pattern=r".*gate_up$", dimension=1, repeat_count=2
+    )(params)
+    sharding = jax.sharding.SingleDeviceSharding(jax.devices()[0])
+    params = stacking.stack(r"layers\.(\d+\.)", target_sharding=sharding)(
+        params
+    )
+
+    expected = np.stack([
+        np.repeat(np.concatenate(self.arrays[:2]), 2, axis=1),
+        np.repeat(np.concatenate([self.arrays[2], self.arrays[0]]), 2, axis=1),
+    ])
+    self.assertIsInstance(params["layers.gate_up"], jax.Array)
+    np.testing.assert_array_equal(params["layers.gate_up"], expected)
+
+  def test_stack_with_filler(self):
+    params = {
+        "layers.0.w": lazy.from_array(self.arrays[0]),
+        "layers.2.w": lazy.from_array(self.arrays[2]),
+    }
+    result = stacking.stack(
+        r"layers\.(\d+\.)", expected_count=3, default_filler=-1.0
+    )(params)
+    self.assertTrue(lazy.is_lazy(result["layers.w"]))
+    np.testing.assert_array_equal(
+        lazy.materialize(result["layers.w"]),
+        np.stack([self.arrays[0], -np.ones((4, 3)), self.arrays[2]]),
+    )
+
+
+if __name__ == "__main__":
+  absltest.main()
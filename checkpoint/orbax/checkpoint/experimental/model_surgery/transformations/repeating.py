@@ -22,6 +22,7 @@ from absl import logging
 import jax
 import jax.numpy as jnp
 import numpy as np
+from orbax.checkpoint.experimental.model_surgery.transformations import lazy
 from orbax.checkpoint.experimental.model_surgery.transformations import types
 
 
@@ -39,7 +40,9 @@ def _cpu_repeat(array, *, repeats, axis):
 
 
 def _repeat_val(val, dimension: int, repeat_count: int) -> jax.Array:
-  if _is_host_array(val):
+  if lazy.is_lazy(val):
+    return lazy.repeat(val, repeat_count, axis=dimension)  # pyrefly: ignore[bad-return]
+  elif _is_host_array(val):
     # Ensure that host arrays are repeated on CPU, to avoid unnecessary
     # device transfers.
     return _cpu_repeat(val, repeats=repeat_count, axis=dimension)
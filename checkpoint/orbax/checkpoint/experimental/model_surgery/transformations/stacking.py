@@ -22,6 +22,7 @@ from absl import logging
 import jax
 import jax.numpy as jnp
 import numpy as np
+from orbax.checkpoint.experimental.model_surgery.transformations import lazy
 from orbax.checkpoint.experimental.model_surgery.transformations import types
 
 
@@ -79,6 +80,7 @@ def _select_stack_fn(
 ) -> Callable[[Sequence[jax.Array | np.ndarray], int], jax.Array | np.ndarray]:
   """Selects the stack function based on the input array sharding.
 
+  * If any of the `items` is a `lazy.LazyArray`, use lazy.stack.
   * If any of the `items` is a numpy array, use np.stack.
   * If a sharding is specified and all the `items` are jax arrays that live in
     host memory, use _streaming_stack.
@@ -91,6 +93,8 @@ def _select_stack_fn(
   Returns:
     The stack function to use for the given items.
   """
+  if any(lazy.is_lazy(x) for x in items):
+    return lazy.stack
   if any(isinstance(x, np.ndarray) for x in items):
     return np.stack
   if sharding is not None and all(_is_host_array(x) for x in items):
@@ -98,6 +102,43 @@ def _select_stack_fn(
   return jnp.stack
 
 
+def _lazy_stack_with_filler(
+    base_key: str,
+    idx_dict: Mapping[int, jax.Array | lazy.LazyArray],
+    expected_count: int,
+    axis: int,
+    filler_val: float,
+) -> lazy.LazyArray:
+  """Lazily stacks `idx_dict`, filling missing indices with `filler_val`."""
+  if len(idx_dict) > expected_count:
+    raise ValueError(
+        f"Found {len(idx_dict)} items, but expected maximum"
+        f" {expected_count} for {base_key}"
+    )
+  for idx in idx_dict:
+    if idx >= expected_count:
+      logging.warning(
+          "Stacking %s: Found %d items, expected %d. Skipping index %d.",
+          base_key,
+          len(idx_dict),
+          expected_count,
+          idx,
+      )
+  rep_val = next(iter(idx_dict.values()))
+  filler = lazy.full(rep_val.shape, rep_val.dtype, filler_val)
+  if len(idx_dict) != expected_count:
+    logging.warning(
+        "Stacking %s: Found %d items, expected %d. Padded with %s.",
+        base_key,
+        len(idx_dict),
+        expected_count,
+        filler_val,
+    )
+  return lazy.stack(
+      [idx_dict.get(i, filler) for i in range(expected_count)], axis
+  )
+
+
 def stack(
     pattern: str,
     *,
@@ -149,7 +190,8 @@ def stack(
       sort_by_size: If True, stacks largest parameters first to manage peak
         headroom.
       target_sharding: If not None, reshards the stacked parameter to this
-        sharding.
+        sharding. Stacked `lazy.LazyArray` parameters are read directly into
+        the shards of this sharding; without it, they stay lazy.
 
   Returns:
       A Transformation function.
@@ -212,6 +254,11 @@ def stack(
     # Determine types and stack function (use NumPy if inputs are NumPy)
     rep_val = next(iter(next(iter(groups.values())).values()))
     is_numpy = isinstance(rep_val, np.ndarray)
+    is_lazy = any(
+        lazy.is_lazy(v)
+        for idx_dict in groups.values()
+        for v in idx_dict.values()
+    )
     ones_fn = np.ones if is_numpy else jnp.ones
 
     # Determine expected_count if not provided
@@ -255,6 +302,14 @@ def stack(
         stacked = stack_fn(items_to_stack, axis)
         if target_sharding is not None and stack_fn in (np.stack, jnp.stack):
           stacked = jax.device_put(stacked, target_sharding)
+        elif target_sharding is not None and stack_fn is lazy.stack:
+          stacked = lazy.materialize(stacked, target_sharding)
+      elif is_lazy:
+        stacked = _lazy_stack_with_filler(
+            base_key, idx_dict, local_expected_count, axis, filler_val
+        )
+        if target_sharding is not None:
+          stacked = lazy.materialize(stacked, target_sharding)
       else:
         # Find representative shape/dtype
         rep_val = next(iter(idx_dict.values()))
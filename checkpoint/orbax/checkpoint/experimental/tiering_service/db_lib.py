@@ -290,13 +290,13 @@ async def _has_eligible_jobs(
   return result.scalar() is not None
 
 
-async def _try_lock_backend(
+async def _lock_backend_capacity(
     session: AsyncSession,
     backend_id: int,
     max_active: int,
     now: datetime.datetime,
-) -> bool:
-  """Locks the backend and returns True if it has capacity for more jobs."""
+) -> int:
+  """Locks the backend and returns how many more jobs it can take."""
   # Lock only this specific backend to avoid race conditions.
   backend_stmt = (
       select(db_schema.StorageBackend)
@@ -322,18 +322,19 @@ async def _try_lock_backend(
   active_count_result = await session.execute(active_count_stmt)
   active_count = active_count_result.scalar() or 0
 
-  return active_count < max_active
+  return max(max_active - active_count, 0)
 
 
-async def _claim_eligible_job(
+async def _claim_eligible_jobs(
     session: AsyncSession,
     backend_id: int | None,
     lease_duration: datetime.timedelta,
     hostname: str,
     pid: int,
     now: datetime.datetime,
-) -> db_schema.AssetJob | None:
-  """Fetches and claims the next eligible job, if any."""
+    max_jobs: int,
+) -> list[db_schema.AssetJob]:
+  """Fetches and claims up to `max_jobs` eligible jobs, oldest first."""
   active_assets_subquery = (
       select(db_schema.AssetJob.asset_uuid)
       .where(
@@ -354,9 +355,9 @@ async def _claim_eligible_job(
   # 2. Jobs targeting assets that aren't already actively being processed by
   #    another job, preventing concurrency conflicts on the same asset.
   # 3. Jobs belonging to the requested storage backend.
-  # We select the oldest job (FIFO order) and use SKIP LOCKED concurrency
+  # We select the oldest jobs (FIFO order) and use SKIP LOCKED concurrency
   # control to prevent multiple workers from matching or blocking on the same
-  # job.
+  # jobs.
   stmt = (
       select(db_schema.AssetJob)
       .options(
@@ -386,14 +387,20 @@ async def _claim_eligible_job(
           backend_cond,
       )
       .order_by(db_schema.AssetJob.created_at.asc())
-      .limit(1)
+      .limit(max_jobs)
       .with_for_update(skip_locked=True)
   )
 
   result = await session.execute(stmt)
-  job = result.scalars().first()
+  jobs = []
+  claimed_assets = set()
+  for job in result.scalars().all():
+    # The active assets subquery only sees jobs claimed before this statement,
+    # so keep at most one job per asset within the batch as well.
+    if job.asset_uuid in claimed_assets:
+      continue
+    claimed_assets.add(job.asset_uuid)
 
-  if job:
     # Atomically claim the job
     job.status = db_schema.JobStatus.JOB_STATUS_PROCESSING
     job.expiration_at = now + lease_duration
@@ -407,33 +414,37 @@ async def _claim_eligible_job(
     ):
       job.target_tier_path.state = db_schema.TierPathState.IN_PROGRESS
       session.add(job.target_tier_path)  # pyrefly: ignore[missing-attribute]
+    jobs.append(job)
 
-  return job
+  return jobs
 
 
-async def acquire_next_job(
+async def acquire_next_jobs(
     session_maker: sessionmaker | async_sessionmaker,
     backend_id: int | None,
     lease_duration: datetime.timedelta,
     hostname: str,
     pid: int,
     max_active: int,
-) -> db_schema.AssetJob | None:
-  """Queries the database for the next eligible job on the given backend and claims it.
+    max_jobs: int,
+) -> list[db_schema.AssetJob]:
+  """Claims up to `max_jobs` eligible jobs on a backend in one transaction.
 
   Args:
     session_maker: A session maker or session factory. MUST be configured with
       `expire_on_commit=False` to prevent returned Job relationships from being
       expired upon transaction commit.
     backend_id: The ID of the storage backend.
-    lease_duration: Lease duration for the claimed job.
+    lease_duration: Lease duration for the claimed jobs.
     hostname: Hostname of the claiming worker.
     pid: PID of the claiming worker.
-    max_active: Maximum active jobs allowed on this backend.
+    max_active: Maximum active jobs allowed on this backend. Fewer than
+      `max_jobs` jobs are claimed if the backend is close to capacity.
+    max_jobs: Maximum number of jobs to claim.
 
   Returns:
-    The claimed AssetJob instance, or None if no eligible jobs are available or
-    if capacity is full.
+    The claimed AssetJob instances, oldest first. Empty if no eligible jobs are
+    available or if capacity is full.
   """
   now = datetime.datetime.now(datetime.timezone.utc)
 
@@ -443,23 +454,63 @@ async def acquire_next_job(
       # Check if there are any jobs at all before acquiring locks
       if not await _has_eligible_jobs(session, backend_id, now):
         await session.rollback()
-        return None
+        return []
 
       if backend_id is not None:
-        if not await _try_lock_backend(session, backend_id, max_active, now):
-          # no jobs available on this backend, release lock and return None
+        capacity = await _lock_backend_capacity(
+            session, backend_id, max_active, now
+        )
+        if not capacity:
+          # no jobs available on this backend, release lock and return
           await session.rollback()
-          return None
+          return []
+        max_jobs = min(max_jobs, capacity)
 
-      job = await _claim_eligible_job(
-          session, backend_id, lease_duration, hostname, pid, now
+      jobs = await _claim_eligible_jobs(
+          session, backend_id, lease_duration, hostname, pid, now, max_jobs
       )
-      if job is None:
+      if not jobs:
         await session.rollback()
-        return None
+        return []
 
       await session.commit()
-      return job
+      return jobs
     except Exception:
       await session.rollback()
       raise
+
+
+async def acquire_next_job(
+    session_maker: sessionmaker | async_sessionmaker,
+    backend_id: int | None,
+    lease_duration: datetime.timedelta,
+    hostname: str,
+    pid: int,
+    max_active: int,
+) -> db_schema.AssetJob | None:
+  """Queries the database for the next eligible job on the given backend and claims it.
+
+  Args:
+    session_maker: A session maker or session factory. MUST be configured with
+      `expire_on_commit=False` to prevent returned Job relationships from being
+      expired upon transaction commit.
+    backend_id: The ID of the storage backend.
+    lease_duration: Lease duration for the claimed job.
+    hostname: Hostname of the claiming worker.
+    pid: PID of the claiming worker.
+    max_active: Maximum active jobs allowed on this backend.
+
+  Returns:
+    The claimed AssetJob instance, or None if no eligible jobs are available or
+    if capacity is full.
+  """
+  jobs = await acquire_next_jobs(
+      session_maker,
+      backend_id,
+      lease_duration,
+      hostname,
+      pid,
+      max_active,
+      max_jobs=1,
+  )
+  return jobs[0] if jobs else None
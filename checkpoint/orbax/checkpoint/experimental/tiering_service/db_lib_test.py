@@ -368,6 +368,179 @@ class DbLibTest(absltest.TestCase, unittest.IsolatedAsyncioTestCase):
         session2.add(backend_row)
     await engine.dispose()
 
+  async def test_acquire_next_jobs_claims_one_job_per_asset(self):
+    tmp_file = self.create_tempfile()
+    db_url = f"sqlite+aiosqlite:///{tmp_file.full_path}"
+    yaml_content = textwrap.dedent(f"""\
+        db_connection_str: {db_url}
+        storage_backends:
+          - level: 0
+            backend_type: BACKEND_TYPE_LUSTRE
+            prefix: /mnt/lustre
+            zone: us-central1-a
+          - level: 0
+            backend_type: BACKEND_TYPE_LUSTRE
+            prefix: /mnt/lustre2
+            zone: us-central1-b
+    """)
+    config_dict = yaml.safe_load(yaml_content)
+    config = server_config.parse_config(config_dict)
+    await db_lib.async_initialize_db(config)
+
+    engine = db_lib.get_async_engine(config)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session() as session:
+      result = await session.execute(
+          select(db_schema.StorageBackend).order_by(db_schema.StorageBackend.id)
+      )
+      backend_ids = [backend.id for backend in result.scalars().all()]
+      self.assertLen(backend_ids, 2)
+
+      # Two queued jobs for asset "uuid-a", one per backend, since an asset
+      # has at most one TierPath per backend, and one job for asset "uuid-b".
+      for asset_uuid, num_jobs in (("uuid-a", 2), ("uuid-b", 1)):
+        session.add(
+            db_schema.Asset(
+                asset_uuid=asset_uuid,
+                path=f"/path/{asset_uuid}",
+                user="test-user",
+                state=db_schema.AssetState.ASSET_STATE_STORED,
+            )
+        )
+        await session.commit()
+        for i in range(num_jobs):
+          tier_path = db_schema.TierPath(
+              asset_uuid=asset_uuid,
+              storage_backend_id=backend_ids[i],
+              path=f"/mnt/lustre{i}/{asset_uuid}",
+          )
+          session.add(tier_path)
+          await session.commit()
+          session.add(
+              db_schema.AssetJob(
+                  asset_uuid=asset_uuid,
+                  request_type=db_schema.RequestType.REQUEST_TYPE_COPY,
+                  status=db_schema.JobStatus.JOB_STATUS_QUEUED,
+                  target_tier_path_id=tier_path.id,
+              )
+          )
+          await session.commit()
+
+    acquired_jobs = await db_lib.acquire_next_jobs(
+        session_maker=async_session,
+        backend_id=backend_ids[0],
+        lease_duration=datetime.timedelta(minutes=5),
+        hostname="test-host",
+        pid=1234,
+        max_active=10,
+        max_jobs=10,
+    )
+    self.assertCountEqual(
+        [job.asset_uuid for job in acquired_jobs], ["uuid-a", "uuid-b"]
+    )
+    for job in acquired_jobs:
+      self.assertEqual(job.status, db_schema.JobStatus.JOB_STATUS_PROCESSING)
+      self.assertEqual(job.worker_host, "test-host")
+
+    async with async_session() as session:
+      active_jobs = await db_lib.get_active_jobs(
+          session=session, hostname="test-host", pid=1234
+      )
+      self.assertLen(active_jobs, 2)
+
+    # Only one job per asset may be active at a time, so the job on the other
+    # backend is blocked by the active job on its asset.
+    self.assertEmpty(
+        await db_lib.acquire_next_jobs(
+            session_maker=async_session,
+            backend_id=backend_ids[1],
+            lease_duration=datetime.timedelta(minutes=5),
+            hostname="test-host",
+            pid=1234,
+            max_active=10,
+            max_jobs=10,
+        )
+    )
+    await engine.dispose()
+
+  async def test_acquire_next_jobs_limited_by_backend_capacity(self):
+    tmp_file = self.create_tempfile()
+    db_url = f"sqlite+aiosqlite:///{tmp_file.full_path}"
+    yaml_content = textwrap.dedent(f"""\
+        db_connection_str: {db_url}
+        storage_backends:
+          - level: 1
+            backend_type: BACKEND_TYPE_GCS
+            prefix: gs://my-bucket
+            region: us-central1
+    """)
+    config_dict = yaml.safe_load(yaml_content)
+    config = server_config.parse_config(config_dict)
+    await db_lib.async_initialize_db(config)
+
+    engine = db_lib.get_async_engine(config)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session() as session:
+      result = await session.execute(select(db_schema.StorageBackend))
+      backend = result.scalars().first()
+      assert backend is not None
+      backend_id = backend.id
+
+      for i in range(3):
+        asset_uuid = f"uuid-{i}"
+        session.add(
+            db_schema.Asset(
+                asset_uuid=asset_uuid,
+                path=f"/path/{i}",
+                user="test-user",
+                state=db_schema.AssetState.ASSET_STATE_STORED,
+            )
+        )
+        await session.commit()
+        tier_path = db_schema.TierPath(
+            asset_uuid=asset_uuid,
+            storage_backend_id=backend_id,
+            path=f"/mnt/lustre/{i}",
+        )
+        session.add(tier_path)
+        await session.commit()
+        session.add(
+            db_schema.AssetJob(
+                asset_uuid=asset_uuid,
+                request_type=db_schema.RequestType.REQUEST_TYPE_COPY,
+                status=db_schema.JobStatus.JOB_STATUS_QUEUED,
+                target_tier_path_id=tier_path.id,
+            )
+        )
+        await session.commit()
+
+    acquired_jobs = await db_lib.acquire_next_jobs(
+        session_maker=async_session,
+        backend_id=backend_id,
+        lease_duration=datetime.timedelta(minutes=5),
+        hostname="test-host",
+        pid=1234,
+        max_active=2,
+        max_jobs=10,
+    )
+    self.assertLen(acquired_jobs, 2)
+
+    # The backend is now at capacity.
+    self.assertEmpty(
+        await db_lib.acquire_next_jobs(
+            session_maker=async_session,
+            backend_id=backend_id,
+            lease_duration=datetime.timedelta(minutes=5),
+            hostname="test-host",
+            pid=1234,
+            max_active=2,
+            max_jobs=10,
+        )
+    )
+    await engine.dispose()
+
 
 if __name__ == "__main__":
   absltest.main()
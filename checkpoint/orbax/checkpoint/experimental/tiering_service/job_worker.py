@@ -16,9 +16,15 @@
 
 Consumes queued AssetJobs and manages the asynchronous data movement (eg. Lustre
 - GCS import/export).
+
+Each acquisition round claims a batch of jobs per backend in one transaction
+and processes them concurrently, up to `max_concurrent_jobs` at a time. The
+worker sleeps for `poll_interval_seconds` between rounds unless `notify()` wakes
+it early, e.g. when a job is queued or a running job finishes.
 """
 
 import asyncio
+import contextlib
 import datetime
 import os
 import random
@@ -40,6 +46,32 @@ from sqlalchemy.orm import sessionmaker
 _EXTRA_KEYS = frozenset({"bytes_copied", "total_bytes", "error"})
 
 
+def _is_sqlite(session_maker: sessionmaker | async_sessionmaker | None) -> bool:
+  """Returns whether `session_maker` is bound to a SQLite database."""
+  bind = getattr(session_maker, "kw", {}).get("bind")
+  dialect = getattr(bind, "dialect", None)
+  return getattr(dialect, "name", None) == "sqlite"
+
+
+class _SerializedSessionMaker:
+  """Session maker that lets only one of its sessions be open at a time.
+
+  SQLite locks whole tables for a write transaction and fails concurrent
+  writers with `database table is locked` instead of waiting for them. Jobs
+  processed concurrently by a worker therefore take turns using the database.
+  """
+
+  def __init__(self, session_maker: sessionmaker | async_sessionmaker):
+    self._session_maker = session_maker
+    self._lock = asyncio.Lock()
+
+  @contextlib.asynccontextmanager
+  async def __call__(self):
+    async with self._lock:
+      async with self._session_maker() as session:
+        yield session
+
+
 class TieringServiceWorker:
   """Background worker that processes AssetJobs."""
 
@@ -50,6 +82,7 @@ class TieringServiceWorker:
       *,
       lease_duration_seconds: int = 60,
       poll_interval_seconds: int = 10,
+      max_concurrent_jobs: int = 16,
   ):
     """Initializes the background worker.
 
@@ -58,15 +91,24 @@ class TieringServiceWorker:
       config: The server configuration.
       lease_duration_seconds: Duration of the lease acquired for jobs.
       poll_interval_seconds: Polling interval for checking job status.
+      max_concurrent_jobs: Maximum number of acquired jobs processed at once.
+        Jobs are only claimed when there is room for them, so claimed jobs
+        never wait for a slot while their lease runs. On SQLite, the jobs
+        still take turns using the database.
     """
+    if _is_sqlite(session_maker):
+      session_maker = _SerializedSessionMaker(session_maker)
     self._session_maker = session_maker
     self._config = config
     self._lease_duration = datetime.timedelta(seconds=lease_duration_seconds)
     self._poll_interval = poll_interval_seconds
+    self._max_concurrent_jobs = max_concurrent_jobs
     self._hostname = socket.gethostname()
     self._pid = os.getpid()
     self._tasks = []
     self._shutdown_event = asyncio.Event()
+    self._wakeup_event = asyncio.Event()
+    self._running_jobs: dict[int, asyncio.Task[None]] = {}
     self._backends = None
     self._backends_to_try = []
     self._delete_queue = asyncio.Queue()
@@ -101,40 +143,70 @@ class TieringServiceWorker:
     """Stops the background worker loops gracefully."""
     logging.info("Stopping TieringServiceWorker...")
     self._shutdown_event.set()
+    self._wakeup_event.set()
     if self._delete_worker_task:
       self._delete_worker_task.cancel()
     if self._tasks:
       # Wait for tasks to finish
       await asyncio.gather(*self._tasks, return_exceptions=True)
       self._tasks.clear()
+    if self._running_jobs:
+      # Let in-flight jobs record their outcome before the DB goes away.
+      await asyncio.gather(
+          *self._running_jobs.values(), return_exceptions=True
+      )
     logging.info("TieringServiceWorker stopped.")
 
+  def notify(self):
+    """Wakes the acquisition loop to claim newly queued jobs."""
+    self._wakeup_event.set()
+
+  async def _wait(self, event: asyncio.Event):
+    """Waits until `event` is set or the poll interval elapses."""
+    try:
+      await asyncio.wait_for(event.wait(), timeout=self._poll_interval)
+    except asyncio.TimeoutError:
+      pass
+
   async def _run_acquisition_loop(self):
-    """Periodically acquires and triggers queued jobs."""
+    """Acquires and triggers queued jobs whenever woken or polled."""
     while not self._shutdown_event.is_set():
+      self._wakeup_event.clear()
       try:
-        for backend_id in self._backends_to_try:
-          job = await db_lib.acquire_next_job(
-              session_maker=self._session_maker,  # pyrefly: ignore[bad-argument-type]
-              backend_id=backend_id,
-              lease_duration=self._lease_duration,
-              hostname=self._hostname,
-              pid=self._pid,
-              max_active=self._config.max_active_jobs_per_backend,
-          )
-
-          if job:
-            logging.info(
-                "Acquired job %d for backend %s", job.id, str(backend_id)
-            )
-            await self._process_job(job)
-
-          # Add some random sleep between checks to stagger concurrent workers.
-          await asyncio.sleep(random.uniform(1.0, 5.0))
-
+        await self._acquire_jobs()
       except Exception:  # pylint: disable=broad-except
         logging.exception("Error in job acquisition loop.")
-      await asyncio.sleep(self._poll_interval)
+      await self._wait(self._wakeup_event)
+
+  async def _acquire_jobs(self):
+    """Claims as many jobs as there are free slots, one batch per backend."""
+    for backend_id in self._backends_to_try:
+      free_slots = self._max_concurrent_jobs - len(self._running_jobs)
+      if free_slots <= 0 or self._shutdown_event.is_set():
+        return
+      jobs = await db_lib.acquire_next_jobs(
+          session_maker=self._session_maker,  # pyrefly: ignore[bad-argument-type]
+          backend_id=backend_id,
+          lease_duration=self._lease_duration,
+          hostname=self._hostname,
+          pid=self._pid,
+          max_active=self._config.max_active_jobs_per_backend,
+          max_jobs=free_slots,
+      )
+      for job in jobs:
+        logging.info("Acquired job %d for backend %s", job.id, str(backend_id))
+        self._running_jobs[job.id] = asyncio.create_task(self._run_job(job))
+
+  async def _run_job(self, job: db_schema.AssetJob):
+    """Processes an acquired job, then frees its slot."""
+    try:
+      await self._process_job(job)
+    except Exception:  # pylint: disable=broad-except
+      logging.exception("Error processing job %d", job.id)
+    finally:
+      self._running_jobs.pop(job.id, None)
+      # A slot is free, so look for more work without waiting for the poll.
+      self.notify()
 
   async def _run_polling_loop(self):
     """Periodically polls status of active jobs owned by this worker."""
@@ -143,7 +215,7 @@ class TieringServiceWorker:
         await self._poll_active_jobs()
       except Exception:  # pylint: disable=broad-except
         logging.exception("Error in job polling loop.")
-      await asyncio.sleep(self._poll_interval)
+      await self._wait(self._shutdown_event)
 
   async def _poll_active_jobs(self):
     """Polls status of active jobs owned by this worker."""
@@ -156,10 +228,10 @@ class TieringServiceWorker:
     for job in active_jobs:
       await self._poll_single_job(job, now)
 
-  async def _extend_delete_job_lease(
+  async def _renew_lease(
       self, job: db_schema.AssetJob, now: datetime.datetime
   ):
-    """Extends the lease for an active background delete job."""
+    """Extends the lease of a job that this worker is still working on."""
     async with self._session_maker() as session:  # pyrefly: ignore[not-callable]
       async with session.begin():
         merged_job = await session.get(
@@ -229,11 +301,14 @@ class TieringServiceWorker:
     """Polls a single active copy/delete job and updates its status."""
     logging.info("Polling job %d", job.id)
 
-    if job.request_type in (
+    if job.id in self._running_jobs or job.request_type in (
         db_schema.RequestType.REQUEST_TYPE_DELETE_FROM_INSTANCE,
         db_schema.RequestType.REQUEST_TYPE_DELETE_FROM_ALL_TIERS,
     ):
-      await self._extend_delete_job_lease(job, now)
+      # Delete jobs, and copy jobs still being triggered, have no transfer to
+      # poll. Their lease is only renewed while this process is alive, so a
+      # crash still lets another worker reclaim them.
+      await self._renew_lease(job, now)
     else:
       # a copy job
       await self._poll_copy_job_status(job, now)
@@ -843,6 +918,7 @@ async def run_tiering_service_worker_loop(
     *,
     lease_duration_seconds: int = 60,
     poll_interval_seconds: int = 5,
+    max_concurrent_jobs: int = 16,
 ) -> TieringServiceWorker:
   """Runs the worker loop."""
   worker = TieringServiceWorker(
@@ -850,6 +926,7 @@ async def run_tiering_service_worker_loop(
       config,
       lease_duration_seconds=lease_duration_seconds,
       poll_interval_seconds=poll_interval_seconds,
+      max_concurrent_jobs=max_concurrent_jobs,
   )
   await worker.start()
   return worker
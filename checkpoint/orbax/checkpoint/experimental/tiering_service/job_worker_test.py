@@ -434,6 +434,172 @@ class TieringServiceWorkerTest(
           jobs_list[1].status, db_schema.JobStatus.JOB_STATUS_PROCESSING
       )
 
+  async def test_acquires_batch_of_jobs_per_backend(self):
+    self.config.max_active_jobs_per_backend = 3
+    async with self.session_maker() as session:
+      result = await session.execute(select(db_schema.StorageBackend))
+      backends = result.scalars().all()
+      lustre_a = next(b for b in backends if b.zone == "us-central1-a")
+      gcs = next(b for b in backends if b.region == "us-central1")
+
+      for i in range(3):
+        await self._create_asset_and_job(
+            session,
+            asset_uuid=f"asset-{i}",
+            path=f"path/{i}",
+            target_backend_id=lustre_a.id,
+            source_backend_id=gcs.id,
+        )
+
+    batch_sizes = []
+    acquire_next_jobs = db_lib.acquire_next_jobs
+
+    async def _acquire_next_jobs(*args, **kwargs):
+      jobs = await acquire_next_jobs(*args, **kwargs)
+      if jobs:
+        batch_sizes.append(len(jobs))
+      return jobs
+
+    # Mock poll_operation to return IN_PROGRESS to prevent job completion
+    with mock.patch.object(
+        db_lib, "acquire_next_jobs", side_effect=_acquire_next_jobs
+    ), mock.patch.object(
+        self.gcp_client,
+        "poll_operation",
+        return_value=gcp_storage_client.Result(
+            status=gcp_storage_client.OperationStatus.IN_PROGRESS,
+            detail_info={"bytes_copied": 0, "total_bytes": 100000},
+        ),
+    ):
+      await self.worker.start()
+
+      async def _check():
+        async with self.session_maker() as session:
+          result = await session.execute(select(db_schema.AssetJob))
+          jobs_list = result.scalars().all()
+          return all(
+              j.status == db_schema.JobStatus.JOB_STATUS_PROCESSING
+              and j.transfer_status
+              and "request_id" in j.transfer_status
+              for j in jobs_list
+          )
+
+      await self._wait_for_condition(_check, max_attempts=50, sleep_time=0.1)
+      await self.worker.stop()
+
+    # All three jobs were claimed in a single round trip.
+    self.assertEqual(batch_sizes, [3])
+
+  async def test_max_concurrent_jobs_respected(self):
+    async with self.session_maker() as session:
+      result = await session.execute(select(db_schema.StorageBackend))
+      backends = result.scalars().all()
+      lustre_a = next(b for b in backends if b.zone == "us-central1-a")
+      lustre_b = next(b for b in backends if b.zone == "us-central1-b")
+      gcs = next(b for b in backends if b.region == "us-central1")
+
+      await self._create_asset_and_job(
+          session,
+          asset_uuid="asset-1",
+          path="path/1",
+          target_backend_id=lustre_a.id,
+          source_backend_id=gcs.id,
+      )
+      await self._create_asset_and_job(
+          session,
+          asset_uuid="asset-2",
+          path="path/2",
+          target_backend_id=lustre_b.id,
+          source_backend_id=gcs.id,
+      )
+
+    self.worker = job_worker.TieringServiceWorker(
+        self.session_maker,
+        self.config,
+        lease_duration_seconds=2,
+        poll_interval_seconds=1,
+        max_concurrent_jobs=1,
+    )
+    release_trigger = asyncio.Event()
+    trigger_copy = self.gcp_client.trigger_copy
+
+    async def _blocked_trigger_copy(*args, **kwargs):
+      await release_trigger.wait()
+      return await trigger_copy(*args, **kwargs)
+
+    async def _count_processing():
+      async with self.session_maker() as session:
+        result = await session.execute(select(db_schema.AssetJob))
+        return sum(
+            j.status == db_schema.JobStatus.JOB_STATUS_PROCESSING
+            for j in result.scalars().all()
+        )
+
+    with mock.patch.object(
+        self.gcp_client, "trigger_copy", side_effect=_blocked_trigger_copy
+    ), mock.patch.object(
+        self.gcp_client,
+        "poll_operation",
+        return_value=gcp_storage_client.Result(
+            status=gcp_storage_client.OperationStatus.IN_PROGRESS,
+            detail_info={"bytes_copied": 0, "total_bytes": 100000},
+        ),
+    ):
+      await self.worker.start()
+
+      async def _check_one():
+        return await _count_processing() == 1
+
+      await self._wait_for_condition(_check_one, max_attempts=50, sleep_time=0.1)
+      # Outlive the lease: the running job keeps it, and the other job is not
+      # claimed while the only slot is taken.
+      await asyncio.sleep(3)
+      self.assertEqual(await _count_processing(), 1)
+
+      release_trigger.set()
+
+      async def _check_all():
+        return await _count_processing() == 2
+
+      await self._wait_for_condition(_check_all, max_attempts=50, sleep_time=0.1)
+      await self.worker.stop()
+
+  async def test_notify_wakes_acquisition_loop(self):
+    self.worker = job_worker.TieringServiceWorker(
+        self.session_maker,
+        self.config,
+        lease_duration_seconds=60,
+        poll_interval_seconds=60,
+    )
+    await self.worker.start()
+    # Let the first acquisition round find the queue empty.
+    await asyncio.sleep(0.5)
+
+    async with self.session_maker() as session:
+      result = await session.execute(select(db_schema.StorageBackend))
+      backends = result.scalars().all()
+      lustre_a = next(b for b in backends if b.zone == "us-central1-a")
+      gcs = next(b for b in backends if b.region == "us-central1")
+
+      await self._create_asset_and_job(
+          session,
+          asset_uuid="asset-1",
+          path="path/1",
+          target_backend_id=lustre_a.id,
+          source_backend_id=gcs.id,
+      )
+    self.worker.notify()
+
+    async def _check():
+      async with self.session_maker() as session:
+        result = await session.execute(select(db_schema.AssetJob))
+        job = result.scalars().first()
+        return job.status == db_schema.JobStatus.JOB_STATUS_PROCESSING  # pyrefly: ignore[missing-attribute]
+
+    # Well within the 60 second poll interval.
+    await self._wait_for_condition(_check, max_attempts=50, sleep_time=0.1)
+    await self.worker.stop()
+
   async def test_job_trigger_failure(self):
     async with self.session_maker() as session:
       result = await session.execute(select(db_schema.StorageBackend))
@@ -789,6 +955,41 @@ class TieringServiceWorkerTest(
           expected_expiration.replace(tzinfo=None),
       )
 
+  async def test_poll_running_job_renews_lease(self):
+    async with self.session_maker() as session:
+      result = await session.execute(select(db_schema.StorageBackend))
+      backends = result.scalars().all()
+      lustre_a = next(b for b in backends if b.zone == "us-central1-a")
+      gcs = next(b for b in backends if b.region == "us-central1")
+
+      # A copy job still being triggered has no transfer status yet.
+      job, _ = await self._create_asset_and_job(
+          session,
+          asset_uuid="asset-running-lease",
+          path="path/running/lease",
+          target_backend_id=lustre_a.id,
+          source_backend_id=gcs.id,
+          job_status=db_schema.JobStatus.JOB_STATUS_PROCESSING,
+      )
+      job.worker_host = self.worker._hostname
+      job.worker_pid = self.worker._pid
+      job.expiration_at = datetime.datetime.now(
+          datetime.timezone.utc
+      ) - datetime.timedelta(seconds=10)
+      await session.commit()
+
+    self.worker._running_jobs[job.id] = asyncio.create_task(asyncio.sleep(0))
+    now = datetime.datetime.now(datetime.timezone.utc)
+    await self.worker._poll_single_job(job, now)
+
+    async with self.session_maker() as session:
+      db_job = await session.get(db_schema.AssetJob, job.id)
+      expected_expiration = now + self.worker._lease_duration
+      self.assertEqual(
+          db_job.expiration_at.replace(tzinfo=None),  # pyrefly: ignore[missing-attribute]
+          expected_expiration.replace(tzinfo=None),
+      )
+
   async def test_custom_transfer_status_details_preserved(self):
     async with self.session_maker() as session:
       result = await session.execute(select(db_schema.StorageBackend))
@@ -15,7 +15,7 @@
 """Checkpoint Tiering Service (CTS) Server implementation."""
 
 import asyncio
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from concurrent import futures
 import contextlib
 import datetime
@@ -70,12 +70,22 @@ class TieringServiceServicer(tiering_service_pb2_grpc.TieringServiceServicer):
         expire_on_commit=False,
     )
     self._level0_backends: Sequence[db_schema.StorageBackend] | None = None
+    self._job_listeners: list[Callable[[], None]] = []
 
   @property
   def session_maker(self) -> sessionmaker | async_sessionmaker:
     """The session maker for the database."""
     return self._session_maker
 
+  def add_job_listener(self, listener: Callable[[], None]) -> None:
+    """Registers a callback invoked after a job is committed to the queue."""
+    self._job_listeners.append(listener)
+
+  def _notify_job_queued(self) -> None:
+    """Tells the registered listeners that a job was queued."""
+    for listener in self._job_listeners:
+      listener()
+
   async def initialize(self) -> None:
     """Initializes the servicer, loading static data."""
     async with self._session_maker() as session:
@@ -274,6 +284,7 @@ class TieringServiceServicer(tiering_service_pb2_grpc.TieringServiceServicer):
 
         # default policy to preserve it from L0 to L1
         await assets.trigger_l0_to_l1_copy(session, db_asset)
+        self._notify_job_queued()
       except ValueError as e:
         logging.exception("Finalize failed for UUID: %s", request.uuid)
         await context.abort(
@@ -387,6 +398,8 @@ class TieringServiceServicer(tiering_service_pb2_grpc.TieringServiceServicer):
             ),
         )
         db_asset = result.asset
+        if result.created:
+          self._notify_job_queued()
       except assets.DeletionPendingError:
         identifier = request.uuid if request.HasField("uuid") else request.path
         error_msg = f"Prefetch: Asset {identifier} is marked for deletion"
@@ -539,6 +552,7 @@ class TieringServiceServicer(tiering_service_pb2_grpc.TieringServiceServicer):
       )
       try:
         await assets.queue_delete_asset_job(session, db_asset)
+        self._notify_job_queued()
       except Exception:  # pylint: disable=broad-except
         logging.exception(
             "Failed to queue delete job for asset: %r", db_asset.asset_uuid
@@ -624,6 +638,7 @@ class CtsServer:
         worker = await job_worker.run_tiering_service_worker_loop(
             servicer.session_maker, config
         )
+        servicer.add_job_listener(worker.notify)
 
       await server.wait_for_termination()
     finally:
@@ -347,6 +347,17 @@ class TieringServiceTest(
       self.assertLen(jobs, 1)
       self.assertEqual(jobs[0].status, db_schema.JobStatus.JOB_STATUS_QUEUED)
 
+  async def test_delete_notifies_job_listeners(self):
+    asset_uuid = await self._reserve_asset()
+    listener = mock.Mock()
+    self.servicer.add_job_listener(listener)
+
+    await self.servicer.Delete(
+        tiering_service_pb2.DeleteRequest(uuid=asset_uuid), self.context
+    )
+
+    listener.assert_called_once_with()
+
   async def test_delete_finalized_success(self):
     asset_uuid = await self._reserve_asset()
     await self.servicer.Finalize(
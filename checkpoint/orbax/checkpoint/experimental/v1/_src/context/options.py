@@ -609,6 +609,11 @@ class MemoryOptions(_ActiveContextGuard):
     serialization_status_callback: A callback object that is called at various
       points during the save process per keypath, allowing for monitoring or
       control over the save process.
+    host_buffer_pool_bytes: Byte budget of the pool of host buffers that arrays
+      are transferred into, which later saves reuse instead of allocating
+      again. Pooled buffers stay allocated between saves, so resident host
+      memory grows by up to this many bytes. `None` uses a default budget, and
+      0 disables the pool.
   """
 
   write_concurrent_bytes: int | None = None
@@ -618,15 +623,18 @@ class MemoryOptions(_ActiveContextGuard):
   serialization_status_callback: (
       serialization_types.SerializationStatusCallback | None
   ) = None
+  host_buffer_pool_bytes: int | None = None
 
 
 @dataclasses.dataclass(kw_only=True)
 class SafetensorsOptions(_ActiveContextGuard):
-  """Options for configuring Safetensors loading.
+  """Options for configuring Safetensors loading and saving.
 
   In-flight read bytes are bounded by `MemoryOptions.read_concurrent_bytes`,
   shared with the rest of restore (the loader falls back to a 2 GiB default
-  when it is unset, since its streaming path needs a finite budget).
+  when it is unset, since its streaming path needs a finite budget). When
+  saving, host copies of array shards are bounded by
+  `MemoryOptions.transfer_concurrent_bytes`.
 
   Attributes:
     max_over_read_ratio: Maximum tolerated `block_size / needed_bytes` when
@@ -647,10 +655,18 @@ class SafetensorsOptions(_ActiveContextGuard):
       (`MemoryOptions.read_concurrent_bytes`), which also caps concurrent
       requests at `budget / read_chunk_bytes` per host. `None` selects an
       implementation default (currently 128 MiB).
+    max_file_bytes: Maximum bytes of tensor data per file when saving. Tensors
+      exceeding it in total are split over files named
+      `model-00001-of-0000N.safetensors`, along with a
+      `model.safetensors.index.json` mapping each tensor to its file, as in
+      sharded HuggingFace checkpoints. A tensor larger than `max_file_bytes`
+      gets a file of its own. `None` (the default) saves every tensor to a
+      single `model.safetensors`.
   """
 
   max_over_read_ratio: float | None = None
   read_chunk_bytes: int | None = None
+  max_file_bytes: int | None = None
 
 
 class CheckpointLayout(enum.Enum):
@@ -661,11 +677,11 @@ class CheckpointLayout(enum.Enum):
   interoperatibility with other checkpointing libraries.
 
   The Safetensors format, commonly used by checkpoints on HuggingFace,
-  is supported by Orbax for loading as a tree of `jax.Array`. Standard Orbax
-  usages apply, where a tree of `jax.ShapeDtypeStruct` may be specified to
-  dictate shardings. An abstract state is required when loading in a multi-host
-  setting; if not specified in a single-host setting, arrays will be loaded in
-  memory as numpy arrays.
+  is supported by Orbax for loading as a tree of `jax.Array`, and for saving a
+  flat dict of arrays. Standard Orbax usages apply, where a tree of
+  `jax.ShapeDtypeStruct` may be specified to dictate shardings. An abstract
+  state is required when loading in a multi-host setting; if not specified in a
+  single-host setting, arrays will be loaded in memory as numpy arrays.
 
   Example usage for loading a Safetensors checkpoint::
 
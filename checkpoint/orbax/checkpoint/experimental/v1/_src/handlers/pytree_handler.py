@@ -116,6 +116,7 @@ def _create_v0_handler(
       array_metadata_validator=array_metadata_validator,
       enable_pinned_host_transfer=context.array_options.saving.enable_pinned_host_transfer,
       is_prioritized_key_fn=context.memory_options.is_prioritized_key_fn,
+      host_buffer_pool_bytes=context.memory_options.host_buffer_pool_bytes,
   )
 
 
@@ -39,15 +39,23 @@ whole-file case especially -- is fetched as parallel ranged reads instead of
 one long single-stream read. As each file's reads complete, its tensors are
 assembled into `jax.Array`s and their host buffers released while other files
 are still reading.
+
+Chunks are read on a dedicated I/O thread pool, one thread hop per chunk. On
+local files, each chunk is a single `os.preadv` scattering its bytes straight
+into the pre-allocated destination buffers, so the budget above only covers
+the gaps read between them; other files are read into a temporary buffer and
+copied out.
 """
 
 import asyncio
 import collections
 from collections.abc import Awaitable, Callable, Sequence
+from concurrent import futures
 import dataclasses
 import itertools
 import json
 import math
+import os
 import time
 from typing import Any, NamedTuple, cast
 
@@ -66,6 +74,8 @@ from orbax.checkpoint.experimental.v1._src.context import context as context_lib
 from orbax.checkpoint.experimental.v1._src.layout import checkpoint_layout
 from orbax.checkpoint.experimental.v1._src.metadata import types as metadata_types
 from orbax.checkpoint.experimental.v1._src.path import types
+from orbax.checkpoint.experimental.v1._src.synchronization import multihost as sync_multihost
+from orbax.checkpoint.experimental.v1._src.synchronization import synchronization
 
 CheckpointLayout = checkpoint_layout.CheckpointLayout
 InvalidLayoutError = checkpoint_layout.InvalidLayoutError
@@ -107,6 +117,13 @@ _DEFAULT_MAX_IN_FLIGHT_BYTES = 2 * 1024 * 1024 * 1024  # 2 GiB
 # negligible while the default 2 GiB budget still admits 16 concurrent
 # streams.
 _DEFAULT_READ_CHUNK_BYTES = 128 * 1024 * 1024  # 128 MiB
+# Chunks are read on a dedicated pool of this many threads, one thread hop per
+# chunk. Enough to keep a local NVMe drive's queues full, or many object
+# storage requests in flight.
+_IO_THREADS = 32
+# Most platforms limit `preadv` to 1024 buffers (`IOV_MAX`); a chunk scattered
+# over more is read in several calls.
+_MAX_IOVECS = 1024
 
 # Heavy over-read under the automatic ratio means the target sharding
 # fragments the checkpoint's byte layout and whole spans were read to keep the
@@ -115,6 +132,16 @@ _DEFAULT_READ_CHUNK_BYTES = 128 * 1024 * 1024  # 128 MiB
 # merges alone stays well below this.
 _OVER_READ_WARN_RATIO = 1.5
 
+# Saved file names, following the HuggingFace convention: one file when the
+# tensors fit in `SafetensorsOptions.max_file_bytes` (or it is unset), numbered
+# files plus an index mapping each tensor to its file otherwise.
+_SINGLE_FILE_NAME = "model.safetensors"
+_SHARDED_FILE_NAME = "model-{index:05d}-of-{count:05d}.safetensors"
+_INDEX_FILE_NAME = "model.safetensors.index.json"
+# Saved headers are padded with spaces to a multiple of this size, so that the
+# data section starts aligned in the file.
+_HEADER_ALIGNMENT = 8
+
 
 def _get_dtypes() -> dict[str, Any]:
   """Returns the mapping from safetensor `dtype` strings to NumPy `dtypes`."""
@@ -532,41 +559,166 @@ def _plan_chunk_reads(
   )
 
 
+def _open_local(path: Path) -> int | None:
+  """Opens `path` for positional reads, or returns None if it is not local."""
+  if not hasattr(os, "preadv"):
+    return None
+  try:
+    return os.open(os.fspath(path), os.O_RDONLY)
+  except (OSError, TypeError):
+    return None
+
+
+def _preadv_fully(fd: int, buffers: list[memoryview], offset: int) -> None:
+  """Fills `buffers`, in order, with consecutive bytes from `offset`."""
+  i = 0
+  while i < len(buffers):
+    batch = buffers[i : i + _MAX_IOVECS]
+    if not (n := os.preadv(fd, batch, offset)):
+      raise ValueError(f"Unexpected end of file at byte {offset}.")
+    offset += n
+    # Skips the buffers filled by this read, and trims a partially filled one.
+    for buf in batch:
+      if n < len(buf):
+        buffers[i] = buf[n:]
+        break
+      n -= len(buf)
+      i += 1
+
+
+def _chunk_gaps(chunk: _ChunkRead) -> list[int] | None:
+  """Returns the bytes of a chunk before each of its writes, and after the last.
+
+  Args:
+    chunk: The chunk to read.
+
+  Returns:
+    The gap sizes, some possibly zero, or None if the writes overlap.
+  """
+  gaps = []
+  end = 0
+  for w in chunk.writes:
+    if w.start < end:
+      return None
+    gaps.append(w.start - end)
+    end = w.stop
+  gaps.append(chunk.length - end)
+  return gaps
+
+
+def _scatter_buffers(chunk: _ChunkRead, gaps: list[int]) -> list[memoryview]:
+  """Lays out a chunk as its destination buffers, separated by scratch space.
+
+  Reading the chunk into the returned buffers, in order, delivers every write
+  straight into its destination. The gaps between writes are read into one
+  scratch buffer, which they all share since their bytes are dropped.
+
+  Args:
+    chunk: The chunk to read.
+    gaps: The gaps of the chunk, from `_chunk_gaps`.
+
+  Returns:
+    The buffers to read the chunk into.
+  """
+  scratch = memoryview(np.empty(max(gaps), dtype=np.uint8))
+  buffers = []
+  for gap, w in itertools.zip_longest(gaps, chunk.writes):
+    if gap:
+      buffers.append(scratch[:gap])
+    if w is not None:
+      buffers.append(memoryview(w.dst))
+  return buffers
+
+
+class _FileReader:
+  """Reads chunks of one file on the I/O thread pool.
+
+  Local files are read with `os.preadv` through one shared descriptor,
+  straight into the destination buffers: no intermediate `bytes`, no copy,
+  and a single thread hop per chunk. Other files (e.g. on object storage) are
+  read into a temporary buffer with one handle per chunk, and copied out.
+  """
+
+  def __init__(self, path: Path, executor: futures.Executor | None):
+    self.path = path
+    self._executor = executor
+    self._fd = None
+
+  async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(
+        self._executor, fn, *args
+    )
+
+  async def __aenter__(self) -> "_FileReader":
+    self._fd = await self._run(_open_local, self.path)
+    return self
+
+  async def __aexit__(self, *exc_info: Any) -> None:
+    if self._fd is not None:
+      os.close(self._fd)
+      self._fd = None
+
+  def scratch_bytes(self, chunk: _ChunkRead) -> int:
+    """Returns the temporary memory needed to read `chunk`."""
+    if self._fd is not None and (gaps := _chunk_gaps(chunk)) is not None:
+      return max(gaps)
+    return chunk.length
+
+  def _read(self, chunk: _ChunkRead) -> None:
+    if self._fd is not None and (gaps := _chunk_gaps(chunk)) is not None:
+      _preadv_fully(self._fd, _scatter_buffers(chunk, gaps), chunk.offset)
+      return
+    if self._fd is not None:
+      data = np.empty(chunk.length, dtype=np.uint8)
+      _preadv_fully(self._fd, [memoryview(data)], chunk.offset)
+    else:
+      with self.path.open("rb") as f:
+        f.seek(chunk.offset)
+        src = f.read(chunk.length)
+      if len(src) != chunk.length:
+        raise ValueError(
+            f"Unexpected end of file at byte {chunk.offset + len(src)}."
+        )
+      data = np.frombuffer(src, dtype=np.uint8)
+    for w in chunk.writes:
+      w.dst[:] = data[w.start : w.stop]
+
+  async def read(self, chunk: _ChunkRead) -> None:
+    """Reads `chunk` into its destination buffers."""
+    await self._run(self._read, chunk)
+
+
 async def _read_chunk(
-    path: Path, chunk: _ChunkRead, byte_budget: limits.LimitInFlightBytes
+    reader: _FileReader,
+    chunk: _ChunkRead,
+    byte_budget: limits.LimitInFlightBytes,
 ) -> None:
-  """Reads one chunk and copies its bytes into the destination buffers.
+  """Reads one chunk into its destination buffers.
 
   Args:
-    path: The file to read from. Each read opens its own handle, so chunks are
-      safe to issue concurrently.
+    reader: The reader of the file to read from. Its reads are positional, so
+      chunks are safe to issue concurrently.
     chunk: The byte range to read and the buffer copies it serves.
-    byte_budget: The shared in-flight byte limiter; the chunk's bytes stay
-      reserved until they have been copied out.
+    byte_budget: The shared in-flight byte limiter; the temporary memory the
+      chunk needs beyond its destination buffers stays reserved until it has
+      been read.
   """
   start_reserve = time.time()
-  async with limits.reserved_bytes(byte_budget, chunk.length):
+  async with limits.reserved_bytes(byte_budget, reader.scratch_bytes(chunk)):
     wait_time = time.time() - start_reserve
     start_read = time.time()
-    async with async_path.open_file(path, mode="rb") as f:
-      await f.seek(chunk.offset)
-      # `AsyncFile.read` is declared `bytes | str`; `mode="rb"` guarantees
-      # bytes at runtime but pytype can't narrow that statically.
-      data = cast(bytes, await f.read(chunk.length))
+    await reader.read(chunk)
     read_time = time.time() - start_read
     logging.vlog(
         1,
         "Read chunk of size %d bytes from %s at offset %d (limit wait: %.3f s,"
         " drive read: %.3f s)",
         chunk.length,
-        path.name,
+        reader.path.name,
         chunk.offset,
         wait_time,
         read_time,
     )
-    src = memoryview(data)
-    for w in chunk.writes:
-      w.dst[:] = np.frombuffer(src[w.start : w.stop], dtype=np.uint8)
 
 
 async def _read_file(
@@ -575,6 +727,7 @@ async def _read_file(
     byte_budget: limits.LimitInFlightBytes,
     max_over_read_ratio: float | None,
     chunk_bytes: int,
+    executor: futures.Executor | None = None,
 ) -> _ReadStats:
   """Serves all of one file's byte runs with concurrent ranged reads.
 
@@ -585,6 +738,8 @@ async def _read_file(
     max_over_read_ratio: Upper bound on `block_size / needed_bytes` per block.
       `None` picks the ratio from this file's runs (`_auto_over_read_ratio`).
     chunk_bytes: Maximum size of one ranged read.
+    executor: The I/O thread pool to read on. `None` uses the default executor
+      of the event loop.
 
   Returns:
     The file's read accounting.
@@ -592,7 +747,8 @@ async def _read_file(
   if not reads:
     return _ReadStats(needed_bytes=0, read_bytes=0, num_reads=0, num_gets=0)
   chunks, stats = _plan_chunk_reads(reads, max_over_read_ratio, chunk_bytes)
-  await asyncio.gather(*[_read_chunk(path, c, byte_budget) for c in chunks])
+  async with _FileReader(path, executor) as reader:
+    await asyncio.gather(*[_read_chunk(reader, c, byte_budget) for c in chunks])
   return stats
 
 
@@ -801,11 +957,231 @@ def _warn_if_over_read(
   )
 
 
+def _get_dtype_name(dtype: Any) -> str:
+  """Returns the safetensors `dtype` string of a NumPy `dtype`."""
+  dtype = np.dtype(dtype)
+  for name, np_dtype in _get_dtypes().items():
+    if np.dtype(np_dtype) == dtype:
+      return name
+  raise ValueError(f"Unsupported dtype for SafeTensors: {dtype}.")
+
+
+def _encode_header(header: dict[str, Any]) -> bytes:
+  """Serializes a header, preceded by its size and padded for alignment."""
+  header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+  header_bytes += b" " * (-len(header_bytes) % _HEADER_ALIGNMENT)
+  return len(header_bytes).to_bytes(HEADER_NUM_BYTES, "little") + header_bytes
+
+
+class _FilePlan(NamedTuple):
+  """The layout of one saved file."""
+
+  name: str
+  header: bytes  # The encoded header, from `_encode_header`.
+  tensor_bases: dict[str, int]  # Absolute byte offset of each tensor.
+  size: int
+
+
+def _plan_files(
+    tensors: dict[str, tuple[tuple[int, ...], np.dtype]],
+    max_file_bytes: int | None,
+) -> list[_FilePlan]:
+  """Assigns tensors to files and lays out each file.
+
+  Tensors are placed back to back in sorted name order, so every process
+  computes the same plan. A new file is started whenever the next tensor would
+  grow the current one past `max_file_bytes`; a tensor larger than that gets a
+  file of its own.
+
+  Args:
+    tensors: The shape and dtype of each tensor.
+    max_file_bytes: Maximum bytes of tensor data per file, or `None` for a
+      single file.
+
+  Returns:
+    The files to write, in order.
+  """
+  groups: list[list[str]] = [[]]
+  group_bytes = 0
+  for name in sorted(tensors):
+    shape, dtype = tensors[name]
+    nbytes = math.prod(shape) * dtype.itemsize
+    if (
+        max_file_bytes is not None
+        and groups[-1]
+        and group_bytes + nbytes > max_file_bytes
+    ):
+      groups.append([])
+      group_bytes = 0
+    groups[-1].append(name)
+    group_bytes += nbytes
+
+  plans = []
+  for i, names in enumerate(groups):
+    header: dict[str, Any] = {}
+    end = 0
+    for name in names:
+      shape, dtype = tensors[name]
+      nbytes = math.prod(shape) * dtype.itemsize
+      header[name] = {
+          "dtype": _get_dtype_name(dtype),
+          "shape": list(shape),
+          "data_offsets": [end, end + nbytes],
+      }
+      end += nbytes
+    encoded = _encode_header(header)
+    plans.append(
+        _FilePlan(
+            name=(
+                _SINGLE_FILE_NAME
+                if len(groups) == 1
+                else _SHARDED_FILE_NAME.format(index=i + 1, count=len(groups))
+            ),
+            header=encoded,
+            tensor_bases={
+                name: len(encoded) + info["data_offsets"][0]
+                for name, info in header.items()
+            },
+            size=len(encoded) + end,
+        )
+    )
+  return plans
+
+
+def _encode_index(plans: Sequence[_FilePlan]) -> str:
+  """Returns the HuggingFace index mapping each tensor to its file."""
+  return json.dumps(
+      {
+          "metadata": {
+              "total_size": sum(p.size - len(p.header) for p in plans)
+          },
+          "weight_map": {
+              name: p.name for p in plans for name in p.tensor_bases
+          },
+      },
+      indent=2,
+  )
+
+
+def _create_file(path: Path, plan: _FilePlan) -> None:
+  """Creates one file at its final size, with its header written."""
+  with path.open("wb") as f:
+    f.write(plan.header)
+    f.truncate(plan.size)
+
+
+class _ShardWrite(NamedTuple):
+  """One shard this process writes, and where its bytes go."""
+
+  file_name: str
+  runs: list[tuple[int, int]]  # `(offset, length)` byte runs, sorted.
+  nbytes: int
+  data: Any  # A `jax.Array` on device, or its host copy.
+
+
+def _plan_shard_writes(
+    name: str, value: Any, plan: _FilePlan, is_primary_host: bool
+) -> list[_ShardWrite]:
+  """Returns the shards of one tensor that this process writes.
+
+  Each shard of a `jax.Array` is written by the process holding its replica 0,
+  so replicated shards are written once. Host values are written by the primary
+  process.
+
+  Args:
+    name: The tensor name.
+    value: A `jax.Array`, or a NumPy array.
+    plan: The file the tensor belongs to.
+    is_primary_host: Whether this process is the primary one.
+
+  Returns:
+    The shards to write.
+  """
+  tensor_base = plan.tensor_bases[name]
+  if not isinstance(value, jax.Array):
+    if not is_primary_host or not value.nbytes:
+      return []
+    runs = [(tensor_base, value.nbytes)]
+    return [_ShardWrite(plan.name, runs, value.nbytes, value)]
+  writes = []
+  for shard in value.addressable_shards:
+    if shard.replica_id != 0 or not shard.data.nbytes:
+      continue
+    runs = index_domain_to_byte_runs(
+        _normalize_index(shard.index, value.shape),
+        value.shape,
+        value.dtype.itemsize,
+        tensor_base,
+    )
+    writes.append(_ShardWrite(plan.name, runs, shard.data.nbytes, shard.data))
+  return writes
+
+
+def _pwrite_fully(fd: int, data: memoryview, offset: int) -> None:
+  """Writes all of `data` at `offset`."""
+  while data:
+    n = os.pwrite(fd, data, offset)
+    data = data[n:]
+    offset += n
+
+
+def _write_runs(
+    path: Path, runs: Sequence[tuple[int, int]], data: np.ndarray
+) -> None:
+  """Writes the bytes of a shard to its runs, in place.
+
+  Positional writes through a descriptor of its own keep concurrent writes to
+  the same file independent.
+
+  Args:
+    path: The preallocated file to write to.
+    runs: The (offset, length) of the runs, in the order of the shard's bytes.
+    data: The shard.
+  """
+  src = memoryview(np.ascontiguousarray(data).reshape(-1).view(np.uint8))
+  fd = os.open(os.fspath(path), os.O_WRONLY)
+  try:
+    start = 0
+    for offset, length in runs:
+      _pwrite_fully(fd, src[start : start + length], offset)
+      start += length
+  finally:
+    os.close(fd)
+
+
+async def _write_shard(
+    directory: Path,
+    write: _ShardWrite,
+    byte_budget: limits.ByteLimiter,
+    max_in_flight_bytes: int | None,
+) -> None:
+  """Transfers one shard to host if needed, and writes it.
+
+  Args:
+    directory: The checkpoint directory.
+    write: The shard to write. Each write opens its own handle, so shards are
+      safe to write concurrently.
+    byte_budget: The shared device-to-host byte limiter; the shard's bytes stay
+      reserved until they have been written.
+    max_in_flight_bytes: The budget of `byte_budget`, if limited. A larger
+      shard reserves the whole budget, so it is transferred alone.
+  """
+  nbytes = write.nbytes
+  if max_in_flight_bytes is not None:
+    nbytes = min(nbytes, max_in_flight_bytes)
+  async with limits.reserved_bytes(byte_budget, nbytes):
+    data = await asyncio.to_thread(np.asarray, write.data)
+    await asyncio.to_thread(
+        _write_runs, directory / write.file_name, write.runs, data
+    )
+
+
 class SafetensorsLayout(CheckpointLayout):
   """Handles checkpoints in the HuggingFace Safetensors format.
 
   Inherits the abstract methods of :py:class:`~.CheckpointLayout`. Loading is
-  resharding-aware: see the module docstring. Saving is not yet supported.
+  resharding-aware, and saving writes each process's shards in parallel: see
+  the module docstring.
   """
 
   def __init__(self):
@@ -934,10 +1310,138 @@ class SafetensorsLayout(CheckpointLayout):
       *,
       checkpointables: dict[str, Checkpointable],
   ) -> Awaitable[None]:
-    """Raises: saving to Safetensors is not supported."""
-    del path, checkpointables
-    raise NotImplementedError(
-        "Saving to Safetensors format is not supported yet."
+    """Saves a flat PyTree of arrays as a SafeTensors checkpoint.
+
+    The tensors are written to `model.safetensors` in the checkpoint directory,
+    or split over numbered files indexed by `model.safetensors.index.json` when
+    they exceed `SafetensorsOptions.max_file_bytes`.
+
+    When `MemoryOptions.transfer_concurrent_bytes` is unset, every shard is
+    copied to host before returning, so the arrays may be updated as soon as
+    this returns. Otherwise, shards are copied to host in the background within
+    that budget, and the arrays must not be modified or deleted until the save
+    completes.
+
+    Args:
+      path: The checkpoint directory, which may not exist yet.
+      checkpointables: A single checkpointable, which must be a flat dict
+        mapping tensor name to a `jax.Array`, NumPy array or scalar.
+
+    Returns:
+      An awaitable completing once every process has written its shards.
+
+    Raises:
+      ValueError: If `checkpointables` does not hold a single flat dict, or a
+        tensor has a dtype unsupported by SafeTensors.
+    """
+    if len(checkpointables) != 1:
+      raise ValueError(
+          "SafetensorsLayout saves exactly one checkpointable, got"
+          f" {list(checkpointables)}."
+      )
+    (tree,) = checkpointables.values()
+    if not tree_utils.is_flat_dict(tree):
+      raise ValueError("The PyTree is not a flat dictionary.")
+    tensors = {
+        str(name): value if isinstance(value, jax.Array) else np.asarray(value)
+        for name, value in tree.items()
+    }
+    context = context_lib.get_context()
+    plans = _plan_files(
+        {
+            name: (value.shape, np.dtype(value.dtype))
+            for name, value in tensors.items()
+        },
+        context.safetensors_options.max_file_bytes,
+    )
+    plan_by_tensor = {name: p for p in plans for name in p.tensor_bases}
+    is_primary_host = sync_multihost.is_primary_host(
+        context.multiprocessing_options.primary_host
+    )
+    writes = [
+        w
+        for name, value in tensors.items()
+        for w in _plan_shard_writes(
+            name, value, plan_by_tensor[name], is_primary_host
+        )
+    ]
+
+    max_in_flight_bytes = context.memory_options.transfer_concurrent_bytes
+    if max_in_flight_bytes is None:
+      # Starts every transfer before waiting on any, so they overlap.
+      for w in writes:
+        if isinstance(w.data, jax.Array):
+          w.data.copy_to_host_async()
+      writes = [w._replace(data=np.asarray(w.data)) for w in writes]
+    return self._save(
+        path,
+        plans,
+        writes,
+        max_in_flight_bytes,
+        is_primary_host=is_primary_host,
+        operation_id=synchronization.get_operation_id(),
+        context=context,
+    )
+
+  async def _save(
+      self,
+      path: types.PathAwaitingCreation,
+      plans: Sequence[_FilePlan],
+      writes: Sequence[_ShardWrite],
+      max_in_flight_bytes: int | None,
+      *,
+      is_primary_host: bool,
+      operation_id: str,
+      context: context_lib.Context,
+  ) -> None:
+    """Background save phase: creates the files, then writes the shards."""
+    directory = await path.await_creation()
+    if is_primary_host:
+      await asyncio.gather(*[
+          asyncio.to_thread(_create_file, directory / p.name, p)
+          for p in plans
+      ])
+      if len(plans) > 1:
+        await async_path.write_text(
+            directory / _INDEX_FILE_NAME, _encode_index(plans)
+        )
+    # Every file must exist at its final size before shards are written to it.
+    await sync_multihost.sync_global_processes(
+        sync_multihost.unique_barrier_key(
+            "SafetensorsLayout:create_files",
+            prefix=context.multiprocessing_options.barrier_sync_key_prefix,
+        ),
+        operation_id=operation_id,
+        processes=context.multiprocessing_options.active_processes,
+    )
+
+    start = time.time()
+    # Same sizing as the loader's limiter: a single shard can then reserve the
+    # full budget.
+    byte_budget = limits.get_byte_limiter(
+        None if max_in_flight_bytes is None else max_in_flight_bytes + 1
+    )
+    await asyncio.gather(*[
+        _write_shard(directory, w, byte_budget, max_in_flight_bytes)
+        for w in writes
+    ])
+    logging.vlog(
+        1,
+        "[process=%s] Wrote %d shards (%s) to %s in %.3f s.",
+        sync_multihost.process_index(),
+        len(writes),
+        humanize.naturalsize(sum(w.nbytes for w in writes), binary=True),
+        directory,
+        time.time() - start,
+    )
+    # The checkpoint is only complete once every process has written.
+    await sync_multihost.sync_global_processes(
+        sync_multihost.unique_barrier_key(
+            "SafetensorsLayout:write_shards",
+            prefix=context.multiprocessing_options.barrier_sync_key_prefix,
+        ),
+        operation_id=operation_id,
+        processes=context.multiprocessing_options.active_processes,
     )
 
   async def _build_file_index(self, path: Path) -> dict[str, _FileEntry]:
@@ -1036,6 +1540,7 @@ class SafetensorsLayout(CheckpointLayout):
           byte_budget,
           opts.max_over_read_ratio,
           chunk_bytes,
+          executor,
       )
       # Drop the read plan so each shard's host memory can be released as
       # `build()` moves it on-device.
@@ -1044,7 +1549,10 @@ class SafetensorsLayout(CheckpointLayout):
         arrays[name] = build()
       return stats
 
-    stats = await asyncio.gather(*map(load_file, list(reads_by_file)))
+    with futures.ThreadPoolExecutor(
+        max_workers=_IO_THREADS, thread_name_prefix="safetensors_read"
+    ) as executor:
+      stats = await asyncio.gather(*map(load_file, list(reads_by_file)))
     _record_read_stats(stats)
     _warn_if_over_read(stats, opts.max_over_read_ratio is None)
     return {name: arrays[name] for name in names}
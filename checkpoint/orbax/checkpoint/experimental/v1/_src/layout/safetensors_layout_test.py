@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+from typing import Any
 import unittest
 from unittest import mock
 
@@ -178,11 +181,128 @@ class SafetensorsLayoutTest(
     ):
       await layout.load_checkpointables(self.safetensors_path)
 
-  async def test_save_raises_not_implemented(self):
+  def _save(self, path: epath.Path, tree: dict[str, Any], **kwargs):
+    with context_lib.Context(checkpoint_layout='safetensors', **kwargs):
+      saving.save(path, tree)
+
+  def test_save(self):
+    mesh = jax.sharding.Mesh(np.array(jax.devices()), ('x',))
+    tree = {
+        'numpy': np.arange(12, dtype=np.float32).reshape(3, 4),
+        'bf16': jax.numpy.arange(6, dtype=jax.numpy.bfloat16),
+        'sharded': jax.device_put(
+            np.arange(8 * len(jax.devices()) * 3, dtype=np.int32).reshape(
+                8 * len(jax.devices()), 3
+            ),
+            jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec('x')),
+        ),
+        'replicated': jax.device_put(
+            np.ones((2, 2), dtype=np.int8),
+            jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec()),
+        ),
+        'scalar': 3,
+    }
+    path = epath.Path(self.test_dir.full_path) / 'saved'
+    self._save(path, tree)
+
+    self.assertFalse((path / 'model.safetensors.index.json').exists())
+    loaded = safetensors.numpy.load_file(path / 'model.safetensors')
+    self.assertSameElements(loaded, tree)
+    for name, value in tree.items():
+      np.testing.assert_array_equal(loaded[name], np.asarray(value))
+      self.assertEqual(loaded[name].dtype, np.asarray(value).dtype)
+
+  async def test_save_then_load(self):
+    mesh = jax.sharding.Mesh(np.array(jax.devices()), ('x',))
+    sharding = jax.sharding.NamedSharding(
+        mesh, jax.sharding.PartitionSpec(None, 'x')
+    )
+    # Sharded on its inner dimension, so every shard is strided in the file.
+    value = np.arange(4 * 2 * len(jax.devices()), dtype=np.float32).reshape(
+        4, 2 * len(jax.devices())
+    )
+    path = epath.Path(self.test_dir.full_path) / 'saved'
+    self._save(path, {'w': jax.device_put(value, sharding)})
+
+    restore_fn = await SafetensorsLayout().load(
+        path,
+        abstract_state={
+            'w': jax.ShapeDtypeStruct(
+                value.shape, value.dtype, sharding=sharding
+            )
+        },
+    )
+    pytree = await restore_fn
+    np.testing.assert_array_equal(pytree['w'], value)
+
+  def test_save_sharded_files(self):
+    tree = {
+        name: np.full((4,), i, dtype=np.int32)  # 16 bytes each.
+        for i, name in enumerate(['a', 'b', 'c', 'd', 'e'])
+    }
+    tree['large'] = np.arange(16, dtype=np.int32)
+    path = epath.Path(self.test_dir.full_path) / 'saved'
+    self._save(
+        path,
+        tree,
+        safetensors_options=options_lib.SafetensorsOptions(max_file_bytes=32),
+    )
+
+    index = json.loads((path / 'model.safetensors.index.json').read_text())
+    self.assertEqual(index['metadata'], {'total_size': 5 * 16 + 64})
+    self.assertEqual(
+        index['weight_map'],
+        {
+            'a': 'model-00001-of-00004.safetensors',
+            'b': 'model-00001-of-00004.safetensors',
+            'c': 'model-00002-of-00004.safetensors',
+            'd': 'model-00002-of-00004.safetensors',
+            'e': 'model-00003-of-00004.safetensors',
+            'large': 'model-00004-of-00004.safetensors',
+        },
+    )
+    for file_name in set(index['weight_map'].values()):
+      loaded = safetensors.numpy.load_file(path / file_name)
+      for name, value in loaded.items():
+        self.assertEqual(index['weight_map'][name], file_name)
+        np.testing.assert_array_equal(value, tree[name])
+
+  def test_save_with_transfer_budget(self):
+    tree = {
+        name: jax.numpy.full((64,), i, dtype=np.float32)  # 256 bytes each.
+        for i, name in enumerate(['a', 'b', 'c'])
+    }
+    path = epath.Path(self.test_dir.full_path) / 'saved'
+    # Smaller than one array: arrays are transferred one at a time.
+    self._save(
+        path,
+        tree,
+        memory_options=options_lib.MemoryOptions(transfer_concurrent_bytes=100),
+    )
+    loaded = safetensors.numpy.load_file(path / 'model.safetensors')
+    for name, value in tree.items():
+      np.testing.assert_array_equal(loaded[name], value)
+
+  async def test_save_requires_flat_dict(self):
+    layout = SafetensorsLayout()
+    mock_path = mock.Mock(spec=types.PathAwaitingCreation)
+    with self.assertRaisesRegex(ValueError, 'flat dictionary'):
+      await layout.save_checkpointables(
+          mock_path, checkpointables={'pytree': {'a': {'b': np.ones(2)}}}
+      )
+    with self.assertRaisesRegex(ValueError, 'exactly one checkpointable'):
+      await layout.save_checkpointables(
+          mock_path, checkpointables={'a': {}, 'b': {}}
+      )
+
+  async def test_save_unsupported_dtype_raises(self):
     layout = SafetensorsLayout()
     mock_path = mock.Mock(spec=types.PathAwaitingCreation)
-    with self.assertRaises(NotImplementedError):
-      await layout.save_checkpointables(mock_path, checkpointables={})
+    with self.assertRaisesRegex(ValueError, 'Unsupported dtype'):
+      await layout.save_checkpointables(
+          mock_path,
+          checkpointables={'pytree': {'a': np.ones(2, dtype=np.complex64)}},
+      )
 
 
 class SafetensorsLayoutDirectoryTest(
@@ -658,6 +778,33 @@ class FileReadTest(unittest.IsolatedAsyncioTestCase, parameterized.TestCase):
     received = await self._run(1.0, 16, [0], [64])
     self.assertEqual(received[0], self.payload[:64])
 
+  @parameterized.parameters(
+      ([0, 16, 32, 48], [16] * 4),
+      ([0, 1024, 2048], [16] * 3),
+  )
+  async def test_delivers_bytes_without_positional_reads(
+      self, offsets, lengths
+  ):
+    with mock.patch.object(
+        safetensors_layout, '_open_local', return_value=None
+    ):
+      received = await self._run(1.5, 64, offsets, lengths)
+    for off, length, b in zip(offsets, lengths, received):
+      self.assertEqual(b, self.payload[off : off + length])
+
+  async def test_delivers_bytes_with_short_positional_reads(self):
+    preadv = os.preadv
+
+    def short_preadv(fd, buffers, offset):
+      # Fills at most 5 bytes of the first buffer per call.
+      return preadv(fd, [buffers[0][:5]], offset)
+
+    offsets = [0, 16, 40]
+    with mock.patch.object(os, 'preadv', side_effect=short_preadv):
+      received = await self._run(None, 1 << 20, offsets, [16] * 3)
+    for off, b in zip(offsets, received):
+      self.assertEqual(b, self.payload[off : off + 16])
+
   async def test_read_file_returns_read_stats(self):
     # 4 dense 16-byte runs coalesce into one 64-byte block (ratio 1.0); the
     # huge chunk size reads it in a single ranged GET.
@@ -32,6 +32,7 @@ from orbax.checkpoint._src.metadata import sharding as sharding_metadata
 from orbax.checkpoint._src.metadata import value as value_metadata
 from orbax.checkpoint._src.serialization import type_handlers as type_handlers_v0
 from orbax.checkpoint.experimental.v1._src.context import context as context_lib
+from orbax.checkpoint.experimental.v1._src.context import options as options_lib
 from orbax.checkpoint.experimental.v1._src.serialization import options_resolution
 from orbax.checkpoint.experimental.v1._src.serialization import protocol_utils
 from orbax.checkpoint.experimental.v1._src.serialization import registration
@@ -85,17 +86,26 @@ def _create_v0_array_handler(
   return registration.get_array_handler(context)
 
 
-def _create_v0_saving_paraminfo(
-    param: ArraySerializationParam,
+def _create_v0_saving_paraminfos(
+    params: Sequence[ArraySerializationParam],
     context: context_lib.Context,
     serialization_context: types.SerializationContext,
-) -> type_handlers_v0.ParamInfo:
-  """Creates a V0 `ParamInfo` from V1 params and contexts for saving."""
+) -> list[type_handlers_v0.ParamInfo]:
+  """Creates V0 `ParamInfo`s from a batch of V1 params for saving.
 
-  saving_options = context.array_options.saving
+  Only the name and keypath differ between leaves: every other field comes
+  from the contexts, and is resolved once for the whole batch.
+
+  Args:
+    params: The params of the leaves to save.
+    context: The V1 context.
+    serialization_context: The serialization context shared by the batch.
 
-  return type_handlers_v0.ParamInfo(
-      name=param.name,
+  Returns:
+    One `ParamInfo` per param.
+  """
+  saving_options = context.array_options.saving
+  shared_fields = dict(
       parent_dir=serialization_context.parent_dir.path,
       byte_limiter=serialization_context.byte_limiter,
       device_host_byte_limiter=serialization_context.device_host_byte_limiter,
@@ -105,19 +115,20 @@ def _create_v0_saving_paraminfo(
       ocdbt_target_data_file_size=saving_options.ocdbt_target_data_file_size,
       ts_context=serialization_context.ts_context,
       value_typestr=None,  # TODO(dnlng): Add value typestr.
-      enable_pinned_host_transfer=saving_options.enable_pinned_host_transfer,  # pyrefly: ignore[bad-argument-type]
-      keypath=param.keypath,
+      enable_pinned_host_transfer=saving_options.enable_pinned_host_transfer,
   )
+  return [
+      type_handlers_v0.ParamInfo(  # pyrefly: ignore[bad-argument-type]
+          name=p.name, keypath=p.keypath, **shared_fields
+      )
+      for p in params
+  ]
 
 
-def _create_v0_savearg(
-    param: ArraySerializationParam,
-    context: context_lib.Context,
+def _to_v0_savearg(
+    storage_options: options_lib.ArrayOptions.Saving.StorageOptions,
 ) -> type_handlers_v0.SaveArgs:
-  """Creates a V0 `SaveArgs` from V1 params and context for saving."""
-  storage_options = options_resolution.resolve_storage_options(
-      param.keypath, param.value, context.array_options.saving
-  )
+  """Creates a V0 `SaveArgs` from resolved V1 storage options."""
   return type_handlers_v0.SaveArgs(
       dtype=jnp.dtype(storage_options.dtype) if storage_options.dtype else None,
       chunk_byte_size=storage_options.chunk_byte_size,
@@ -125,30 +136,59 @@ def _create_v0_savearg(
   )
 
 
-def _create_v0_restore_paraminfo(
-    param: (
+def _create_v0_saveargs(
+    params: Sequence[ArraySerializationParam],
+    context: context_lib.Context,
+) -> list[type_handlers_v0.SaveArgs]:
+  """Creates V0 `SaveArgs` from a batch of V1 params for saving.
+
+  Without a `scoped_storage_options_creator`, every leaf resolves to the global
+  storage options, so the batch shares a single `SaveArgs`, as the V0 handler
+  itself does for default arguments.
+
+  Args:
+    params: The params of the leaves to save.
+    context: The V1 context.
+
+  Returns:
+    One `SaveArgs` per param.
+  """
+  saving_options = context.array_options.saving
+  if saving_options.scoped_storage_options_creator is None:
+    savearg = _to_v0_savearg(
+        options_resolution.resolve_storage_options((), None, saving_options)
+    )
+    return [savearg] * len(params)
+  return [
+      _to_v0_savearg(
+          options_resolution.resolve_storage_options(
+              p.keypath, p.value, saving_options
+          )
+      )
+      for p in params
+  ]
+
+
+def _create_v0_restore_paraminfos(
+    params: Sequence[
         types.DeserializationParam[None]
         | types.DeserializationParam[AbstractShardedArray]
-    ),
+    ],
     context: context_lib.Context,
     deserialization_context: types.DeserializationContext,
-) -> type_handlers_v0.ParamInfo:
-  """Creates a V0 `ParamInfo` from V1 params and contexts for loading."""
+) -> list[type_handlers_v0.ParamInfo]:
+  """Creates V0 `ParamInfo`s from a batch of V1 params for loading.
 
-  loading_options = context.array_options.loading
+  Args:
+    params: The params of the leaves to load.
+    context: The V1 context.
+    deserialization_context: The deserialization context shared by the batch.
 
-  if isinstance(param.value, ArrayMetadata):
-    # the write_shape is populated for metadata() calls.
-    v = cast(ArrayMetadata, param.value)
-    if v.storage_metadata is not None:
-      write_shape = v.storage_metadata.write_shape
-    else:
-      write_shape = None
-  else:
-    write_shape = None
-
-  return type_handlers_v0.ParamInfo(
-      name=param.name,
+  Returns:
+    One `ParamInfo` per param.
+  """
+  loading_options = context.array_options.loading
+  shared_fields = dict(
       parent_dir=deserialization_context.parent_dir,
       skip_deserialize=False,
       byte_limiter=deserialization_context.byte_limiter,
@@ -156,35 +196,97 @@ def _create_v0_restore_paraminfo(
       ts_context=deserialization_context.ts_context,
       raise_array_data_missing_error=loading_options.raise_array_data_missing_error,
       use_zarr3=deserialization_context.zarr3_checkpoint,
-      write_shape=write_shape,
-      keypath=param.keypath,
   )
+  paraminfos = []
+  for p in params:
+    # The write_shape is populated for metadata() calls.
+    write_shape = None
+    if isinstance(p.value, ArrayMetadata):
+      v = cast(ArrayMetadata, p.value)
+      if v.storage_metadata is not None:
+        write_shape = v.storage_metadata.write_shape
+    paraminfos.append(
+        type_handlers_v0.ParamInfo(  # pyrefly: ignore[bad-argument-type]
+            name=p.name,
+            keypath=p.keypath,
+            write_shape=write_shape,
+            **shared_fields,
+        )
+    )
+  return paraminfos
 
 
-def _create_v0_restorearg(
-    param: ArrayDeserializationParam,
+def _create_v0_restoreargs(
+    params: Sequence[ArrayDeserializationParam],
     context: context_lib.Context,
-) -> type_handlers_v0.ArrayRestoreArgs:
-  """Creates a V0 `ArrayRestoreArgs` from V1 params."""
+) -> list[type_handlers_v0.ArrayRestoreArgs]:
+  """Creates V0 `ArrayRestoreArgs` from a batch of V1 params.
+
+  Loading does not modify restore args, so leaves with the same abstract
+  array, e.g. the layers of a model, share a single `ArrayRestoreArgs`.
+
+  Args:
+    params: The params of the leaves to load.
+    context: The V1 context.
+
+  Returns:
+    One `ArrayRestoreArgs` per param.
+
+  Raises:
+    TypeError: If the abstract value of a param is not an array.
+  """
+  loading_options = context.array_options.loading
   restore_arg_cls = (
       type_handlers_v0.SingleReplicaArrayRestoreArgs
-      if context.array_options.loading.use_load_and_broadcast
+      if loading_options.use_load_and_broadcast
       else type_handlers_v0.ArrayRestoreArgs
   )
-  value = param.value
-  if value is None or isinstance(value, type):
-    return restore_arg_cls(restore_type=jax.Array)
-  elif protocol_utils.is_subclass_protocol(value, AbstractShardedArray):  # pyrefly: ignore[bad-argument-type]
-    value = typing.cast(AbstractShardedArray, value)
+  strict = not loading_options.enable_padding_and_truncation
+
+  def _new_restorearg(
+      value: AbstractShardedArray | None,
+  ) -> type_handlers_v0.ArrayRestoreArgs:
+    if value is None:
+      return restore_arg_cls(restore_type=jax.Array)
     return restore_arg_cls(
         restore_type=jax.Array,
         dtype=value.dtype,
         sharding=value.sharding,
         shape=value.shape,
-        strict=not context.array_options.loading.enable_padding_and_truncation,
+        strict=strict,
     )
-  else:
-    raise TypeError(f'Unrecognized abstract value type: {type(value)}')
+
+  # Whether values of a type are abstract arrays, checked once per type.
+  is_array_type: dict[type[typing.Any], bool] = {}
+  shared_restoreargs: dict[
+      typing.Hashable, type_handlers_v0.ArrayRestoreArgs
+  ] = {}
+  restoreargs = []
+  for p in params:
+    value = p.value
+    if value is None or isinstance(value, type):
+      value = None
+      key = None
+    else:
+      value_type = type(value)
+      if value_type not in is_array_type:
+        is_array_type[value_type] = protocol_utils.is_subclass_protocol(
+            value, AbstractShardedArray  # pyrefly: ignore[bad-argument-type]
+        )
+      if not is_array_type[value_type]:
+        raise TypeError(f'Unrecognized abstract value type: {value_type}')
+      value = typing.cast(AbstractShardedArray, value)
+      key = (value.dtype, value.sharding, value.shape)
+    try:
+      restorearg = shared_restoreargs.get(key)
+    except TypeError:
+      # Values with an unhashable sharding or shape are not shared.
+      restoreargs.append(_new_restorearg(value))
+      continue
+    if restorearg is None:
+      restorearg = shared_restoreargs[key] = _new_restorearg(value)
+    restoreargs.append(restorearg)
+  return restoreargs
 
 
 async def _async_futures(commit_futures: Sequence[future.Future]):
@@ -223,11 +325,10 @@ class ArrayLeafHandler(types.LeafHandler[jax.Array, AbstractShardedArray]):
       operation.
     """
     values = [p.value for p in params]
-    paraminfos = [
-        _create_v0_saving_paraminfo(p, self._context, serialization_context)
-        for p in params
-    ]
-    saveargs = [_create_v0_savearg(p, self._context) for p in params]
+    paraminfos = _create_v0_saving_paraminfos(
+        params, self._context, serialization_context
+    )
+    saveargs = _create_v0_saveargs(params, self._context)
 
     commit_futures = await self._handler_impl.serialize(
         values, paraminfos, saveargs
@@ -252,11 +353,10 @@ class ArrayLeafHandler(types.LeafHandler[jax.Array, AbstractShardedArray]):
     """
 
     # validate all parameters
-    paraminfos = [
-        _create_v0_restore_paraminfo(p, self._context, deserialization_context)
-        for p in params
-    ]
-    restoreargs = [_create_v0_restorearg(p, self._context) for p in params]
+    paraminfos = _create_v0_restore_paraminfos(
+        params, self._context, deserialization_context
+    )
+    restoreargs = _create_v0_restoreargs(params, self._context)
 
     return asyncio.create_task(
         self._handler_impl.deserialize(paraminfos, restoreargs)
@@ -277,10 +377,9 @@ class ArrayLeafHandler(types.LeafHandler[jax.Array, AbstractShardedArray]):
     Returns:
       Sequence of ArrayMetadata for each provided ArrayDeserializationParam.
     """
-    paraminfos = [
-        _create_v0_restore_paraminfo(p, self._context, deserialization_context)  # pyrefly: ignore[bad-argument-type]
-        for p in params
-    ]
+    paraminfos = _create_v0_restore_paraminfos(
+        params, self._context, deserialization_context
+    )
 
     async def _convert_to_array_metadata() -> Sequence[ArrayMetadata]:
       v0_metadatas = await self._handler_impl.metadata(paraminfos)
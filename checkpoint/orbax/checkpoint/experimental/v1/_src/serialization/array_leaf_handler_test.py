@@ -26,6 +26,7 @@ from orbax.checkpoint._src.serialization import ocdbt_utils
 from orbax.checkpoint._src.serialization import tensorstore_utils as ts_utils
 from orbax.checkpoint._src.tree import utils as tree_utils
 from orbax.checkpoint.experimental.v1._src.context import context as context_lib
+from orbax.checkpoint.experimental.v1._src.context import options as options_lib
 from orbax.checkpoint.experimental.v1._src.serialization import array_leaf_handler
 from orbax.checkpoint.experimental.v1._src.serialization import types
 from orbax.checkpoint.experimental.v1._src.synchronization import multihost
@@ -71,6 +72,92 @@ def _get_metadata_params(pytree):
   ]
 
 
+class CreateV0ArgsTest(parameterized.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.params = _get_serialization_params(
+        {'a': np.arange(4, dtype=np.float32), 'b': np.arange(8)}
+    )
+
+  def test_saveargs_are_shared_without_scoped_creator(self):
+    context = context_lib.Context()
+    context.array.saving.storage_options.chunk_byte_size = 1024
+    saveargs = array_leaf_handler._create_v0_saveargs(self.params, context)
+    self.assertLen(saveargs, 2)
+    self.assertIs(saveargs[0], saveargs[1])
+    self.assertEqual(saveargs[0].chunk_byte_size, 1024)
+
+  def test_saveargs_with_scoped_creator(self):
+    context = context_lib.Context()
+    context.array.saving.storage_options.chunk_byte_size = 1024
+    context.array.saving.scoped_storage_options_creator = (
+        lambda keypath, value: options_lib.ArrayOptions.Saving.StorageOptions(
+            dtype=jnp.bfloat16
+        )
+        if value.dtype == np.float32
+        else None
+    )
+    saveargs = array_leaf_handler._create_v0_saveargs(self.params, context)
+    self.assertEqual(saveargs[0].dtype, jnp.bfloat16)
+    self.assertIsNone(saveargs[1].dtype)
+    self.assertEqual(saveargs[0].chunk_byte_size, 1024)
+    self.assertEqual(saveargs[1].chunk_byte_size, 1024)
+
+  def test_saving_paraminfos(self):
+    parent_dir = epath.Path(self.create_tempdir().full_path)
+    context = context_lib.Context()
+    context.array.saving.use_zarr3 = False
+    serialization_context = types.SerializationContext(
+        parent_dir=path_test_utils.PathAwaitingCreationWrapper(parent_dir),
+    )
+    infos = array_leaf_handler._create_v0_saving_paraminfos(
+        self.params, context, serialization_context
+    )
+    self.assertEqual([info.name for info in infos], ['a', 'b'])
+    self.assertEqual(
+        [info.keypath for info in infos], [p.keypath for p in self.params]
+    )
+    for info in infos:
+      self.assertEqual(info.parent_dir, parent_dir)
+      self.assertEqual(info.path, parent_dir / info.name)
+      self.assertFalse(info.use_zarr3)
+
+  def test_restoreargs_are_shared_between_identical_arrays(self):
+    mesh = jax.sharding.Mesh(np.asarray(jax.devices()), ('x',))
+    sharding = jax.sharding.NamedSharding(mesh, jax.sharding.PartitionSpec())
+    params = [
+        array_leaf_handler.ArrayDeserializationParam(
+            keypath=(jax.tree_util.DictKey(name),),
+            value=jax.ShapeDtypeStruct(shape, np.float32, sharding=sharding),
+        )
+        for name, shape in (('a', (4,)), ('b', (4,)), ('c', (8,)))
+    ] + [
+        array_leaf_handler.ArrayDeserializationParam(
+            keypath=(jax.tree_util.DictKey(name),), value=None
+        )
+        for name in ('d', 'e')
+    ]
+    restoreargs = array_leaf_handler._create_v0_restoreargs(
+        params, context_lib.Context()
+    )
+    self.assertLen(restoreargs, 5)
+    self.assertIs(restoreargs[0], restoreargs[1])
+    self.assertIsNot(restoreargs[0], restoreargs[2])
+    self.assertEqual(restoreargs[2].shape, (8,))
+    self.assertIs(restoreargs[3], restoreargs[4])
+    self.assertIsNone(restoreargs[3].shape)
+
+  def test_restoreargs_unrecognized_value(self):
+    params = [
+        array_leaf_handler.ArrayDeserializationParam(
+            keypath=(jax.tree_util.DictKey('a'),), value=object()
+        )
+    ]
+    with self.assertRaises(TypeError):
+      array_leaf_handler._create_v0_restoreargs(params, context_lib.Context())
+
+
 class ArrayLeafHandlerTest(
     unittest.IsolatedAsyncioTestCase, parameterized.TestCase
 ):
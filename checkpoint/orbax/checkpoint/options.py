@@ -27,6 +27,13 @@ class AsyncOptions:
   """Options used to configure async behavior.
 
   See :py:class:`.AsyncCheckpointer` for details.
+
+  max_concurrent_commits: The maximum number of saves that may commit in the
+    background at the same time. With the default of 1, each save blocks until
+    the previous one has been committed. Larger values allow training to keep
+    going when storage is temporarily slow; checkpoints are still finalized in
+    the order in which they were saved. Save memory budgets of the handler are
+    split evenly between the in-flight saves.
   """
 
   timeout_secs: int = (
@@ -35,6 +42,7 @@ class AsyncOptions:
   barrier_sync_fn: Optional[multihost.BarrierSyncFn] = None
   post_finalization_callback: Optional[Callable[[], None]] = None
   create_directories_asynchronously: bool = True
+  max_concurrent_commits: int = 1
 
 
 @dataclasses.dataclass
@@ -22,3 +22,4 @@ from orbax.checkpoint._src.path import atomicity_types
 from orbax.checkpoint._src.path import deleter
 from orbax.checkpoint._src.path import format_utils
 from orbax.checkpoint._src.path import step
+from orbax.checkpoint._src.path import step_watcher